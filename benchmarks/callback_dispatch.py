@@ -0,0 +1,73 @@
+"""
+Offline benchmark: producer-side cost of per-token callbacks.
+
+Streams ``--tokens`` tokens through a ``CallbackManager`` holding the two
+built-in streaming handlers (``StreamingStatisticsCallback`` and
+``StreamingStdOutCallbackHandler``, writing to /dev/null) and reports how
+long the producer spends per token, first with per-token dispatch (one
+``asyncio.gather`` and one executor hop per token) and then with the
+handlers' default batched ``token_dispatch``. ``end`` is the time spent in
+``on_llm_end`` waiting for queued tokens to be delivered.
+
+Usage:
+    python benchmarks/callback_dispatch.py [--tokens 5000] [--repeat 3]
+"""
+import argparse
+import asyncio
+import contextlib
+import os
+import statistics
+import time
+from uuid import uuid4
+
+from spoon_ai.callbacks import CallbackManager, StreamingStatisticsCallback, StreamingStdOutCallbackHandler
+
+
+async def run(tokens: int, batched: bool):
+    handlers = [StreamingStatisticsCallback(auto_print=False), StreamingStdOutCallbackHandler()]
+    if not batched:
+        for handler in handlers:
+            handler.token_dispatch = None
+    manager = CallbackManager(handlers)
+    run_id = uuid4()
+
+    timings = []
+    await manager.on_llm_start(run_id=run_id, messages=[])
+    for i in range(tokens):
+        start = time.perf_counter_ns()
+        await manager.on_llm_new_token("tok ", run_id=run_id)
+        timings.append(time.perf_counter_ns() - start)
+    start = time.perf_counter()
+    await manager.on_llm_end(None, run_id=run_id)
+    end = time.perf_counter() - start
+    assert handlers[0].token_count == tokens
+    return timings, end
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tokens", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with open(os.devnull, "w") as sink, contextlib.redirect_stdout(sink):
+        results = {}
+        for name, batched in (("per-token", False), ("batched", True)):
+            best = None
+            for _ in range(args.repeat):
+                timings, end = asyncio.run(run(args.tokens, batched))
+                total = sum(timings) / 1e6
+                if best is None or total < best[0]:
+                    timings.sort()
+                    best = (total, statistics.fmean(timings) / 1000, timings[int(0.99 * (len(timings) - 1))] / 1000, end)
+            results[name] = best
+
+    for name, (total, mean_us, p99_us, end) in results.items():
+        print(
+            f"{name:10s} producer {total:8.1f} ms   per token mean {mean_us:7.1f} us   "
+            f"p99 {p99_us:7.1f} us   end {end * 1000:6.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
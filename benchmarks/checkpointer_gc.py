@@ -0,0 +1,115 @@
+"""
+Micro-benchmark: InMemoryCheckpointer save/get cost with many live threads.
+
+Compares the current checkpointer against the previous scan-based GC, which
+walked every thread and snapshot on each save and sorted all threads for LRU
+eviction. Also reports the size of the TTL heap, which should follow the
+number of live threads rather than the number of saves.
+
+Usage:
+    python benchmarks/checkpointer_gc.py [--threads 10000] [--saves 2] [--max-per-thread 100]
+"""
+import argparse
+import time
+from datetime import datetime
+from typing import Dict, List
+
+from spoon_ai.graph.checkpointer import InMemoryCheckpointer
+from spoon_ai.graph.types import StateSnapshot
+
+
+class LegacyInMemoryCheckpointer:
+    """The pre-OrderedDict implementation, kept here only for comparison."""
+
+    def __init__(self, max_checkpoints_per_thread: int = 100, *, max_threads=None, ttl_seconds=None):
+        self.checkpoints: Dict[str, List[StateSnapshot]] = {}
+        self.max_checkpoints_per_thread = max_checkpoints_per_thread
+        self.max_threads = max_threads
+        self.ttl_seconds = ttl_seconds
+        self.last_access: Dict[str, datetime] = {}
+
+    def _gc(self) -> None:
+        if self.ttl_seconds is not None:
+            cutoff = datetime.now().timestamp() - self.ttl_seconds
+            remove_keys = []
+            for tid, snaps in self.checkpoints.items():
+                kept = [s for s in snaps if s.created_at.timestamp() >= cutoff]
+                if kept:
+                    self.checkpoints[tid] = kept[-self.max_checkpoints_per_thread:]
+                else:
+                    remove_keys.append(tid)
+            for tid in remove_keys:
+                self.checkpoints.pop(tid, None)
+                self.last_access.pop(tid, None)
+        if self.max_threads is not None and len(self.checkpoints) > self.max_threads:
+            sorted_threads = sorted(self.last_access.items(), key=lambda kv: kv[1])
+            for tid, _ in sorted_threads[:len(self.checkpoints) - self.max_threads]:
+                self.checkpoints.pop(tid, None)
+                self.last_access.pop(tid, None)
+
+    def save_checkpoint(self, thread_id: str, snapshot: StateSnapshot) -> None:
+        self.last_access[thread_id] = datetime.now()
+        self.checkpoints.setdefault(thread_id, []).append(snapshot)
+        if len(self.checkpoints[thread_id]) > self.max_checkpoints_per_thread:
+            self.checkpoints[thread_id] = self.checkpoints[thread_id][-self.max_checkpoints_per_thread:]
+        self._gc()
+
+    def get_checkpoint(self, thread_id: str, checkpoint_id=None):
+        for checkpoint in self.checkpoints.get(thread_id, []):
+            if checkpoint.metadata.get("checkpoint_id") == checkpoint_id:
+                return checkpoint
+        return None
+
+
+def _snapshot(thread_idx: int, step: int) -> StateSnapshot:
+    return StateSnapshot(
+        values={"step": step},
+        next=("node",),
+        config={},
+        metadata={"checkpoint_id": f"{thread_idx}-{step}"},
+        created_at=datetime.now(),
+    )
+
+
+def run(checkpointer, threads: int, saves: int) -> Dict[str, float]:
+    start = time.perf_counter()
+    for step in range(saves):
+        for t in range(threads):
+            checkpointer.save_checkpoint(f"thread-{t}", _snapshot(t, step))
+    save_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for t in range(threads):
+        checkpointer.get_checkpoint(f"thread-{t}", f"{t}-0")
+    get_time = time.perf_counter() - start
+
+    total_saves = threads * saves
+    return {
+        "save_us": save_time / total_saves * 1e6,
+        "get_by_id_us": get_time / threads * 1e6,
+        "total_s": save_time + get_time,
+        "heap": len(getattr(checkpointer, "_expiry", ())),
+        "snapshots": sum(len(snaps) for snaps in checkpointer.checkpoints.values()),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threads", type=int, default=10_000)
+    parser.add_argument("--saves", type=int, default=2, help="checkpoints saved per thread")
+    parser.add_argument("--max-per-thread", type=int, default=100, help="max_checkpoints_per_thread")
+    args = parser.parse_args()
+
+    # TTL and thread limit enabled so both GC paths run on every save
+    kwargs = {"max_checkpoints_per_thread": args.max_per_thread, "max_threads": args.threads, "ttl_seconds": 3600}
+    for label, cls in (("current", InMemoryCheckpointer), ("legacy", LegacyInMemoryCheckpointer)):
+        result = run(cls(**kwargs), args.threads, args.saves)
+        print(
+            f"{label:>8}: save {result['save_us']:9.1f} us/op   "
+            f"get-by-id {result['get_by_id_us']:7.2f} us/op   total {result['total_s']:.2f} s   "
+            f"heap {result['heap']} entries / {result['snapshots']} snapshots"
+        )
+
+
+if __name__ == "__main__":
+    main()
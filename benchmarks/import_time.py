@@ -0,0 +1,104 @@
+"""
+Startup benchmark: wall time of importing spoon_ai entry points.
+
+Each module is imported in a fresh interpreter ``--repeat`` times and the
+best run is compared against its budget. The run fails (exit status 1) if
+any import exceeds its budget or loads a provider SDK, which should only
+be imported once a provider is used.
+
+Usage:
+    python benchmarks/import_time.py [--repeat 5] [--budget spoon_ai.chat=800]
+    python benchmarks/import_time.py --profile spoon_ai.chat
+"""
+import argparse
+import json
+import subprocess
+import sys
+
+# Budgets in milliseconds, with headroom over a warm-cache run
+DEFAULT_BUDGETS = {
+    "spoon_ai": 150,
+    "spoon_ai.llm": 150,
+    "spoon_ai.chat": 1000,
+    "spoon_ai.agents.toolcall": 1000,
+}
+
+# Imported lazily, by the provider (or tool) that needs them
+DEFERRED_MODULES = ["openai", "anthropic", "google.genai", "pinecone"]
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    "ms": elapsed * 1000,
+    "modules": len(sys.modules),
+    "deferred": [name for name in {deferred!r} if name in sys.modules],
+}}))
+"""
+
+
+def measure(module: str, repeat: int) -> dict:
+    """Best of ``repeat`` imports of ``module``, each in a new interpreter."""
+    best = None
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", _PROBE.format(module=module, deferred=DEFERRED_MODULES)],
+            capture_output=True, text=True, check=True,
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        if best is None or result["ms"] < best["ms"]:
+            best = result
+    return best
+
+
+def profile(module: str, top: int) -> None:
+    """Print the modules with the highest cumulative ``-X importtime``."""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True,
+    ).stderr
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = (part.strip() for part in line.split(":", 1)[1].split("|"))
+        rows.append((int(cumulative_us), int(self_us), name))
+    for cumulative_us, self_us, name in sorted(rows, reverse=True)[:top]:
+        print(f"{cumulative_us / 1000:9.1f} ms cumulative  {self_us / 1000:8.1f} ms self  {name}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--budget", action="append", default=[], metavar="MODULE=MS",
+                        help="budget for a module (added to, or overriding, the defaults)")
+    parser.add_argument("--profile", metavar="MODULE", help="show the slowest imports of MODULE instead")
+    parser.add_argument("--top", type=int, default=25)
+    args = parser.parse_args()
+
+    if args.profile:
+        profile(args.profile, args.top)
+        return
+
+    budgets = dict(DEFAULT_BUDGETS)
+    for item in args.budget:
+        module, _, ms = item.partition("=")
+        budgets[module] = float(ms)
+
+    failed = False
+    for module, budget in budgets.items():
+        result = measure(module, args.repeat)
+        over = result["ms"] > budget
+        failed |= over or bool(result["deferred"])
+        status = "OVER BUDGET" if over else "ok"
+        print(f"{module:28s} {result['ms']:8.1f} ms  (budget {budget:6.0f} ms)  "
+              f"{result['modules']:5d} modules  {status}")
+        if result["deferred"]:
+            print(f"{'':28s} loaded deferred modules: {', '.join(result['deferred'])}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Offline benchmark: LLMManager.chat_batch against a one-call-at-a-time loop.
+
+Uses the local fake provider, so no network access or API keys are needed.
+The fake server accepts a limited number of concurrent requests and answers
+429 beyond that, which exercises the adaptive (AIMD) concurrency.
+
+Usage:
+    python benchmarks/llm_batch.py [--requests 500] [--latency 0.02]
+        [--server-concurrency 16] [--max-concurrency 64] [--instances 1]
+"""
+import argparse
+import asyncio
+import logging
+import time
+
+from spoon_ai.llm.batch import BatchRunner
+from spoon_ai.llm.config import ConfigurationManager
+from spoon_ai.llm.manager import LLMManager
+from spoon_ai.schema import Message
+
+
+def _manager(latency: float, server_concurrency: int, instances: int) -> LLMManager:
+    config_manager = ConfigurationManager()
+    config_manager._config_cache = {
+        "llm_settings": {"default_provider": "fake", "fallback_chain": ["fake"]},
+        "providers": {
+            "fake": {
+                "api_key": "offline",
+                "extra_params": {
+                    "fake_latency": latency,
+                    "fake_max_concurrency": server_concurrency,
+                    "fake_seed": 0,
+                },
+            }
+        },
+    }
+    if instances > 1:
+        # One pool instance per simulated API key
+        config_manager._config_cache["providers"]["fake"]["instances"] = [
+            {"api_key": f"offline-{i}"} for i in range(instances)
+        ]
+    manager = LLMManager(config_manager=config_manager)
+    manager.disable_coalescing()
+    # The fake server's 429s clear as soon as a request finishes
+    manager.rate_limit_cooldown = 0.05
+    return manager
+
+
+def _requests(n: int):
+    return [[Message(role="user", content=f"Summarize document {i}")] for i in range(n)]
+
+
+async def sequential(manager: LLMManager, n: int) -> float:
+    start = time.perf_counter()
+    for messages in _requests(n):
+        await manager.chat(messages)
+    return time.perf_counter() - start
+
+
+async def batched(manager: LLMManager, n: int, max_concurrency: int):
+    runner = BatchRunner(manager, _requests(n), max_concurrency=max_concurrency, retry_backoff=0.01, max_retries=50)
+    start = time.perf_counter()
+    failed = sum(1 for result in [r async for r in runner.run()] if not result.ok)
+    return time.perf_counter() - start, failed, runner
+
+
+async def main_async(args) -> None:
+    manager = _manager(args.latency, args.server_concurrency, args.instances)
+
+    seq_n = min(args.requests, args.sequential_requests)
+    seq_time = await sequential(manager, seq_n)
+    print(f"sequential: {seq_n / seq_time:8.1f} req/s   ({seq_n} requests in {seq_time:.2f} s)")
+
+    batch_time, failed, runner = await batched(manager, args.requests, args.max_concurrency)
+    print(
+        f"chat_batch: {args.requests / batch_time:8.1f} req/s   ({args.requests} requests in {batch_time:.2f} s, "
+        f"{failed} failed, {runner.stats['throttled']} throttled, "
+        f"final concurrency {int(runner.limiter.limit)}, {runner.limiter.decreases} decreases)"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--sequential-requests", type=int, default=50, help="requests timed for the sequential loop")
+    parser.add_argument("--latency", type=float, default=0.02, help="simulated provider latency in seconds")
+    parser.add_argument("--server-concurrency", type=int, default=16, help="concurrent requests before the fake server answers 429")
+    parser.add_argument("--max-concurrency", type=int, default=64)
+    parser.add_argument("--instances", type=int, default=1, help="provider pool instances (simulated API keys)")
+    args = parser.parse_args()
+    # Throttled attempts are expected here; keep the per-request error logs quiet
+    logging.getLogger("spoon_ai").setLevel(logging.CRITICAL)
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
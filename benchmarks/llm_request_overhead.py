@@ -0,0 +1,102 @@
+"""
+Offline benchmark: per-request CPU spent preparing a long conversation.
+
+Simulates an agent loop on a ``--history``-message conversation (user,
+assistant tool call and tool result turns): every request resends the whole
+history plus one new message. For each request it measures the config
+lookup the manager does before dispatch and the provider's message
+conversion (Anthropic and Gemini tool-calling formats), once the old way
+(``config.model_dump()`` per request, conversion cache disabled) and once
+with the cached config mapping and ``MessageConversionCache``.
+
+Usage:
+    python benchmarks/llm_request_overhead.py [--history 200] [--requests 200] [--profile]
+"""
+import argparse
+import cProfile
+import pstats
+import time
+
+from spoon_ai.llm.cache import MessageConversionCache
+from spoon_ai.llm.config import ProviderConfig
+from spoon_ai.llm.manager import LLMManager
+from spoon_ai.llm.providers.anthropic_provider import AnthropicProvider
+from spoon_ai.llm.providers.gemini_provider import GeminiProvider
+from spoon_ai.schema import Function, Message, ToolCall
+
+
+class _StaticConfigs:
+    def __init__(self):
+        self.config = ProviderConfig(name="bench", api_key="offline", model="m",
+                                     extra_params={"a": 1}, custom_headers={"x-team": "bench"})
+
+    def load_provider_config(self, provider_name):
+        return self.config
+
+
+def _history(size: int):
+    messages = [Message(id="sys", role="system", content="You are a careful research agent. " * 20)]
+    turn = 0
+    while len(messages) < size:
+        call = ToolCall(id=f"call-{turn}", function=Function(
+            name="search", arguments=f'{{"query": "topic {turn}", "limit": 10, "filters": {{"lang": "en"}}}}'))
+        messages += [
+            Message(id=f"u{turn}", role="user", content=f"Follow up on finding {turn}. " * 8),
+            Message(id=f"a{turn}", role="assistant", content="", tool_calls=[call]),
+            Message(id=f"t{turn}", role="tool", content=f"result {turn}: " + "lorem ipsum " * 40,
+                    tool_call_id=f"call-{turn}"),
+        ]
+        turn += 1
+    return messages[:size]
+
+
+def run(history, requests: int, cached: bool):
+    anthropic_provider = AnthropicProvider()
+    gemini_provider = GeminiProvider()
+    if not cached:
+        anthropic_provider.message_cache = MessageConversionCache(max_entries=0)
+        gemini_provider.message_cache = MessageConversionCache(max_entries=0)
+    manager = LLMManager.__new__(LLMManager)
+    manager.config_manager = _StaticConfigs()
+    manager._config_snapshots = {}
+
+    messages = list(history)
+    timings = []
+    for i in range(requests):
+        messages.append(Message(id=f"new{i}", role="user", content=f"next step {i}"))
+        start = time.process_time_ns()
+        if cached:
+            manager._get_provider_config("bench")
+        else:
+            manager.config_manager.load_provider_config("bench").model_dump()
+        anthropic_provider._convert_messages(messages)
+        gemini_provider._convert_messages_for_tools(messages)
+        timings.append(time.process_time_ns() - start)
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--history", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--profile", action="store_true", help="print the top functions of each mode")
+    args = parser.parse_args()
+
+    history = _history(args.history)
+    for name, cached in (("uncached", False), ("cached", True)):
+        if args.profile:
+            profiler = cProfile.Profile()
+            profiler.enable()
+        timings = run(history, args.requests, cached)
+        if args.profile:
+            profiler.disable()
+        timings.sort()
+        mean = sum(timings) / len(timings) / 1000
+        p99 = timings[int(0.99 * (len(timings) - 1))] / 1000
+        print(f"{name:9s} per request CPU mean {mean:8.1f} us   p99 {p99:8.1f} us   ({len(history)}+ messages)")
+        if args.profile:
+            pstats.Stats(profiler).sort_stats("cumulative").print_stats(8)
+
+
+if __name__ == "__main__":
+    main()
@@ -12,6 +12,7 @@ from fastapi.responses import HTMLResponse
 from pydantic import BaseModel
 
 from relationship_spark_agent import create_default_relationship_agent
+from spoon_ai.telemetry import metrics_router
 
 # ---------- FastAPI 初始化 ----------
 app = FastAPI(title="Relationship Spark Agent API")
@@ -24,6 +25,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# ---------- 指标（Prometheus / OpenMetrics） ----------
+app.include_router(metrics_router())
+
 # ---------- Agent 实例 ----------
 agent = create_default_relationship_agent()
 
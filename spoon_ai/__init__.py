@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+from importlib import import_module
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 try:  # Python 3.12+
     from importlib.metadata import PackageNotFoundError, version as _dist_version
@@ -61,8 +63,33 @@ def _resolve_version() -> str:
 
 __version__: str = _resolve_version()
 
-from spoon_ai.chat import ChatBot
-from spoon_ai.schema import LLMResponse, LLMResponseChunk, Message
+# Public names and the modules defining them. They are imported on first
+# access (PEP 562) so that ``import spoon_ai`` does not load the LLM stack
+# and every provider SDK behind it.
+_LAZY_ATTRS = {
+    "ChatBot": "spoon_ai.chat",
+    "Message": "spoon_ai.schema",
+    "LLMResponse": "spoon_ai.schema",
+    "LLMResponseChunk": "spoon_ai.schema",
+}
+
+if TYPE_CHECKING:
+    from spoon_ai.chat import ChatBot
+    from spoon_ai.schema import LLMResponse, LLMResponseChunk, Message
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
 
 __all__ = [
     "__version__",
@@ -71,9 +98,3 @@ __all__ = [
     "LLMResponse",
     "LLMResponseChunk",
 ]
-
-
-
-
-
-
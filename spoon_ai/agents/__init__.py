@@ -1,3 +1,31 @@
-from .spoon_react import SpoonReactAI
-from .toolcall import ToolCallAgent
-from .spoon_react_mcp import SpoonReactMCP
\ No newline at end of file
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+# Agents are imported on first access (PEP 562), so importing one agent
+# module does not load the others and their dependencies.
+_LAZY_ATTRS = {
+    "SpoonReactAI": ".spoon_react",
+    "ToolCallAgent": ".toolcall",
+    "SpoonReactMCP": ".spoon_react_mcp",
+}
+
+if TYPE_CHECKING:
+    from .spoon_react import SpoonReactAI
+    from .toolcall import ToolCallAgent
+    from .spoon_react_mcp import SpoonReactMCP
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
+
+__all__ = ["SpoonReactAI", "ToolCallAgent", "SpoonReactMCP"]
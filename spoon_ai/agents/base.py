@@ -17,8 +17,13 @@ from spoon_ai.chat import ChatBot, Memory
 from spoon_ai.schema import AgentState, ToolCall
 from spoon_ai.callbacks.base import BaseCallbackHandler
 from spoon_ai.callbacks.manager import CallbackManager
+from spoon_ai.telemetry import REGISTRY, traced
 
 logger = logging.getLogger(__name__)
+
+_AGENT_RUNS = REGISTRY.counter("spoon_agent_runs", "Agent runs by outcome.", ["agent", "status"])
+_AGENT_RUN_SECONDS = REGISTRY.histogram("spoon_agent_run_duration_seconds", "Agent run time in seconds.", ["agent"])
+_AGENT_STEPS = REGISTRY.counter("spoon_agent_steps", "Agent steps executed.", ["agent"])
 DEBUG = False
 
 def debug_log(message):
@@ -269,6 +274,7 @@ class BaseAgent(BaseModel, ABC):
         if len(self._state_transition_history) > self._max_history:
             self._state_transition_history.pop(0)
 
+    @traced("agent.run", lambda self, *args, **kwargs: {"agent": self.name, "agent.class": type(self).__name__})
     async def run(self, request: Optional[str] = None, timeout: Optional[float] = None) -> str:
         """Thread-safe run method with proper concurrency control and callback support."""
         timeout = timeout or self._default_timeout
@@ -295,6 +301,8 @@ class BaseAgent(BaseModel, ABC):
 
         results: List[str] = []
         operation_id = str(uuid.uuid4())
+        run_started = time.perf_counter()
+        run_status = "error"
 
         try:
             self._active_operations.add(operation_id)
@@ -307,6 +315,7 @@ class BaseAgent(BaseModel, ABC):
                         not self._shutdown_event.is_set()
                     ):
                         self.current_step += 1
+                        _AGENT_STEPS.labels(self.name).inc()
                         logger.info(f"Agent {self.name} is running step {self.current_step}/{self.max_steps}")
 
                         # Execute step with timeout protection
@@ -329,9 +338,11 @@ class BaseAgent(BaseModel, ABC):
                         results.append(f"Step {self.current_step}: Reached maximum steps. Stopping.")
 
             final_output = "\n".join(results) if results else "No results"
+            run_status = "success"
             return final_output
 
         except asyncio.TimeoutError as e:
+            run_status = "timeout"
             logger.error(f"Agent {self.name} run() timed out after {timeout}s")
             
             raise RuntimeError(f"Agent run timed out after {timeout}s")
@@ -342,6 +353,7 @@ class BaseAgent(BaseModel, ABC):
             raise
         finally:
             self._active_operations.discard(operation_id)
+            self._record_run(run_status, run_started)
 
             # Always reset to IDLE state safely
             async with self._state_lock:
@@ -350,6 +362,11 @@ class BaseAgent(BaseModel, ABC):
                     self.state = AgentState.IDLE
                     self.current_step = 0
 
+    def _record_run(self, status: str, started: float) -> None:
+        """Export the outcome and duration of a run() call."""
+        _AGENT_RUNS.labels(self.name, status).inc()
+        _AGENT_RUN_SECONDS.labels(self.name).observe(time.perf_counter() - started)
+
     async def step(self, run_id: Optional[uuid.UUID] = None) -> str:
         """Override this method in subclasses - now with step-level locking and callback support."""
         async with self._step_lock:
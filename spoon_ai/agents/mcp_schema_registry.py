@@ -0,0 +1,198 @@
+"""
+Process-wide registry of MCP tool schemas, keyed by server (see
+``transport_key``).
+
+Agents and tools talking to the same server share one discovery: the first
+lookup lists the server's tools, later lookups (from any agent) are a dict
+lookup. Each schema carries its provider-ready function spec, built once,
+and a content hash; refreshes keep unchanged schemas (and their specs) as
+the same objects. Schemas are refreshed in the background when a server
+announces that its tool list changed, or when they are older than
+``max_age``, while the cached ones keep serving.
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+from logging import getLogger
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+from spoon_ai.telemetry import REGISTRY
+
+logger = getLogger(__name__)
+
+_SCHEMA_FETCHES = REGISTRY.counter("spoon_mcp_schema_fetches", "MCP tool list fetches by outcome.", ["result"])
+_SCHEMA_LOOKUPS = REGISTRY.counter("spoon_mcp_schema_lookups", "MCP tool schema registry lookups.", ["result"])
+
+_EMPTY_PARAMETERS = {"type": "object", "properties": {}, "required": []}
+
+
+class ToolSchema:
+    """One MCP tool with its provider-ready function spec and content hash."""
+
+    __slots__ = ("name", "description", "parameters", "spec", "spec_json", "digest")
+
+    def __init__(self, name: str, description: str, parameters: Dict[str, Any]):
+        self.name = name
+        self.description = description
+        self.parameters = parameters
+        self.spec = {
+            "type": "function",
+            "function": {"name": name, "description": description, "parameters": parameters},
+        }
+        self.spec_json = json.dumps(self.spec, sort_keys=True, separators=(",", ":"), default=str)
+        self.digest = hashlib.sha256(self.spec_json.encode()).hexdigest()[:16]
+
+    @classmethod
+    def from_mcp(cls, tool: Any) -> "ToolSchema":
+        """Build from an ``mcp.types.Tool``, a tool dict or a tool object."""
+        if isinstance(tool, dict):
+            get = tool.get
+        else:
+            get = lambda attr: getattr(tool, attr, None)  # noqa: E731
+        parameters = get("inputSchema") or get("parameters") or dict(_EMPTY_PARAMETERS)
+        return cls(get("name") or "mcp_tool", get("description") or "", parameters)
+
+
+class ServerSchemas:
+    """Snapshot of the tools one server exposes."""
+
+    def __init__(self, key: str, tools: Iterable[ToolSchema]):
+        self.key = key
+        self.tools: Dict[str, ToolSchema] = {tool.name: tool for tool in tools}
+        self.specs: List[Dict[str, Any]] = [tool.spec for tool in self.tools.values()]
+        self.digest = hashlib.sha256("".join(tool.digest for tool in self.tools.values()).encode()).hexdigest()[:16]
+        self.fetched_at = time.monotonic()
+
+    def get(self, name: str) -> Optional[ToolSchema]:
+        return self.tools.get(name)
+
+    def __len__(self) -> int:
+        return len(self.tools)
+
+
+class MCPSchemaRegistry:
+    """Shared MCP tool schemas, one ``ServerSchemas`` per server key.
+
+    Args:
+        max_age: Seconds after which a lookup also schedules a background
+            refresh (for servers that do not send list-changed
+            notifications). None to rely on notifications only
+    """
+
+    def __init__(self, max_age: Optional[float] = 300.0):
+        self.max_age = max_age
+        self._servers: Dict[str, ServerSchemas] = {}
+        self._fetchers: Dict[str, Callable[[], Awaitable[List[Any]]]] = {}
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._refreshes: Dict[str, int] = {}
+
+    async def get(self, key: str, fetch: Optional[Callable[[], Awaitable[List[Any]]]] = None) -> ServerSchemas:
+        """Schemas of a server, listing its tools on first use.
+
+        Concurrent first lookups share one fetch.
+
+        Args:
+            key: Server key
+            fetch: Lists the server's tools; remembered for background
+                refreshes
+
+        Raises:
+            KeyError: If the server is unknown and no fetch was given
+        """
+        if fetch is not None:
+            self._fetchers[key] = fetch
+        schemas = self._servers.get(key)
+        if schemas is not None:
+            _SCHEMA_LOOKUPS.labels("hit").inc()
+            if self.max_age and time.monotonic() - schemas.fetched_at > self.max_age:
+                self.schedule_refresh(key)
+            return schemas
+        _SCHEMA_LOOKUPS.labels("miss").inc()
+        return await self.refresh(key)
+
+    def peek(self, key: str) -> Optional[ServerSchemas]:
+        """Cached schemas of a server without fetching."""
+        return self._servers.get(key)
+
+    async def refresh(self, key: str) -> ServerSchemas:
+        """List the server's tools now (joining a fetch already in flight)."""
+        task = self._inflight.get(key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = self._inflight[key] = asyncio.ensure_future(self._fetch(key))
+            task.add_done_callback(lambda done: self._inflight.pop(key, None) if self._inflight.get(key) is done else None)
+        return await asyncio.shield(task)
+
+    def schedule_refresh(self, key: str) -> Optional[asyncio.Task]:
+        """Refresh in the background; cached schemas keep serving meanwhile
+        and on failure.
+
+        Returns:
+            Optional[asyncio.Task]: The refresh, or None if the server was
+            never fetched
+        """
+        if key not in self._fetchers:
+            return None
+        task = self._inflight.get(key)
+        if task is not None and task.get_loop() is asyncio.get_running_loop():
+            return task
+        task = asyncio.ensure_future(self.refresh(key))
+        task.add_done_callback(self._log_refresh_error)
+        return task
+
+    @staticmethod
+    def _log_refresh_error(task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Background MCP schema refresh failed: {task.exception()}")
+
+    async def _fetch(self, key: str) -> ServerSchemas:
+        fetch = self._fetchers.get(key)
+        if fetch is None:
+            raise KeyError(f"No MCP tool fetcher registered for server {key}")
+        try:
+            tools = await fetch()
+        except Exception:
+            _SCHEMA_FETCHES.labels("failed").inc()
+            raise
+        self._refreshes[key] = self._refreshes.get(key, 0) + 1
+
+        previous = self._servers.get(key)
+        fresh = []
+        for tool in tools or []:
+            schema = ToolSchema.from_mcp(tool)
+            kept = previous.get(schema.name) if previous else None
+            fresh.append(kept if kept is not None and kept.digest == schema.digest else schema)
+        schemas = ServerSchemas(key, fresh)
+
+        if previous is not None and previous.digest == schemas.digest:
+            previous.fetched_at = schemas.fetched_at
+            _SCHEMA_FETCHES.labels("unchanged").inc()
+            return previous
+        self._servers[key] = schemas
+        _SCHEMA_FETCHES.labels("changed").inc()
+        logger.debug(f"MCP server {key} exposes {len(schemas)} tools (schema {schemas.digest})")
+        return schemas
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """Forget the schemas of one server, or of all servers."""
+        if key is None:
+            self._servers.clear()
+        else:
+            self._servers.pop(key, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        return {
+            key: {
+                "tools": len(schemas),
+                "digest": schemas.digest,
+                "age": now - schemas.fetched_at,
+                "fetches": self._refreshes.get(key, 0),
+            }
+            for key, schemas in self._servers.items()
+        }
+
+
+# Shared by every agent and MCP tool in the process
+SCHEMA_REGISTRY = MCPSchemaRegistry()
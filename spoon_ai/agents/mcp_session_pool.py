@@ -0,0 +1,363 @@
+"""
+Process-wide pool of long-lived MCP client sessions.
+
+Every tool and agent that talks to the same MCP server (same transport
+configuration) shares one warm ``fastmcp`` client. MCP sessions multiplex
+concurrent requests, so callers borrow the session for the duration of a
+request instead of connecting and disconnecting around it. A background task
+per server pings it, reconnects broken sessions off the request path and
+closes sessions that have been idle for too long.
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+from contextlib import asynccontextmanager
+from logging import getLogger
+from typing import Any, AsyncIterator, Callable, Dict, Optional
+
+from fastmcp.client import Client as MCPClient
+
+from spoon_ai.telemetry import REGISTRY
+
+logger = getLogger(__name__)
+
+_SESSION_EVENTS = REGISTRY.counter("spoon_mcp_session_events", "MCP client session lifecycle events.", ["event"])
+_SESSIONS_ACTIVE = REGISTRY.gauge("spoon_mcp_sessions_active", "Open MCP client sessions.")
+_CALLS_IN_FLIGHT = REGISTRY.gauge("spoon_mcp_calls_in_flight", "MCP requests currently using a pooled session.")
+_HEALTH_CHECKS = REGISTRY.counter("spoon_mcp_health_checks", "Background MCP session health checks.", ["result"])
+_ACQUIRE_SECONDS = REGISTRY.histogram("spoon_mcp_session_acquire_seconds",
+                                      "Time spent waiting for a pooled MCP session in seconds.")
+
+
+def _digest(value: Any) -> str:
+    return hashlib.sha1(json.dumps(value, sort_keys=True, default=str).encode()).hexdigest()[:12]
+
+
+def transport_key(transport: Any) -> str:
+    """Identity of the MCP server a transport connects to.
+
+    Transports with the same URL and headers, or the same command, arguments,
+    environment and working directory, share a pooled session. Headers and
+    environment are hashed so credentials never show up in keys or stats.
+    In-memory transports are keyed by the server object they wrap.
+    """
+    if isinstance(transport, str):
+        return transport
+    kind = type(transport).__name__
+    url = getattr(transport, "url", None)
+    if url:
+        return f"{kind}:{url}#{_digest(getattr(transport, 'headers', None))}"
+    command = getattr(transport, "command", None)
+    if command:
+        args = " ".join(str(arg) for arg in getattr(transport, "args", None) or [])
+        env = [getattr(transport, "env", None), getattr(transport, "cwd", None)]
+        return f"{kind}:{command} {args}#{_digest(env)}"
+    server = getattr(transport, "server", None)
+    return f"{kind}:{id(server if server is not None else transport)}"
+
+
+class PooledSession:
+    """The warm client of one MCP server, shared by every borrower.
+
+    Bound to the event loop it was created on; the pool replaces it when the
+    server is used from another loop.
+    """
+
+    def __init__(self,
+                 key: str,
+                 factory: Callable[[], MCPClient],
+                 max_concurrency: Optional[int] = None,
+                 health_check_interval: float = 30.0,
+                 health_check_timeout: float = 10.0,
+                 idle_timeout: Optional[float] = 600.0):
+        self.key = key
+        self.factory = factory
+        self.max_concurrency = max_concurrency
+        self.health_check_interval = health_check_interval
+        self.health_check_timeout = health_check_timeout
+        self.idle_timeout = idle_timeout
+        self.loop = asyncio.get_running_loop()
+        self.client: Optional[MCPClient] = None
+        self.healthy = True
+        self.in_flight = 0
+        self.total_calls = 0
+        self.connects = 0
+        self.reconnects = 0
+        self.failures = 0
+        self.last_used = time.monotonic()
+        self.last_health_check: Optional[float] = None
+        self._lock = asyncio.Lock()
+        self._slots = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+        self._monitor: Optional[asyncio.Task] = None
+
+    @property
+    def connected(self) -> bool:
+        return self.client is not None and self.client.is_connected()
+
+    async def connect(self) -> MCPClient:
+        """Return the warm client, (re)connecting it if it dropped or failed
+        its last health check.
+
+        Raises:
+            ConnectionError: If the server cannot be reached
+        """
+        if self.connected and self.healthy:
+            return self.client
+        async with self._lock:
+            if self.connected and self.healthy:
+                return self.client
+            if self.client is not None:
+                logger.info(f"Reconnecting MCP session for {self.key}")
+                await self._close_client()
+                self.reconnects += 1
+                _SESSION_EVENTS.labels("reconnected").inc()
+
+            client = self.factory()
+            try:
+                await client.__aenter__()
+            except Exception as e:
+                self.failures += 1
+                self.healthy = False
+                _SESSION_EVENTS.labels("failed").inc()
+                raise ConnectionError(f"Could not connect to MCP server {self.key}: {e}") from e
+
+            self.client = client
+            self.healthy = True
+            self.connects += 1
+            _SESSION_EVENTS.labels("created").inc()
+            _SESSIONS_ACTIVE.inc()
+            logger.debug(f"Opened pooled MCP session for {self.key}")
+            if self.health_check_interval and (self._monitor is None or self._monitor.done()):
+                self._monitor = asyncio.create_task(self._monitor_loop())
+            return client
+
+    @asynccontextmanager
+    async def lease(self) -> AsyncIterator[MCPClient]:
+        """Borrow the client for one request.
+
+        Raises:
+            ConnectionError: If the server cannot be reached, or the session
+                dropped while the request was using it (the next lease
+                reconnects)
+        """
+        started = time.perf_counter()
+        if self._slots is not None:
+            await self._slots.acquire()
+        try:
+            client = await self.connect()
+            _ACQUIRE_SECONDS.observe(time.perf_counter() - started)
+            self.in_flight += 1
+            self.total_calls += 1
+            _CALLS_IN_FLIGHT.inc()
+            try:
+                yield client
+            except Exception as e:
+                if client is self.client and not client.is_connected():
+                    self.healthy = False
+                    raise ConnectionError(f"MCP session for {self.key} dropped: {e}") from e
+                raise
+            finally:
+                self.in_flight -= 1
+                self.last_used = time.monotonic()
+                _CALLS_IN_FLIGHT.dec()
+        finally:
+            if self._slots is not None:
+                self._slots.release()
+
+    async def check_health(self) -> bool:
+        """Ping the server and reconnect if it does not answer."""
+        client = self.client
+        try:
+            ok = client is not None and client.is_connected() and bool(
+                await asyncio.wait_for(client.ping(), timeout=self.health_check_timeout))
+        except Exception as e:
+            logger.warning(f"MCP health check failed for {self.key}: {e}")
+            ok = False
+        self.last_health_check = time.monotonic()
+        _HEALTH_CHECKS.labels("ok" if ok else "failed").inc()
+        if not ok:
+            self.healthy = False
+            try:
+                await self.connect()
+            except ConnectionError as e:
+                logger.warning(str(e))
+        return ok
+
+    async def _monitor_loop(self) -> None:
+        while self.client is not None:
+            await asyncio.sleep(self.health_check_interval)
+            if self.client is None:
+                return
+            idle = time.monotonic() - self.last_used
+            if self.idle_timeout and self.in_flight == 0 and idle >= self.idle_timeout:
+                logger.debug(f"Closing MCP session for {self.key} after {idle:.0f}s idle")
+                _SESSION_EVENTS.labels("idle_closed").inc()
+                async with self._lock:
+                    await self._close_client()
+                return
+            if self.in_flight == 0 or not self.healthy:
+                await self.check_health()
+
+    async def _close_client(self) -> None:
+        client, self.client = self.client, None
+        if client is None:
+            return
+        _SESSIONS_ACTIVE.dec()
+        try:
+            await client.close()
+            _SESSION_EVENTS.labels("closed").inc()
+        except Exception as e:
+            logger.warning(f"Error closing MCP session for {self.key}: {e}")
+            _SESSION_EVENTS.labels("failed").inc()
+
+    async def close(self) -> None:
+        monitor, self._monitor = self._monitor, None
+        if monitor is not None and monitor is not asyncio.current_task():
+            monitor.cancel()
+            await asyncio.gather(monitor, return_exceptions=True)
+        async with self._lock:
+            await self._close_client()
+
+    def get_stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        return {
+            "server": self.key,
+            "connected": self.connected,
+            "healthy": self.healthy,
+            "in_flight": self.in_flight,
+            "max_concurrency": self.max_concurrency,
+            "total_calls": self.total_calls,
+            "connects": self.connects,
+            "reconnects": self.reconnects,
+            "failures": self.failures,
+            "idle_seconds": now - self.last_used,
+            "last_health_check_age": None if self.last_health_check is None else now - self.last_health_check,
+        }
+
+
+class MCPSessionPool:
+    """Long-lived MCP sessions keyed by server (see ``transport_key``).
+
+    Args:
+        max_concurrency: Requests allowed in flight per server; further
+            requests queue for a slot. None for no limit
+        health_check_interval: Seconds between background pings of an idle
+            session, 0 to disable the background task
+        health_check_timeout: Seconds to wait for a ping
+        idle_timeout: Seconds without requests after which a session is
+            closed (reopened on next use). None to keep sessions forever
+    """
+
+    def __init__(self,
+                 max_concurrency: Optional[int] = 10,
+                 health_check_interval: float = 30.0,
+                 health_check_timeout: float = 10.0,
+                 idle_timeout: Optional[float] = 600.0):
+        self.max_concurrency = max_concurrency
+        self.health_check_interval = health_check_interval
+        self.health_check_timeout = health_check_timeout
+        self.idle_timeout = idle_timeout
+        self._sessions: Dict[str, PooledSession] = {}
+        self._owners: Dict[str, int] = {}
+        self._intervals: Dict[str, float] = {}
+
+    def retain(self, key: str, health_check_interval: Optional[float] = None) -> None:
+        """Register a user of a server; its session stays open until the last
+        user releases it (or it idles out).
+
+        Args:
+            key: Server key
+            health_check_interval: Requested ping interval; the shortest
+                request for a server wins
+        """
+        self._owners[key] = self._owners.get(key, 0) + 1
+        if health_check_interval:
+            current = self._intervals.get(key)
+            self._intervals[key] = min(current, health_check_interval) if current else health_check_interval
+            entry = self._sessions.get(key)
+            if entry is not None:
+                entry.health_check_interval = self._intervals[key]
+
+    async def release(self, key: str) -> None:
+        """Drop one user of a server, closing its session after the last."""
+        remaining = self._owners.get(key, 0) - 1
+        if remaining > 0:
+            self._owners[key] = remaining
+            return
+        self._owners.pop(key, None)
+        self._intervals.pop(key, None)
+        await self.close(key)
+
+    def _entry(self, key: str, factory: Callable[[], MCPClient]) -> PooledSession:
+        loop = asyncio.get_running_loop()
+        entry = self._sessions.get(key)
+        if entry is not None and entry.loop is not loop:
+            # Sessions cannot move between event loops; the old loop owns
+            # (and on shutdown closed) the previous connection
+            if entry.client is not None:
+                _SESSIONS_ACTIVE.dec()
+            entry = None
+        if entry is None:
+            entry = self._sessions[key] = PooledSession(
+                key,
+                factory,
+                max_concurrency=self.max_concurrency,
+                health_check_interval=self._intervals.get(key, self.health_check_interval),
+                health_check_timeout=self.health_check_timeout,
+                idle_timeout=self.idle_timeout,
+            )
+        return entry
+
+    @asynccontextmanager
+    async def session(self, key: str, factory: Callable[[], MCPClient]) -> AsyncIterator[MCPClient]:
+        """Borrow the warm session of a server, connecting it on first use.
+
+        Args:
+            key: Server key
+            factory: Builds a new (unconnected) client for the server
+
+        Raises:
+            ConnectionError: If the server cannot be reached or the session
+                dropped mid-request
+        """
+        entry = self._entry(key, factory)
+        if entry.client is not None:
+            _SESSION_EVENTS.labels("reused").inc()
+        async with entry.lease() as client:
+            yield client
+
+    def is_healthy(self, key: str) -> bool:
+        """Result of the last connection attempt or background health check.
+
+        Never does I/O; a server that was not used yet counts as healthy.
+        """
+        entry = self._sessions.get(key)
+        return entry is None or entry.healthy
+
+    async def close(self, key: Optional[str] = None) -> None:
+        """Close the session of one server, or of all servers."""
+        keys = [key] if key is not None else list(self._sessions)
+        loop = asyncio.get_running_loop()
+        for name in keys:
+            entry = self._sessions.pop(name, None)
+            if entry is None:
+                continue
+            if entry.loop is loop:
+                await entry.close()
+            elif entry.client is not None:
+                _SESSIONS_ACTIVE.dec()
+
+    def get_stats(self, key: Optional[str] = None) -> Dict[str, Any]:
+        """Stats of one server's session, or of every pooled session by key."""
+        if key is not None:
+            entry = self._sessions.get(key)
+            stats = entry.get_stats() if entry else {"server": key, "connected": False, "healthy": True}
+            return {**stats, "owners": self._owners.get(key, 0)}
+        return {name: {**entry.get_stats(), "owners": self._owners.get(name, 0)}
+                for name, entry in self._sessions.items()}
+
+
+# Shared by every MCP client in the process
+SESSION_POOL = MCPSessionPool()
@@ -21,31 +21,36 @@ class SpoonReactMCP(SpoonReactAI):
         super().__init__(**kwargs)
         logger.info(f"Initialized SpoonReactMCP agent: {self.name}")
 
-    async def list_mcp_tools(self):
-        """Return MCP tools from available_tools manager"""
-        # Import here to avoid circular imports
-        from mcp.types import Tool as MCPTool
+    async def _load_mcp_tools(self):
+        """Load the server schemas of the MCP tools in available_tools.
 
-        # Return MCP tools that are available in the tool manager
-        # Create proper MCPTool objects that match the expected interface
-        mcp_tools = []
+        Schemas come from the shared MCP schema registry, so tools of a server
+        another agent already discovered load without a server round trip.
+        """
+        mcp_tool_instances = [tool for tool in self.available_tools.tool_map.values() if hasattr(tool, 'mcp_config')]
+        # Each tool is loaded once per agent; failures are not retried every step
+        attempted = getattr(self, '_mcp_tools_attempted', None)
+        if attempted is None:
+            attempted = self._mcp_tools_attempted = set()
+        pending = [tool for tool in mcp_tool_instances
+                   if hasattr(tool, 'ensure_parameters_loaded') and id(tool) not in attempted]
+        if not pending:
+            return mcp_tool_instances
+        attempted.update(id(tool) for tool in pending)
 
         # Pre-load parameters for all MCP tools concurrently
         async def load_tool_params(tool):
-            if hasattr(tool, 'ensure_parameters_loaded'):
-                try:
-                    # Derive a sensible timeout from the tool's own connection timeout
-                    base_timeout = float(getattr(tool, '_connection_timeout', 30))
-                    preload_timeout = max(15.0, min(base_timeout + 10.0, 60.0))
-                    await asyncio.wait_for(tool.ensure_parameters_loaded(), timeout=preload_timeout)
-                except asyncio.TimeoutError:
-                    logger.warning(f"Timeout loading parameters for tool: {tool.name}")
-                except Exception as e:
-                    logger.warning(f"Failed loading parameters for tool {tool.name}: {e}")
-            return tool
+            try:
+                # Derive a sensible timeout from the tool's own connection timeout
+                base_timeout = float(getattr(tool, '_connection_timeout', 30))
+                preload_timeout = max(15.0, min(base_timeout + 10.0, 60.0))
+                await asyncio.wait_for(tool.ensure_parameters_loaded(), timeout=preload_timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f"Timeout loading parameters for tool: {tool.name}")
+            except Exception as e:
+                logger.warning(f"Failed loading parameters for tool {tool.name}: {e}")
 
-        mcp_tool_instances = [tool for tool in self.available_tools.tool_map.values() if hasattr(tool, 'mcp_config')]
-        loaded_tools = await asyncio.gather(*[load_tool_params(tool) for tool in mcp_tool_instances])
+        await asyncio.gather(*[load_tool_params(tool) for tool in pending])
 
         # Some MCP tools may have updated their name after fetching server schema
         # Ensure the ToolManager reflects any dynamic renames
@@ -54,6 +59,21 @@ class SpoonReactMCP(SpoonReactAI):
                 self.available_tools.reindex()
         except Exception:
             pass
+        return mcp_tool_instances
+
+    async def _get_mcp_tool_specs(self):
+        """Specs of the MCP tools in available_tools (prebuilt by the schema registry)."""
+        return [tool.to_param() for tool in await self._load_mcp_tools()]
+
+    async def list_mcp_tools(self):
+        """Return MCP tools from available_tools manager"""
+        # Import here to avoid circular imports
+        from mcp.types import Tool as MCPTool
+
+        # Return MCP tools that are available in the tool manager
+        # Create proper MCPTool objects that match the expected interface
+        mcp_tools = []
+        loaded_tools = await self._load_mcp_tools()
 
         for tool in loaded_tools:
             # Create proper MCPTool instance for the tool system
@@ -8,18 +8,24 @@ import logging
 from pydantic import AliasChoices, Field
 from termcolor import colored
 
+from spoon_ai.agents.base import _AGENT_STEPS
 from spoon_ai.agents.react import ReActAgent
 from spoon_ai.prompts.toolcall import \
     NEXT_STEP_PROMPT as TOOLCALL_NEXT_STEP_PROMPT
 from spoon_ai.prompts.toolcall import SYSTEM_PROMPT as TOOLCALL_SYSTEM_PROMPT
+from spoon_ai.agents.mcp_schema_registry import SCHEMA_REGISTRY, ToolSchema
 from spoon_ai.schema import TOOL_CHOICE_TYPE, AgentState, ToolCall, ToolChoice, Message, Role
 from spoon_ai.tools import ToolManager
-from mcp.types import Tool as MCPTool
+from spoon_ai.tools.tool_index import ToolIndex, spec_text
+from spoon_ai.telemetry import REGISTRY, traced
 
 logging.getLogger("spoon_ai").setLevel(logging.INFO)
 
 logger = getLogger("spoon_ai")
 
+_TOOL_CALLS = REGISTRY.counter("spoon_agent_tool_calls", "Tool calls made by agents.", ["tool", "status"])
+_TOOL_SECONDS = REGISTRY.histogram("spoon_agent_tool_duration_seconds", "Tool call time in seconds.", ["tool"])
+
 class ToolCallAgent(ReActAgent):
 
     name: str = "toolcall"
@@ -38,62 +44,65 @@ class ToolCallAgent(ReActAgent):
 
     tool_calls: List[ToolCall] = Field(default_factory=list)
 
+    # Run the independent tool calls of one turn concurrently; tools declared
+    # ``serial`` (and calls to tools the agent cannot inspect) still run alone, in order
+    parallel_tool_calls: bool = False
+    max_tool_concurrency: int = Field(default=4, ge=1)
+    # Default per-call limit in seconds; a tool's own ``call_timeout`` wins
+    tool_timeout: Optional[float] = None
+
+    # Send only the tools most relevant to the request when there are more
+    # than this many (special tools are always sent); None sends every tool
+    tool_top_k: Optional[int] = Field(default=None, ge=1)
+    # SQLite file to persist the tool embeddings of that selection to
+    tool_index_path: Optional[str] = None
+
     output_queue: asyncio.Queue = Field(default_factory=asyncio.Queue)
 
     # Track last tool error for higher-level fallbacks
     last_tool_error: Optional[str] = Field(default=None, exclude=True)
 
-    # MCP Tools Caching
-    mcp_tools_cache: Optional[List[MCPTool]] = Field(default=None, exclude=True)
-    mcp_tools_cache_timestamp: Optional[float] = Field(default=None, exclude=True)
-    mcp_tools_cache_ttl: float = Field(default=300.0, exclude=True)  # 5 minutes TTL
-
-    async def _get_cached_mcp_tools(self) -> List[MCPTool]:
-        """Get MCP tools with caching to avoid repeated server calls."""
-        current_time = time.time()
-
-        # Thread-safe cache check
-        async with asyncio.Lock() if not hasattr(self, '_cache_lock') else asyncio.Lock():
-            if not hasattr(self, '_cache_lock'):
-                self._cache_lock = asyncio.Lock()
-
-        async with self._cache_lock:
-            # Check if cache is valid and not expired
-            if (self.mcp_tools_cache is not None and
-                self.mcp_tools_cache_timestamp is not None and
-                current_time - self.mcp_tools_cache_timestamp < self.mcp_tools_cache_ttl):
-                logger.info(f"♻️ {self.name} using cached MCP tools ({len(self.mcp_tools_cache)} tools)")
-                return self.mcp_tools_cache.copy() # Return copy to prevent external modification
-
-            # Cache expired or invalid - clean up and fetch fresh
-            self._invalidate_mcp_cache()
-
-
-            if hasattr(self, "list_mcp_tools"):
-                try:
-                    logger.info(f"🔄 {self.name} fetching MCP tools from server...")
-                    mcp_tools = await self.list_mcp_tools()
-
-                    # Validate and limit cache size (prevent memory bloat)
-                    if isinstance(mcp_tools, list) and len(mcp_tools) <= 100:
-                        self.mcp_tools_cache = mcp_tools
-                        self.mcp_tools_cache_timestamp = current_time
-                        logger.info(f"📋 {self.name} cached {len(mcp_tools)} MCP tools")
-                        return mcp_tools.copy()
-                    else:
-                        logger.warning(f"⚠️ {self.name} received {len(mcp_tools) if isinstance(mcp_tools, list) else 'invalid'} tools - not caching")
-                        return mcp_tools if isinstance(mcp_tools, list) else []
-
-                except Exception as e:
-                    logger.error(f"❌ {self.name} failed to fetch MCP tools: {e}")
-                    # Return empty list on error rather than crashing
-                    return []
-
-        return []
-
-
-
+    async def _get_mcp_tool_specs(self) -> List[dict]:
+        """Provider-ready function specs of the tools on this agent's MCP server.
 
+        Agents that are MCP clients share the schemas of their server with
+        every other agent through the process-wide schema registry; other
+        ``list_mcp_tools`` implementations are converted on each call.
+        """
+        if not hasattr(self, "list_mcp_tools"):
+            return []
+        try:
+            server_key = getattr(self, "_server_key", None)
+            if server_key is not None:
+                return (await SCHEMA_REGISTRY.get(server_key, self.list_mcp_tools)).specs
+            return [ToolSchema.from_mcp(tool).spec for tool in await self.list_mcp_tools() or []]
+        except Exception as e:
+            logger.error(f"❌ {self.name} failed to fetch MCP tools: {e}")
+            # Return empty list on error rather than crashing
+            return []
+
+    def _select_relevant_tools(self, specs: List[dict]) -> List[dict]:
+        """Keep the ``tool_top_k`` specs most relevant to the latest request."""
+        if not self.tool_top_k or len(specs) <= self.tool_top_k:
+            return specs
+        query = next(
+            (message.content for message in reversed(self.memory.messages)
+             if message.role == Role.USER.value and message.content and message.content != self.next_step_prompt),
+            None,
+        )
+        if not query:
+            return specs
+
+        index = getattr(self, '_tool_index', None)
+        if index is None:
+            index = self._tool_index = ToolIndex(cache_path=self.tool_index_path)
+        index.update({spec["function"]["name"]: spec_text(spec) for spec in specs})
+        selected = {name for name, _ in index.search(query, top_k=self.tool_top_k)}
+        if not selected:
+            return specs
+        selected.update(spec["function"]["name"] for spec in specs if self._is_special_tool(spec["function"]["name"]))
+        logger.debug(f"{self.name} sending {len(selected)} of {len(specs)} tools")
+        return [spec for spec in specs if spec["function"]["name"] in selected]
 
     # Legacy compatibility alias for previous misspelling 'avaliable_tools'
     @property
@@ -106,37 +115,17 @@ class ToolCallAgent(ReActAgent):
 
 
 
+    @traced("agent.think", lambda self: {"agent": self.name, "agent.step": self.current_step})
     async def think(self) -> bool:
         if self.next_step_prompt:
             await self.add_message("user", self.next_step_prompt)
 
-        # Use cached MCP tools to avoid repeated server calls
-        mcp_tools = await self._get_cached_mcp_tools()
-
-        def convert_mcp_tool(tool: MCPTool) -> dict:
-            # Convert MCPTool to function call parameter format, using the actual
-            # server tool name if ensure_parameters_loaded renamed it.
-            params = getattr(tool, 'parameters', None) or getattr(tool, 'inputSchema', None) or {
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-            return {
-                "type": "function",
-                "function": {
-                    "name": getattr(tool, 'name', 'mcp_tool'),
-                    "description": getattr(tool, 'description', 'MCP tool'),
-                    "parameters": params
-                }
-            }
-
-        all_tools = self.available_tools.to_params()
-        mcp_tools_params = [convert_mcp_tool(tool) for tool in mcp_tools]
-        unique_tools = {}
-        for tool in all_tools + mcp_tools_params:
-            tool_name = tool["function"]["name"]
-            unique_tools[tool_name] = tool
-        unique_tools_list = list(unique_tools.values())
+        # Prebuilt specs from the shared MCP schema registry; they replace
+        # local tools of the same name
+        mcp_specs = await self._get_mcp_tool_specs()
+        unique_tools = {spec["function"]["name"]: spec for spec in self.available_tools.to_params()}
+        unique_tools.update((spec["function"]["name"], spec) for spec in mcp_specs)
+        unique_tools_list = self._select_relevant_tools(list(unique_tools.values()))
 
         # Bound LLM tool selection time to avoid step-level timeouts
         llm_timeout = max(20.0, min(60.0, getattr(self, '_default_timeout', 30.0) - 5.0))
@@ -205,6 +194,7 @@ class ToolCallAgent(ReActAgent):
             await self.add_message("assistant", f"Error encountered while thinking: {e}")
             return False
 
+    @traced("agent.run", lambda self, *args, **kwargs: {"agent": self.name, "agent.class": type(self).__name__})
     async def run(self, request: Optional[str] = None) -> str:
         """Override run method to handle finish_reason termination specially."""
         if self.state != AgentState.IDLE:
@@ -220,6 +210,8 @@ class ToolCallAgent(ReActAgent):
         self._final_response_content = None
 
         results: List[str] = []
+        run_started = time.perf_counter()
+        run_status = "error"
         try:
             async with self.state_context(AgentState.RUNNING):
                 while (
@@ -227,6 +219,7 @@ class ToolCallAgent(ReActAgent):
                     self.state == AgentState.RUNNING
                 ):
                     self.current_step += 1
+                    _AGENT_STEPS.labels(self.name).inc()
                     logger.info(f"Agent {self.name} is running step {self.current_step}/{self.max_steps}")
 
 
@@ -239,7 +232,7 @@ class ToolCallAgent(ReActAgent):
                             if hasattr(self, 'available_tools') and hasattr(self.available_tools, 'tool_map'):
                                 has_mcp_tools = any(hasattr(t, 'mcp_config') for t in self.available_tools.tool_map.values())
                             if not has_mcp_tools:
-                                has_mcp_tools = bool(getattr(self, 'mcp_tools_cache', None))
+                                has_mcp_tools = getattr(self, '_server_key', None) is not None
                         except Exception:
                             pass
                         if has_mcp_tools:
@@ -263,6 +256,7 @@ class ToolCallAgent(ReActAgent):
                         self._finish_reason_terminated = False
                         if hasattr(self, '_final_response_content'):
                             delattr(self, '_final_response_content')
+                        run_status = "success"
                         return final_content
 
                     results.append(f"Step {self.current_step}: {step_result}")
@@ -271,11 +265,13 @@ class ToolCallAgent(ReActAgent):
                 if self.current_step >= self.max_steps:
                     results.append(f"Step {self.current_step}: Stuck in loop. Resetting state.")
 
+            run_status = "success"
             return "\n".join(results) if results else "No results"
         except Exception as e:
             logger.error(f"Error during agent run: {e}")
             raise
         finally:
+            self._record_run(run_status, run_started)
             # Always reset to IDLE state after run completes or fails
             if self.state != AgentState.IDLE:
                 logger.info(f"Resetting agent {self.name} state from {self.state} to IDLE")
@@ -297,33 +293,112 @@ class ToolCallAgent(ReActAgent):
 
         return await self.act()
 
+    @traced("agent.act", lambda self: {"agent": self.name, "agent.tool_calls": len(self.tool_calls or [])})
     async def act(self) -> str:
         if not self.tool_calls:
             if self.tool_choices == ToolChoice.REQUIRED:
                 raise ValueError("No tools to call")
             return self.memory.messages[-1].content or "No response from assistant"
 
+        if self.parallel_tool_calls and len(self.tool_calls) > 1:
+            results = await self._execute_tool_calls_concurrently(self.tool_calls)
+            # Tool messages go in call order so the provider sees a valid sequence
+            for tool_call, result in zip(self.tool_calls, results):
+                await self.add_message("tool", result, tool_call_id=tool_call.id, tool_name=tool_call.function.name)
+            return "\n\n".join(results)
+
         results = []
         for tool_call in self.tool_calls:
-            try:
-                result = await self.execute_tool(tool_call)
-                logger.info(f"Tool {tool_call.function.name} executed with result: {result}")
-                # Flag error-like results so callers can decide on fallbacks
-                if isinstance(result, str) and (
-                    "not healthy" in result.lower() or "execution failed" in result.lower()
-                ):
-                    self.last_tool_error = result
-            except Exception as e:
-                # Ensure we always create a tool response, even on failure
-                result = f"Error executing tool {tool_call.function.name}: {str(e)}"
-                logger.error(f"Tool {tool_call.function.name} execution failed: {e}")
-                self.last_tool_error = str(e)
-
+            result = await self._run_tool_call(tool_call)
             # Always add a tool message for each tool call to satisfy OpenAI API requirements
             await self.add_message("tool", result, tool_call_id=tool_call.id, tool_name=tool_call.function.name)
             results.append(result)
         return "\n\n".join(results)
 
+    async def _execute_tool_calls_concurrently(self, tool_calls: List[ToolCall]) -> List[str]:
+        """Run tool calls under ``max_tool_concurrency`` and return results in call order.
+
+        Consecutive non-serial calls run together; a serial call waits for
+        everything before it and finishes before anything after it starts.
+        """
+        semaphore = asyncio.Semaphore(self.max_tool_concurrency)
+        results: List[Optional[str]] = [None] * len(tool_calls)
+
+        async def run(index: int, tool_call: ToolCall) -> None:
+            async with semaphore:
+                results[index] = await self._run_tool_call(tool_call)
+
+        batch = []
+        for index, tool_call in enumerate(tool_calls):
+            if self._is_serial_tool_call(tool_call):
+                if batch:
+                    await asyncio.gather(*batch)
+                    batch = []
+                results[index] = await self._run_tool_call(tool_call)
+            else:
+                batch.append(run(index, tool_call))
+        if batch:
+            await asyncio.gather(*batch)
+        return results
+
+    def _is_serial_tool_call(self, tool_call: ToolCall) -> bool:
+        name = tool_call.function.name if tool_call.function else None
+        tool = self.available_tools.tool_map.get(name)
+        # Unknown names are routed to MCP servers; their side effects can't be inspected
+        return tool is None or getattr(tool, "serial", False) is True or self._is_special_tool(name)
+
+    def _tool_timeout(self, tool_call: ToolCall) -> Optional[float]:
+        tool = self.available_tools.tool_map.get(tool_call.function.name if tool_call.function else None)
+        timeout = getattr(tool, "call_timeout", None)
+        return timeout if isinstance(timeout, (int, float)) else self.tool_timeout
+
+    async def _run_tool_call(self, tool_call: ToolCall) -> str:
+        """Execute one tool call, turning failures and timeouts into a result message."""
+        started = time.perf_counter()
+        status = "success"
+        timeout = self._tool_timeout(tool_call)
+        try:
+            if timeout is not None:
+                result = await asyncio.wait_for(self.execute_tool(tool_call), timeout)
+            else:
+                result = await self.execute_tool(tool_call)
+            logger.info(f"Tool {tool_call.function.name} executed with result: {result}")
+            # Flag error-like results so callers can decide on fallbacks
+            if isinstance(result, str) and (
+                "not healthy" in result.lower() or "execution failed" in result.lower()
+            ):
+                self.last_tool_error = result
+        except asyncio.TimeoutError:
+            result = f"Error executing tool {tool_call.function.name}: timed out after {timeout}s"
+            logger.error(result)
+            self.last_tool_error = result
+            status = "timeout"
+        except Exception as e:
+            # Ensure we always create a tool response, even on failure
+            result = f"Error executing tool {tool_call.function.name}: {str(e)}"
+            logger.error(f"Tool {tool_call.function.name} execution failed: {e}")
+            self.last_tool_error = str(e)
+            status = "error"
+        label = self._tool_metric_label(tool_call.function.name)
+        _TOOL_CALLS.labels(label, status).inc()
+        _TOOL_SECONDS.labels(label).observe(time.perf_counter() - started)
+        return result
+
+    def _tool_metric_label(self, name: Optional[str]) -> str:
+        """Metric label for a tool name the model produced.
+
+        Only tools the agent knows (its own or its MCP server's) get their own
+        series; any other name is reported as ``"unknown"``.
+        """
+        if name and name in self.available_tools.tool_map:
+            return name
+        server_key = getattr(self, "_server_key", None)
+        schemas = SCHEMA_REGISTRY.peek(server_key) if server_key is not None else None
+        if name and schemas is not None and schemas.get(name) is not None:
+            return name
+        return "unknown"
+
+    @traced("tool.execute", lambda self, tool_call: {"tool": tool_call.function.name if tool_call and tool_call.function else None})
     async def execute_tool(self, tool_call: ToolCall) -> str:
         def parse_tool_arguments(arguments):
             """Parse tool arguments using improved logic."""
@@ -432,23 +507,10 @@ class ToolCallAgent(ReActAgent):
             return native_finish_reason in ["stop", "end_turn"]
         return False
 
-    def _invalidate_mcp_cache(self):
-        """Properly invalidate and clean up MCP tools cache."""
-        self.mcp_tools_cache = None
-        self.mcp_tools_cache_timestamp = None
-        logger.debug(f"🧹 {self.name} invalidated MCP tools cache")
-
     def clear(self):
         self.memory.clear()
         self.tool_calls = []
         self.state = AgentState.IDLE
         self.current_step = 0
 
-        #cache cleanup
-        self._invalidate_mcp_cache()
-
-        # Clean up lock if it exists
-        if hasattr(self, '_cache_lock'):
-            delattr(self, '_cache_lock')
-
-        logger.debug(f"🧹 {self.name} fully cleared state and cache")
+        logger.debug(f"🧹 {self.name} fully cleared state")
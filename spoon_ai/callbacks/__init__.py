@@ -18,7 +18,10 @@ from spoon_ai.callbacks.base import (
 from spoon_ai.callbacks.manager import (
     CallbackManager,
     AsyncCallbackManager,
+    inheritable_callbacks,
+    get_inheritable_callbacks,
 )
+from spoon_ai.callbacks.dispatch import TokenBatch, TokenDispatch
 from spoon_ai.callbacks.streaming_stdout import (
     StreamingStdOutCallbackHandler,
 )
@@ -40,6 +43,10 @@ __all__ = [
     # Managers
     "CallbackManager",
     "AsyncCallbackManager",
+    "inheritable_callbacks",
+    "get_inheritable_callbacks",
+    "TokenDispatch",
+    "TokenBatch",
     
     # Built-in handlers
     "StreamingStdOutCallbackHandler",
@@ -4,6 +4,7 @@ from abc import ABC
 from typing import Any, List, Optional
 from uuid import UUID
 
+from spoon_ai.callbacks.dispatch import TokenDispatch
 from spoon_ai.schema import LLMResponse, LLMResponseChunk, Message
 
 
@@ -184,6 +185,9 @@ class BaseCallbackHandler(
     run_inline: bool = False
     """Whether the callback prefers to run on the caller's event loop."""
 
+    token_dispatch: Optional[TokenDispatch] = None
+    """Queue ``on_llm_new_token`` events and deliver them in micro-batches (see ``spoon_ai.callbacks.dispatch``)."""
+
     @property
     def ignore_llm(self) -> bool:
         """Return True to skip LLM callbacks."""
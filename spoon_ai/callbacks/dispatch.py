@@ -0,0 +1,215 @@
+"""
+Batched, non-blocking delivery of streamed token events to callback handlers.
+
+By default every ``on_llm_new_token`` is awaited across all handlers, and
+synchronous handlers cost one thread-pool hop per token. A handler that sets
+``token_dispatch`` instead gets its tokens through a bounded queue owned by
+the ``CallbackManager``:
+
+* the producer only appends to the queue and never waits on the handler;
+* tokens are delivered in micro-batches of ``max_batch`` events or after
+  ``max_delay`` seconds, whichever comes first;
+* synchronous handlers run on one dedicated worker thread, one hop per batch;
+* when a slow handler lets its queue fill up, new events are either dropped
+  or coalesced into the newest queued event, per ``overflow``.
+
+Handlers may implement ``on_llm_token_batch(batch: TokenBatch)`` to receive a
+whole batch at once; otherwise ``on_llm_new_token`` is called per queued event.
+Pending tokens are always delivered before ``on_llm_end``/``on_llm_error``.
+"""
+
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from logging import getLogger
+from threading import Lock
+from typing import Any, Deque, Dict, List, Optional
+
+from spoon_ai.telemetry import REGISTRY
+
+logger = getLogger(__name__)
+
+OVERFLOW_POLICIES = ("drop", "coalesce")
+
+_TOKEN_OVERFLOW = REGISTRY.counter(
+    "spoon_callback_token_overflow",
+    "Streamed token events dropped or coalesced because a callback handler fell behind.",
+    ["handler", "policy"],
+)
+
+_sync_worker: Optional[ThreadPoolExecutor] = None
+_sync_worker_lock = Lock()
+
+
+def _get_sync_worker() -> ThreadPoolExecutor:
+    """Return the single thread that runs synchronous batched handlers."""
+    global _sync_worker
+    if _sync_worker is None:
+        with _sync_worker_lock:
+            if _sync_worker is None:
+                _sync_worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="spoon-callbacks")
+    return _sync_worker
+
+
+@dataclass(frozen=True)
+class TokenDispatch:
+    """Queueing policy for a handler's ``on_llm_new_token`` events.
+
+    Args:
+        max_batch: Deliver as soon as this many events are queued
+        max_delay: Deliver at most this many seconds after the first queued event
+        max_queue: Events held for the handler before ``overflow`` applies
+        overflow: ``"coalesce"`` merges new tokens into the newest queued event,
+            ``"drop"`` discards them (and reports the count in the next batch)
+    """
+
+    max_batch: int = 32
+    max_delay: float = 0.05
+    max_queue: int = 1024
+    overflow: str = "coalesce"
+
+    def __post_init__(self) -> None:
+        if self.overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"overflow must be one of {OVERFLOW_POLICIES}, got {self.overflow!r}")
+        if self.max_batch < 1 or self.max_queue < 1:
+            raise ValueError("max_batch and max_queue must be at least 1")
+
+
+@dataclass
+class TokenBatch:
+    """A micro-batch of token events delivered to one handler.
+
+    ``tokens`` and ``chunks`` are parallel lists, one entry per queued event;
+    a coalesced event carries the joined text and the newest chunk. ``count``
+    is the number of original events represented and ``dropped`` the number
+    discarded since the previous batch.
+    """
+
+    tokens: List[str] = field(default_factory=list)
+    chunks: List[Any] = field(default_factory=list)
+    run_id: Any = None
+    count: int = 0
+    dropped: int = 0
+
+    @property
+    def text(self) -> str:
+        return "".join(self.tokens)
+
+
+class _Event:
+    __slots__ = ("token", "chunk", "run_id", "kwargs", "count")
+
+    def __init__(self, token: str, chunk: Any, run_id: Any, kwargs: Dict[str, Any]):
+        self.token = token
+        self.chunk = chunk
+        self.run_id = run_id
+        self.kwargs = kwargs
+        self.count = 1
+
+
+class TokenQueue:
+    """Bounded per-handler queue drained by a background task on the running loop."""
+
+    def __init__(self, handler: Any, policy: TokenDispatch):
+        self.handler = handler
+        self.policy = policy
+        self.dropped = 0
+        self.coalesced = 0
+        self._items: Deque[_Event] = deque()
+        self._pending_drops = 0
+        self._wakeup = asyncio.Event()
+        self._closing = False
+        self._task: Optional[asyncio.Task] = None
+        self._name = type(handler).__name__
+
+    def put(self, token: str, chunk: Any = None, run_id: Any = None, **kwargs: Any) -> None:
+        """Queue one token event. Never blocks and never runs the handler inline."""
+        if len(self._items) >= self.policy.max_queue:
+            if self.policy.overflow == "drop":
+                self.dropped += 1
+                self._pending_drops += 1
+            else:
+                last = self._items[-1]
+                last.token += token
+                last.chunk = chunk if chunk is not None else last.chunk
+                last.kwargs = kwargs
+                last.count += 1
+                self.coalesced += 1
+            _TOKEN_OVERFLOW.labels(self._name, self.policy.overflow).inc()
+        else:
+            self._items.append(_Event(token, chunk, run_id, kwargs))
+
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._drain())
+        elif len(self._items) >= self.policy.max_batch:
+            self._wakeup.set()
+
+    async def flush(self) -> None:
+        """Deliver everything queued so far and wait for the handler to finish."""
+        self._closing = True
+        self._wakeup.set()
+        try:
+            if self._task is not None:
+                await asyncio.shield(self._task)
+        finally:
+            self._closing = False
+
+    async def _drain(self) -> None:
+        try:
+            while self._items:
+                if len(self._items) < self.policy.max_batch and not self._closing:
+                    self._wakeup.clear()
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), self.policy.max_delay)
+                    except asyncio.TimeoutError:
+                        pass
+                batch = self._take()
+                try:
+                    await self._deliver(batch)
+                except Exception as exc:
+                    # Same contract as CallbackManager._dispatch: observers never fail the stream
+                    logger.debug(f"Callback {self._name} failed on a token batch: {exc}")
+        finally:
+            self._task = None
+
+    def _take(self) -> List[_Event]:
+        batch = list(self._items)
+        self._items.clear()
+        return batch
+
+    async def _deliver(self, events: List[_Event]) -> None:
+        batch = TokenBatch(
+            tokens=[event.token for event in events],
+            chunks=[event.chunk for event in events],
+            run_id=events[-1].run_id if events else None,
+            count=sum(event.count for event in events),
+            dropped=self._pending_drops,
+        )
+        self._pending_drops = 0
+
+        batch_callback = getattr(self.handler, "on_llm_token_batch", None)
+        if batch_callback is not None:
+            if asyncio.iscoroutinefunction(batch_callback):
+                await batch_callback(batch)
+            else:
+                await self._run_sync(lambda: batch_callback(batch))
+            return
+
+        callback = getattr(self.handler, "on_llm_new_token", None)
+        if callback is None:
+            return
+        if asyncio.iscoroutinefunction(callback):
+            for event in events:
+                await callback(token=event.token, chunk=event.chunk, run_id=event.run_id, **event.kwargs)
+            return
+
+        def run_all() -> None:
+            for event in events:
+                callback(token=event.token, chunk=event.chunk, run_id=event.run_id, **event.kwargs)
+
+        await self._run_sync(run_all)
+
+    @staticmethod
+    async def _run_sync(fn) -> None:
+        await asyncio.wrap_future(_get_sync_worker().submit(fn))
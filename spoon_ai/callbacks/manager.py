@@ -1,16 +1,42 @@
 import asyncio
-from typing import Any, Dict, List, Optional, Union
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 from uuid import UUID
 
 from spoon_ai.callbacks.base import BaseCallbackHandler
+from spoon_ai.callbacks.dispatch import TokenQueue
 from spoon_ai.schema import Message
 
+# Handlers inherited by every LLM call made in the current context (and in
+# tasks spawned from it), without threading them through each call site.
+_inheritable_handlers: ContextVar[Tuple[BaseCallbackHandler, ...]] = ContextVar(
+    "spoon_inheritable_callbacks", default=()
+)
+
+
+@contextmanager
+def inheritable_callbacks(*handlers: BaseCallbackHandler) -> Iterator[None]:
+    """Attach ``handlers`` to every LLM call made within the ``with`` block."""
+    token = _inheritable_handlers.set(_inheritable_handlers.get() + tuple(handlers))
+    try:
+        yield
+    finally:
+        _inheritable_handlers.reset(token)
+
+
+def get_inheritable_callbacks() -> List[BaseCallbackHandler]:
+    """Return the handlers installed by enclosing ``inheritable_callbacks`` blocks."""
+    return list(_inheritable_handlers.get())
+
 
 class CallbackManager:
     """Lightweight dispatcher for callback handlers."""
 
     def __init__(self, handlers: Optional[List[BaseCallbackHandler]] = None):
         self.handlers: List[BaseCallbackHandler] = list(handlers or [])
+        # Token queues for handlers that opted into batched delivery, keyed by id(handler)
+        self._token_queues: Dict[int, TokenQueue] = {}
 
     @classmethod
     def from_callbacks(cls,callbacks: Union[None,BaseCallbackHandler,List[BaseCallbackHandler],"CallbackManager",],
@@ -31,12 +57,32 @@ class CallbackManager:
         merged = CallbackManager.from_callbacks(other)
         return CallbackManager(self.handlers + merged.handlers)
 
-    async def _dispatch(self, event: str, **kwargs: Any) -> None:
-        if not self.handlers:
+    async def _dispatch(self, event: str, handlers: Optional[List[BaseCallbackHandler]] = None, **kwargs: Any) -> None:
+        handlers = self.handlers if handlers is None else handlers
+        if not handlers:
             return
-        tasks = [self._invoke(handler, event, **kwargs) for handler in self.handlers]
+        tasks = [self._invoke(handler, event, **kwargs) for handler in handlers]
         await asyncio.gather(*tasks, return_exceptions=True)
 
+    def _queue_tokens(self, token: str, chunk: Any, run_id: Optional[UUID], kwargs: Dict[str, Any]) -> List[BaseCallbackHandler]:
+        """Queue the token for batched handlers and return the handlers to call directly."""
+        direct = []
+        for handler in self.handlers:
+            policy = getattr(handler, "token_dispatch", None)
+            if policy is None:
+                direct.append(handler)
+                continue
+            queue = self._token_queues.get(id(handler))
+            if queue is None:
+                queue = self._token_queues[id(handler)] = TokenQueue(handler, policy)
+            queue.put(token, chunk, run_id, **kwargs)
+        return direct
+
+    async def flush_tokens(self) -> None:
+        """Wait until every queued token has been delivered to its handler."""
+        if self._token_queues:
+            await asyncio.gather(*(queue.flush() for queue in self._token_queues.values()), return_exceptions=True)
+
     @staticmethod
     async def _invoke(handler: BaseCallbackHandler, event: str, **kwargs: Any) -> None:
         callback = getattr(handler, event, None)
@@ -52,12 +98,16 @@ class CallbackManager:
         await self._dispatch("on_llm_start", run_id=run_id, messages=messages, **kwargs)
 
     async def on_llm_new_token(self,token: str,*,chunk: Optional[Any] = None,run_id: UUID = None,**kwargs: Any,) -> None:
-        await self._dispatch("on_llm_new_token",token=token,chunk=chunk,run_id=run_id,**kwargs,)
+        direct = self._queue_tokens(token, chunk, run_id, kwargs)
+        await self._dispatch("on_llm_new_token",direct,token=token,chunk=chunk,run_id=run_id,**kwargs,)
 
     async def on_llm_end(self,response: Any,*,run_id: UUID,**kwargs: Any,) -> None:
+        # Batched handlers see every token before the end of the run
+        await self.flush_tokens()
         await self._dispatch("on_llm_end", response=response, run_id=run_id, **kwargs)
 
     async def on_llm_error(self,error: Exception,*,run_id: UUID,**kwargs: Any,) -> None:
+        await self.flush_tokens()
         await self._dispatch("on_llm_error", error=error, run_id=run_id, **kwargs)
 
     async def on_tool_start(self,tool_name: str,tool_input: Dict[str, Any],*,run_id: UUID,**kwargs: Any,) -> None:
@@ -5,6 +5,7 @@ from typing import Any, Callable, Optional
 from uuid import UUID
 
 from spoon_ai.callbacks.base import BaseCallbackHandler, LLMManagerMixin
+from spoon_ai.callbacks.dispatch import TokenBatch, TokenDispatch
 from spoon_ai.schema import LLMResponse, LLMResponseChunk
 
 
@@ -14,8 +15,11 @@ class StreamingStatisticsCallback(BaseCallbackHandler, LLMManagerMixin):
     By default, the callback prints summary metrics when the LLM finishes.
     Consumers can provide a custom ``print_fn`` to redirect output, or disable
     printing entirely and read the public attributes after execution.
+    Tokens are counted in batches, off the streaming path.
     """
 
+    token_dispatch = TokenDispatch(max_batch=256, max_delay=0.1)
+
     def __init__(
         self,
         *,
@@ -66,6 +70,10 @@ class StreamingStatisticsCallback(BaseCallbackHandler, LLMManagerMixin):
         self.token_count += 1
         self.chunk_count += 1
 
+    async def on_llm_token_batch(self, batch: TokenBatch) -> None:
+        self.token_count += batch.count + batch.dropped
+        self.chunk_count += batch.count + batch.dropped
+
     async def on_llm_end(
         self,
         response: LLMResponse,
@@ -3,11 +3,15 @@ from typing import Any
 from uuid import UUID
 
 from spoon_ai.callbacks.base import BaseCallbackHandler
+from spoon_ai.callbacks.dispatch import TokenBatch, TokenDispatch
 
 
 class StreamingStdOutCallbackHandler(BaseCallbackHandler):
     """Callback handler that streams tokens to standard output."""
-    
+
+    # A terminal can't show more than ~50 updates a second anyway
+    token_dispatch = TokenDispatch(max_batch=64, max_delay=0.02)
+
     def on_llm_new_token(self, token: str, **kwargs: Any) -> None:
         """Print token to stdout immediately.
             Args:
@@ -16,7 +20,16 @@ class StreamingStdOutCallbackHandler(BaseCallbackHandler):
         """
         sys.stdout.write(token)
         sys.stdout.flush()
-    
+
+    def on_llm_token_batch(self, batch: TokenBatch) -> None:
+        """Write a batch of queued tokens with a single flush.
+
+        Args:
+            batch: Tokens queued since the previous write
+        """
+        sys.stdout.write(batch.text)
+        sys.stdout.flush()
+
     def on_llm_end(self, response: Any, **kwargs: Any) -> None:
         """Print newline after LLM completes.
         
@@ -26,7 +39,3 @@ class StreamingStdOutCallbackHandler(BaseCallbackHandler):
         """
         sys.stdout.write("\n")
         sys.stdout.flush()
-
-
-
-
@@ -12,12 +12,14 @@ from spoon_ai.memory.short_term_manager import (
     TrimStrategy,
     MessageTokenCounter,
 )
+from spoon_ai.memory.tokenizers import TokenizerTokenCounter
 from spoon_ai.memory.remove_message import (
     RemoveMessage,
     REMOVE_ALL_MESSAGES,
 )
 from spoon_ai.callbacks.base import BaseCallbackHandler
 from spoon_ai.callbacks.manager import CallbackManager
+from spoon_ai.telemetry import traced
 from pydantic import BaseModel, Field
 from spoon_ai.utils.streaming import (
     StreamOutcome,
@@ -114,7 +116,8 @@ class ChatBot:
             base_url: Base URL override
             enable_short_term_memory: Enable short-term memory management (default: True)
             short_term_memory_config: Configuration dict or ShortTermMemoryConfig instance
-            token_counter: Optional custom token counter instance
+            token_counter: Optional custom token counter instance (default: tokenizer
+                registry counter for the model, see spoon_ai.memory.tokenizers)
             callbacks: Optional list of callback handlers for monitoring
             **kwargs: Additional parameters
         """
@@ -156,7 +159,7 @@ class ChatBot:
             
             # Initialize manager
             self.short_term_memory_manager = ShortTermMemoryManager(
-                token_counter=token_counter
+                token_counter=token_counter or TokenizerTokenCounter(default_model=self.model_name)
             )
             
             logger.info(
@@ -478,6 +481,7 @@ class ChatBot:
             # Return original messages on error to avoid breaking the flow
             return messages
 
+    @traced("chatbot.ask", lambda self, messages, *args, **kwargs: {"chat.messages": len(messages)})
     async def ask(self, messages: List[Union[dict, Message]], system_msg: Optional[str] = None, output_queue: Optional[asyncio.Queue] = None) -> str:
         """Ask method using the LLM manager architecture.
         
@@ -510,6 +514,7 @@ class ChatBot:
 
         return response.content
 
+    @traced("chatbot.ask_tool", lambda self, messages, *args, **kwargs: {"chat.messages": len(messages)})
     async def ask_tool(self, messages: List[Union[dict, Message]], system_msg: Optional[str] = None, tools: Optional[List[dict]] = None, tool_choice: Optional[str] = None, output_queue: Optional[asyncio.Queue] = None, **kwargs) -> LLMResponse:
         """Ask tool method using the LLM manager architecture.
         
@@ -34,7 +34,8 @@ from .decorators import (
     node_decorator,
     router_decorator,
 )
-from .checkpointer import InMemoryCheckpointer
+from .checkpointer import InMemoryCheckpointer, SQLiteCheckpointer
+from .snapshots import DeltaStateSnapshot
 
 # Engine and agent implementations (now within this package)
 from .engine import (
@@ -197,7 +197,7 @@ class DeclarativeGraphBuilder:
         auto_groups: Dict[str, List[str]] = defaultdict(list)
 
         for node in template.nodes:
-            graph.add_node(node.name, node.handler)
+            graph.add_node(node.name, node.handler, cpu_bound=bool(node.metadata.get("cpu_bound")))
             if node.parallel_group:
                 auto_groups[node.parallel_group].append(node.name)
 
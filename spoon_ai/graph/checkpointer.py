@@ -1,43 +1,28 @@
 """
-In-memory checkpointer for the graph package.
+Checkpointers for the graph package: in-memory and SQLite-backed.
 """
-from typing import Any, Dict, Iterable, List, Optional
+import contextvars
+import heapq
+import itertools
+import pickle
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
 from datetime import datetime
 from .types import StateSnapshot, CheckpointTuple
 from .exceptions import CheckpointError
 
 
-class InMemoryCheckpointer:
-    def __init__(self, max_checkpoints_per_thread: int = 100, *, max_threads: int | None = None, ttl_seconds: int | None = None):
-        self.checkpoints: Dict[str, List[StateSnapshot]] = {}
-        self.max_checkpoints_per_thread = max_checkpoints_per_thread
-        self.max_threads = max_threads
-        self.ttl_seconds = ttl_seconds
-        self.last_access: Dict[str, datetime] = {}
+class BaseCheckpointer:
+    """Shared helpers for checkpointer backends.
 
-    def _gc(self) -> None:
-        # TTL-based cleanup
-        if self.ttl_seconds is not None:
-            cutoff = datetime.now().timestamp() - self.ttl_seconds
-            remove_keys = []
-            for tid, snaps in self.checkpoints.items():
-                # remove snapshots older than TTL
-                kept = [s for s in snaps if s.created_at.timestamp() >= cutoff]
-                if kept:
-                    self.checkpoints[tid] = kept[-self.max_checkpoints_per_thread:]
-                else:
-                    remove_keys.append(tid)
-            for tid in remove_keys:
-                self.checkpoints.pop(tid, None)
-                self.last_access.pop(tid, None)
-        # Global thread limit
-        if self.max_threads is not None and len(self.checkpoints) > self.max_threads:
-            # evict least recently used threads by last_access
-            sorted_threads = sorted(self.last_access.items(), key=lambda kv: kv[1])
-            to_evict = len(self.checkpoints) - self.max_threads
-            for tid, _ in sorted_threads[:to_evict]:
-                self.checkpoints.pop(tid, None)
-                self.last_access.pop(tid, None)
+    Subclasses implement ``save_checkpoint``, ``get_checkpoint``,
+    ``list_checkpoints`` and ``clear_thread``.
+    """
 
     @staticmethod
     def _checkpoint_id(snapshot: StateSnapshot) -> str:
@@ -60,17 +45,128 @@ class InMemoryCheckpointer:
             pending_writes=[],
         )
 
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Group several saves into a single write. No-op unless a backend overrides it."""
+        yield
+
+    def get_checkpoint_tuple(self, config: Dict[str, Any]) -> Optional[CheckpointTuple]:
+        if not isinstance(config, dict):
+            raise CheckpointError("config must be a dictionary", operation="get_tuple")
+
+        configurable = config.get("configurable", {})
+        thread_id = configurable.get("thread_id")
+        checkpoint_id = configurable.get("checkpoint_id")
+
+        if not thread_id:
+            raise CheckpointError("thread_id is required", operation="get_tuple")
+
+        snapshot = self.get_checkpoint(thread_id, checkpoint_id)
+        if not snapshot:
+            return None
+
+        return self._snapshot_to_tuple(snapshot)
+
+    def iter_checkpoint_history(self, config: Dict[str, Any]) -> Iterable[CheckpointTuple]:
+        """Return checkpoint tuples for the specified thread, newest last."""
+        if not isinstance(config, dict):
+            raise CheckpointError("config must be a dictionary", operation="history_tuple")
+
+        configurable = config.get("configurable", {})
+        thread_id = configurable.get("thread_id")
+        if not thread_id:
+            raise CheckpointError("thread_id is required", operation="history_tuple")
+
+        snapshots = self.list_checkpoints(thread_id)
+        return [self._snapshot_to_tuple(snapshot) for snapshot in snapshots]
+
+
+class InMemoryCheckpointer(BaseCheckpointer):
+    """Process-local checkpointer.
+
+    Threads are kept in an ``OrderedDict`` in LRU order, each with a bounded
+    deque of snapshots and a checkpoint-id index. TTL expiry uses a min-heap
+    with one live entry per thread, so save, get and eviction cost O(1) or
+    O(log n) regardless of how many threads or saves there are.
+    """
+
+    def __init__(self, max_checkpoints_per_thread: int = 100, *, max_threads: int | None = None, ttl_seconds: int | None = None):
+        self.checkpoints: "OrderedDict[str, Deque[StateSnapshot]]" = OrderedDict()
+        self.max_checkpoints_per_thread = max_checkpoints_per_thread
+        self.max_threads = max_threads
+        self.ttl_seconds = ttl_seconds
+        self.last_access: Dict[str, datetime] = {}
+        # thread_id -> checkpoint_id -> snapshots with that id, oldest first
+        self._index: Dict[str, Dict[str, Deque[StateSnapshot]]] = {}
+        # (created_at timestamp, sequence, thread_id) for TTL expiry. An entry's
+        # timestamp is at most that of its thread's oldest snapshot; entries
+        # whose sequence is not in _expiry_live are stale and skipped.
+        self._expiry: List[Tuple[float, int, str]] = []
+        self._expiry_seq = itertools.count()
+        self._expiry_live: Dict[str, int] = {}
+
+    def _touch(self, thread_id: str) -> None:
+        self.checkpoints.move_to_end(thread_id)
+        self.last_access[thread_id] = datetime.now()
+
+    def _pop_oldest(self, thread_id: str) -> None:
+        snapshot = self.checkpoints[thread_id].popleft()
+        by_id = self._index[thread_id]
+        checkpoint_id = self._checkpoint_id(snapshot)
+        same_id = by_id.get(checkpoint_id)
+        if same_id and same_id[0] is snapshot:
+            same_id.popleft()
+            if not same_id:
+                del by_id[checkpoint_id]
+
+    def _schedule_expiry(self, thread_id: str, timestamp: float) -> None:
+        seq = next(self._expiry_seq)
+        self._expiry_live[thread_id] = seq
+        heapq.heappush(self._expiry, (timestamp, seq, thread_id))
+        # Entries of cleared threads wait for their timestamp; compact once they dominate
+        if len(self._expiry) > 2 * len(self._expiry_live) + 64:
+            self._expiry = [entry for entry in self._expiry if self._expiry_live.get(entry[2]) == entry[1]]
+            heapq.heapify(self._expiry)
+
+    def _gc(self) -> None:
+        # TTL-based cleanup: pop expired entries off the heap, then trim the
+        # affected thread from its oldest end and reschedule it
+        if self.ttl_seconds is not None:
+            cutoff = datetime.now().timestamp() - self.ttl_seconds
+            while self._expiry and self._expiry[0][0] < cutoff:
+                _, seq, tid = heapq.heappop(self._expiry)
+                if self._expiry_live.get(tid) != seq:
+                    continue
+                del self._expiry_live[tid]
+                snaps = self.checkpoints[tid]
+                while snaps and snaps[0].created_at.timestamp() < cutoff:
+                    self._pop_oldest(tid)
+                if snaps:
+                    self._schedule_expiry(tid, snaps[0].created_at.timestamp())
+                else:
+                    self.clear_thread(tid)
+        # Global thread limit: evict least recently used threads
+        if self.max_threads is not None:
+            while len(self.checkpoints) > self.max_threads:
+                tid = next(iter(self.checkpoints))
+                self.clear_thread(tid)
+
     def save_checkpoint(self, thread_id: str, snapshot: StateSnapshot) -> None:
         try:
             if not thread_id:
                 raise CheckpointError("Thread ID cannot be empty", operation="save")
+            snaps = self.checkpoints.get(thread_id)
+            if snaps is None:
+                snaps = self.checkpoints[thread_id] = deque()
+                self._index[thread_id] = {}
             # update access time and run GC
-            self.last_access[thread_id] = datetime.now()
-            if thread_id not in self.checkpoints:
-                self.checkpoints[thread_id] = []
-            self.checkpoints[thread_id].append(snapshot)
-            if len(self.checkpoints[thread_id]) > self.max_checkpoints_per_thread:
-                self.checkpoints[thread_id] = self.checkpoints[thread_id][-self.max_checkpoints_per_thread:]
+            self._touch(thread_id)
+            snaps.append(snapshot)
+            self._index[thread_id].setdefault(self._checkpoint_id(snapshot), deque()).append(snapshot)
+            while len(snaps) > self.max_checkpoints_per_thread:
+                self._pop_oldest(thread_id)
+            if self.ttl_seconds is not None and thread_id not in self._expiry_live:
+                self._schedule_expiry(thread_id, snaps[0].created_at.timestamp())
             self._gc()
         except Exception as e:
             raise CheckpointError(f"Failed to save checkpoint: {str(e)}", thread_id=thread_id, operation="save") from e
@@ -79,17 +175,15 @@ class InMemoryCheckpointer:
         try:
             if not thread_id:
                 raise CheckpointError("Thread ID cannot be empty", operation="get")
-            if thread_id not in self.checkpoints:
+            checkpoints = self.checkpoints.get(thread_id)
+            if checkpoints is None:
                 return None
-            self.last_access[thread_id] = datetime.now()
-            checkpoints = self.checkpoints[thread_id]
+            self._touch(thread_id)
             if not checkpoints:
                 return None
             if checkpoint_id:
-                for checkpoint in checkpoints:
-                    if self._checkpoint_id(checkpoint) == checkpoint_id:
-                        return checkpoint
-                return None
+                matches = self._index[thread_id].get(checkpoint_id)
+                return matches[0] if matches else None
             return checkpoints[-1]
         except Exception as e:
             raise CheckpointError(
@@ -99,47 +193,283 @@ class InMemoryCheckpointer:
                 operation="get",
             ) from e
 
-    def get_checkpoint_tuple(self, config: Dict[str, Any]) -> Optional[CheckpointTuple]:
-        if not isinstance(config, dict):
-            raise CheckpointError("config must be a dictionary", operation="get_tuple")
+    def list_checkpoints(self, thread_id: str) -> List[StateSnapshot]:
+        try:
+            if not thread_id:
+                raise CheckpointError("Thread ID cannot be empty", operation="list")
+            checkpoints = self.checkpoints.get(thread_id)
+            if checkpoints is None:
+                return []
+            self._touch(thread_id)
+            return list(checkpoints)
+        except Exception as e:
+            raise CheckpointError(f"Failed to list checkpoints: {str(e)}", thread_id=thread_id, operation="list") from e
 
-        configurable = config.get("configurable", {})
-        thread_id = configurable.get("thread_id")
-        checkpoint_id = configurable.get("checkpoint_id")
+    def clear_thread(self, thread_id: str) -> None:
+        self.checkpoints.pop(thread_id, None)
+        self._index.pop(thread_id, None)
+        self.last_access.pop(thread_id, None)
+        self._expiry_live.pop(thread_id, None)
+
+
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS checkpoints (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    thread_id TEXT NOT NULL,
+    checkpoint_id TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    payload BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_checkpoints_thread_seq ON checkpoints (thread_id, seq);
+CREATE INDEX IF NOT EXISTS idx_checkpoints_thread_id ON checkpoints (thread_id, checkpoint_id);
+CREATE INDEX IF NOT EXISTS idx_checkpoints_created_at ON checkpoints (created_at);
+CREATE TABLE IF NOT EXISTS threads (
+    thread_id TEXT PRIMARY KEY,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_threads_last_access ON threads (last_access);
+"""
+
+# Payload header byte: raw pickle or zlib-compressed pickle
+_RAW = b"\x00"
+_ZLIB = b"\x01"
+
+_active_batches: contextvars.ContextVar[Optional[Dict[int, List[Tuple[str, StateSnapshot]]]]] = contextvars.ContextVar(
+    "spoon_ai_checkpoint_batches", default=None
+)
+
+
+class SQLiteCheckpointer(BaseCheckpointer):
+    """Persistent checkpointer backed by a SQLite database in WAL mode.
+
+    Drop-in replacement for ``InMemoryCheckpointer``: several worker processes
+    can share one database file and resume each other's threads without
+    keeping every snapshot in RAM. Snapshots are stored as compressed pickles,
+    so only point it at databases written by trusted processes.
+
+    TTL and LRU limits are enforced with indexed DELETEs inside the same
+    transaction as each write.
+    """
+
+    def __init__(
+        self,
+        path: str = "checkpoints.db",
+        max_checkpoints_per_thread: int = 100,
+        *,
+        max_threads: int | None = None,
+        ttl_seconds: int | None = None,
+        compress_threshold: int = 1024,
+        timeout: float = 30.0,
+    ):
+        self.path = path
+        self.max_checkpoints_per_thread = max_checkpoints_per_thread
+        self.max_threads = max_threads
+        self.ttl_seconds = ttl_seconds
+        self.compress_threshold = compress_threshold
+        self._lock = threading.RLock()
+        try:
+            self._conn = sqlite3.connect(path, timeout=timeout, check_same_thread=False, isolation_level=None)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SQLITE_SCHEMA)
+        except sqlite3.Error as e:
+            raise CheckpointError(f"Failed to open checkpoint database '{path}': {e}", operation="init") from e
 
+    # ------------------------------------------------------------------
+    # Serialization
+    # ------------------------------------------------------------------
+
+    def _dumps(self, snapshot: StateSnapshot) -> bytes:
+        record = (
+            snapshot.values,
+            tuple(snapshot.next),
+            snapshot.config,
+            snapshot.metadata,
+            snapshot.created_at,
+            snapshot.parent_config,
+            tuple(snapshot.tasks),
+        )
+        data = pickle.dumps(record, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(data) >= self.compress_threshold:
+            return _ZLIB + zlib.compress(data, 1)
+        return _RAW + data
+
+    @staticmethod
+    def _loads(payload: bytes) -> StateSnapshot:
+        header, body = payload[:1], payload[1:]
+        if header == _ZLIB:
+            body = zlib.decompress(body)
+        values, next_nodes, config, metadata, created_at, parent_config, tasks = pickle.loads(body)
+        return StateSnapshot(
+            values=values,
+            next=next_nodes,
+            config=config,
+            metadata=metadata,
+            created_at=created_at,
+            parent_config=parent_config,
+            tasks=tasks,
+        )
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Buffer saves made in the current task and commit them in one transaction on exit."""
+        batches = _active_batches.get()
+        if batches is not None and id(self) in batches:
+            # Nested batch: the outermost one flushes
+            yield
+            return
+        batches = dict(batches or {})
+        batches[id(self)] = []
+        token = _active_batches.set(batches)
+        try:
+            yield
+        finally:
+            pending = batches.pop(id(self))
+            _active_batches.reset(token)
+            if pending:
+                self._write(pending)
+
+    def save_checkpoint(self, thread_id: str, snapshot: StateSnapshot) -> None:
         if not thread_id:
-            raise CheckpointError("thread_id is required", operation="get_tuple")
+            raise CheckpointError("Thread ID cannot be empty", operation="save")
+        batches = _active_batches.get()
+        if batches is not None and id(self) in batches:
+            batches[id(self)].append((thread_id, snapshot))
+            return
+        self._write([(thread_id, snapshot)])
 
-        snapshot = self.get_checkpoint(thread_id, checkpoint_id)
-        if not snapshot:
-            return None
+    def _write(self, items: List[Tuple[str, StateSnapshot]]) -> None:
+        thread_ids = {thread_id for thread_id, _ in items}
+        try:
+            rows = [
+                (thread_id, self._checkpoint_id(snapshot), snapshot.created_at.timestamp(), self._dumps(snapshot))
+                for thread_id, snapshot in items
+            ]
+            now = time.time()
+            with self._transaction() as cur:
+                cur.executemany(
+                    "INSERT INTO checkpoints (thread_id, checkpoint_id, created_at, payload) VALUES (?, ?, ?, ?)",
+                    rows,
+                )
+                cur.executemany(
+                    "INSERT INTO threads (thread_id, last_access) VALUES (?, ?) "
+                    "ON CONFLICT(thread_id) DO UPDATE SET last_access = excluded.last_access",
+                    [(thread_id, now) for thread_id in thread_ids],
+                )
+                self._gc(cur, thread_ids, now)
+        except CheckpointError:
+            raise
+        except Exception as e:
+            raise CheckpointError(
+                f"Failed to save checkpoint: {str(e)}",
+                thread_id=next(iter(thread_ids)) if len(thread_ids) == 1 else None,
+                operation="save",
+            ) from e
 
-        return self._snapshot_to_tuple(snapshot)
+    def _gc(self, cur: sqlite3.Cursor, thread_ids: Iterable[str], now: float) -> None:
+        # Per-thread cap: drop everything older than the newest N rows
+        for thread_id in thread_ids:
+            cur.execute(
+                "DELETE FROM checkpoints WHERE thread_id = ? AND seq <= ("
+                "SELECT seq FROM checkpoints WHERE thread_id = ? ORDER BY seq DESC LIMIT 1 OFFSET ?)",
+                (thread_id, thread_id, self.max_checkpoints_per_thread),
+            )
+        # TTL-based cleanup
+        if self.ttl_seconds is not None:
+            cutoff = now - self.ttl_seconds
+            cur.execute("DELETE FROM checkpoints WHERE created_at < ?", (cutoff,))
+            cur.execute(
+                "DELETE FROM threads WHERE last_access < ? AND NOT EXISTS ("
+                "SELECT 1 FROM checkpoints WHERE checkpoints.thread_id = threads.thread_id)",
+                (cutoff,),
+            )
+        # Global thread limit: evict least recently used threads
+        if self.max_threads is not None:
+            (count,) = cur.execute("SELECT COUNT(*) FROM threads").fetchone()
+            excess = count - self.max_threads
+            if excess > 0:
+                evicted = [
+                    row[0]
+                    for row in cur.execute(
+                        "SELECT thread_id FROM threads ORDER BY last_access ASC LIMIT ?", (excess,)
+                    ).fetchall()
+                ]
+                cur.executemany("DELETE FROM checkpoints WHERE thread_id = ?", [(t,) for t in evicted])
+                cur.executemany("DELETE FROM threads WHERE thread_id = ?", [(t,) for t in evicted])
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Cursor]:
+        with self._lock:
+            cur = self._conn.cursor()
+            cur.execute("BEGIN IMMEDIATE")
+            try:
+                yield cur
+            except BaseException:
+                cur.execute("ROLLBACK")
+                raise
+            else:
+                cur.execute("COMMIT")
+            finally:
+                cur.close()
+
+    def _touch(self, thread_id: str) -> None:
+        with self._lock:
+            self._conn.execute("UPDATE threads SET last_access = ? WHERE thread_id = ?", (time.time(), thread_id))
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def get_checkpoint(self, thread_id: str, checkpoint_id: Optional[str] = None) -> Optional[StateSnapshot]:
+        try:
+            if not thread_id:
+                raise CheckpointError("Thread ID cannot be empty", operation="get")
+            with self._lock:
+                if checkpoint_id:
+                    row = self._conn.execute(
+                        "SELECT payload FROM checkpoints WHERE thread_id = ? AND checkpoint_id = ? ORDER BY seq ASC LIMIT 1",
+                        (thread_id, checkpoint_id),
+                    ).fetchone()
+                else:
+                    row = self._conn.execute(
+                        "SELECT payload FROM checkpoints WHERE thread_id = ? ORDER BY seq DESC LIMIT 1",
+                        (thread_id,),
+                    ).fetchone()
+                if row is None:
+                    return None
+                self._touch(thread_id)
+            return self._loads(row[0])
+        except Exception as e:
+            raise CheckpointError(
+                f"Failed to get checkpoint: {str(e)}",
+                thread_id=thread_id,
+                checkpoint_id=checkpoint_id,
+                operation="get",
+            ) from e
 
     def list_checkpoints(self, thread_id: str) -> List[StateSnapshot]:
         try:
             if not thread_id:
                 raise CheckpointError("Thread ID cannot be empty", operation="list")
-            self.last_access[thread_id] = datetime.now()
-            return self.checkpoints.get(thread_id, [])
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT payload FROM checkpoints WHERE thread_id = ? ORDER BY seq ASC", (thread_id,)
+                ).fetchall()
+                if rows:
+                    self._touch(thread_id)
+            return [self._loads(row[0]) for row in rows]
         except Exception as e:
             raise CheckpointError(f"Failed to list checkpoints: {str(e)}", thread_id=thread_id, operation="list") from e
 
-    def iter_checkpoint_history(self, config: Dict[str, Any]) -> Iterable[CheckpointTuple]:
-        """Return checkpoint tuples for the specified thread, newest last."""
-        if not isinstance(config, dict):
-            raise CheckpointError("config must be a dictionary", operation="history_tuple")
-
-        configurable = config.get("configurable", {})
-        thread_id = configurable.get("thread_id")
-        if not thread_id:
-            raise CheckpointError("thread_id is required", operation="history_tuple")
-
-        snapshots = self.list_checkpoints(thread_id)
-        return [self._snapshot_to_tuple(snapshot) for snapshot in snapshots]
-
     def clear_thread(self, thread_id: str) -> None:
-        if thread_id in self.checkpoints:
-            del self.checkpoints[thread_id]
-        if thread_id in self.last_access:
-            del self.last_access[thread_id]
+        with self._transaction() as cur:
+            cur.execute("DELETE FROM checkpoints WHERE thread_id = ?", (thread_id,))
+            cur.execute("DELETE FROM threads WHERE thread_id = ?", (thread_id,))
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
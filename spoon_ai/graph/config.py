@@ -114,6 +114,12 @@ class GraphConfig:
     """Top-level configuration applied to an entire graph instance."""
 
     max_iterations: int = 100
+    # Write a full checkpoint every N steps; steps in between only store changed keys
+    checkpoint_keyframe_interval: int = 16
+    # Worker processes for nodes added with cpu_bound=True (None → os.cpu_count())
+    process_pool_workers: Optional[int] = None
+    # Events buffered by CompiledGraph.stream before the graph waits for the consumer
+    stream_buffer_size: int = 64
     router: RouterConfig = field(default_factory=RouterConfig)
     state_validators: List[Validator] = field(default_factory=list)
     parallel_groups: Dict[str, ParallelGroupConfig] = field(default_factory=dict)
@@ -121,5 +127,9 @@ class GraphConfig:
     def __post_init__(self) -> None:
         if self.max_iterations <= 0:
             self.max_iterations = 1
+        if self.checkpoint_keyframe_interval < 1:
+            self.checkpoint_keyframe_interval = 1
+        if self.stream_buffer_size < 1:
+            self.stream_buffer_size = 1
 
 
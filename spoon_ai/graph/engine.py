@@ -4,12 +4,15 @@ Graph engine: StateGraph, CompiledGraph, and interrupt API implementation.
 import asyncio
 import logging
 import uuid
+import weakref
 import inspect
 import time
 import re
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager, nullcontext
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Callable, Dict, List, Optional, Union, Pattern, TypeVar, Generic, TypedDict, Literal, Iterable
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Union, Pattern, TypeVar, Generic, TypedDict, Literal, Iterable
 from abc import ABC, abstractmethod
 
 from .exceptions import (
@@ -34,11 +37,24 @@ from .reducers import (
 )
 from .decorators import node_decorator
 from .checkpointer import InMemoryCheckpointer
+from .snapshots import SnapshotChain
+from .parallel import BranchStateView, CircuitBreaker, TokenBucket
+from .routing import RouteRule, RoutingTable, DIRECT, PATH_MAP, PREDICATE
+from .streaming import STREAM_MODES, MessageStreamHandler, StreamBuffer, running_node
+from spoon_ai.callbacks.manager import inheritable_callbacks
 from spoon_ai.schema import Message
+from spoon_ai.telemetry import REGISTRY, traced
 from .config import GraphConfig, ParallelGroupConfig, ParallelRetryPolicy, RouterConfig
 
 logger = logging.getLogger(__name__)
 
+_NODE_EXECUTIONS = REGISTRY.counter("spoon_graph_node_executions", "Graph node executions.", ["node", "status"])
+_NODE_SECONDS = REGISTRY.histogram("spoon_graph_node_duration_seconds", "Graph node execution time in seconds.", ["node"])
+_ROUTING_SECONDS = REGISTRY.histogram(
+    "spoon_graph_routing_duration_seconds", "Time spent choosing the next graph node, in seconds.",
+    buckets=(0.00001, 0.0001, 0.001, 0.01, 0.1, 1.0),
+)
+
 # Type variables for generic state handling
 State = TypeVar('State')
 ConfigurableFieldSpec = Dict[str, Any]
@@ -75,21 +91,24 @@ class RunnableNode(BaseNode[State]):
                 result = await self.func(state)
             else:
                 result = self.func(state)
-
-            # Handle different return types
-            if isinstance(result, dict):
-                return result
-            elif isinstance(result, (list, tuple)) and len(result) == 2:
-                # Handle (updates, next_node) format
-                updates, next_node = result
-                return {"updates": updates, "next_node": next_node}
-            else:
-                return {"result": result}
+            return self.normalize_result(result)
 
         except Exception as e:
             logger.error(f"Node {self.name} execution failed: {e}")
             raise NodeExecutionError(f"Node '{self.name}' failed", node_name=self.name, original_error=e, state=state) from e
 
+    @staticmethod
+    def normalize_result(result: Any) -> Dict[str, Any]:
+        """Map the wrapped function's return value onto the node result dict."""
+        if isinstance(result, dict):
+            return result
+        elif isinstance(result, (list, tuple)) and len(result) == 2:
+            # Handle (updates, next_node) format
+            updates, next_node = result
+            return {"updates": updates, "next_node": next_node}
+        else:
+            return {"result": result}
+
 
 class ToolNode(BaseNode[State]):
     """Tool node for executing tools"""
@@ -164,28 +183,6 @@ def interrupt(data: Dict[str, Any]) -> Any:
     raise InterruptError(data)
 
 
-class RouteRule:
-    """Advanced routing rule for automatic path selection"""
-
-    def __init__(self, condition: Union[str, Callable, Pattern], target: str, priority: int = 0):
-        self.condition = condition
-        self.target = target
-        self.priority = priority
-
-    def matches(self, state: Dict[str, Any], query: str = "") -> bool:
-        """Check if this rule matches the current state/query"""
-        if isinstance(self.condition, str):
-            # Simple string matching
-            return self.condition.lower() in (query + str(state)).lower()
-        elif isinstance(self.condition, Pattern):
-            # Regex pattern matching
-            return bool(self.condition.search(query + str(state)))
-        elif callable(self.condition):
-            # Custom function matching
-            return self.condition(state, query)
-        return False
-
-
 @dataclass
 class RunningSummary:
     """Rolling conversation summary used by the summarisation node."""
@@ -286,6 +283,7 @@ class StateGraph(Generic[State]):
         # Node storage
         self.nodes: Dict[str, BaseNode[State]] = {}
         self.node_functions: Dict[str, Callable] = {}  # For backward compatibility
+        self.cpu_bound_nodes: Set[str] = set()
 
         # Edge management
         self.edges: Dict[str, List[tuple]] = {}  # (end_node, condition_func)
@@ -294,6 +292,9 @@ class StateGraph(Generic[State]):
         # Special handling for START and END
         self._entry_point: Optional[str] = None
         self._compiled = False
+        # Bumped whenever nodes, edges or routing rules change so compiled
+        # routing tables can tell they are stale
+        self._topology_version = 0
 
         # Enhanced features
         self.routing_rules: Dict[str, List[RouteRule]] = {}
@@ -318,7 +319,7 @@ class StateGraph(Generic[State]):
         # Configuration
         self.config: GraphConfig = GraphConfig()
         self.stream_mode: str = "values"
-        self.stream_channels: List[str] = ["values", "updates", "debug"]
+        self.stream_channels: List[str] = ["values", "updates", "messages", "debug"]
 
         # Monitoring
         self.monitoring_enabled: bool = False
@@ -334,8 +335,12 @@ class StateGraph(Generic[State]):
             self.monitoring_metrics = metrics
         return self
 
-    def add_node(self, node_name: str, node: Union[BaseNode[State], Callable[[State], Any]]) -> "StateGraph":
-        """Add a node to the graph"""
+    def add_node(self, node_name: str, node: Union[BaseNode[State], Callable[[State], Any]], *, cpu_bound: bool = False) -> "StateGraph":
+        """Add a node to the graph.
+
+        With ``cpu_bound=True`` a plain synchronous function runs in a worker
+        process; the function, the state it reads and its result must be picklable.
+        """
         if node_name in [START, END]:
             raise GraphConfigurationError(f"Node name '{node_name}' is reserved", component="node")
 
@@ -348,6 +353,14 @@ class StateGraph(Generic[State]):
         else:
             raise GraphConfigurationError(f"Node must be callable or BaseNode instance", component="node")
 
+        if cpu_bound:
+            if not isinstance(self.nodes[node_name], RunnableNode) or asyncio.iscoroutinefunction(node):
+                raise GraphConfigurationError("cpu_bound nodes must be plain synchronous functions", component="node")
+            self.cpu_bound_nodes.add(node_name)
+        else:
+            self.cpu_bound_nodes.discard(node_name)
+
+        self._topology_version += 1
         return self
 
     def add_edge(self, start_node: str, end_node: str, condition: Optional[Callable[[State], bool]] = None) -> "StateGraph":
@@ -363,6 +376,7 @@ class StateGraph(Generic[State]):
         if start_node not in self.edges:
             self.edges[start_node] = []
         self.edges[start_node].append((end_node, condition))
+        self._topology_version += 1
         return self
 
     def add_conditional_edges(self, start_node: str, condition: Callable[[State], str],
@@ -379,6 +393,7 @@ class StateGraph(Generic[State]):
         if start_node not in self.edges:
             self.edges[start_node] = []
         self.edges[start_node].append((condition, path_map))
+        self._topology_version += 1
         return self
 
     def set_entry_point(self, node_name: str) -> "StateGraph":
@@ -442,6 +457,7 @@ class StateGraph(Generic[State]):
 
         # Sort rules by priority (highest first)
         self.routing_rules[source_node].sort(key=lambda r: r.priority, reverse=True)
+        self._topology_version += 1
 
         return self
 
@@ -646,81 +662,122 @@ class CompiledGraph(Generic[State]):
         self._current_node: Optional[str] = None
         self._iteration: int = 0
 
+        # Parallel execution resources, created on first use
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._process_pool_finalizer: Optional[weakref.finalize] = None
+        self._group_rate_limiters: Dict[str, TokenBucket] = {}
+        self._group_breakers: Dict[str, CircuitBreaker] = {}
+        self._group_stats: Dict[str, Dict[str, Any]] = {}
+
         # Execution metrics
         self.execution_metrics = {
             "total_executions": 0,
             "success_rate": 0.0,
             "average_execution_time": 0.0,
-            "routing_performance": {}
+            "routing_performance": {"hops": 0, "total_time": 0.0, "max_time": 0.0, "avg_time": 0.0, "by_source": {}}
         }
 
-    def _find_matching_route(self, current_node: str, state: Dict[str, Any]) -> Optional[str]:
-        """Find matching routing rule for the current node and state"""
-        if current_node not in self.graph.routing_rules:
-            return None
+        # Immutable routing table; rebuilt only if the graph is changed after compile()
+        self._routing: RoutingTable = self._build_routing_table()
 
-        query = state.get("user_query", "").lower()
+    def _build_routing_table(self) -> RoutingTable:
+        graph_cfg = self.graph.config if isinstance(self.graph.config, GraphConfig) else GraphConfig()
+        return RoutingTable(
+            self.graph.nodes.keys(),
+            END,
+            self.graph.edges,
+            self.graph.routing_rules,
+            graph_cfg.router,
+            version=self.graph._topology_version,
+            config=self.graph.config,
+        )
 
-        # Check routing rules in priority order
-        for rule in self.graph.routing_rules[current_node]:
-            if rule.matches(state, query):
-                return rule.target
+    def _routing_table(self) -> RoutingTable:
+        table = self._routing
+        if table.version != self.graph._topology_version or table.config is not self.graph.config:
+            table = self._routing = self._build_routing_table()
+        return table
+
+    def _record_routing(self, source: str, elapsed: float) -> None:
+        _ROUTING_SECONDS.observe(elapsed)
+        perf = self.execution_metrics["routing_performance"]
+        perf["hops"] += 1
+        perf["total_time"] += elapsed
+        perf["avg_time"] = perf["total_time"] / perf["hops"]
+        if elapsed > perf["max_time"]:
+            perf["max_time"] = elapsed
+        by_source = perf["by_source"]
+        by_source[source] = by_source.get(source, 0) + 1
 
-        return None
+    def _find_matching_route(self, current_node: str, state: Dict[str, Any]) -> Optional[str]:
+        """Find matching routing rule for the current node and state"""
+        query = state.get("user_query", "").lower()
+        return self._routing_table().match_rule(current_node, state, query)
 
     def _find_edge_target(self, current_node: str, state: Dict[str, Any]) -> Optional[str]:
-        if current_node in self.graph.edges:
-            for edge_target, edge_condition in self.graph.edges[current_node]:
-                if edge_condition is None and isinstance(edge_target, str) and (edge_target in self.graph.nodes or edge_target == END):
-                    return edge_target
-                if callable(edge_target) and isinstance(edge_condition, dict):
-                    try:
-                        cond_key = edge_target(state)
-                        if isinstance(cond_key, str) and cond_key in edge_condition:
-                            return edge_condition[cond_key]
-                    except Exception as e:
-                        logger.warning(f"Conditional map evaluation failed: {e}")
-                if isinstance(edge_target, str) and callable(edge_condition):
-                    try:
-                        if edge_condition(state):
-                            return edge_target
-                    except Exception as e:
-                        logger.warning(f"Predicate condition failed: {e}")
+        table = self._routing_table()
+        direct = table.direct.get(current_node)
+        if direct is not None:
+            return direct
+        for kind, first, second in table.edges.get(current_node, ()):
+            if kind == DIRECT:
+                return first
+            if kind == PATH_MAP:
+                try:
+                    cond_key = first(state)
+                    if isinstance(cond_key, str) and cond_key in second:
+                        return second[cond_key]
+                except Exception as e:
+                    logger.warning(f"Conditional map evaluation failed: {e}")
+            elif kind == PREDICATE:
+                try:
+                    if second(state):
+                        return first
+                except Exception as e:
+                    logger.warning(f"Predicate condition failed: {e}")
         return None
 
     async def _determine_next_node(self, current_node: str, state: Dict[str, Any]) -> Optional[str]:
         """Determine the next node to execute (async to support async LLM router)."""
-        query = state.get("user_query", "")
-        logger.info(f"Getting next node from '{current_node}' for query: '{query}'")
-
-        graph_cfg = self.graph.config if isinstance(self.graph.config, GraphConfig) else GraphConfig()
-        router_cfg: RouterConfig = graph_cfg.router
-
-        # Priority 1: Explicit edges
-        logger.info("Checking explicit edges...")
+        start = time.perf_counter()
+        target, source = await self._route(current_node, state)
+        self._record_routing(source, time.perf_counter() - start)
+        return target
+
+    async def _route(self, current_node: str, state: Dict[str, Any]) -> tuple:
+        """Return ``(next_node, source)`` where source names the routing step that decided."""
+        table = self._routing_table()
+
+        # Priority 1: Explicit edges (plain add_edge is a dict hit)
+        direct = table.direct.get(current_node)
+        if direct is not None:
+            return direct, "direct_edge"
         explicit_target = self._find_edge_target(current_node, state)
         if explicit_target:
-            return explicit_target
+            return explicit_target, "edge"
+
+        query = state.get("user_query", "")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"No explicit edge from '{current_node}', trying routers for query: '{query}'")
+        router_cfg: RouterConfig = table.router_config
 
         # Priority 2: Intelligent routing rules
-        logger.info("Trying routing rules...")
-        matching_route = self._find_matching_route(current_node, state)
+        matching_route = table.match_rule(current_node, state, query.lower())
         if matching_route:
-            logger.info(f"Routing rule matched: {matching_route}")
-            return matching_route
+            logger.debug(f"Routing rule matched: {matching_route}")
+            return matching_route, "rule"
 
         # Priority 3: Intelligent router function
         if self.graph.intelligent_router:
-            logger.info("Trying intelligent router...")
             try:
                 router = self.graph.intelligent_router
                 next_node = await router(state, query) if asyncio.iscoroutinefunction(router) else router(state, query)
                 if next_node and next_node != current_node:
-                    if router_cfg.allowed_targets and next_node not in router_cfg.allowed_targets:
+                    if not table.is_allowed(next_node):
                         logger.warning(f"Intelligent router returned disallowed target '{next_node}'")
                     else:
-                        logger.info(f"Intelligent router selected: {next_node}")
-                        return next_node
+                        logger.debug(f"Intelligent router selected: {next_node}")
+                        return next_node, "intelligent_router"
             except Exception as e:
                 logger.warning(f"Intelligent router failed: {e}")
 
@@ -733,27 +790,32 @@ class CompiledGraph(Generic[State]):
                 else:
                     next_node = router(state, query)
                 if next_node and next_node != current_node and next_node in self.graph.nodes:
-                    if router_cfg.allowed_targets and next_node not in router_cfg.allowed_targets:
+                    if not table.is_allowed(next_node):
                         logger.warning(f"LLM router returned disallowed target '{next_node}'")
                     else:
                         logger.info(f"LLM Router selected: {next_node}")
-                        return next_node
+                        return next_node, "llm_router"
             except Exception as e:
                 logger.warning(f"LLM router failed: {e}")
 
         # Priority 5: Default target
         if router_cfg.enable_fallback_to_default and router_cfg.default_target:
             target = router_cfg.default_target
-            if router_cfg.allowed_targets and target not in router_cfg.allowed_targets:
+            if not table.is_allowed(target):
                 logger.warning(f"Default target '{target}' not in allowed targets")
             elif target in self.graph.nodes:
-                logger.info(f"Using default router target: {target}")
-                return target
+                logger.debug(f"Using default router target: {target}")
+                return target, "default"
 
-        logger.warning("No valid next node found")
-        return None
+        logger.debug("No valid next node found")
+        return None, "none"
 
+    @traced("graph.invoke", lambda self, *args, **kwargs: {"graph.nodes": len(self.graph.nodes)})
     async def invoke(self, initial_state: Optional[Dict[str, Any]] = None, config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        return await self._run(initial_state, config)
+
+    async def _run(self, initial_state: Optional[Dict[str, Any]], config: Optional[Dict[str, Any]], stream: Optional[StreamBuffer] = None) -> Dict[str, Any]:
+        """Execution loop shared by invoke and stream; events go to ``stream`` when given."""
         config = config or {}
         thread_id = config.get("configurable", {}).get("thread_id", str(uuid.uuid4()))
 
@@ -776,50 +838,74 @@ class CompiledGraph(Generic[State]):
 
         max_iterations = int(config.get("max_iterations", 100) or 100)
         self._current_thread_id = thread_id
+        graph_cfg = self.graph.config if isinstance(self.graph.config, GraphConfig) else GraphConfig()
+        snapshots = SnapshotChain(thread_id, keyframe_interval=graph_cfg.checkpoint_keyframe_interval)
         try:
             while current_node and iteration < max_iterations:
                 self._current_iteration = iteration
                 iteration += 1
-                # checkpoint (best-effort)
+                # checkpoint (best-effort), committed before the node runs so it can be resumed elsewhere
                 try:
-                    snapshot = StateSnapshot(values=state.copy(), next=(current_node,), config=config, metadata={"iteration": iteration, "node": current_node}, created_at=datetime.now())
+                    snapshot = snapshots.snapshot(state, next=(current_node,), config=config, metadata={"iteration": iteration, "node": current_node})
                     self.graph.checkpointer.save_checkpoint(thread_id, snapshot)
                 except Exception:
                     pass
-                # execute current node or parallel group
-                try:
-                    # Check if current node is part of a parallel group
-                    if current_node in self.graph.node_to_group:
-                        group_name = self.graph.node_to_group[current_node]
-                        logger.info(f"Executing parallel group: {group_name}")
-                        await self._execute_parallel_group(group_name, state)
-                    else:
-                        result = await self._execute_node(current_node, state)
-                        if isinstance(result, dict):
-                            self._update_state_with_reducers(state, result)
-                            self._maybe_cleanup_state(state)
-                            # optional validation
-                            try:
-                                if callable(self.graph.state_validator):
-                                    self.graph.state_validator(state)
-                            except Exception as e:
-                                raise GraphExecutionError(f"State validation failed: {e}", node=current_node, iteration=iteration)
-                except InterruptError as e:
-                    # record interrupt + checkpoint
+                # Saves made while the superstep runs (branches, interrupt record) share one write
+                with self._superstep_checkpoints():
+                    goto = None
+                    # execute current node or parallel group
                     try:
-                        interrupt_snapshot = StateSnapshot(values=state.copy(), next=(current_node,), config=config, metadata={"iteration": iteration, "node": current_node, "interrupt_id": e.interrupt_id, "interrupt_data": e.interrupt_data, "status": "interrupted"}, created_at=datetime.now())
-                        self.graph.checkpointer.save_checkpoint(thread_id, interrupt_snapshot)
-                    except Exception:
-                        pass
-                    return {**state, "__interrupt__": [{"interrupt_id": e.interrupt_id, "value": e.interrupt_data, "node": current_node, "iteration": iteration}]}
-
-                # next - use intelligent routing
-                next_node = await self._determine_next_node(current_node, state)
-                if next_node == current_node:
-                    break
-                current_node = next_node
-                if current_node == END or current_node is None:
-                    break
+                        # Check if current node is part of a parallel group
+                        if current_node in self.graph.node_to_group:
+                            group_name = self.graph.node_to_group[current_node]
+                            logger.info(f"Executing parallel group: {group_name}")
+                            branch_updates = await self._execute_parallel_group(group_name, state)
+                            if stream is not None and stream.wants("updates"):
+                                for node_name, updates in branch_updates.items():
+                                    for update in updates:
+                                        await stream.emit("updates", {node_name: update})
+                        else:
+                            result = await self._execute_node(current_node, state)
+                            if isinstance(result, dict) and isinstance(result.get("result"), Command) and len(result) == 1:
+                                result = result["result"]
+                            if isinstance(result, Command):
+                                goto = result.goto
+                                result = result.update or {}
+                            if isinstance(result, dict):
+                                self._update_state_with_reducers(state, result)
+                                self._maybe_cleanup_state(state)
+                                # optional validation
+                                try:
+                                    if callable(self.graph.state_validator):
+                                        self.graph.state_validator(state)
+                                except Exception as e:
+                                    raise GraphExecutionError(f"State validation failed: {e}", node=current_node, iteration=iteration)
+                                if stream is not None:
+                                    await stream.emit("updates", {current_node: result})
+                        if stream is not None and stream.wants("values"):
+                            await stream.emit("values", state.copy())
+                    except Exception as exc:
+                        # nodes surface interrupts wrapped in NodeExecutionError
+                        e = self._unwrap_interrupt(exc)
+                        if e is None:
+                            raise
+                        # record interrupt + checkpoint
+                        try:
+                            interrupt_snapshot = snapshots.snapshot(state, next=(current_node,), config=config, metadata={"iteration": iteration, "node": current_node, "interrupt_id": e.interrupt_id, "interrupt_data": e.interrupt_data, "status": "interrupted"})
+                            self.graph.checkpointer.save_checkpoint(thread_id, interrupt_snapshot)
+                        except Exception:
+                            pass
+                        if stream is not None:
+                            await stream.emit("interrupt", {"type": "interrupt", "node": current_node, "interrupt_id": e.interrupt_id, "interrupt_data": e.interrupt_data, "state": state.copy()})
+                        return {**state, "__interrupt__": [{"interrupt_id": e.interrupt_id, "value": e.interrupt_data, "node": current_node, "iteration": iteration}]}
+
+                    # next - Command.goto wins, otherwise use intelligent routing
+                    next_node = goto or await self._determine_next_node(current_node, state)
+                    if next_node == current_node:
+                        break
+                    current_node = next_node
+                    if current_node == END or current_node is None:
+                        break
             if iteration >= max_iterations:
                 raise GraphExecutionError(f"Graph execution exceeded maximum iterations ({max_iterations})", node=current_node, iteration=iteration)
             return state
@@ -829,6 +915,25 @@ class CompiledGraph(Generic[State]):
             raise GraphExecutionError(f"Graph execution failed: {e}", node=current_node, iteration=iteration) from e
 
 
+    @contextmanager
+    def _superstep_checkpoints(self) -> Iterator[None]:
+        """Commit the checkpoints saved while one superstep runs (including those of
+        parallel branches) in a single checkpointer write.
+
+        Checkpointers without ``batch()`` save each checkpoint as it comes. Like
+        each individual save, the write is best-effort and never fails the run.
+        """
+        batch_factory = getattr(self.graph.checkpointer, "batch", None)
+        batch = batch_factory() if callable(batch_factory) else nullcontext()
+        batch.__enter__()
+        try:
+            yield
+        finally:
+            try:
+                batch.__exit__(None, None, None)
+            except Exception as e:
+                logger.warning(f"Failed to save checkpoints for thread {self._current_thread_id}: {e}")
+
     def _initialize_state(self, initial_state: State) -> State:
         """Initialize state for execution"""
         if initial_state is None:
@@ -847,16 +952,20 @@ class CompiledGraph(Generic[State]):
                 return {}
         return initial_state
 
+    @traced("graph.node", lambda self, node_name, *args, **kwargs: {"graph.node": node_name})
     async def _execute_node(self, node_name: str, state: State, config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Execute a node and return its result"""
         node = self.graph.nodes.get(node_name)
         if not node:
             raise GraphExecutionError(f"Node '{node_name}' not found")
 
+        token = running_node.set(node_name)
         try:
             start_dt = datetime.now()
             # Call the node with proper parameters
-            if hasattr(node, '__call__'):
+            if node_name in self.graph.cpu_bound_nodes:
+                result = await self._execute_in_process(node, state)
+            elif hasattr(node, '__call__'):
                 if config is not None:
                     result = await node(state, config)
                 else:
@@ -878,6 +987,35 @@ class CompiledGraph(Generic[State]):
             except Exception:
                 pass
             raise NodeExecutionError(f"Node '{node_name}' failed", node_name=node_name, original_error=e, state=state) from e
+        finally:
+            running_node.reset(token)
+
+    async def _execute_in_process(self, node: "RunnableNode", state: State) -> Dict[str, Any]:
+        """Run a cpu-bound node's function in the graph's process pool."""
+        if self._process_pool is None:
+            graph_cfg = self.graph.config if isinstance(self.graph.config, GraphConfig) else GraphConfig()
+            self._process_pool = ProcessPoolExecutor(max_workers=graph_cfg.process_pool_workers)
+            # Workers are released by close() (or leaving ``async with``), and at
+            # the latest when this compiled graph is garbage collected
+            self._process_pool_finalizer = weakref.finalize(
+                self, self._process_pool.shutdown, wait=False, cancel_futures=True
+            )
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(self._process_pool, node.func, dict(state))
+        return node.normalize_result(result)
+
+    def close(self) -> None:
+        """Release the worker process pool used by cpu-bound nodes."""
+        if self._process_pool_finalizer is not None:
+            self._process_pool_finalizer()
+            self._process_pool_finalizer = None
+        self._process_pool = None
+
+    async def __aenter__(self) -> "CompiledGraph":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.close()
 
     def _update_state(self, state: State, updates: Dict[str, Any]) -> None:
         """Update state with node results"""
@@ -957,6 +1095,8 @@ class CompiledGraph(Generic[State]):
             return
         try:
             execution_time = (end_time - start_time).total_seconds()
+            _NODE_EXECUTIONS.labels(node_name, "success" if success else "error").inc()
+            _NODE_SECONDS.labels(node_name).observe(execution_time)
             record = {
                 "node_name": node_name,
                 "start_time": start_time.isoformat(),
@@ -976,7 +1116,7 @@ class CompiledGraph(Generic[State]):
     def get_execution_metrics(self) -> Dict[str, Any]:
         """Get aggregated execution metrics"""
         if not self.execution_history:
-            return {"total_executions": 0, "avg_execution_time": 0, "success_rate": 0, "node_stats": {}}
+            return {"total_executions": 0, "avg_execution_time": 0, "success_rate": 0, "node_stats": {}, "parallel_groups": self._parallel_group_metrics(), "routing": self._routing_metrics()}
 
         total = len(self.execution_history)
         successful = sum(1 for h in self.execution_history if h["success"])
@@ -1000,13 +1140,32 @@ class CompiledGraph(Generic[State]):
             "total_executions": total,
             "avg_execution_time": total_time / total,
             "success_rate": successful / total,
-            "node_stats": node_stats
+            "node_stats": node_stats,
+            "parallel_groups": self._parallel_group_metrics(),
+            "routing": self._routing_metrics(),
         }
 
-    async def _execute_parallel_group(self, group_name: str, state: Dict[str, Any]) -> None:
+    def _routing_metrics(self) -> Dict[str, Any]:
+        perf = self.execution_metrics["routing_performance"]
+        return {**perf, "by_source": dict(perf["by_source"])}
+
+    def _parallel_group_metrics(self) -> Dict[str, Any]:
+        groups: Dict[str, Any] = {}
+        for group_name, stats in self._group_stats.items():
+            entry = dict(stats)
+            breaker = self._group_breakers.get(group_name)
+            entry["circuit_breaker"] = breaker.to_dict() if breaker is not None else None
+            groups[group_name] = entry
+        return groups
+
+    async def _execute_parallel_group(self, group_name: str, state: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
+        """Run one superstep of a parallel group and merge its writes into ``state``.
+
+        Returns the merged branch updates keyed by node, in declaration order.
+        """
         nodes = self.graph.parallel_groups.get(group_name, [])
         if not nodes:
-            return
+            return {}
         graph_cfg = self.graph.config if isinstance(self.graph.config, GraphConfig) else GraphConfig()
         group_cfg = self.graph.parallel_group_configs.get(group_name)
         if not group_cfg:
@@ -1017,14 +1176,62 @@ class CompiledGraph(Generic[State]):
         error_strategy = group_cfg.error_strategy
         join_condition = group_cfg.join_condition
 
-        # create tasks
-        loop = asyncio.get_event_loop()
+        stats = self._group_stats.setdefault(group_name, {
+            "supersteps": 0,
+            "branch_failures": 0,
+            "retries": 0,
+            "short_circuited": 0,
+            "rate_limit_wait_seconds": 0.0,
+        })
+        breaker = self._get_group_circuit_breaker(group_name, group_cfg)
+        if breaker is not None and not breaker.allow():
+            stats["short_circuited"] += 1
+            message = f"Parallel group '{group_name}' circuit breaker is open"
+            logger.warning(message)
+            if error_strategy == "fail_fast":
+                raise GraphExecutionError(message, node=group_name, iteration=getattr(self, "_current_iteration", None))
+            self._update_state_with_reducers(state, {"__errors__": [{"node": group_name, "error": message}]})
+            return {}
+        stats["supersteps"] += 1
+
+        # Superstep: every branch reads an isolated, read-only view of the state;
+        # nothing is written back until all branches have passed the barrier.
+        in_flight = asyncio.Semaphore(group_cfg.max_in_flight) if group_cfg.max_in_flight else nullcontext()
+        rate_limiter = self._get_group_rate_limiter(group_name, group_cfg)
+        retry_policy = group_cfg.retry_policy or ParallelRetryPolicy()
+
+        async def run_branch(node_name: str) -> Dict[str, Any]:
+            attempt = 0
+            while True:
+                try:
+                    # The in-flight slot is only held while the node runs, not during backoff
+                    async with in_flight:
+                        if rate_limiter is not None:
+                            stats["rate_limit_wait_seconds"] += await rate_limiter.acquire()
+                        result = await self._execute_node(node_name, BranchStateView(state))
+                except Exception as e:
+                    if attempt >= retry_policy.max_retries or self._is_interrupt(e):
+                        stats["branch_failures"] += 1
+                        if breaker is not None and not self._is_interrupt(e):
+                            breaker.record_failure()
+                        raise
+                    delay = min(retry_policy.backoff_max, retry_policy.backoff_initial * (retry_policy.backoff_multiplier ** attempt))
+                    attempt += 1
+                    stats["retries"] += 1
+                    logger.warning(f"Parallel branch '{node_name}' failed (attempt {attempt}), retrying in {delay:.2f}s: {e}")
+                    await asyncio.sleep(delay)
+                    continue
+                if breaker is not None:
+                    breaker.record_success()
+                return result
+
+        loop = asyncio.get_running_loop()
         tasks: Dict[str, asyncio.Task] = {}
         for n in nodes:
-            tasks[n] = loop.create_task(self._execute_node(n, state))
+            tasks[n] = loop.create_task(run_branch(n))
 
         completed_nodes: List[str] = []
-        updates_to_merge: List[Dict[str, Any]] = []
+        branch_updates: Dict[str, List[Dict[str, Any]]] = {}
         errors: List[Dict[str, Any]] = []
 
         async def handle_done(done_set):
@@ -1033,14 +1240,15 @@ class CompiledGraph(Generic[State]):
                 node_name = next((name for name, task in tasks.items() if task is t), None)
                 try:
                     result = t.result()
+                    writes = branch_updates.setdefault(node_name, [])
                     if isinstance(result, Command):
                         if result.update:
-                            updates_to_merge.append(result.update)
+                            writes.append(result.update)
                     elif isinstance(result, dict):
-                        updates_to_merge.append(result)
+                        writes.append(result)
                     elif isinstance(result, RouterResult):
                         # RouterResult in parallel branch is unusual; ignore routing but record metadata
-                        updates_to_merge.append({"__router__": {"node": node_name, "next": result.next_node}})
+                        writes.append({"__router__": {"node": node_name, "next": result.next_node}})
                     completed_nodes.append(node_name or "")
                 except Exception as e:
                     err_info = {"node": node_name, "error": str(e)}
@@ -1098,10 +1306,9 @@ class CompiledGraph(Generic[State]):
         except Exception:
             if error_strategy == "collect_errors":
                 # merge successful updates and attach errors into state
-                for upd in updates_to_merge:
-                    self._update_state_with_reducers(state, upd)
+                merged = self._merge_branch_writes(state, nodes, branch_updates)
                 self._update_state_with_reducers(state, {"__errors__": errors})
-                return
+                return merged
             raise
 
         # join_condition hook: allow custom early merge decision
@@ -1113,14 +1320,13 @@ class CompiledGraph(Generic[State]):
                     for task in tasks.values():
                         if not task.done():
                             task.cancel()
-                    return
+                    return {}
             except Exception:
                 # ignore join_condition errors and proceed to merge
                 pass
 
         # finally merge accumulated updates
-        for upd in updates_to_merge:
-            self._update_state_with_reducers(state, upd)
+        merged = self._merge_branch_writes(state, nodes, branch_updates)
         if errors:
             if error_strategy in {"ignore_errors", "collect_errors"}:
                 self._update_state_with_reducers(state, {"__errors__": errors})
@@ -1130,45 +1336,116 @@ class CompiledGraph(Generic[State]):
                 )
         # optional cleanup per group
         self._maybe_cleanup_state(state)
+        return merged
+
+    @staticmethod
+    def _unwrap_interrupt(error: Optional[BaseException]) -> Optional[InterruptError]:
+        """Return the InterruptError behind (possibly nested) NodeExecutionErrors, if any."""
+        while error is not None:
+            if isinstance(error, InterruptError):
+                return error
+            error = getattr(error, "original_error", None)
+        return None
 
+    @classmethod
+    def _is_interrupt(cls, error: Exception) -> bool:
+        return cls._unwrap_interrupt(error) is not None
 
-    async def stream(self, initial_state: Optional[Dict[str, Any]] = None, config: Optional[Dict[str, Any]] = None, stream_mode: str = "values"):
-        config = config or {}
-        state = self._initialize_state(initial_state)
-        current_node = self.graph._entry_point
-        iteration = 0
-        max_iterations = int(config.get("max_iterations", 100) or 100)
-        while current_node and iteration < max_iterations:
-            iteration += 1
+    def _get_group_circuit_breaker(self, group_name: str, group_cfg: ParallelGroupConfig) -> Optional[CircuitBreaker]:
+        """Return the group's circuit breaker; its state persists across invocations."""
+        threshold = group_cfg.circuit_breaker_threshold
+        if not threshold:
+            return None
+        breaker = self._group_breakers.get(group_name)
+        if breaker is None:
+            breaker = self._group_breakers[group_name] = CircuitBreaker(threshold, group_cfg.circuit_breaker_cooldown)
+        else:
+            breaker.threshold = threshold
+            breaker.cooldown = group_cfg.circuit_breaker_cooldown
+        return breaker
+
+    def _get_group_rate_limiter(self, group_name: str, group_cfg: ParallelGroupConfig) -> Optional[TokenBucket]:
+        """Return the group's token bucket; it persists across supersteps and invocations."""
+        rate = group_cfg.rate_limit_per_second
+        if not rate:
+            return None
+        limiter = self._group_rate_limiters.get(group_name)
+        if limiter is None or limiter.rate != rate:
+            limiter = self._group_rate_limiters[group_name] = TokenBucket(rate)
+        return limiter
+
+    def _merge_branch_writes(self, state: Dict[str, Any], nodes: List[str], branch_updates: Dict[str, List[Dict[str, Any]]]) -> Dict[str, List[Dict[str, Any]]]:
+        """Apply branch writes channel by channel, in group declaration order.
+
+        Completion order never affects the merged state: for each channel the
+        reducers see the writes of earlier-declared branches first. Returns the
+        applied updates keyed by node, in declaration order.
+        """
+        merged: Dict[str, List[Dict[str, Any]]] = {}
+        channel_writes: Dict[str, List[Any]] = {}
+        for node_name in nodes:
+            for update in branch_updates.get(node_name, ()):
+                merged.setdefault(node_name, []).append(update)
+                for key, value in update.items():
+                    channel_writes.setdefault(key, []).append(value)
+        for key, values in channel_writes.items():
+            for value in values:
+                self._update_state_with_reducers(state, {key: value})
+        return merged
+
+
+    async def stream(self, initial_state: Optional[Dict[str, Any]] = None, config: Optional[Dict[str, Any]] = None, stream_mode: Union[str, List[str]] = "values"):
+        """Run the graph and yield events as it executes.
+
+        ``stream_mode`` selects what is yielded:
+
+        - ``"values"``: a copy of the full state after every node or parallel group
+        - ``"updates"``: ``{node_name: update}`` with only the update each node returned
+        - ``"messages"``: ``(chunk, {"node": ..., "run_id": ...})`` for every LLM token
+          streamed while a node runs
+
+        Passing a list of modes yields ``(mode, payload)`` tuples instead. Checkpointing,
+        resume and interrupts behave exactly as in ``invoke``; an interrupt is yielded as
+        ``{"type": "interrupt", ...}`` before the stream ends. Events go through a bounded
+        buffer (``GraphConfig.stream_buffer_size``), so the graph pauses while a slow
+        consumer catches up.
+        """
+        modes = [stream_mode] if isinstance(stream_mode, str) else list(stream_mode)
+        unknown = [mode for mode in modes if mode not in STREAM_MODES]
+        if unknown or not modes:
+            raise ValueError(f"Unsupported stream_mode {unknown or modes!r}; expected one of {STREAM_MODES}")
+        graph_cfg = self.graph.config if isinstance(self.graph.config, GraphConfig) else GraphConfig()
+        buffer = StreamBuffer(modes, multi=not isinstance(stream_mode, str), maxsize=graph_cfg.stream_buffer_size)
+
+        async def produce() -> None:
+            handlers = inheritable_callbacks(MessageStreamHandler(buffer)) if buffer.wants("messages") else nullcontext()
             try:
-                # If current node is a parallel group entry, stream merged results after group finishes
-                if current_node in self.graph.node_to_group and current_node in self.graph.parallel_entry_nodes:
-                    await self._execute_parallel_group(self.graph.node_to_group[current_node], state)
-                    if stream_mode == "values":
-                        yield state.copy()
-                else:
-                    result = await self._execute_node(current_node, state)
-                    if isinstance(result, Command):
-                        if result.update:
-                            self._update_state_with_reducers(state, result.update)
-                            if stream_mode == "values":
-                                yield state.copy()
-                        if result.goto:
-                            current_node = result.goto
-                            continue
-                    elif isinstance(result, dict):
-                        self._update_state_with_reducers(state, result)
-                        if stream_mode == "values":
-                            yield state.copy()
-            except InterruptError as e:
-                yield {"type": "interrupt", "node": current_node, "interrupt_id": e.interrupt_id, "interrupt_data": e.interrupt_data, "state": state.copy()}
-                return
-            next_node = await self._determine_next_node(current_node, state)
-            if next_node == "END" or next_node is None:
-                if stream_mode == "values":
-                    yield state.copy()
-                break
-            current_node = next_node
+                with handlers:
+                    await self._run(initial_state, config, buffer)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                await buffer.close()
+                raise
+            await buffer.close()
+
+        producer = asyncio.create_task(produce())
+        try:
+            while True:
+                try:
+                    event = await buffer.get()
+                except StopAsyncIteration:
+                    break
+                yield event
+            # surface errors raised by the run
+            await producer
+        finally:
+            if not producer.done():
+                producer.cancel()
+                try:
+                    await producer
+                except (asyncio.CancelledError, Exception):
+                    pass
 
     def _initialize_state(self, initial_state: Optional[Dict[str, Any]]) -> Dict[str, Any]:
         state: Dict[str, Any] = {}
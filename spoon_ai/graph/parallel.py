@@ -0,0 +1,132 @@
+"""
+Superstep helpers for parallel groups: isolated branch state, rate limiting
+and circuit breaking.
+"""
+import asyncio
+import copy
+import time
+from typing import Any, Dict, Iterator, Mapping, Optional
+
+
+class BranchStateView(Mapping):
+    """Read-only view of the graph state handed to one parallel branch.
+
+    The underlying state is not modified while branches run. Mutable top-level
+    containers (lists, dicts, sets) are shallow-copied on first access, so a
+    branch may mutate what it reads without affecting its siblings. Branches
+    communicate only through the updates they return, which are merged after
+    the barrier.
+    """
+
+    __slots__ = ("_state", "_copies")
+
+    def __init__(self, state: Mapping[str, Any]):
+        self._state = state
+        self._copies: Dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        value = self._state[key]
+        if isinstance(value, (list, dict, set)):
+            cached = self._copies.get(key)
+            if cached is None:
+                cached = self._copies[key] = copy.copy(value)
+            return cached
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._state)
+
+    def __len__(self) -> int:
+        return len(self._state)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        raise TypeError(
+            f"Cannot assign '{key}': parallel branches receive a read-only state view; return updates instead"
+        )
+
+    def __delitem__(self, key: str) -> None:
+        raise TypeError(f"Cannot delete '{key}': parallel branches receive a read-only state view")
+
+    def copy(self) -> Dict[str, Any]:
+        return dict(self.items())
+
+    def __repr__(self) -> str:
+        return f"BranchStateView({self._state!r})"
+
+
+class TokenBucket:
+    """Async token bucket allowing ``rate`` acquisitions per second with bursts up to ``capacity``."""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = float(rate)
+        self.capacity = float(capacity) if capacity else max(1.0, self.rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> float:
+        """Take one token, waiting for a refill if needed. Returns the seconds waited."""
+        start = time.monotonic()
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return time.monotonic() - start
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+
+class CircuitBreaker:
+    """Per-group circuit breaker: closed → open after ``threshold`` consecutive
+    branch failures, half-open after ``cooldown`` seconds, closed again on success."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, threshold: int, cooldown: float):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None
+        self.trips = 0
+
+    def allow(self) -> bool:
+        """Return whether the group may run now, moving open → half-open after the cooldown."""
+        if self.state == self.OPEN:
+            if time.monotonic() - (self.opened_at or 0.0) < self.cooldown:
+                return False
+            self.state = self.HALF_OPEN
+        return True
+
+    def record_success(self) -> None:
+        self.consecutive_failures = 0
+        self.state = self.CLOSED
+        self.opened_at = None
+
+    def record_failure(self) -> None:
+        self.consecutive_failures += 1
+        if self.state == self.HALF_OPEN or self.consecutive_failures >= self.threshold:
+            if self.state != self.OPEN:
+                self.trips += 1
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+
+    def to_dict(self) -> Dict[str, Any]:
+        retry_in = None
+        if self.state == self.OPEN and self.opened_at is not None:
+            retry_in = max(0.0, self.cooldown - (time.monotonic() - self.opened_at))
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "threshold": self.threshold,
+            "trips": self.trips,
+            "retry_in_seconds": retry_in,
+        }
@@ -0,0 +1,165 @@
+"""
+Routing rules and the immutable routing table built when a graph is compiled.
+"""
+import copy
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Pattern, Sequence, Tuple, Union
+
+# Edge entry kinds in a compiled routing table
+DIRECT = "direct"
+PATH_MAP = "map"
+PREDICATE = "predicate"
+
+# Rule kinds
+SUBSTRING = "substring"
+REGEX = "regex"
+CALLABLE = "callable"
+CUSTOM = "custom"
+
+
+class RouteRule:
+    """Advanced routing rule for automatic path selection"""
+
+    def __init__(self, condition: Union[str, Callable, Pattern], target: str, priority: int = 0):
+        self.condition = condition
+        self.target = target
+        self.priority = priority
+
+    def matches(self, state: Dict[str, Any], query: str = "") -> bool:
+        """Check if this rule matches the current state/query"""
+        if isinstance(self.condition, str):
+            # Simple string matching
+            return self.condition.lower() in (query + str(state)).lower()
+        elif isinstance(self.condition, Pattern):
+            # Regex pattern matching
+            return bool(self.condition.search(query + str(state)))
+        elif callable(self.condition):
+            # Custom function matching
+            return self.condition(state, query)
+        return False
+
+
+class RoutingTable:
+    """Immutable routing data compiled from a StateGraph.
+
+    Holds a direct map for nodes whose first edge is unconditional, ordered
+    edge entries for everything else, priority-sorted rules with pre-lowered
+    substrings, and a bitset of router-allowed targets. The common case (a
+    plain ``add_edge``) is a single dict lookup.
+
+    The router config is snapshotted, so the table stays consistent with it;
+    changes made to the graph's router config in place apply once the table
+    is rebuilt (on the next compile or topology change).
+    """
+
+    __slots__ = (
+        "version",
+        "config",
+        "router_config",
+        "node_index",
+        "allowed_mask",
+        "direct",
+        "edges",
+        "rules",
+    )
+
+    def __init__(
+        self,
+        node_names: Iterable[str],
+        end: str,
+        edges: Mapping[str, Sequence[tuple]],
+        routing_rules: Mapping[str, Sequence[RouteRule]],
+        router_config: Any,
+        *,
+        version: int = 0,
+        config: Any = None,
+    ):
+        names = list(node_names)
+        index = {name: i for i, name in enumerate(names)}
+        index.setdefault(end, len(index))
+
+        self.version = version
+        self.config = config
+        self.router_config = router_config = copy.deepcopy(router_config)
+        self.node_index: Mapping[str, int] = MappingProxyType(index)
+
+        allowed = getattr(router_config, "allowed_targets", None)
+        if allowed:
+            mask = 0
+            for name in allowed:
+                if name in index:
+                    mask |= 1 << index[name]
+            self.allowed_mask: Optional[int] = mask
+        else:
+            self.allowed_mask = None
+
+        direct: Dict[str, str] = {}
+        compiled_edges: Dict[str, Tuple[tuple, ...]] = {}
+        for source, entries in edges.items():
+            compiled: List[tuple] = []
+            for edge_target, edge_condition in entries:
+                if edge_condition is None and isinstance(edge_target, str):
+                    if edge_target in index:
+                        compiled.append((DIRECT, edge_target, None))
+                elif callable(edge_target) and isinstance(edge_condition, dict):
+                    compiled.append((PATH_MAP, edge_target, MappingProxyType(dict(edge_condition))))
+                elif isinstance(edge_target, str) and callable(edge_condition):
+                    compiled.append((PREDICATE, edge_target, edge_condition))
+            if compiled and compiled[0][0] == DIRECT:
+                direct[source] = compiled[0][1]
+            compiled_edges[source] = tuple(compiled)
+        self.direct: Mapping[str, str] = MappingProxyType(direct)
+        self.edges: Mapping[str, Tuple[tuple, ...]] = MappingProxyType(compiled_edges)
+
+        compiled_rules: Dict[str, Tuple[tuple, ...]] = {}
+        for source, rules in routing_rules.items():
+            ordered = sorted(rules, key=lambda r: r.priority, reverse=True)
+            compiled_rules[source] = tuple(self._compile_rule(rule) for rule in ordered)
+        self.rules: Mapping[str, Tuple[tuple, ...]] = MappingProxyType(compiled_rules)
+
+    @staticmethod
+    def _compile_rule(rule: RouteRule) -> tuple:
+        if type(rule).matches is not RouteRule.matches:
+            return (CUSTOM, rule, rule.target)
+        condition = rule.condition
+        if isinstance(condition, str):
+            return (SUBSTRING, condition.lower(), rule.target)
+        if isinstance(condition, Pattern):
+            return (REGEX, condition, rule.target)
+        if callable(condition):
+            return (CALLABLE, condition, rule.target)
+        return (CUSTOM, rule, rule.target)
+
+    def is_allowed(self, name: Any) -> bool:
+        """Whether the router config permits ``name``; everything is allowed without a whitelist."""
+        if self.allowed_mask is None:
+            return True
+        idx = self.node_index.get(name) if isinstance(name, str) else None
+        return idx is not None and bool((self.allowed_mask >> idx) & 1)
+
+    def match_rule(self, current_node: str, state: Dict[str, Any], query: str) -> Optional[str]:
+        rules = self.rules.get(current_node)
+        if not rules:
+            return None
+        # str(state) can be large; build it at most once per hop
+        haystack: Optional[str] = None
+        lowered: Optional[str] = None
+        for kind, condition, target in rules:
+            if kind == SUBSTRING:
+                if lowered is None:
+                    if haystack is None:
+                        haystack = query + str(state)
+                    lowered = haystack.lower()
+                if condition in lowered:
+                    return target
+            elif kind == REGEX:
+                if haystack is None:
+                    haystack = query + str(state)
+                if condition.search(haystack):
+                    return target
+            elif kind == CALLABLE:
+                if condition(state, query):
+                    return target
+            elif condition.matches(state, query):
+                return target
+        return None
@@ -0,0 +1,165 @@
+"""
+Copy-on-write checkpoint snapshots for the graph package.
+
+Instead of copying the whole state before every node, the engine records only
+the top-level keys that changed since the previous checkpoint plus a pointer to
+that parent snapshot. Full values are rebuilt on demand when ``.values`` is read.
+"""
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+from .types import StateSnapshot
+
+_MISSING = object()
+
+
+@dataclass(frozen=True)
+class ListExtension:
+    """Delta entry for a list that only grew since the parent snapshot."""
+
+    base_len: int
+    items: Tuple[Any, ...]
+
+
+class DeltaStateSnapshot(StateSnapshot):
+    """StateSnapshot that stores changed keys and shares the rest with its parent.
+
+    A snapshot without a parent is a keyframe and holds a shallow copy of the
+    full state. ``values`` is materialized lazily by replaying deltas from the
+    nearest keyframe, so it behaves like a regular ``StateSnapshot``.
+    """
+
+    def __init__(
+        self,
+        delta: Dict[str, Any],
+        next: Tuple[str, ...],
+        config: Dict[str, Any],
+        metadata: Dict[str, Any],
+        created_at: datetime,
+        parent: Optional[StateSnapshot] = None,
+        removed: FrozenSet[str] = frozenset(),
+        parent_config: Optional[Dict[str, Any]] = None,
+        tasks: Tuple[Any, ...] = (),
+    ):
+        self.delta = delta
+        self.removed = removed
+        self.parent = parent
+        self.next = next
+        self.config = config
+        self.metadata = metadata
+        self.created_at = created_at
+        self.parent_config = parent_config
+        self.tasks = tasks
+
+    @property
+    def values(self) -> Dict[str, Any]:
+        return self.materialize()
+
+    @property
+    def is_keyframe(self) -> bool:
+        return self.parent is None
+
+    def materialize(self) -> Dict[str, Any]:
+        """Rebuild the full state by applying deltas from the nearest keyframe."""
+        chain: List[DeltaStateSnapshot] = []
+        node: Optional[StateSnapshot] = self
+        while isinstance(node, DeltaStateSnapshot):
+            chain.append(node)
+            node = node.parent
+        values: Dict[str, Any] = dict(node.values) if node is not None else {}
+
+        # Lists copied during this rebuild can be extended in place
+        owned: set = set()
+        for snapshot in reversed(chain):
+            for key in snapshot.removed:
+                values.pop(key, None)
+                owned.discard(key)
+            for key, value in snapshot.delta.items():
+                if isinstance(value, ListExtension):
+                    current = values.get(key)
+                    if key in owned:
+                        del current[value.base_len:]
+                    else:
+                        current = list(current[:value.base_len]) if isinstance(current, list) else []
+                        owned.add(key)
+                    current.extend(value.items)
+                    values[key] = current
+                else:
+                    values[key] = value
+                    owned.discard(key)
+        return values
+
+
+def _diff_value(previous: Any, value: Any) -> Any:
+    """Encode an append-only list change as a ListExtension, else keep the value."""
+    if type(previous) is list and type(value) is list and len(value) >= len(previous):
+        if all(a is b for a, b in zip(previous, value)):
+            return ListExtension(len(previous), tuple(value[len(previous):]))
+    return value
+
+
+class SnapshotChain:
+    """Builds copy-on-write snapshots for a single graph run.
+
+    Only top-level key identity is compared, so nodes and reducers that return
+    new objects (the engine's reducers always do) are tracked without copying.
+    A keyframe is written every ``keyframe_interval`` snapshots to bound both
+    the rebuild cost and how much history a snapshot keeps alive.
+    """
+
+    def __init__(self, thread_id: str, keyframe_interval: int = 16):
+        self.thread_id = thread_id
+        self.keyframe_interval = max(1, int(keyframe_interval))
+        self.last: Optional[DeltaStateSnapshot] = None
+        self._refs: Dict[str, Any] = {}
+        self._since_keyframe = 0
+
+    def snapshot(
+        self,
+        state: Dict[str, Any],
+        next: Tuple[str, ...],
+        config: Dict[str, Any],
+        metadata: Dict[str, Any],
+    ) -> DeltaStateSnapshot:
+        previous = self.last
+        if previous is None or self._since_keyframe >= self.keyframe_interval:
+            delta = dict(state)
+            removed: FrozenSet[str] = frozenset()
+            parent = None
+            self._since_keyframe = 0
+        else:
+            delta = {}
+            for key, value in state.items():
+                old = self._refs.get(key, _MISSING)
+                if old is not value:
+                    delta[key] = _diff_value(old, value)
+            removed = frozenset(key for key in self._refs if key not in state)
+            parent = previous
+            self._since_keyframe += 1
+
+        metadata = dict(metadata)
+        metadata.setdefault("checkpoint_id", str(uuid.uuid4()))
+        parent_config = None
+        if previous is not None:
+            parent_config = {
+                "configurable": {
+                    "thread_id": self.thread_id,
+                    "checkpoint_id": previous.metadata["checkpoint_id"],
+                }
+            }
+
+        snapshot = DeltaStateSnapshot(
+            delta=delta,
+            next=next,
+            config=config,
+            metadata=metadata,
+            created_at=datetime.now(),
+            parent=parent,
+            removed=removed,
+            parent_config=parent_config,
+        )
+        self._refs = dict(state)
+        self.last = snapshot
+        return snapshot
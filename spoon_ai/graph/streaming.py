@@ -0,0 +1,71 @@
+"""
+Stream plumbing for CompiledGraph.stream: a bounded event buffer between the
+graph runner and the consumer, and the callback handler that relays LLM token
+chunks produced inside nodes.
+"""
+import asyncio
+from contextvars import ContextVar
+from typing import Any, Iterable, Optional
+from uuid import UUID
+
+from spoon_ai.callbacks.base import BaseCallbackHandler
+
+STREAM_MODES = ("values", "updates", "messages")
+
+# Name of the node executing in the current context, used to tag relayed chunks
+running_node: ContextVar[Optional[str]] = ContextVar("spoon_graph_running_node", default=None)
+
+_END = object()
+
+
+class StreamBuffer:
+    """Bounded queue of stream events.
+
+    ``emit`` waits while the buffer is full, so a slow consumer applies
+    backpressure to the graph instead of letting events pile up in memory.
+    Interrupt events are always delivered, whatever modes were requested.
+    """
+
+    def __init__(self, modes: Iterable[str], *, multi: bool = False, maxsize: int = 64):
+        self.modes = frozenset(modes)
+        self.multi = multi
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+
+    def wants(self, mode: str) -> bool:
+        return mode in self.modes
+
+    async def emit(self, mode: str, payload: Any) -> None:
+        if mode != "interrupt" and mode not in self.modes:
+            return
+        await self._queue.put((mode, payload) if self.multi else payload)
+
+    async def close(self) -> None:
+        await self._queue.put(_END)
+
+    async def get(self) -> Any:
+        """Return the next event, or raise StopAsyncIteration once the run has finished."""
+        item = await self._queue.get()
+        if item is _END:
+            raise StopAsyncIteration
+        return item
+
+    def qsize(self) -> int:
+        return self._queue.qsize()
+
+
+class MessageStreamHandler(BaseCallbackHandler):
+    """Relay streamed LLM tokens into a StreamBuffer as ``(chunk, metadata)`` pairs."""
+
+    def __init__(self, buffer: StreamBuffer):
+        self._buffer = buffer
+
+    async def on_llm_new_token(
+        self,
+        token: str,
+        *,
+        chunk: Any = None,
+        run_id: Optional[UUID] = None,
+        **kwargs: Any,
+    ) -> None:
+        metadata = {"node": running_node.get(), "run_id": run_id}
+        await self._buffer.emit("messages", (chunk if chunk is not None else token, metadata))
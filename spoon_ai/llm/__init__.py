@@ -5,68 +5,103 @@ This package provides a unified interface for working with different LLM provide
 including comprehensive configuration management, monitoring, and error handling.
 """
 
-from .interface import (
-    LLMProviderInterface,
-    ProviderCapability,
-    ProviderMetadata,
-    LLMResponse
-)
-
-from .registry import (
-    LLMProviderRegistry,
-    register_provider,
-    get_global_registry
-)
-
-from .config import (
-    ConfigurationManager,
-    ProviderConfig
-)
-
-from .monitoring import (
-    DebugLogger,
-    MetricsCollector,
-    RequestMetrics,
-    ProviderStats,
-    get_debug_logger,
-    get_metrics_collector
-)
-
-from .errors import (
-    LLMError,
-    ProviderError,
-    ConfigurationError,
-    RateLimitError,
-    AuthenticationError,
-    ModelNotFoundError,
-    TokenLimitError,
-    NetworkError,
-    ProviderUnavailableError,
-    ValidationError
-)
-
-from .manager import (
-    LLMManager,
-    FallbackStrategy,
-    LoadBalancer,
-    get_llm_manager,
-    set_llm_manager
-)
-
-from .response_normalizer import (
-    ResponseNormalizer,
-    get_response_normalizer
-)
-
-from .providers import (
-    OpenAIProvider,
-    AnthropicProvider,
-    GeminiProvider
-)
-
-# Legacy imports for backward compatibility
-from .base import LLMBase, LLMConfig
-from .factory import LLMFactory
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+# Exported name -> submodule defining it. Submodules are imported on first
+# access (PEP 562); in particular the provider SDKs are only loaded once a
+# provider class is used.
+_LAZY_ATTRS = {
+    # New unified interface
+    'LLMProviderInterface': '.interface',
+    'ProviderCapability': '.interface',
+    'ProviderMetadata': '.interface',
+    'LLMResponse': '.interface',
+
+    # Registry
+    'LLMProviderRegistry': '.registry',
+    'register_provider': '.registry',
+    'get_global_registry': '.registry',
+
+    # Configuration
+    'ConfigurationManager': '.config',
+    'ProviderConfig': '.config',
+
+    # Monitoring
+    'DebugLogger': '.monitoring',
+    'MetricsCollector': '.monitoring',
+    'RequestMetrics': '.monitoring',
+    'ProviderStats': '.monitoring',
+    'get_debug_logger': '.monitoring',
+    'get_metrics_collector': '.monitoring',
+
+    # Errors
+    'LLMError': '.errors',
+    'ProviderError': '.errors',
+    'ConfigurationError': '.errors',
+    'RateLimitError': '.errors',
+    'AuthenticationError': '.errors',
+    'ModelNotFoundError': '.errors',
+    'TokenLimitError': '.errors',
+    'NetworkError': '.errors',
+    'ProviderUnavailableError': '.errors',
+    'ValidationError': '.errors',
+
+    # Manager and orchestration
+    'LLMManager': '.manager',
+    'FallbackStrategy': '.manager',
+    'LoadBalancer': '.manager',
+    'get_llm_manager': '.manager',
+    'set_llm_manager': '.manager',
+    'BatchRequest': '.batch',
+    'BatchResult': '.batch',
+
+    # Response normalization
+    'ResponseNormalizer': '.response_normalizer',
+    'get_response_normalizer': '.response_normalizer',
+
+    # Provider implementations
+    'OpenAIProvider': '.providers.openai_provider',
+    'AnthropicProvider': '.providers.anthropic_provider',
+    'GeminiProvider': '.providers.gemini_provider',
+
+    # Legacy (for backward compatibility)
+    'LLMBase': '.base',
+    'LLMConfig': '.base',
+    'LLMFactory': '.factory',
+}
+
+if TYPE_CHECKING:
+    from .interface import LLMProviderInterface, ProviderCapability, ProviderMetadata, LLMResponse
+    from .registry import LLMProviderRegistry, register_provider, get_global_registry
+    from .config import ConfigurationManager, ProviderConfig
+    from .monitoring import (
+        DebugLogger, MetricsCollector, RequestMetrics, ProviderStats, get_debug_logger, get_metrics_collector
+    )
+    from .errors import (
+        LLMError, ProviderError, ConfigurationError, RateLimitError, AuthenticationError,
+        ModelNotFoundError, TokenLimitError, NetworkError, ProviderUnavailableError, ValidationError
+    )
+    from .manager import LLMManager, FallbackStrategy, LoadBalancer, get_llm_manager, set_llm_manager
+    from .batch import BatchRequest, BatchResult
+    from .response_normalizer import ResponseNormalizer, get_response_normalizer
+    from .providers import OpenAIProvider, AnthropicProvider, GeminiProvider
+    from .base import LLMBase, LLMConfig
+    from .factory import LLMFactory
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
 
 __all__ = [
     # New unified interface
@@ -110,6 +145,8 @@ __all__ = [
     'LoadBalancer',
     'get_llm_manager',
     'set_llm_manager',
+    'BatchRequest',
+    'BatchResult',
     
     # Response normalization
     'ResponseNormalizer',
@@ -0,0 +1,368 @@
+"""
+Batch inference on top of LLMManager: adaptive concurrency, results streamed
+as they finish and resumable on-disk checkpoints.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import random
+from dataclasses import dataclass, field
+from datetime import datetime
+from logging import getLogger
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Iterable, List, Optional, Union
+
+from spoon_ai.schema import Message, ToolCall
+
+from .cache import request_key
+from .errors import NetworkError, RateLimitError
+from .interface import LLMResponse
+
+if TYPE_CHECKING:
+    from .manager import LLMManager
+
+logger = getLogger(__name__)
+
+SUCCESS = "success"
+THROTTLED = "throttled"
+FAILED = "failed"
+
+
+@dataclass
+class BatchRequest:
+    """One chat request in a batch."""
+    messages: List[Message]
+    provider: Optional[str] = None
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+    request_id: Optional[str] = None
+
+    @classmethod
+    def coerce(cls, item: Union["BatchRequest", List[Any], Dict[str, Any]]) -> "BatchRequest":
+        """Build a request from a BatchRequest, a message list or a dict.
+
+        Dicts take ``messages``, ``provider`` and ``request_id``; any other
+        key is passed to ``LLMManager.chat`` as a keyword argument.
+        """
+        if isinstance(item, BatchRequest):
+            return item
+        if isinstance(item, dict):
+            params = dict(item)
+            messages = params.pop('messages')
+            provider = params.pop('provider', None)
+            request_id = params.pop('request_id', None)
+            return cls(_coerce_messages(messages), provider, params, request_id)
+        return cls(_coerce_messages(item))
+
+
+def _coerce_messages(messages: List[Any]) -> List[Message]:
+    return [m if isinstance(m, Message) else Message(**m) for m in messages]
+
+
+@dataclass
+class BatchResult:
+    """Outcome of one batch request."""
+    index: int
+    request_id: str
+    response: Optional[LLMResponse] = None
+    error: Optional[BaseException] = None
+    attempts: int = 0
+    resumed: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class AdaptiveConcurrency:
+    """AIMD concurrency limit.
+
+    Each success raises the limit by ``increase / limit`` (about +1 per
+    window of requests); a throttled request (429 or timeout) multiplies it
+    by ``decrease``. Requests started before the last decrease cannot
+    decrease it again, so one burst of 429s halves the limit once.
+    """
+
+    def __init__(self, max_limit: int, initial: Optional[int] = None, min_limit: int = 1,
+                 increase: float = 1.0, decrease: float = 0.5):
+        if max_limit < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_limit}")
+        self.max_limit = max_limit
+        self.min_limit = max(1, min(min_limit, max_limit))
+        self.limit = float(initial if initial is not None else max_limit)
+        self.increase = increase
+        self.decrease = decrease
+        self.in_flight = 0
+        self.decreases = 0
+        self._epoch = 0
+        self._condition = asyncio.Condition()
+
+    async def acquire(self) -> int:
+        """Wait for a slot; returns the epoch to pass back to ``release``."""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < int(self.limit))
+            self.in_flight += 1
+            return self._epoch
+
+    async def release(self, epoch: int, outcome: str) -> None:
+        async with self._condition:
+            self.in_flight -= 1
+            if outcome == THROTTLED:
+                if epoch == self._epoch:
+                    self.limit = max(float(self.min_limit), self.limit * self.decrease)
+                    self._epoch += 1
+                    self.decreases += 1
+                    logger.debug(f"Batch concurrency decreased to {int(self.limit)}")
+            elif outcome == SUCCESS:
+                self.limit = min(float(self.max_limit), self.limit + self.increase / self.limit)
+            self._condition.notify_all()
+
+
+def _response_to_dict(response: LLMResponse) -> Dict[str, Any]:
+    return {
+        'content': response.content,
+        'provider': response.provider,
+        'model': response.model,
+        'finish_reason': response.finish_reason,
+        'native_finish_reason': response.native_finish_reason,
+        'tool_calls': [tool_call.model_dump() for tool_call in response.tool_calls],
+        'usage': response.usage,
+        'metadata': response.metadata,
+        'request_id': response.request_id,
+        'duration': response.duration,
+        'timestamp': response.timestamp.isoformat(),
+    }
+
+
+def _response_from_dict(data: Dict[str, Any]) -> LLMResponse:
+    data = dict(data)
+    data['tool_calls'] = [ToolCall(**tool_call) for tool_call in data.get('tool_calls') or []]
+    data['timestamp'] = datetime.fromisoformat(data['timestamp'])
+    return LLMResponse(**data)
+
+
+class BatchCheckpoint:
+    """Append-only JSONL file recording each completed request of a batch.
+
+    The first line identifies the batch; resuming with a different set of
+    requests is refused rather than returning mismatched responses. A line
+    torn by a crash is ignored and its request runs again.
+    """
+
+    def __init__(self, path: str, batch_key: str):
+        self.path = path
+        self.batch_key = batch_key
+        self._file = None
+
+    def load(self) -> Dict[int, LLMResponse]:
+        """Return the responses already recorded, by request index."""
+        if not os.path.exists(self.path):
+            return {}
+        completed: Dict[int, LLMResponse] = {}
+        with open(self.path, 'r', encoding='utf-8') as f:
+            header = f.readline()
+            if not header.strip():
+                return {}
+            if json.loads(header).get('batch') != self.batch_key:
+                raise ValueError(f"Checkpoint {self.path} belongs to a different batch")
+            for line in f:
+                try:
+                    record = json.loads(line)
+                    completed[record['index']] = _response_from_dict(record['response'])
+                except (ValueError, KeyError, TypeError):
+                    logger.warning(f"Skipping unreadable checkpoint record in {self.path}")
+        return completed
+
+    def record(self, index: int, request_id: str, response: LLMResponse) -> None:
+        if self._file is None:
+            new = not os.path.exists(self.path) or os.path.getsize(self.path) == 0
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            if not new:
+                with open(self.path, 'rb') as f:
+                    f.seek(-1, os.SEEK_END)
+                    torn = f.read(1) != b"\n"
+            self._file = open(self.path, 'a', encoding='utf-8')
+            if new:
+                self._file.write(json.dumps({'batch': self.batch_key}) + "\n")
+            elif torn:
+                # Terminate a record cut short by a crash so it stays a single bad line
+                self._file.write("\n")
+        record = {'index': index, 'request_id': request_id, 'response': _response_to_dict(response)}
+        self._file.write(json.dumps(record, default=str) + "\n")
+        self._file.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def _batch_key(requests: List[BatchRequest]) -> str:
+    digest = hashlib.sha256()
+    for request in requests:
+        try:
+            key = request_key(request.messages, request.provider or "", **request.kwargs)
+        except TypeError:
+            params = {name: repr(value) for name, value in request.kwargs.items()}
+            key = request_key(request.messages, request.provider or "", **params)
+        digest.update(f"{request.request_id}:{key}\n".encode())
+    return digest.hexdigest()
+
+
+def _is_throttle(error: BaseException) -> bool:
+    """Whether an error (or the error it wraps) is a 429 or a timeout."""
+    while error is not None:
+        if isinstance(error, (RateLimitError, NetworkError, asyncio.TimeoutError)):
+            return True
+        error = getattr(error, 'original_error', None)
+    return False
+
+
+def _retry_after(error: BaseException) -> Optional[float]:
+    while error is not None:
+        if getattr(error, 'retry_after', None):
+            return float(error.retry_after)
+        error = getattr(error, 'original_error', None)
+    return None
+
+
+class BatchRunner:
+    """Runs a batch of chat requests through an LLMManager.
+
+    Requests go through ``LLMManager.chat``, so provider pools, fallback and
+    coalescing apply to each of them. Concurrency adapts with AIMD, and
+    throttled requests are retried with backoff up to ``max_retries``
+    times. Other failures are reported in their BatchResult without
+    stopping the batch.
+    """
+
+    def __init__(self,
+                 manager: "LLMManager",
+                 requests: Iterable[Union[BatchRequest, List[Any], Dict[str, Any]]],
+                 max_concurrency: int = 8,
+                 ordered: bool = False,
+                 checkpoint_path: Optional[str] = None,
+                 max_retries: int = 3,
+                 retry_backoff: float = 1.0,
+                 request_timeout: Optional[float] = None):
+        self.manager = manager
+        self.requests = [BatchRequest.coerce(item) for item in requests]
+        for index, request in enumerate(self.requests):
+            if request.request_id is None:
+                request.request_id = str(index)
+        self.ordered = ordered
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.request_timeout = request_timeout
+        self.limiter = AdaptiveConcurrency(max_concurrency)
+        self.checkpoint = BatchCheckpoint(checkpoint_path, _batch_key(self.requests)) if checkpoint_path else None
+        self.stats = {'completed': 0, 'failed': 0, 'resumed': 0, 'retries': 0, 'throttled': 0}
+
+    async def run(self) -> AsyncIterator[BatchResult]:
+        """Yield a BatchResult per request, as they finish or in input order."""
+        completed = self.checkpoint.load() if self.checkpoint else {}
+        pending = [index for index in range(len(self.requests)) if index not in completed]
+        queue: asyncio.Queue = asyncio.Queue()
+        buffer: Dict[int, BatchResult] = {}
+        next_index = 0
+        scheduler = asyncio.create_task(self._schedule(pending, queue))
+        try:
+            resumed = [
+                BatchResult(index, self.requests[index].request_id, response, resumed=True)
+                for index, response in sorted(completed.items())
+            ]
+            self.stats['resumed'] = len(resumed)
+            for result in resumed:
+                if self.ordered:
+                    buffer[result.index] = result
+                else:
+                    yield result
+
+            remaining = len(pending)
+            while True:
+                if self.ordered:
+                    while next_index in buffer:
+                        yield buffer.pop(next_index)
+                        next_index += 1
+                if not remaining:
+                    break
+                result = await queue.get()
+                remaining -= 1
+                if self.ordered:
+                    buffer[result.index] = result
+                else:
+                    yield result
+            await scheduler
+        finally:
+            if not scheduler.done():
+                scheduler.cancel()
+            await asyncio.gather(scheduler, return_exceptions=True)
+            if self.checkpoint:
+                self.checkpoint.close()
+
+    async def _schedule(self, indices: List[int], queue: asyncio.Queue) -> None:
+        tasks = set()
+        try:
+            for index in indices:
+                epoch = await self.limiter.acquire()
+                task = asyncio.create_task(self._run_one(index, epoch, queue))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _run_one(self, index: int, epoch: int, queue: asyncio.Queue) -> None:
+        request = self.requests[index]
+        attempts = 0
+        holding = True
+        try:
+            while True:
+                attempts += 1
+                try:
+                    call = self.manager.chat(request.messages, provider=request.provider, **request.kwargs)
+                    if self.request_timeout:
+                        response = await asyncio.wait_for(call, self.request_timeout)
+                    else:
+                        response = await call
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    throttled = _is_throttle(e)
+                    holding = False
+                    await self.limiter.release(epoch, THROTTLED if throttled else FAILED)
+                    if throttled:
+                        self.stats['throttled'] += 1
+                    if throttled and attempts <= self.max_retries:
+                        self.stats['retries'] += 1
+                        await asyncio.sleep(self._backoff(e, attempts))
+                        epoch = await self.limiter.acquire()
+                        holding = True
+                        continue
+                    self.stats['failed'] += 1
+                    logger.warning(f"Batch request {request.request_id} failed after {attempts} attempt(s): {e}")
+                    await queue.put(BatchResult(index, request.request_id, error=e, attempts=attempts))
+                    return
+
+                holding = False
+                await self.limiter.release(epoch, SUCCESS)
+                if self.checkpoint:
+                    self.checkpoint.record(index, request.request_id, response)
+                self.stats['completed'] += 1
+                await queue.put(BatchResult(index, request.request_id, response, attempts=attempts))
+                return
+        finally:
+            if holding:
+                await self.limiter.release(epoch, FAILED)
+
+    def _backoff(self, error: BaseException, attempts: int) -> float:
+        retry_after = _retry_after(error)
+        if retry_after is not None:
+            return retry_after
+        return min(60.0, self.retry_backoff * (2 ** (attempts - 1))) * random.uniform(0.5, 1.5)
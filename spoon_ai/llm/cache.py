@@ -2,18 +2,68 @@
 Caching system for LLM responses to improve performance.
 """
 
+import asyncio
 import hashlib
 import json
+import pickle
+import sqlite3
+import threading
 import time
-from typing import Dict, Any, Optional, List
+import zlib
+from collections import OrderedDict
+from typing import Dict, Any, Optional, List, Awaitable, Callable, Tuple
 from dataclasses import dataclass, field
 from logging import getLogger
 
 from .interface import LLMResponse
-from spoon_ai.schema import Message
+from spoon_ai.schema import Message, message_key
 
 logger = getLogger(__name__)
 
+# Payload header byte: raw pickle or zlib-compressed pickle
+_RAW = b"\x00"
+_ZLIB = b"\x01"
+
+
+def request_key(messages: List[Message], provider: str, **kwargs) -> str:
+    """Normalized hash of an LLM request, shared by the cache and request coalescing.
+
+    Args:
+        messages: List of messages
+        provider: Provider name
+        **kwargs: Additional request parameters
+
+    Returns:
+        str: Hex digest identifying the request
+
+    Raises:
+        TypeError: If a parameter is not JSON serializable
+    """
+    normalized = []
+    for msg in messages:
+        item = {'role': msg.role, 'content': msg.content}
+        # Only present when set, so keys of plain messages stay stable
+        for attr in ('name', 'tool_call_id'):
+            if getattr(msg, attr, None):
+                item[attr] = getattr(msg, attr)
+        if getattr(msg, 'tool_calls', None):
+            item['tool_calls'] = [
+                tool_call.model_dump() if hasattr(tool_call, 'model_dump') else tool_call
+                for tool_call in msg.tool_calls
+            ]
+        normalized.append(item)
+
+    # Create a deterministic representation of the request
+    cache_data = {
+        'messages': normalized,
+        'provider': provider,
+        'params': {k: v for k, v in sorted(kwargs.items()) if k not in ['request_id', 'timestamp']}
+    }
+
+    # Generate hash
+    cache_str = json.dumps(cache_data, sort_keys=True)
+    return hashlib.sha256(cache_str.encode()).hexdigest()
+
 
 @dataclass
 class CacheEntry:
@@ -22,16 +72,20 @@ class CacheEntry:
     timestamp: float
     access_count: int = 0
     last_accessed: float = field(default_factory=time.time)
+    ttl: Optional[float] = None
     
-    def is_expired(self, ttl: float) -> bool:
+    def is_expired(self, ttl: Optional[float] = None) -> bool:
         """Check if cache entry is expired.
         
         Args:
-            ttl: Time to live in seconds
+            ttl: Time to live in seconds; the entry's own TTL is used when omitted
             
         Returns:
             bool: True if expired
         """
+        ttl = ttl if ttl is not None else self.ttl
+        if ttl is None:
+            return False
         return time.time() - self.timestamp > ttl
     
     def touch(self) -> None:
@@ -40,26 +94,278 @@ class CacheEntry:
         self.last_accessed = time.time()
 
 
+class MessageConversionCache:
+    """Bounded cache of provider-format messages keyed by ``message_key``.
+
+    Agent conversations resend the same history every turn; with this cache a
+    provider converts only the messages it has not seen before. Keys hold the
+    message id and content, so edited messages are converted again and equal
+    messages rebuilt from dicts still hit. Cached values are shared between
+    requests and must be treated as read-only.
+
+    Eviction is first-in-first-out: a hit costs one dict lookup, and a
+    long-lived message that gets evicted is simply converted once more.
+    """
+
+    def __init__(self, max_entries: int = 4096):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Converted messages to keep; 0 disables caching
+        """
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[Tuple[Any, ...], Any] = {}
+
+    def convert_all(self, messages: List[Message], convert: Callable[[Message], Any],
+                    context: Optional[Callable[[Message], Any]] = None) -> List[Any]:
+        """Return ``[convert(m) for m in messages]``, reusing results for identical messages.
+
+        Args:
+            messages: Messages to convert
+            convert: Provider conversion of a single message
+            context: Extra key component, for conversions that depend on more
+                than the message itself (e.g. on other messages of the history)
+
+        Returns:
+            List[Any]: The converted messages, in order
+        """
+        if self.max_entries <= 0:
+            return [convert(message) for message in messages]
+        entries = self._entries
+        converted = []
+        misses = 0
+        for message in messages:
+            key = message_key(message)
+            if context is not None:
+                key += (context(message),)
+            value = entries.get(key)
+            if value is None:
+                misses += 1
+                value = entries[key] = convert(message)
+            converted.append(value)
+        self.hits += len(messages) - misses
+        self.misses += misses
+        while len(entries) > self.max_entries:
+            del entries[next(iter(entries))]
+        return converted
+
+    def convert(self, message: Message, convert: Callable[[Message], Any]) -> Any:
+        """Return ``convert(message)``, reusing the result for an identical message."""
+        return self.convert_all([message], convert)[0]
+
+    def clear(self) -> None:
+        """Drop every cached conversion."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class DiskCacheTier:
+    """SQLite-backed second cache tier, bounded by total payload bytes.
+
+    Entries survive restarts and can be shared by several processes on the
+    same host. Responses are stored as pickles, so only point it at a file
+    written by trusted processes. When the tier grows past ``max_bytes`` the
+    least recently used entries are deleted through an index on access time.
+
+    The stored byte total is tracked incrementally and re-read from the file
+    every ``resync_interval`` writes, which also picks up writes made by
+    other processes.
+    """
+
+    def __init__(
+        self,
+        path: str = "llm_cache.db",
+        max_bytes: int = 256 * 1024 * 1024,
+        *,
+        compress_threshold: int = 1024,
+        timeout: float = 30.0,
+        resync_interval: int = 256,
+    ):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.compress_threshold = compress_threshold
+        self.resync_interval = resync_interval
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(path, timeout=timeout, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                created_at REAL NOT NULL,
+                ttl REAL,
+                last_access REAL NOT NULL,
+                size INTEGER NOT NULL,
+                payload BLOB NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_entries_last_access ON entries(last_access);
+            """
+        )
+        self._bytes = self._total_bytes()
+        self._writes_since_sync = 0
+
+    def _total_bytes(self) -> int:
+        return self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+
+    def _dumps(self, response: LLMResponse) -> bytes:
+        data = pickle.dumps(response, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(data) >= self.compress_threshold:
+            return _ZLIB + zlib.compress(data, 1)
+        return _RAW + data
+
+    @staticmethod
+    def _loads(payload: bytes) -> LLMResponse:
+        header, body = payload[:1], payload[1:]
+        if header == _ZLIB:
+            body = zlib.decompress(body)
+        return pickle.loads(body)
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT created_at, ttl, payload FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            created_at, ttl, payload = row
+            self._conn.execute("UPDATE entries SET last_access = ? WHERE key = ?", (time.time(), key))
+        try:
+            response = self._loads(payload)
+        except Exception as e:
+            logger.warning(f"Dropping unreadable disk cache entry {key[:16]}...: {e}")
+            self.delete(key)
+            return None
+        return CacheEntry(response=response, timestamp=created_at, ttl=ttl)
+
+    def put(self, key: str, entry: CacheEntry) -> None:
+        payload = self._dumps(entry.response)
+        if len(payload) > self.max_bytes:
+            return
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._writes_since_sync += 1
+                if self._writes_since_sync >= self.resync_interval:
+                    self._bytes = self._total_bytes()
+                    self._writes_since_sync = 0
+                replaced = self._conn.execute("SELECT size FROM entries WHERE key = ?", (key,)).fetchone()
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO entries (key, created_at, ttl, last_access, size, payload) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, entry.timestamp, entry.ttl, now, len(payload), payload),
+                )
+                self._bytes += len(payload) - (replaced[0] if replaced else 0)
+                self._evict()
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                # The running total may be off; re-read it on the next write
+                self._writes_since_sync = self.resync_interval
+                raise
+
+    def _evict(self) -> int:
+        removed = 0
+        while self._bytes > self.max_bytes:
+            rows = self._conn.execute(
+                "SELECT key, size FROM entries ORDER BY last_access LIMIT 64"
+            ).fetchall()
+            if not rows:
+                self._bytes = 0
+                break
+            doomed = []
+            for key, size in rows:
+                doomed.append((key,))
+                self._bytes -= size
+                if self._bytes <= self.max_bytes:
+                    break
+            self._conn.executemany("DELETE FROM entries WHERE key = ?", doomed)
+            removed += len(doomed)
+        return removed
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            row = self._conn.execute("SELECT size FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self._bytes -= row[0]
+
+    def cleanup_expired(self, default_ttl: Optional[float]) -> int:
+        now = time.time()
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM entries WHERE created_at + COALESCE(ttl, ?) < ?",
+                (default_ttl if default_ttl is not None else float("inf"), now),
+            )
+            if cursor.rowcount:
+                self._bytes = self._total_bytes()
+            return cursor.rowcount
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+            self._bytes = 0
+
+    def stats(self) -> Tuple[int, int]:
+        """Return (entries, bytes) currently stored."""
+        with self._lock:
+            count, size = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+        return count, size
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
 class LLMResponseCache:
-    """Cache for LLM responses with TTL and size limits."""
+    """Cache for LLM responses with TTL and size limits.
+
+    The memory tier is an ``OrderedDict`` kept in LRU order, so lookups,
+    inserts and evictions are O(1). An optional ``DiskCacheTier`` is written
+    through on every put and consulted on memory misses, which keeps the
+    cache warm across restarts. ``get_or_compute`` adds single-flight: one
+    provider call per key no matter how many identical requests are waiting.
+    """
     
-    def __init__(self, max_size: int = 1000, default_ttl: float = 3600):
+    def __init__(
+        self,
+        max_size: int = 1000,
+        default_ttl: float = 3600,
+        *,
+        disk: Optional[DiskCacheTier] = None,
+        disk_path: Optional[str] = None,
+        disk_max_bytes: int = 256 * 1024 * 1024,
+    ):
         """Initialize cache.
         
         Args:
-            max_size: Maximum number of entries
+            max_size: Maximum number of entries kept in memory
             default_ttl: Default time to live in seconds
+            disk: Disk tier instance (optional)
+            disk_path: Create a SQLite disk tier at this path (optional)
+            disk_max_bytes: Byte budget for a disk tier created from ``disk_path``
         """
         self.max_size = max_size
         self.default_ttl = default_ttl
-        self._cache: Dict[str, CacheEntry] = {}
+        self._cache: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._lock = threading.RLock()
+        if disk is None and disk_path:
+            disk = DiskCacheTier(disk_path, disk_max_bytes)
+        self.disk = disk
+        self._inflight: Dict[str, asyncio.Future] = {}
         self._stats = {
             'hits': 0,
             'misses': 0,
             'evictions': 0,
-            'size': 0
+            'size': 0,
+            'disk_hits': 0,
+            'coalesced': 0,
         }
-    
     def _generate_key(self, messages: List[Message], provider: str, **kwargs) -> str:
         """Generate cache key from request parameters.
         
@@ -71,16 +377,7 @@ class LLMResponseCache:
         Returns:
             str: Cache key
         """
-        # Create a deterministic representation of the request
-        cache_data = {
-            'messages': [{'role': msg.role, 'content': msg.content} for msg in messages],
-            'provider': provider,
-            'params': {k: v for k, v in sorted(kwargs.items()) if k not in ['request_id', 'timestamp']}
-        }
-        
-        # Generate hash
-        cache_str = json.dumps(cache_data, sort_keys=True)
-        return hashlib.sha256(cache_str.encode()).hexdigest()
+        return request_key(messages, provider, **kwargs)
     
     def get(self, messages: List[Message], provider: str, ttl: Optional[float] = None, **kwargs) -> Optional[LLMResponse]:
         """Get cached response if available and not expired.
@@ -95,68 +392,189 @@ class LLMResponseCache:
             Optional[LLMResponse]: Cached response if available
         """
         key = self._generate_key(messages, provider, **kwargs)
-        entry = self._cache.get(key)
-        
-        if entry is None:
-            self._stats['misses'] += 1
-            return None
-        
-        # Check if expired
-        ttl = ttl or self.default_ttl
-        if entry.is_expired(ttl):
-            del self._cache[key]
-            self._stats['misses'] += 1
-            self._stats['size'] = len(self._cache)
-            return None
-        
-        # Update access info and return
-        entry.touch()
-        self._stats['hits'] += 1
-        
-        logger.debug(f"Cache hit for key: {key[:16]}...")
-        return entry.response
+        return self._lookup(key, ttl)
+    
+    def _lookup(self, key: str, ttl: Optional[float] = None) -> Optional[LLMResponse]:
+        response = self._memory_lookup(key, ttl)
+        if response is None and self.disk is not None:
+            response = self._disk_lookup(key, ttl)
+        if response is None:
+            with self._lock:
+                self._stats['misses'] += 1
+        return response
+
+    def _memory_lookup(self, key: str, ttl: Optional[float] = None) -> Optional[LLMResponse]:
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                if self._expired(entry, ttl):
+                    del self._cache[key]
+                    self._stats['size'] = len(self._cache)
+                    entry = None
+                else:
+                    self._cache.move_to_end(key)
+                    entry.touch()
+                    self._stats['hits'] += 1
+                    logger.debug(f"Cache hit for key: {key[:16]}...")
+                    return entry.response
+        return None
+
+    def _disk_lookup(self, key: str, ttl: Optional[float] = None) -> Optional[LLMResponse]:
+        """Read through the disk tier, promoting a hit into the memory tier.
+
+        Blocking (SQLite and unpickling); async callers run it in a worker thread.
+        """
+        entry = self.disk.get(key)
+        if entry is not None and not self._expired(entry, ttl):
+            entry.touch()
+            with self._lock:
+                self._store(key, entry)
+                self._stats['hits'] += 1
+                self._stats['disk_hits'] += 1
+            logger.debug(f"Disk cache hit for key: {key[:16]}...")
+            return entry.response
+        if entry is not None:
+            self.disk.delete(key)
+        return None
     
-    def put(self, messages: List[Message], provider: str, response: LLMResponse, **kwargs) -> None:
+    def _expired(self, entry: CacheEntry, ttl: Optional[float]) -> bool:
+        if ttl is not None:
+            return entry.is_expired(ttl)
+        return entry.is_expired(entry.ttl if entry.ttl is not None else self.default_ttl)
+    
+    def put(self, messages: List[Message], provider: str, response: LLMResponse, ttl: Optional[float] = None, **kwargs) -> None:
         """Store response in cache.
         
         Args:
             messages: List of messages
             provider: Provider name
             response: Response to cache
+            ttl: Time to live for this entry (defaults to ``default_ttl``)
             **kwargs: Additional parameters
         """
         key = self._generate_key(messages, provider, **kwargs)
-        
-        # Check if we need to evict entries
-        if len(self._cache) >= self.max_size:
-            self._evict_lru()
-        
-        # Store entry
+        self._put(key, response, ttl)
+    
+    def _put(self, key: str, response: LLMResponse, ttl: Optional[float] = None) -> None:
+        entry = self._put_memory(key, response, ttl)
+        if self.disk is not None:
+            self._write_disk(key, entry)
+
+    def _put_memory(self, key: str, response: LLMResponse, ttl: Optional[float] = None) -> CacheEntry:
         entry = CacheEntry(
             response=response,
-            timestamp=time.time()
+            timestamp=time.time(),
+            ttl=ttl
         )
+        with self._lock:
+            self._store(key, entry)
+        logger.debug(f"Cached response for key: {key[:16]}...")
+        return entry
+
+    def _write_disk(self, key: str, entry: CacheEntry) -> None:
+        """Write through to the disk tier (blocking; async callers run it in a worker thread)."""
+        try:
+            self.disk.put(key, entry)
+        except Exception as e:
+            logger.warning(f"Failed to write disk cache entry {key[:16]}...: {e}")
+    
+    def _store(self, key: str, entry: CacheEntry) -> None:
+        """Insert into the memory tier as most recently used, evicting as needed (lock held)."""
         self._cache[key] = entry
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.max_size:
+            self._evict_lru()
         self._stats['size'] = len(self._cache)
-        
-        logger.debug(f"Cached response for key: {key[:16]}...")
     
     def _evict_lru(self) -> None:
         """Evict least recently used entry."""
         if not self._cache:
             return
         
-        # Find LRU entry
-        lru_key = min(self._cache.keys(), key=lambda k: self._cache[k].last_accessed)
-        del self._cache[lru_key]
+        lru_key, _ = self._cache.popitem(last=False)
         self._stats['evictions'] += 1
         
         logger.debug(f"Evicted LRU entry: {lru_key[:16]}...")
     
+    async def get_or_compute(
+        self,
+        messages: List[Message],
+        provider: str,
+        compute: Callable[[], Awaitable[LLMResponse]],
+        ttl: Optional[float] = None,
+        **kwargs
+    ) -> LLMResponse:
+        """Return the cached response, or compute and cache it exactly once.
+        
+        Concurrent callers with the same key wait for the first caller's
+        ``compute`` instead of issuing their own provider call. Failures are
+        propagated to every waiter and are not cached.
+        
+        Args:
+            messages: List of messages
+            provider: Provider name
+            compute: Coroutine function producing the response on a miss
+            ttl: Time to live for a newly cached entry
+            **kwargs: Additional parameters
+            
+        Returns:
+            LLMResponse: Response (cached or fresh)
+        """
+        key = self._generate_key(messages, provider, **kwargs)
+        while True:
+            cached = self._memory_lookup(key)
+            pending = self._inflight.get(key)
+            if cached is None and pending is None and self.disk is not None:
+                # SQLite I/O and unpickling run in a worker thread, off the event loop
+                cached = await asyncio.to_thread(self._disk_lookup, key)
+                if cached is None:
+                    # Another caller may have filled or claimed the key meanwhile
+                    cached = self._memory_lookup(key)
+                    pending = self._inflight.get(key)
+            if cached is not None:
+                return cached
+            with self._lock:
+                self._stats['misses'] += 1
+            if pending is None:
+                break
+            self._stats['coalesced'] += 1
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if asyncio.current_task().cancelling():
+                    raise
+                # the leading call was cancelled, not us: take over
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            response = await compute()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            if not future.done():
+                future.set_exception(e)
+                # mark retrieved so an unawaited failure is not logged
+                future.exception()
+            raise
+        else:
+            entry = self._put_memory(key, response, ttl)
+            if not future.done():
+                future.set_result(response)
+            if self.disk is not None:
+                await asyncio.to_thread(self._write_disk, key, entry)
+            return response
+        finally:
+            self._inflight.pop(key, None)
+    
     def clear(self) -> None:
         """Clear all cache entries."""
-        self._cache.clear()
-        self._stats['size'] = 0
+        with self._lock:
+            self._cache.clear()
+            self._stats['size'] = 0
+        if self.disk is not None:
+            self.disk.clear()
         logger.info("Cache cleared")
     
     def get_stats(self) -> Dict[str, Any]:
@@ -168,15 +586,22 @@ class LLMResponseCache:
         total_requests = self._stats['hits'] + self._stats['misses']
         hit_rate = self._stats['hits'] / total_requests if total_requests > 0 else 0
         
-        return {
+        stats = {
             'hits': self._stats['hits'],
             'misses': self._stats['misses'],
             'evictions': self._stats['evictions'],
             'size': self._stats['size'],
             'max_size': self.max_size,
             'hit_rate': hit_rate,
-            'total_requests': total_requests
+            'total_requests': total_requests,
+            'disk_hits': self._stats['disk_hits'],
+            'coalesced': self._stats['coalesced'],
+            'in_flight': len(self._inflight),
         }
+        if self.disk is not None:
+            stats['disk_entries'], stats['disk_bytes'] = self.disk.stats()
+            stats['disk_max_bytes'] = self.disk.max_bytes
+        return stats
     
     def cleanup_expired(self) -> int:
         """Remove expired entries.
@@ -184,22 +609,20 @@ class LLMResponseCache:
         Returns:
             int: Number of entries removed
         """
-        expired_keys = []
-        current_time = time.time()
-        
-        for key, entry in self._cache.items():
-            if current_time - entry.timestamp > self.default_ttl:
-                expired_keys.append(key)
-        
-        for key in expired_keys:
-            del self._cache[key]
+        with self._lock:
+            expired_keys = [key for key, entry in self._cache.items() if self._expired(entry, None)]
+            for key in expired_keys:
+                del self._cache[key]
+            self._stats['size'] = len(self._cache)
         
-        self._stats['size'] = len(self._cache)
+        removed = len(expired_keys)
+        if self.disk is not None:
+            removed += self.disk.cleanup_expired(self.default_ttl)
         
-        if expired_keys:
-            logger.info(f"Cleaned up {len(expired_keys)} expired cache entries")
+        if removed:
+            logger.info(f"Cleaned up {removed} expired cache entries")
         
-        return len(expired_keys)
+        return removed
 
 
 # Global cache instance
@@ -257,18 +680,13 @@ class CachedLLMManager:
         if not (self.cache_enabled and use_cache):
             return await self.manager.chat(messages, provider=provider, **kwargs)
         
-        # Try to get from cache
-        cached_response = self.cache.get(messages, provider or 'default', **kwargs)
-        if cached_response is not None:
-            return cached_response
-        
-        # Get fresh response
-        response = await self.manager.chat(messages, provider=provider, **kwargs)
-        
-        # Cache the response
-        self.cache.put(messages, provider or 'default', response, **kwargs)
-        
-        return response
+        # Identical concurrent requests share one provider call
+        return await self.cache.get_or_compute(
+            messages,
+            provider or 'default',
+            lambda: self.manager.chat(messages, provider=provider, **kwargs),
+            **kwargs
+        )
     
     async def chat_with_tools(self, messages: List[Message], tools: List[Dict], provider: Optional[str] = None, use_cache: bool = True, **kwargs) -> LLMResponse:
         """Chat with tools and caching support.
@@ -283,24 +701,17 @@ class CachedLLMManager:
         Returns:
             LLMResponse: Response (cached or fresh)
         """
-        # Include tools in cache key
-        kwargs['tools'] = tools
-        
         if not (self.cache_enabled and use_cache):
             return await self.manager.chat_with_tools(messages, tools, provider=provider, **kwargs)
         
-        # Try to get from cache
-        cached_response = self.cache.get(messages, provider or 'default', **kwargs)
-        if cached_response is not None:
-            return cached_response
-        
-        # Get fresh response
-        response = await self.manager.chat_with_tools(messages, tools, provider=provider, **kwargs)
-        
-        # Cache the response
-        self.cache.put(messages, provider or 'default', response, **kwargs)
-        
-        return response
+        # Include tools in cache key
+        return await self.cache.get_or_compute(
+            messages,
+            provider or 'default',
+            lambda: self.manager.chat_with_tools(messages, tools, provider=provider, **kwargs),
+            tools=tools,
+            **kwargs
+        )
     
     def enable_cache(self) -> None:
         """Enable caching."""
@@ -0,0 +1,88 @@
+"""
+Single-flight coalescing of identical concurrent LLM requests.
+"""
+
+import asyncio
+from dataclasses import dataclass
+from logging import getLogger
+from typing import Any, Awaitable, Callable, Dict
+
+logger = getLogger(__name__)
+
+
+@dataclass
+class _Flight:
+    task: asyncio.Task
+    refs: int = 1
+
+
+class RequestCoalescer:
+    """Share one in-flight call between concurrent callers with the same key.
+
+    The call runs in its own task. Each caller holds a reference to it; a
+    caller that is cancelled drops its reference, and the call itself is only
+    cancelled when no caller is left waiting for it. Results and failures
+    are delivered to every caller; nothing is kept once the call finishes.
+    """
+
+    def __init__(self):
+        self._flights: Dict[str, _Flight] = {}
+        self._stats = {'requests': 0, 'coalesced': 0, 'cancelled': 0}
+
+    async def run(self, key: str, compute: Callable[[], Awaitable[Any]]) -> Any:
+        """Await the in-flight call for ``key``, starting it with ``compute`` if there is none.
+
+        Args:
+            key: Normalized request key
+            compute: Coroutine function issuing the call
+
+        Returns:
+            Any: Result of the shared call
+        """
+        self._stats['requests'] += 1
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = _Flight(asyncio.create_task(compute()))
+            self._flights[key] = flight
+            flight.task.add_done_callback(lambda task, key=key: self._finish(key, task))
+        else:
+            flight.refs += 1
+            self._stats['coalesced'] += 1
+
+        try:
+            return await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            if not flight.task.done():
+                # This caller gave up; the others keep waiting
+                flight.refs -= 1
+                if flight.refs == 0:
+                    self._stats['cancelled'] += 1
+                    flight.task.cancel()
+                    if self._flights.get(key) is flight:
+                        del self._flights[key]
+            raise
+
+    def _finish(self, key: str, task: asyncio.Task) -> None:
+        flight = self._flights.get(key)
+        if flight is not None and flight.task is task:
+            del self._flights[key]
+        if not task.cancelled() and task.exception() is not None:
+            # Retrieved here so a failure nobody awaited any more is not logged
+            logger.debug(f"Coalesced request failed: {task.exception()}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get coalescing statistics.
+
+        Returns:
+            Dict[str, Any]: Request counts and the share of requests served by another caller's call
+        """
+        requests = self._stats['requests']
+        return {
+            **self._stats,
+            'in_flight': len(self._flights),
+            'coalescing_ratio': self._stats['coalesced'] / requests if requests else 0.0,
+        }
+
+    def reset_stats(self) -> None:
+        for key in self._stats:
+            self._stats[key] = 0
@@ -46,6 +46,11 @@ class ProviderConfig:
     retry_attempts: int = 3
     custom_headers: Dict[str, str] = field(default_factory=dict)
     extra_params: Dict[str, Any] = field(default_factory=dict)
+    # Provider pool: per-instance overrides (api_key, base_url, limits, ...)
+    instances: List[Dict[str, Any]] = field(default_factory=list)
+    max_concurrency: Optional[int] = None
+    requests_per_minute: Optional[int] = None
+    tokens_per_minute: Optional[int] = None
 
     def __post_init__(self):
         """Validate configuration after initialization."""
@@ -61,6 +66,10 @@ class ProviderConfig:
             raise ConfigurationError(f"timeout must be positive, got {self.timeout}")
         if self.retry_attempts < 0:
             raise ConfigurationError(f"retry_attempts must be non-negative, got {self.retry_attempts}")
+        for key in ('max_concurrency', 'requests_per_minute', 'tokens_per_minute'):
+            value = getattr(self, key)
+            if value is not None and value <= 0:
+                raise ConfigurationError(f"{key} must be positive, got {value}")
 
     def model_dump(self) -> Dict[str, Any]:
         """Convert the configuration to a dictionary.
@@ -78,7 +87,11 @@ class ProviderConfig:
             'timeout': self.timeout,
             'retry_attempts': self.retry_attempts,
             'custom_headers': self.custom_headers.copy(),
-            'extra_params': self.extra_params.copy()
+            'extra_params': self.extra_params.copy(),
+            'instances': [instance.copy() for instance in self.instances],
+            'max_concurrency': self.max_concurrency,
+            'requests_per_minute': self.requests_per_minute,
+            'tokens_per_minute': self.tokens_per_minute
         }
 
 
@@ -141,7 +154,11 @@ class ConfigurationManager:
                 timeout=provider_config.get('timeout', 30),
                 retry_attempts=provider_config.get('retry_attempts', 3),
                 custom_headers=provider_config.get('custom_headers', {}),
-                extra_params=provider_config.get('extra_params', {})
+                extra_params=provider_config.get('extra_params', {}),
+                instances=provider_config.get('instances', []),
+                max_concurrency=provider_config.get('max_concurrency'),
+                requests_per_minute=provider_config.get('requests_per_minute'),
+                tokens_per_minute=provider_config.get('tokens_per_minute')
             )
 
             # Cache the validated config
@@ -210,7 +227,10 @@ class ConfigurationManager:
             'model': f'{provider_name.upper()}_MODEL',
             'max_tokens': f'{provider_name.upper()}_MAX_TOKENS',
             'temperature': f'{provider_name.upper()}_TEMPERATURE',
-            'timeout': f'{provider_name.upper()}_TIMEOUT'
+            'timeout': f'{provider_name.upper()}_TIMEOUT',
+            'max_concurrency': f'{provider_name.upper()}_MAX_CONCURRENCY',
+            'requests_per_minute': f'{provider_name.upper()}_REQUESTS_PER_MINUTE',
+            'tokens_per_minute': f'{provider_name.upper()}_TOKENS_PER_MINUTE'
         }
 
         for config_key, env_key in env_mappings.items():
@@ -229,7 +249,7 @@ class ConfigurationManager:
                 continue
 
             # Convert string values to appropriate types
-            if config_key in ['max_tokens', 'timeout']:
+            if config_key in ['max_tokens', 'timeout', 'max_concurrency', 'requests_per_minute', 'tokens_per_minute']:
                 try:
                     config[config_key] = int(env_value)
                 except ValueError:
@@ -242,7 +262,22 @@ class ConfigurationManager:
             else:
                 config[config_key] = env_value.strip()
 
-        # 2.1. Fallback to generic environment variables for backward compatibility
+        # 2.1. Several API keys form a pool: OPENAI_API_KEYS=key1,key2
+        if 'instances' not in config:
+            env_keys = os.getenv(f'{provider_name.upper()}_API_KEYS')
+            if env_keys:
+                keys = [key.strip() for key in env_keys.split(',')
+                        if key.strip() and not self._is_placeholder_value(key)]
+                if keys:
+                    config['instances'] = [{'api_key': key} for key in keys]
+
+        # The primary instance uses the first pool key when no api_key is set
+        if not config.get('api_key'):
+            pool_keys = [instance.get('api_key') for instance in config.get('instances') or [] if instance.get('api_key')]
+            if pool_keys:
+                config['api_key'] = pool_keys[0]
+
+        # 2.2. Fallback to generic environment variables for backward compatibility
         if 'base_url' not in config:
             generic_base_url = os.getenv('BASE_URL')
             if generic_base_url:
@@ -345,6 +380,12 @@ class ConfigurationManager:
                 'base_url': 'https://generativelanguage.googleapis.com/v1beta',
                 'temperature': 0.1,   # Lower temperature for Gemini
                 **{k: v for k, v in common_defaults.items() if k != 'temperature'}
+            },
+            'fake': {
+                # Offline provider for tests and benchmarks; needs no real key
+                'api_key': 'offline',
+                'model': 'fake-model',
+                **common_defaults
             }
         }
 
@@ -453,6 +494,24 @@ class ConfigurationManager:
         logger.warning("No fallback chain configured, using default")
         return ['openai']
 
+    def get_request_coalescing(self) -> bool:
+        """Whether identical concurrent requests should share one provider call.
+
+        Off unless enabled by ``LLM_REQUEST_COALESCING`` or
+        ``llm_settings.request_coalescing``.
+
+        Returns:
+            bool: True if request coalescing is enabled
+        """
+        env_value = os.getenv("LLM_REQUEST_COALESCING")
+        if env_value is not None:
+            return env_value.strip().lower() in ("1", "true", "yes", "on")
+
+        if self._config_cache and 'llm_settings' in self._config_cache:
+            return bool(self._config_cache['llm_settings'].get('request_coalescing', False))
+
+        return False
+
     def list_configured_providers(self) -> List[str]:
         """List all configured providers.
 
@@ -3,12 +3,14 @@ LLM Manager - Central orchestrator for managing providers, fallback, and load ba
 """
 
 import asyncio
+import dataclasses
 import random
-from typing import List, Dict, Any, Optional, AsyncGenerator, Set
+from typing import List, Dict, Any, Optional, AsyncGenerator, AsyncIterator, Iterable, Set, Callable, Union, Mapping, Tuple
 from logging import getLogger
 
 from contextlib import asynccontextmanager
 import threading
+from types import MappingProxyType
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 
@@ -18,9 +20,14 @@ from .registry import LLMProviderRegistry, get_global_registry
 from .config import ConfigurationManager
 from .monitoring import DebugLogger, MetricsCollector, get_debug_logger, get_metrics_collector
 from .response_normalizer import ResponseNormalizer, get_response_normalizer
-from .errors import ProviderError, ConfigurationError, ProviderUnavailableError
+from .errors import ProviderError, ConfigurationError, ProviderUnavailableError, RateLimitError
+from .pool import LIMIT_KEYS, PoolLease, PoolMember, ProviderPool, member_configs
+from .cache import request_key
+from .coalescing import RequestCoalescer
+from .batch import BatchRequest, BatchResult, BatchRunner
 from spoon_ai.callbacks.base import BaseCallbackHandler
-from spoon_ai.callbacks.manager import CallbackManager
+from spoon_ai.callbacks.manager import CallbackManager, get_inheritable_callbacks
+from spoon_ai.telemetry import current_span, traced
 
 logger = getLogger(__name__)
 
@@ -73,6 +80,8 @@ class FallbackStrategy:
 
     def __init__(self, debug_logger: DebugLogger):
         self.debug_logger = debug_logger
+        self.hedged_requests = 0
+        self.hedge_wins = 0
 
     async def execute_with_fallback(self, providers: List[str], operation, *args, **kwargs) -> LLMResponse:
         """Execute operation with fallback chain.
@@ -119,20 +128,92 @@ class FallbackStrategy:
             context={"attempted_providers": providers}
         )
 
+    async def execute_with_hedging(self, providers: List[str], operation, hedge_delay: Callable[[str], Optional[float]], *args, **kwargs) -> LLMResponse:
+        """Execute operation on the first provider, hedging to the second when it is slow.
+
+        If the first provider has not answered after ``hedge_delay(provider)``
+        seconds, the same request is sent to the second provider and whichever
+        succeeds first wins; the other request is cancelled and awaited. When
+        both fail, the rest of the chain is tried in order.
+
+        Args:
+            providers: List of provider names in preference order
+            operation: Async operation to execute
+            hedge_delay: Seconds to wait before hedging (None disables hedging)
+            *args, **kwargs: Arguments for the operation
+
+        Returns:
+            LLMResponse: Response from the winning provider
+
+        Raises:
+            ProviderError: If all providers fail
+        """
+        if len(providers) < 2:
+            return await self.execute_with_fallback(providers, operation, *args, **kwargs)
+
+        primary, backup = providers[0], providers[1]
+        tasks: Dict[asyncio.Task, str] = {}
+        last_error: Optional[BaseException] = None
+        try:
+            logger.info(f"Attempting operation with provider: {primary}")
+            first = asyncio.create_task(operation(primary, *args, **kwargs))
+            tasks[first] = primary
+            done, _ = await asyncio.wait({first}, timeout=hedge_delay(primary))
+            if done and first.exception() is None:
+                return first.result()
+            if done:
+                # Failed before the hedge deadline: plain fallback
+                last_error = first.exception()
+                self.debug_logger.log_fallback(primary, backup, str(last_error))
+                return await self.execute_with_fallback(providers[1:], operation, *args, **kwargs)
+
+            self.hedged_requests += 1
+            logger.info(f"Provider {primary} exceeded its hedge delay; hedging to {backup}")
+            second = asyncio.create_task(operation(backup, *args, **kwargs))
+            tasks[second] = backup
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is second:
+                            self.hedge_wins += 1
+                        return task.result()
+                    last_error = task.exception()
+                    logger.warning(f"Provider {tasks[task]} failed: {str(last_error)}")
+        finally:
+            losers = [task for task in tasks if not task.done()]
+            for task in losers:
+                task.cancel()
+            if losers:
+                await asyncio.gather(*losers, return_exceptions=True)
+
+        if len(providers) > 2:
+            self.debug_logger.log_fallback(backup, providers[2], str(last_error))
+            return await self.execute_with_fallback(providers[2:], operation, *args, **kwargs)
+        raise ProviderError(
+            "fallback",
+            f"All providers failed. Last error: {str(last_error)}",
+            original_error=last_error,
+            context={"attempted_providers": providers}
+        )
+
 
 class LoadBalancer:
     """Handles load balancing between multiple provider instances."""
 
-    def __init__(self):
+    def __init__(self, metrics_collector: Optional[MetricsCollector] = None, min_latency_samples: int = 5):
         self.provider_weights: Dict[str, float] = {}
         self.provider_health: Dict[str, bool] = {}
+        self.metrics_collector = metrics_collector
+        self.min_latency_samples = min_latency_samples
 
     def select_provider(self, providers: List[str], strategy: str = "round_robin") -> str:
         """Select a provider based on load balancing strategy.
 
         Args:
             providers: List of available providers
-            strategy: Load balancing strategy ('round_robin', 'weighted', 'random')
+            strategy: Load balancing strategy ('round_robin', 'weighted', 'random', 'latency')
 
         Returns:
             str: Selected provider name
@@ -144,7 +225,9 @@ class LoadBalancer:
             # If no healthy providers, use all providers as fallback
             healthy_providers = providers
 
-        if strategy == "random":
+        if strategy == "latency":
+            return self.rank_by_latency(healthy_providers)[0]
+        elif strategy == "random":
             return random.choice(healthy_providers)
         elif strategy == "weighted":
             return self._weighted_selection(healthy_providers)
@@ -179,6 +262,22 @@ class LoadBalancer:
 
         return providers[-1]  # Fallback
 
+    def rank_by_latency(self, providers: List[str]) -> List[str]:
+        """Order providers healthy-first, then by rolling p50 latency.
+
+        Providers with fewer than ``min_latency_samples`` samples are ranked
+        ahead of measured ones (in chain order) so they get measured.
+        """
+        def sort_key(item):
+            index, provider = item
+            healthy = self.provider_health.get(provider, True)
+            percentiles = self.metrics_collector.get_latency_percentiles(provider) if self.metrics_collector else None
+            if not percentiles or percentiles['samples'] < self.min_latency_samples:
+                return (not healthy, 0.0, index)
+            return (not healthy, percentiles['p50'], index)
+
+        return [provider for _, provider in sorted(enumerate(providers), key=sort_key)]
+
     def update_provider_health(self, provider: str, is_healthy: bool) -> None:
         """Update provider health status."""
         self.provider_health[provider] = is_healthy
@@ -207,7 +306,7 @@ class LLMManager:
         self.registry = registry or get_global_registry()
 
         self.fallback_strategy = FallbackStrategy(self.debug_logger)
-        self.load_balancer = LoadBalancer()
+        self.load_balancer = LoadBalancer(self.metrics_collector)
 
         # Enhanced provider state management
         self.provider_states: Dict[str, ProviderState] = {}
@@ -220,6 +319,19 @@ class LLMManager:
         self.default_provider: Optional[str] = None
         self.load_balancing_enabled: bool = False
         self.load_balancing_strategy: str = "round_robin"
+        self.hedging_enabled: bool = False
+        self.hedge_default_delay: Optional[float] = None
+
+        # Identical concurrent chat requests share one provider call (opt-in)
+        self.coalescing_enabled: bool = False
+        self.coalescer = RequestCoalescer()
+
+        # Provider pools (several instances per provider with their own limits)
+        self.provider_pools: Dict[str, ProviderPool] = {}
+        self.rate_limit_cooldown: float = 10.0
+
+        # Read-only provider configs, rebuilt only when the config manager loads a new config
+        self._config_snapshots: Dict[str, Tuple[Any, Mapping[str, Any]]] = {}
 
         # Initialize providers from configuration
         self._initialize_providers()
@@ -299,13 +411,13 @@ class LLMManager:
             
             try:
                 # Get provider configuration
-                config = self.config_manager.load_provider_config(provider_name)
-                provider_instance = self.registry.get_provider(provider_name, config.model_dump())
+                config = self._get_provider_config(provider_name)
+                provider_instance = self.registry.get_provider(provider_name, config)
 
                 logger.info(f"Initializing provider: {provider_name}")
                 
-                # Initialize the provider
-                await provider_instance.initialize(config.model_dump())
+                # Initialize the provider (with its own copy, providers keep it)
+                await provider_instance.initialize(dict(config))
                 
                 # Mark as successfully initialized
                 state.record_initialization_success()
@@ -341,14 +453,82 @@ class LLMManager:
                 error_msg += f": {state.last_error}"
             raise ProviderUnavailableError(provider_name, error_msg)
 
-        # Get provider instance
+        async with self._acquire_provider(provider_name, args) as (provider_instance, lease):
+            return await self._invoke_provider(provider_name, provider_instance, lease, method, *args, **kwargs)
+
+    @asynccontextmanager
+    async def _acquire_provider(self, provider_name: str, args: tuple):
+        """Yield the provider instance to use and its pool lease (None when not pooled).
+
+        Pooled providers dispatch to the least-loaded instance and wait while
+        every instance is at its concurrency or rate limit.
+        """
         try:
-            config = self.config_manager.load_provider_config(provider_name)
-            provider_instance = self.registry.get_provider(provider_name, config.model_dump())
+            config_dict = self._get_provider_config(provider_name)
+            pool = self._get_provider_pool(provider_name, config_dict)
+            provider_instance = None if pool else self.registry.get_provider(provider_name, config_dict)
         except Exception as e:
             logger.error(f"Failed to get provider instance {provider_name}: {e}")
             raise ProviderError(provider_name, f"Failed to get provider instance: {str(e)}", original_error=e)
 
+        if pool is None:
+            yield provider_instance, None
+            return
+        async with pool.acquire(self._estimate_request_tokens(args)) as lease:
+            yield lease.provider, lease
+
+    def _get_provider_config(self, provider_name: str) -> Mapping[str, Any]:
+        """Get a provider's configuration as a read-only mapping.
+
+        ``ConfigurationManager`` caches validated configs; the dict form is
+        built once per config object instead of on every request.
+        """
+        config = self.config_manager.load_provider_config(provider_name)
+        cached = self._config_snapshots.get(provider_name)
+        if cached is not None and cached[0] is config:
+            return cached[1]
+        snapshot = MappingProxyType(config.model_dump())
+        self._config_snapshots[provider_name] = (config, snapshot)
+        return snapshot
+
+    def _get_provider_pool(self, provider_name: str, config: Dict[str, Any]) -> Optional[ProviderPool]:
+        """Get or build the pool for a provider configured with instances or limits."""
+        pool = self.provider_pools.get(provider_name)
+        if pool is not None:
+            return pool
+        configs = member_configs(config)
+        if not configs:
+            return None
+        members = []
+        for index, member_config in enumerate(configs):
+            limits = {key: member_config.pop(key, None) for key in LIMIT_KEYS}
+            members.append(PoolMember(
+                f"{provider_name}[{index}]",
+                self.registry.create_instance(provider_name),
+                member_config,
+                **limits
+            ))
+        pool = ProviderPool(provider_name, members)
+        self.provider_pools[provider_name] = pool
+        logger.info(f"Created provider pool for {provider_name} with {len(members)} instance(s)")
+        return pool
+
+    @staticmethod
+    def _estimate_request_tokens(args: tuple) -> int:
+        """Rough prompt size charged up front against a pool instance's TPM budget."""
+        payload = args[0] if args else None
+        if isinstance(payload, str):
+            return len(payload) // 4
+        if isinstance(payload, list):
+            return sum(len(str(getattr(message, 'content', None) or '')) for message in payload) // 4
+        return 0
+
+    @traced("llm.provider", lambda self, provider_name, instance, lease, method, *args, **kwargs: {
+        "llm.provider": provider_name, "llm.method": method, "llm.model": kwargs.get('model'),
+    })
+    async def _invoke_provider(self, provider_name: str, provider_instance: LLMProviderInterface,
+                               lease: Optional[PoolLease], method: str, *args, **kwargs) -> LLMResponse:
+        """Call method on a provider instance with logging, metrics and health tracking."""
         # Log request
         request_id = self.debug_logger.log_request(provider_name, method, kwargs)
         start_time = asyncio.get_event_loop().time()
@@ -374,12 +554,24 @@ class LLMManager:
             self.metrics_collector.record_request(
                 provider_name, method, duration, True, tokens, response.model
             )
+            if lease is not None:
+                lease.record_usage(tokens)
+            current_span().set_attributes({"llm.model": response.model, "llm.total_tokens": tokens})
 
             # Mark provider as healthy
             self.load_balancer.update_provider_health(provider_name, True)
 
             return response
 
+        except asyncio.CancelledError:
+            # e.g. the losing side of a hedged request
+            duration = asyncio.get_event_loop().time() - start_time
+            self.debug_logger.log_cancelled(request_id, {"provider": provider_name, "method": method})
+            # The elapsed time is a lower bound on this provider's latency; keep it
+            # so a provider that is always cancelled does not look fast
+            self.metrics_collector.record_latency(provider_name, duration, kwargs.get('model') or '')
+            raise
+
         except Exception as e:
             # Calculate duration
             duration = asyncio.get_event_loop().time() - start_time
@@ -392,6 +584,11 @@ class LLMManager:
                 provider_name, method, duration, False, error=str(e)
             )
 
+            if lease is not None and isinstance(e, RateLimitError):
+                # Only this instance is throttled; the rest of the pool keeps serving
+                lease.cool_down(e.retry_after or self.rate_limit_cooldown)
+                raise
+
             # Update provider health
             self.load_balancer.update_provider_health(provider_name, False)
 
@@ -492,6 +689,8 @@ class LLMManager:
         async with self._manager_lock:
             # Reset state
             state = self.provider_states[provider_name]
+            # Rebuild the provider pool from fresh configuration on next use
+            self.provider_pools.pop(provider_name, None)
             async with state.initialization_lock:
                 state.is_initialized = False
                 state.is_initializing = False
@@ -507,14 +706,8 @@ class LLMManager:
     def _initialize_providers(self) -> None:
         """Initialize providers from configuration."""
         try:
-            # Import providers to trigger registration
-            from .providers import (
-                OpenAIProvider,
-                OpenRouterProvider,
-                DeepSeekProvider,
-                AnthropicProvider,
-                GeminiProvider
-            )
+            # Built-in providers are registered lazily; get_provider imports
+            # only the ones that are configured
 
             # Get configured providers
             configured_providers = self.config_manager.list_configured_providers()
@@ -535,6 +728,9 @@ class LLMManager:
             # Set default provider
             self.default_provider = self.config_manager.get_default_provider()
 
+            coalescing = self.config_manager.get_request_coalescing()
+            self.coalescing_enabled = coalescing if isinstance(coalescing, bool) else False
+
             # Set fallback chain from configuration
             if not self.fallback_chain:
                 configured_chain = self.config_manager.get_fallback_chain()
@@ -548,6 +744,9 @@ class LLMManager:
             logger.error(f"Failed to initialize LLM Manager: {e}")
             raise ConfigurationError(f"LLM Manager initialization failed: {str(e)}")
 
+    @traced("llm.chat", lambda self, messages, provider=None, **kwargs: {
+        "llm.messages": len(messages), "llm.requested_provider": provider,
+    })
     async def chat(self, messages: List[Message], provider: Optional[str] = None, **kwargs) -> LLMResponse:
         """Send chat request with automatic provider selection and fallback.
 
@@ -559,25 +758,58 @@ class LLMManager:
         Returns:
             LLMResponse: Normalized response
         """
-        # Determine provider(s) to use
-        providers = self._get_providers_for_request(provider)
+        async def execute() -> LLMResponse:
+            # Determine provider(s) to use
+            providers = self._get_providers_for_request(provider)
+
+            # Define the operation
+            async def chat_operation(provider_name: str) -> LLMResponse:
+                return await self._execute_provider_operation(
+                    provider_name, 'chat', messages, **kwargs
+                )
+
+            # Execute with fallback
+            response = await self._execute_with_fallback(providers, chat_operation)
+
+            # Normalize and return response
+            return self.response_normalizer.normalize_response(response)
+
+        return await self._coalesce(execute, messages, provider, **kwargs)
+
+    async def chat_batch(self,
+                         requests: Iterable[Union[BatchRequest, List[Message], Dict[str, Any]]],
+                         max_concurrency: int = 8,
+                         ordered: bool = False,
+                         checkpoint_path: Optional[str] = None,
+                         **options) -> AsyncIterator[BatchResult]:
+        """Run many chat requests concurrently and yield results as they finish.
+
+        Concurrency starts at ``max_concurrency`` and adapts (AIMD): it is
+        halved when requests are throttled (429 or timeout) and grows back
+        as requests succeed. Throttled requests are retried with backoff.
+        With ``checkpoint_path``, completed responses are appended to a
+        JSONL file, and a rerun of the same batch resumes where it stopped.
 
-        # Define the operation
-        async def chat_operation(provider_name: str) -> LLMResponse:
-            return await self._execute_provider_operation(
-                provider_name, 'chat', messages, **kwargs
-            )
-
-        # Execute with fallback
-        if len(providers) > 1:
-            response = await self.fallback_strategy.execute_with_fallback(
-                providers, chat_operation
-            )
-        else:
-            response = await chat_operation(providers[0])
+        Args:
+            requests: BatchRequest objects, message lists, or dicts with
+                ``messages`` plus optional ``provider``/``request_id`` and chat kwargs
+            max_concurrency: Upper bound on concurrent requests
+            ordered: Yield results in input order instead of completion order
+            checkpoint_path: Optional checkpoint file for resuming the batch
+            **options: BatchRunner options (max_retries, retry_backoff, request_timeout)
 
-        # Normalize and return response
-        return self.response_normalizer.normalize_response(response)
+        Yields:
+            BatchResult: One result per request; failures carry ``error``
+        """
+        runner = BatchRunner(
+            self, requests,
+            max_concurrency=max_concurrency,
+            ordered=ordered,
+            checkpoint_path=checkpoint_path,
+            **options
+        )
+        async for result in runner.run():
+            yield result
 
     async def chat_stream(self,messages: List[Message],provider: Optional[str] = None,callbacks: Optional[List[BaseCallbackHandler]] = None,**kwargs) -> AsyncGenerator[LLMResponseChunk, None]:
         """Send streaming chat request with callback support.              
@@ -595,42 +827,55 @@ class LLMManager:
         provider_name = providers[0]
         await self._ensure_provider_initialized(provider_name)
         
-        # Get provider instance
-        provider_instance = self.registry.get_provider(provider_name)
-
         # Create callback manager with internal monitoring callbacks
         internal_callbacks = self._get_internal_callbacks()
         all_callbacks = internal_callbacks + (callbacks or [])
         callback_manager = CallbackManager.from_callbacks(all_callbacks)
 
-        # Log request
-        request_id = self.debug_logger.log_request(provider_name, 'chat_stream', kwargs)
-        start_time = asyncio.get_event_loop().time()
-
-        try:
-            # Stream from provider with callbacks
-            async for chunk in provider_instance.chat_stream(messages,callbacks=all_callbacks,**kwargs):
-                yield chunk
+        # Hold the pool lease (concurrency slot and rate budget) for the whole stream
+        async with self._acquire_provider(provider_name, (messages,)) as (provider_instance, lease):
+            # Log request
+            request_id = self.debug_logger.log_request(provider_name, 'chat_stream', kwargs)
+            start_time = asyncio.get_event_loop().time()
 
-            # Log successful completion
-            duration = asyncio.get_event_loop().time() - start_time
-            self.metrics_collector.record_request(
-                provider_name, 'chat_stream', duration, True
-            )
+            completed = False
+            try:
+                # Stream from provider with callbacks
+                tokens = 0
+                async for chunk in provider_instance.chat_stream(messages,callbacks=all_callbacks,**kwargs):
+                    if chunk is not None and chunk.usage:
+                        tokens = chunk.usage.get('total_tokens', tokens)
+                    yield chunk
+
+                # Log successful completion
+                completed = True
+                duration = asyncio.get_event_loop().time() - start_time
+                self.debug_logger.log_completed(request_id, duration, tokens)
+                self.metrics_collector.record_request(
+                    provider_name, 'chat_stream', duration, True, tokens=tokens
+                )
+                if lease is not None:
+                    lease.record_usage(tokens)
 
-        except Exception as e:
-            # Log error
-            duration = asyncio.get_event_loop().time() - start_time
-            self.debug_logger.log_error(request_id, e, {"provider": provider_name})
-            self.metrics_collector.record_request(
-                provider_name, 'chat_stream', duration, False, error=str(e)
-            )
-            raise
+            except Exception as e:
+                # Log error
+                completed = True
+                duration = asyncio.get_event_loop().time() - start_time
+                self.debug_logger.log_error(request_id, e, {"provider": provider_name})
+                self.metrics_collector.record_request(
+                    provider_name, 'chat_stream', duration, False, error=str(e)
+                )
+                if lease is not None and isinstance(e, RateLimitError):
+                    lease.cool_down(e.retry_after or self.rate_limit_cooldown)
+                raise
+            finally:
+                if not completed:
+                    # Consumer stopped early (closed or cancelled); don't leave the request active
+                    self.debug_logger.log_cancelled(request_id, {"provider": provider_name})
     
     def _get_internal_callbacks(self) -> List[BaseCallbackHandler]:
-        """Get internal monitoring callbacks."""
-        # For now, return empty list
-        return []
+        """Get internal monitoring callbacks and those inherited from the calling context."""
+        return get_inheritable_callbacks()
 
     async def completion(self, prompt: str, provider: Optional[str] = None, **kwargs) -> LLMResponse:
         """Send completion request.
@@ -653,16 +898,14 @@ class LLMManager:
             )
 
         # Execute with fallback
-        if len(providers) > 1:
-            response = await self.fallback_strategy.execute_with_fallback(
-                providers, completion_operation
-            )
-        else:
-            response = await completion_operation(providers[0])
+        response = await self._execute_with_fallback(providers, completion_operation)
 
         # Normalize and return response
         return self.response_normalizer.normalize_response(response)
 
+    @traced("llm.chat_with_tools", lambda self, messages, tools, provider=None, **kwargs: {
+        "llm.messages": len(messages), "llm.tools": len(tools or []), "llm.requested_provider": provider,
+    })
     async def chat_with_tools(self, messages: List[Message], tools: List[Dict],
                             provider: Optional[str] = None, **kwargs) -> LLMResponse:
         """Send tool-enabled chat request.
@@ -676,46 +919,87 @@ class LLMManager:
         Returns:
             LLMResponse: Normalized response
         """
-        # Determine provider(s) to use
-        providers = self._get_providers_for_request(provider)
+        async def execute() -> LLMResponse:
+            # Determine provider(s) to use
+            providers = self._get_providers_for_request(provider)
 
-        # Filter providers that support tools
-        tool_capable_providers = []
-        for p in providers:
-            try:
-                capabilities = self.registry.get_capabilities(p)
-                if ProviderCapability.TOOLS in capabilities:
-                    tool_capable_providers.append(p)
-                    logger.debug(f"Provider {p} supports tools")
-                else:
-                    logger.debug(f"Provider {p} does not support tools: {capabilities}")
-            except Exception as e:
-                logger.warning(f"Failed to check capabilities for provider {p}: {e}")
-                continue
+            # Filter providers that support tools
+            tool_capable_providers = []
+            for p in providers:
+                try:
+                    capabilities = self.registry.get_capabilities(p)
+                    if ProviderCapability.TOOLS in capabilities:
+                        tool_capable_providers.append(p)
+                        logger.debug(f"Provider {p} supports tools")
+                    else:
+                        logger.debug(f"Provider {p} does not support tools: {capabilities}")
+                except Exception as e:
+                    logger.warning(f"Failed to check capabilities for provider {p}: {e}")
+                    continue
 
-        if not tool_capable_providers:
-            raise ProviderError(
-                "manager",
-                "No available providers support tool calls",
-                context={"requested_providers": providers, "tools": tools}
-            )
+            if not tool_capable_providers:
+                raise ProviderError(
+                    "manager",
+                    "No available providers support tool calls",
+                    context={"requested_providers": providers, "tools": tools}
+                )
 
-        # Define the operation
-        async def tools_operation(provider_name: str) -> LLMResponse:
-            return await self._execute_provider_operation(
-                provider_name, 'chat_with_tools', messages, tools, **kwargs
-            )
+            # Define the operation
+            async def tools_operation(provider_name: str) -> LLMResponse:
+                return await self._execute_provider_operation(
+                    provider_name, 'chat_with_tools', messages, tools, **kwargs
+                )
 
-        # Execute with fallback
-        if len(tool_capable_providers) > 1:
-            response = await self.fallback_strategy.execute_with_fallback(
-                tool_capable_providers, tools_operation
+            # Execute with fallback
+            response = await self._execute_with_fallback(tool_capable_providers, tools_operation)
+
+            # Normalize and return response
+            return self.response_normalizer.normalize_response(response)
+
+        return await self._coalesce(execute, messages, provider, tools=tools, **kwargs)
+
+    async def _coalesce(self, execute, messages: List[Message], provider: Optional[str], **key_params) -> LLMResponse:
+        """Run execute, sharing the call with identical requests already in flight.
+
+        Requests are matched on the same normalized key as the response
+        cache. Each caller gets its own copy of the shared response.
+        Requests that ask for sampling (``temperature > 0`` or ``n > 1``) are
+        never coalesced, since each caller expects its own completion.
+        """
+        if not self.coalescing_enabled or self._is_sampling(key_params):
+            return await execute()
+        try:
+            key = request_key(messages, provider or "", **key_params)
+        except TypeError:
+            # Parameters that cannot be normalized are never coalesced
+            return await execute()
+        response = await self.coalescer.run(key, execute)
+        return dataclasses.replace(response, metadata=dict(response.metadata))
+
+    @staticmethod
+    def _is_sampling(params: Dict[str, Any]) -> bool:
+        """Whether params request non-deterministic or multiple completions."""
+        try:
+            return float(params.get("temperature") or 0) > 0 or int(params.get("n") or 1) > 1
+        except (TypeError, ValueError):
+            return True
+
+    async def _execute_with_fallback(self, providers: List[str], operation) -> LLMResponse:
+        """Run operation over the provider chain, hedging when enabled."""
+        if len(providers) == 1:
+            return await operation(providers[0])
+        if self.hedging_enabled:
+            return await self.fallback_strategy.execute_with_hedging(
+                providers, operation, self._hedge_delay
             )
-        else:
-            response = await tools_operation(tool_capable_providers[0])
+        return await self.fallback_strategy.execute_with_fallback(providers, operation)
 
-        # Normalize and return response
-        return self.response_normalizer.normalize_response(response)
+    def _hedge_delay(self, provider_name: str) -> Optional[float]:
+        """Seconds to wait for provider_name before hedging: its rolling p95."""
+        percentiles = self.metrics_collector.get_latency_percentiles(provider_name)
+        if percentiles and percentiles['samples'] >= self.load_balancer.min_latency_samples:
+            return percentiles['p95']
+        return self.hedge_default_delay
 
     def _sanitize_provider_chain(self, providers: Optional[List[str]]) -> List[str]:
         """Remove duplicates and unknown providers while preserving order."""
@@ -788,6 +1072,9 @@ class LLMManager:
 
         # Use load balancing if enabled and multiple providers available
         if self.load_balancing_enabled and len(providers) > 1:
+            if self.load_balancing_strategy == "latency":
+                # Fastest healthy first; the runner-up is the hedge target
+                return self.load_balancer.rank_by_latency(providers)
             primary_provider = self.load_balancer.select_provider(
                 providers, self.load_balancing_strategy
             )
@@ -817,9 +1104,9 @@ class LLMManager:
         """Enable load balancing with specified strategy.
 
         Args:
-            strategy: Load balancing strategy ('round_robin', 'weighted', 'random')
+            strategy: Load balancing strategy ('round_robin', 'weighted', 'random', 'latency')
         """
-        valid_strategies = ['round_robin', 'weighted', 'random']
+        valid_strategies = ['round_robin', 'weighted', 'random', 'latency']
         if strategy not in valid_strategies:
             raise ConfigurationError(f"Invalid load balancing strategy: {strategy}")
 
@@ -832,6 +1119,39 @@ class LLMManager:
         self.load_balancing_enabled = False
         logger.info("Disabled load balancing")
 
+    def enable_coalescing(self) -> None:
+        """Share one provider call between identical concurrent requests.
+
+        Off by default. Requests that sample (``temperature > 0`` or ``n > 1``)
+        always get their own call.
+        """
+        self.coalescing_enabled = True
+        logger.info("Enabled request coalescing")
+
+    def disable_coalescing(self) -> None:
+        """Send every request to the provider, e.g. to sample several completions."""
+        self.coalescing_enabled = False
+        logger.info("Disabled request coalescing")
+
+    def enable_hedging(self, default_delay: Optional[float] = None) -> None:
+        """Send a duplicate request to the next provider when the first is slow.
+
+        The hedge fires once the first provider exceeds its rolling p95
+        latency. Until enough samples exist, ``default_delay`` is used; with
+        no default, requests to unmeasured providers are not hedged.
+
+        Args:
+            default_delay: Hedge delay in seconds for providers without latency data
+        """
+        self.hedging_enabled = True
+        self.hedge_default_delay = default_delay
+        logger.info(f"Enabled hedged requests (default delay: {default_delay})")
+
+    def disable_hedging(self) -> None:
+        """Disable hedged requests."""
+        self.hedging_enabled = False
+        logger.info("Disabled hedged requests")
+
     async def health_check_all(self) -> Dict[str, bool]:
         """Check health of all registered providers.
 
@@ -879,6 +1199,16 @@ class LLMManager:
             except Exception as e:
                 logger.warning(f"Cleanup failed for {provider_name}: {e}")
 
+        for provider_name, pool in self.provider_pools.items():
+            for member in pool.members:
+                if not member.initialized:
+                    continue
+                try:
+                    await member.provider.cleanup()
+                except Exception as e:
+                    logger.warning(f"Cleanup failed for {member.member_id}: {e}")
+        self.provider_pools.clear()
+
         logger.info("LLM Manager cleanup completed")
 
     def get_stats(self) -> Dict[str, Any]:
@@ -893,7 +1223,13 @@ class LLMManager:
                 "fallback_chain": self.fallback_chain,
                 "load_balancing_enabled": self.load_balancing_enabled,
                 "load_balancing_strategy": self.load_balancing_strategy,
-                "registered_providers": self.registry.list_providers()
+                "registered_providers": self.registry.list_providers(),
+                "hedging_enabled": self.hedging_enabled,
+                "hedged_requests": self.fallback_strategy.hedged_requests,
+                "hedge_wins": self.fallback_strategy.hedge_wins,
+                "provider_pools": {name: pool.get_stats() for name, pool in self.provider_pools.items()},
+                "coalescing_enabled": self.coalescing_enabled,
+                "coalescing": self.coalescer.get_stats()
             },
             "providers": self.metrics_collector.get_all_stats(),
             "summary": self.metrics_collector.get_summary()
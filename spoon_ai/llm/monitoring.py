@@ -2,22 +2,236 @@
 Comprehensive monitoring, debugging, and metrics collection for LLM operations.
 """
 
+import math
+import re
 import time
 import uuid
-from typing import Dict, Any, Optional, List
+from array import array
+from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime
 from collections import defaultdict, deque
 from logging import getLogger
-import json
+
+from spoon_ai.telemetry import REGISTRY
 
 from .interface import LLMResponse
 from .errors import LLMError
 
 logger = getLogger(__name__)
 
+# Parameter names whose values never reach logs or request history
+_SECRET_KEY = re.compile(r"(api[_-]?key|authorization|(access|auth|bearer|refresh)[_-]?token|secret|password|credential)", re.IGNORECASE)
+_MAX_PARAM_CHARS = 200
+# Distinct error messages counted per provider; the rest are counted as 'other'
+MAX_ERROR_KINDS = 50
 
-@dataclass
+_REQUESTS = REGISTRY.counter("spoon_llm_requests", "LLM provider requests.", ["provider", "method", "status"])
+_REQUEST_SECONDS = REGISTRY.histogram("spoon_llm_request_duration_seconds", "LLM provider request latency in seconds.",
+                                      ["provider", "method"])
+_TOKENS = REGISTRY.counter("spoon_llm_tokens", "Tokens used by LLM requests.", ["provider"])
+
+
+def redact_params(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Summarize request parameters for logging.
+
+    Messages and tools are reduced to counts and sizes, secrets are masked
+    and long strings are truncated, so a logged request costs a few hundred
+    bytes however large the prompt.
+    """
+    redacted: Dict[str, Any] = {}
+    for key, value in params.items():
+        if _SECRET_KEY.search(key):
+            redacted[key] = '***'
+        elif key == 'messages' and isinstance(value, (list, tuple)):
+            redacted[key] = {
+                'count': len(value),
+                'chars': sum(len(str((m.get('content') if isinstance(m, dict) else getattr(m, 'content', None)) or ''))
+                             for m in value),
+            }
+        elif isinstance(value, dict):
+            redacted[key] = redact_params(value)
+        elif key in ('tools', 'functions') and isinstance(value, (list, tuple)):
+            redacted[key] = {'count': len(value)}
+        elif isinstance(value, (bool, int, float)) or value is None:
+            redacted[key] = value
+        else:
+            text = value if isinstance(value, str) else repr(value)
+            if len(text) > _MAX_PARAM_CHARS:
+                text = text[:_MAX_PARAM_CHARS] + f'... ({len(text)} chars)'
+            redacted[key] = text
+    return redacted
+
+
+class LatencyHistogram:
+    """HDR-style latency histogram with fixed memory.
+
+    Values are recorded in microseconds into log-linear buckets: exact below
+    ``2 * 2**sub_bucket_bits`` and with ``2**sub_bucket_bits`` linear
+    sub-buckets per power of two above, which bounds the relative error of
+    a reported percentile to about ``2**-sub_bucket_bits`` (3% by default).
+    Recording is O(1); percentiles scan the ~900 counters.
+    """
+
+    def __init__(self, max_seconds: float = 3600.0, sub_bucket_bits: int = 5):
+        self.sub_bucket_bits = sub_bucket_bits
+        self._sub_count = 1 << sub_bucket_bits
+        self._max_units = max(1, int(max_seconds * 1e6))
+        self._counts = array('q', [0]) * (self._index(self._max_units) + 1)
+        self.total = 0
+        self.max_value = 0.0
+
+    def _index(self, units: int) -> int:
+        if units < 2 * self._sub_count:
+            return units
+        shift = units.bit_length() - (self.sub_bucket_bits + 1)
+        return (shift + 1) * self._sub_count + ((units >> shift) - self._sub_count)
+
+    def _upper_bound(self, index: int) -> int:
+        if index < 2 * self._sub_count:
+            return index
+        shift = index // self._sub_count - 1
+        top = index % self._sub_count + self._sub_count
+        return ((top + 1) << shift) - 1
+
+    def record(self, seconds: float) -> None:
+        units = min(self._max_units, max(0, int(seconds * 1e6)))
+        self._counts[self._index(units)] += 1
+        self.total += 1
+        if seconds > self.max_value:
+            self.max_value = seconds
+
+    def percentile(self, p: float) -> Optional[float]:
+        """Latency in seconds at or below which ``p`` percent of samples fall."""
+        if not self.total:
+            return None
+        target = max(1, math.ceil(p / 100.0 * self.total))
+        seen = 0
+        for index, count in enumerate(self._counts):
+            if count:
+                seen += count
+                if seen >= target:
+                    return min(self._upper_bound(index) / 1e6, self.max_value)
+        return self.max_value
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            'count': self.total,
+            'p50': self.percentile(50),
+            'p95': self.percentile(95),
+            'p99': self.percentile(99),
+            'max': self.max_value if self.total else None,
+        }
+
+    def reset(self) -> None:
+        for index in range(len(self._counts)):
+            self._counts[index] = 0
+        self.total = 0
+        self.max_value = 0.0
+
+
+class _LatencyWindow:
+    """The last ``capacity`` latencies in a ring buffer, for recency-sensitive percentiles."""
+
+    def __init__(self, capacity: int):
+        self._values = array('d', [0.0]) * capacity
+        self._next = 0
+        self._size = 0
+        self._sorted: Optional[List[float]] = None
+
+    def append(self, value: float) -> None:
+        self._values[self._next] = value
+        self._next = (self._next + 1) % len(self._values)
+        self._size = min(self._size + 1, len(self._values))
+        self._sorted = None
+
+    def __len__(self) -> int:
+        return self._size
+
+    def sorted(self) -> List[float]:
+        if self._sorted is None:
+            self._sorted = sorted(self._values[:self._size])
+        return self._sorted
+
+
+class MetricsRing:
+    """Fixed-size ring of request samples stored column-wise in typed arrays.
+
+    Strings (provider, method, model) are interned to small integer ids, so
+    a sample costs about 40 bytes and appending one never allocates.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.timestamps = array('d', [0.0]) * capacity
+        self.durations = array('d', [0.0]) * capacity
+        self.tokens = array('q', [0]) * capacity
+        self.success = array('b', [0]) * capacity
+        self.providers = array('H', [0]) * capacity
+        self.methods = array('H', [0]) * capacity
+        self.models = array('H', [0]) * capacity
+        self.errors: List[Optional[str]] = [None] * capacity
+        # Id 0 absorbs names beyond the 'H' id range
+        self._names: List[str] = ['other']
+        self._ids: Dict[str, int] = {'other': 0}
+        self._next = 0
+        self.size = 0
+
+    def _intern(self, name: str) -> int:
+        name_id = self._ids.get(name)
+        if name_id is None:
+            if len(self._names) > 65535:
+                return 0
+            name_id = self._ids[name] = len(self._names)
+            self._names.append(name)
+        return name_id
+
+    def append(self, timestamp: float, provider: str, method: str, model: str, duration: float,
+               success: bool, tokens: int, error: Optional[str]) -> None:
+        i = self._next
+        self.timestamps[i] = timestamp
+        self.durations[i] = duration
+        self.tokens[i] = tokens
+        self.success[i] = 1 if success else 0
+        self.providers[i] = self._intern(provider)
+        self.methods[i] = self._intern(method)
+        self.models[i] = self._intern(model or '')
+        self.errors[i] = error[:_MAX_PARAM_CHARS] if error else None
+        self._next = (i + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+
+    def indices(self) -> range:
+        """Slot indices from oldest to newest (modulo capacity)."""
+        start = (self._next - self.size) % self.capacity
+        return range(start, start + self.size)
+
+    def row(self, slot: int) -> Dict[str, Any]:
+        i = slot % self.capacity
+        return {
+            'timestamp': datetime.fromtimestamp(self.timestamps[i]),
+            'provider': self._names[self.providers[i]],
+            'method': self._names[self.methods[i]],
+            'duration': self.durations[i],
+            'success': bool(self.success[i]),
+            'tokens': self.tokens[i],
+            'model': self._names[self.models[i]],
+            'error': self.errors[i],
+        }
+
+    def name(self, name_id: int) -> str:
+        return self._names[name_id]
+
+    def name_id(self, name: str) -> Optional[int]:
+        return self._ids.get(name)
+
+    def clear(self) -> None:
+        self._next = 0
+        self.size = 0
+        for i in range(self.capacity):
+            self.errors[i] = None
+
+
+@dataclass(slots=True)
 class RequestMetrics:
     """Metrics for a single LLM request."""
     request_id: str
@@ -79,17 +293,24 @@ class ProviderStats:
 class DebugLogger:
     """Comprehensive logging and debugging system for LLM operations."""
     
-    def __init__(self, max_history: int = 1000, enable_detailed_logging: bool = True):
+    def __init__(self, max_history: int = 1000, enable_detailed_logging: bool = True, max_active: int = 10000):
         """Initialize debug logger.
         
+        Request parameters are kept only in redacted, summarized form (see
+        ``redact_params``), so memory stays bounded by ``max_history`` and
+        ``max_active`` entries of a few hundred bytes each.
+        
         Args:
             max_history: Maximum number of requests to keep in history
             enable_detailed_logging: Whether to enable detailed request/response logging
+            max_active: Maximum number of unfinished requests tracked; the oldest is dropped beyond it
         """
         self.max_history = max_history
         self.enable_detailed_logging = enable_detailed_logging
+        self.max_active = max_active
         self.request_history: deque = deque(maxlen=max_history)
         self.active_requests: Dict[str, RequestMetrics] = {}
+        self.dropped_active = 0
     
     def log_request(self, provider: str, method: str, params: Dict[str, Any]) -> str:
         """Log request with unique ID.
@@ -103,17 +324,22 @@ class DebugLogger:
             str: Unique request ID
         """
         request_id = str(uuid.uuid4())
+        redacted = redact_params(params) if self.enable_detailed_logging else {}
         
         # Create request metrics
         metrics = RequestMetrics(
             request_id=request_id,
             provider=provider,
             method=method,
-            model=params.get('model', 'unknown'),
+            model=str(params.get('model', 'unknown')),
             start_time=datetime.now(),
-            metadata={'params': params if self.enable_detailed_logging else {}}
+            metadata={'params': redacted}
         )
         
+        if len(self.active_requests) >= self.max_active:
+            # A caller never reported the outcome; forget the oldest entry
+            self.active_requests.pop(next(iter(self.active_requests)))
+            self.dropped_active += 1
         self.active_requests[request_id] = metrics
         
         if self.enable_detailed_logging:
@@ -121,7 +347,7 @@ class DebugLogger:
                 'request_id': request_id,
                 'provider': provider,
                 'method': method,
-                'params': params
+                'params': redacted
             })
         else:
             logger.info(f"[{request_id}] {provider}.{method} started")
@@ -158,7 +384,7 @@ class DebugLogger:
                     'content_length': len(response.content),
                     'finish_reason': response.finish_reason,
                     'tool_calls_count': len(response.tool_calls),
-                    'metadata': response.metadata
+                    'metadata_keys': list(response.metadata)[:20]
                 }
             })
         
@@ -210,6 +436,46 @@ class DebugLogger:
             'duration': metrics.duration
         })
     
+    def log_completed(self, request_id: str, duration: float, tokens: int = 0) -> None:
+        """Log successful completion of a request without a single response object (e.g. a stream).
+        
+        Args:
+            request_id: Request ID from log_request
+            duration: Request duration in seconds
+            tokens: Total tokens used, if known
+        """
+        metrics = self.active_requests.pop(request_id, None)
+        if metrics is None:
+            return
+        
+        metrics.end_time = datetime.now()
+        metrics.duration = duration
+        metrics.success = True
+        metrics.total_tokens = tokens
+        self.request_history.append(metrics)
+        
+        logger.debug(f"[{request_id}] {metrics.provider}.{metrics.method} completed in {duration:.3f}s")
+    
+    def log_cancelled(self, request_id: str, context: Dict[str, Any]) -> None:
+        """Log a request that was cancelled before completing (e.g. a losing hedge).
+        
+        Args:
+            request_id: Request ID from log_request
+            context: Additional context
+        """
+        metrics = self.active_requests.pop(request_id, None)
+        if metrics is None:
+            return
+        
+        metrics.end_time = datetime.now()
+        metrics.duration = (metrics.end_time - metrics.start_time).total_seconds()
+        metrics.success = False
+        metrics.error = "cancelled"
+        metrics.metadata.update({'cancel_context': context})
+        self.request_history.append(metrics)
+        
+        logger.debug(f"[{request_id}] {metrics.provider}.{metrics.method} cancelled after {metrics.duration:.3f}s")
+    
     def log_fallback(self, from_provider: str, to_provider: str, reason: str) -> None:
         """Log provider fallback event.
         
@@ -262,15 +528,26 @@ class DebugLogger:
 class MetricsCollector:
     """Collects and aggregates performance metrics for LLM providers."""
     
-    def __init__(self, window_size: int = 3600):
+    def __init__(self, window_size: int = 3600, latency_samples: int = 256, max_samples: int = 10000):
         """Initialize metrics collector.
         
+        Memory is fixed: request samples live in a ring buffer of
+        ``max_samples`` entries and latency distributions in fixed-size
+        histograms, whatever the traffic.
+        
         Args:
             window_size: Time window in seconds for rolling metrics
+            latency_samples: Recent latencies kept per provider/model for percentiles
+            max_samples: Capacity of the rolling request sample buffer
         """
         self.window_size = window_size
+        self.latency_samples = latency_samples
         self.provider_stats: Dict[str, ProviderStats] = {}
-        self.rolling_metrics: deque = deque()
+        self._samples = MetricsRing(max_samples)
+        # (provider, model) -> recent latencies; model '' aggregates the provider
+        self._latencies: Dict[Tuple[str, str], _LatencyWindow] = {}
+        # provider -> latency distribution since the last reset
+        self._histograms: Dict[str, LatencyHistogram] = {}
         self._cost_per_token = {
             'openai': {'gpt-4.1': 0.00003, 'gpt-3.5-turbo': 0.000002},
             'anthropic': {'claude-3-sonnet': 0.000015, 'claude-3-haiku': 0.000001},
@@ -279,7 +556,7 @@ class MetricsCollector:
     
     def record_request(self, provider: str, method: str, duration: float, success: bool, 
                       tokens: int = 0, model: str = '', error: Optional[str] = None) -> None:
-        """Record request metrics.
+        """Record request metrics in O(1) time and without growing memory.
         
         Args:
             provider: Provider name
@@ -291,10 +568,9 @@ class MetricsCollector:
             error: Error message if failed
         """
         # Initialize provider stats if needed
-        if provider not in self.provider_stats:
-            self.provider_stats[provider] = ProviderStats(provider=provider)
-        
-        stats = self.provider_stats[provider]
+        stats = self.provider_stats.get(provider)
+        if stats is None:
+            stats = self.provider_stats[provider] = ProviderStats(provider=provider)
         
         # Update counters
         stats.total_requests += 1
@@ -303,7 +579,10 @@ class MetricsCollector:
         else:
             stats.failed_requests += 1
             if error:
-                stats.errors[error] += 1
+                key = error[:_MAX_PARAM_CHARS]
+                if key not in stats.errors and len(stats.errors) >= MAX_ERROR_KINDS:
+                    key = 'other'
+                stats.errors[key] += 1
         
         # Update timing
         stats.total_duration += duration
@@ -319,20 +598,68 @@ class MetricsCollector:
         # Update error rate
         stats.error_rate = stats.failed_requests / stats.total_requests
         
-        # Add to rolling metrics
-        self.rolling_metrics.append({
-            'timestamp': datetime.now(),
-            'provider': provider,
-            'method': method,
-            'duration': duration,
-            'success': success,
-            'tokens': tokens,
-            'model': model,
-            'error': error
-        })
+        if success:
+            self.record_latency(provider, duration, model)
+            histogram = self._histograms.get(provider)
+            if histogram is None:
+                histogram = self._histograms[provider] = LatencyHistogram()
+            histogram.record(duration)
+        
+        # Add to rolling metrics (overwrites the oldest sample when full)
+        self._samples.append(time.time(), provider, method, model, duration, success, tokens, error)
+        
+        _REQUESTS.labels(provider, method, 'success' if success else 'error').inc()
+        _REQUEST_SECONDS.labels(provider, method).observe(duration)
+        if tokens > 0:
+            _TOKENS.labels(provider).inc(tokens)
+    
+    def record_latency(self, provider: str, duration: float, model: str = '') -> None:
+        """Add a latency sample to the provider's (and model's) rolling window.
+        
+        Args:
+            provider: Provider name
+            duration: Observed latency in seconds
+            model: Model name (optional)
+        """
+        keys = ((provider, ''), (provider, model)) if model else ((provider, ''),)
+        for key in keys:
+            window = self._latencies.get(key)
+            if window is None:
+                window = self._latencies[key] = _LatencyWindow(self.latency_samples)
+            window.append(duration)
+    
+    def get_latency_percentiles(self, provider: str, model: str = '') -> Optional[Dict[str, float]]:
+        """Get rolling p50/p95/p99 latency for a provider, or one of its models.
         
-        # Clean old metrics
-        self._clean_old_metrics()
+        Args:
+            provider: Provider name
+            model: Model name (optional; all models when empty)
+            
+        Returns:
+            Optional[Dict[str, float]]: p50, p95, p99 and sample count, or None without samples
+        """
+        window = self._latencies.get((provider, model or ''))
+        if not window:
+            return None
+        ordered = window.sorted()
+        last = len(ordered) - 1
+        return {
+            'p50': ordered[int(round(0.50 * last))],
+            'p95': ordered[int(round(0.95 * last))],
+            'p99': ordered[int(round(0.99 * last))],
+            'samples': len(ordered),
+        }
+    
+    def get_latency_histogram(self, provider: str) -> Optional[LatencyHistogram]:
+        """Get the latency histogram of a provider's successful requests since the last reset.
+        
+        Args:
+            provider: Provider name
+            
+        Returns:
+            Optional[LatencyHistogram]: Histogram, or None if the provider has no successful requests
+        """
+        return self._histograms.get(provider)
     
     def _calculate_cost(self, provider: str, model: str, tokens: int) -> float:
         """Calculate cost for token usage.
@@ -349,12 +676,6 @@ class MetricsCollector:
             return tokens * self._cost_per_token[provider][model]
         return 0.0
     
-    def _clean_old_metrics(self) -> None:
-        """Remove metrics older than window_size."""
-        cutoff = datetime.now() - timedelta(seconds=self.window_size)
-        while self.rolling_metrics and self.rolling_metrics[0]['timestamp'] < cutoff:
-            self.rolling_metrics.popleft()
-    
     def get_provider_stats(self, provider: str) -> Optional[ProviderStats]:
         """Get statistics for a specific provider.
         
@@ -385,18 +706,41 @@ class MetricsCollector:
         Returns:
             List[Dict[str, Any]]: List of metrics
         """
-        self._clean_old_metrics()
-        
-        metrics = list(self.rolling_metrics)
-        
-        if provider:
-            metrics = [m for m in metrics if m['provider'] == provider]
-        
-        if method:
-            metrics = [m for m in metrics if m['method'] == method]
-        
+        samples = self._samples
+        provider_id = samples.name_id(provider) if provider else None
+        method_id = samples.name_id(method) if method else None
+        if (provider and provider_id is None) or (method and method_id is None):
+            return []
+        
+        cutoff = time.time() - self.window_size
+        metrics = []
+        for slot in self._window_slots(cutoff):
+            i = slot % samples.capacity
+            if provider_id is not None and samples.providers[i] != provider_id:
+                continue
+            if method_id is not None and samples.methods[i] != method_id:
+                continue
+            metrics.append(samples.row(i))
         return metrics
     
+    def _window_slots(self, cutoff: float) -> range:
+        """Ring slots holding samples newer than cutoff (samples are in time order)."""
+        samples = self._samples
+        slots = samples.indices()
+        lo, hi = 0, len(slots)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if samples.timestamps[slots[mid] % samples.capacity] < cutoff:
+                lo = mid + 1
+            else:
+                hi = mid
+        return slots[lo:]
+    
+    @property
+    def rolling_metrics(self) -> List[Dict[str, Any]]:
+        """Samples within the rolling window, oldest first."""
+        return self.get_rolling_metrics()
+    
     def get_summary(self) -> Dict[str, Any]:
         """Get overall summary statistics.
         
@@ -418,7 +762,8 @@ class MetricsCollector:
             'total_cost': total_cost,
             'active_providers': len(self.provider_stats),
             'window_size_seconds': self.window_size,
-            'metrics_count': len(self.rolling_metrics)
+            'metrics_count': len(self._window_slots(time.time() - self.window_size)),
+            'latency': {provider: histogram.summary() for provider, histogram in self._histograms.items()}
         }
     
     def reset_stats(self, provider: Optional[str] = None) -> None:
@@ -431,9 +776,14 @@ class MetricsCollector:
             if provider in self.provider_stats:
                 del self.provider_stats[provider]
                 logger.info(f"Reset statistics for provider: {provider}")
+            for key in [key for key in self._latencies if key[0] == provider]:
+                del self._latencies[key]
+            self._histograms.pop(provider, None)
         else:
             self.provider_stats.clear()
-            self.rolling_metrics.clear()
+            self._samples.clear()
+            self._latencies.clear()
+            self._histograms.clear()
             logger.info("Reset all statistics")
 
 
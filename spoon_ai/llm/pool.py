@@ -0,0 +1,243 @@
+"""
+Provider pools: several configured instances of one provider (different API
+keys and base URLs), each behind its own concurrency and rate limits.
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from logging import getLogger
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from .interface import LLMProviderInterface
+
+logger = getLogger(__name__)
+
+# Keys of an instance entry that configure the pool rather than the provider
+LIMIT_KEYS = ("max_concurrency", "requests_per_minute", "tokens_per_minute")
+
+
+def member_configs(config: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Per-instance configurations for a provider pool.
+
+    Each entry of ``config['instances']`` inherits the provider-level settings
+    and limits and overrides them. A provider with limits but no instances
+    gets a single-member pool. Returns an empty list when the provider is not
+    pooled.
+    """
+    instances = config.get('instances') or []
+    if not instances and all(config.get(key) is None for key in LIMIT_KEYS):
+        return []
+    base = {key: value for key, value in config.items() if key != 'instances'}
+    return [{**base, **instance} for instance in (instances or [{}])]
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at ``rate_per_minute``.
+
+    The level may go negative when usage is reconciled after the fact (actual
+    tokens exceeding the estimate); the debt is paid back before the bucket
+    admits anything else.
+    """
+
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None):
+        if rate_per_minute <= 0:
+            raise ValueError(f"rate_per_minute must be positive, got {rate_per_minute}")
+        self.rate = rate_per_minute / 60.0
+        self.capacity = float(capacity if capacity is not None else rate_per_minute)
+        self._level = self.capacity
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._level = min(self.capacity, self._level + (now - self._updated) * self.rate)
+        self._updated = now
+
+    @property
+    def level(self) -> float:
+        self._refill()
+        return self._level
+
+    def delay(self, amount: float) -> float:
+        """Seconds until ``amount`` tokens can be taken (0 if available now).
+
+        Requests larger than the capacity only wait for a full bucket, so they
+        are slowed down rather than blocked forever.
+        """
+        amount = min(amount, self.capacity)
+        level = self.level
+        if level >= amount:
+            return 0.0
+        return (amount - level) / self.rate
+
+    def consume(self, amount: float) -> None:
+        self._refill()
+        self._level -= amount
+
+
+class PoolMember:
+    """One provider instance in a pool with its own limits."""
+
+    def __init__(self,
+                 member_id: str,
+                 provider: LLMProviderInterface,
+                 config: Dict[str, Any],
+                 max_concurrency: Optional[int] = None,
+                 requests_per_minute: Optional[float] = None,
+                 tokens_per_minute: Optional[float] = None):
+        self.member_id = member_id
+        self.provider = provider
+        self.config = config
+        self.max_concurrency = max_concurrency
+        self.request_bucket = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self.token_bucket = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self.in_flight = 0
+        self.total_requests = 0
+        self.cooldown_until = 0.0
+        self.initialized = False
+        self._init_lock = asyncio.Lock()
+
+    @property
+    def load(self) -> float:
+        """Fraction of the concurrency limit in use (raw count when unlimited)."""
+        if self.max_concurrency:
+            return self.in_flight / self.max_concurrency
+        return float(self.in_flight)
+
+    def delay(self, tokens: float) -> Optional[float]:
+        """Seconds until this member can admit a request, or None if it is at
+        its concurrency limit (it frees up on release, not on a timer)."""
+        if self.max_concurrency and self.in_flight >= self.max_concurrency:
+            return None
+        delay = max(0.0, self.cooldown_until - time.monotonic())
+        if self.request_bucket:
+            delay = max(delay, self.request_bucket.delay(1))
+        if self.token_bucket and tokens:
+            delay = max(delay, self.token_bucket.delay(tokens))
+        return delay
+
+    def record_usage(self, estimated_tokens: float, actual_tokens: float) -> None:
+        """Charge the difference between actual and estimated token usage."""
+        if self.token_bucket and actual_tokens:
+            self.token_bucket.consume(actual_tokens - estimated_tokens)
+
+    def cool_down(self, seconds: float) -> None:
+        """Stop admitting requests for ``seconds`` (e.g. after a 429)."""
+        self.cooldown_until = max(self.cooldown_until, time.monotonic() + seconds)
+
+    async def ensure_initialized(self) -> None:
+        if self.initialized:
+            return
+        async with self._init_lock:
+            if not self.initialized:
+                await self.provider.initialize(self.config)
+                self.initialized = True
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "in_flight": self.in_flight,
+            "max_concurrency": self.max_concurrency,
+            "total_requests": self.total_requests,
+            "requests_available": self.request_bucket.level if self.request_bucket else None,
+            "tokens_available": self.token_bucket.level if self.token_bucket else None,
+            "cooling_down": self.cooldown_until > time.monotonic(),
+        }
+
+
+class PoolLease:
+    """Handle for one admitted request; report usage through it."""
+
+    def __init__(self, member: PoolMember, estimated_tokens: float):
+        self.member = member
+        self.provider = member.provider
+        self.estimated_tokens = estimated_tokens
+
+    def record_usage(self, actual_tokens: float) -> None:
+        self.member.record_usage(self.estimated_tokens, actual_tokens)
+
+    def cool_down(self, seconds: float) -> None:
+        self.member.cool_down(seconds)
+
+
+class ProviderPool:
+    """Dispatches requests to the least-loaded member that can admit them.
+
+    When every member is saturated (concurrency limit, rate limit or cooldown)
+    ``acquire`` waits until one frees up instead of failing.
+    """
+
+    def __init__(self, name: str, members: List[PoolMember]):
+        if not members:
+            raise ValueError(f"Provider pool '{name}' needs at least one member")
+        self.name = name
+        self.members = members
+        self._condition = asyncio.Condition()
+        self.waiting = 0
+        self.queued_requests = 0
+
+    def _pick(self, tokens: float) -> Tuple[Optional[PoolMember], Optional[float]]:
+        """Return (member, None) if one can admit now, else (None, shortest delay)."""
+        best: Optional[PoolMember] = None
+        wait: Optional[float] = None
+        for member in self.members:
+            delay = member.delay(tokens)
+            if delay is None:
+                continue
+            if delay == 0:
+                if best is None or member.load < best.load:
+                    best = member
+            elif wait is None or delay < wait:
+                wait = delay
+        return best, wait
+
+    @asynccontextmanager
+    async def acquire(self, estimated_tokens: float = 0) -> AsyncIterator[PoolLease]:
+        """Reserve a member for one request.
+
+        Args:
+            estimated_tokens: Tokens charged up front against the member's TPM bucket
+
+        Yields:
+            PoolLease: Lease exposing the member's provider instance
+        """
+        async with self._condition:
+            member, wait = self._pick(estimated_tokens)
+            if member is None:
+                self.queued_requests += 1
+                self.waiting += 1
+                try:
+                    while member is None:
+                        try:
+                            # Woken on release; rate-limited members free up on a timer
+                            await asyncio.wait_for(self._condition.wait(), timeout=wait)
+                        except asyncio.TimeoutError:
+                            pass
+                        member, wait = self._pick(estimated_tokens)
+                finally:
+                    self.waiting -= 1
+            member.in_flight += 1
+            member.total_requests += 1
+            if member.request_bucket:
+                member.request_bucket.consume(1)
+            if member.token_bucket and estimated_tokens:
+                member.token_bucket.consume(estimated_tokens)
+
+        try:
+            await member.ensure_initialized()
+            yield PoolLease(member, estimated_tokens)
+        finally:
+            async with self._condition:
+                member.in_flight -= 1
+                self._condition.notify_all()
+
+    @property
+    def in_flight(self) -> int:
+        return sum(member.in_flight for member in self.members)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "members": {member.member_id: member.get_stats() for member in self.members},
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+            "queued_requests": self.queued_requests,
+        }
@@ -1,13 +1,46 @@
 """
 LLM Provider implementations.
+
+Each provider module imports its vendor SDK, so provider classes are only
+imported on first access (PEP 562). The provider registry loads them by
+name when a provider is first used.
 """
 
-from .openai_compatible_provider import OpenAICompatibleProvider
-from .openai_provider import OpenAIProvider
-from .openrouter_provider import OpenRouterProvider
-from .deepseek_provider import DeepSeekProvider
-from .anthropic_provider import AnthropicProvider
-from .gemini_provider import GeminiProvider
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+_LAZY_ATTRS = {
+    'OpenAICompatibleProvider': '.openai_compatible_provider',
+    'OpenAIProvider': '.openai_provider',
+    'OpenRouterProvider': '.openrouter_provider',
+    'DeepSeekProvider': '.deepseek_provider',
+    'AnthropicProvider': '.anthropic_provider',
+    'GeminiProvider': '.gemini_provider',
+    'FakeProvider': '.fake_provider',
+}
+
+if TYPE_CHECKING:
+    from .openai_compatible_provider import OpenAICompatibleProvider
+    from .openai_provider import OpenAIProvider
+    from .openrouter_provider import OpenRouterProvider
+    from .deepseek_provider import DeepSeekProvider
+    from .anthropic_provider import AnthropicProvider
+    from .gemini_provider import GeminiProvider
+    from .fake_provider import FakeProvider
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
 
 __all__ = [
     'OpenAICompatibleProvider',
@@ -15,5 +48,6 @@ __all__ = [
     'OpenRouterProvider',
     'DeepSeekProvider',
     'AnthropicProvider', 
-    'GeminiProvider'
+    'GeminiProvider',
+    'FakeProvider'
 ]
\ No newline at end of file
@@ -11,14 +11,20 @@ from uuid import uuid4
 from anthropic import AsyncAnthropic
 from httpx import AsyncClient
 
-from spoon_ai.schema import Message, ToolCall, Function, LLMResponseChunk
+from spoon_ai.schema import Message, ToolCall, Function, LLMResponseChunk, StreamContent
 from spoon_ai.callbacks.manager import CallbackManager
+from spoon_ai.telemetry import REGISTRY
 from ..interface import LLMProviderInterface, LLMResponse, ProviderMetadata, ProviderCapability
 from ..errors import ProviderError, AuthenticationError, RateLimitError, ModelNotFoundError, NetworkError
 from ..registry import register_provider
+from ..cache import MessageConversionCache
 
 logger = getLogger(__name__)
 
+_PROMPT_CACHE_TOKENS = REGISTRY.counter(
+    "spoon_llm_prompt_cache_tokens", "Anthropic input tokens by prompt cache outcome.", ["kind"]
+)
+
 
 @register_provider("anthropic", [
     ProviderCapability.CHAT,
@@ -36,6 +42,7 @@ class AnthropicProvider(LLMProviderInterface):
         self.max_tokens: int = 4096
         self.temperature: float = 0.3
         self.enable_prompt_cache: bool = True
+        self.message_cache = MessageConversionCache()
         self.cache_metrics = {
             "cache_creation_input_tokens": 0,
             "cache_read_input_tokens": 0,
@@ -73,7 +80,7 @@ class AnthropicProvider(LLMProviderInterface):
     def _convert_messages(self, messages: List[Message]) -> tuple[Optional[str], List[Dict[str, Any]]]:
         """Convert Message objects to Anthropic format, separating system messages."""
         system_content = None
-        anthropic_messages = []
+        conversation = []
         
         for message in messages:
             if message.role == "system":
@@ -92,53 +99,59 @@ class AnthropicProvider(LLMProviderInterface):
                 else:
                     # Use string format for simple system messages
                     system_content = message.content
-            elif message.role == "tool":
-                # Convert tool messages to user messages with tool_result
-                anthropic_messages.append({
-                    "role": "user",
-                    "content": [{
-                        "type": "tool_result",
-                        "tool_use_id": message.tool_call_id,
-                        "content": message.content
-                    }]
-                })
-            elif message.role == "assistant":
-                content = []
-                
-                # Add text content if present
-                if message.content:
-                    content.append({
-                        "type": "text",
-                        "text": message.content
-                    })
-                
-                # Add tool calls if present
-                if message.tool_calls:
-                    for tool_call in message.tool_calls:
-                        try:
-                            arguments = json.loads(tool_call.function.arguments) if isinstance(tool_call.function.arguments, str) else tool_call.function.arguments
-                        except json.JSONDecodeError:
-                            arguments = {}
-                        
-                        content.append({
-                            "type": "tool_use",
-                            "id": tool_call.id,
-                            "name": tool_call.function.name,
-                            "input": arguments
-                        })
-                
-                anthropic_messages.append({
-                    "role": "assistant",
-                    "content": content if content else message.content
-                })
-            elif message.role == "user":
-                anthropic_messages.append({
-                    "role": "user",
-                    "content": message.content
-                })
+            elif message.role in ("tool", "assistant", "user"):
+                conversation.append(message)
         
+        # Only messages not seen in an earlier request are converted
+        anthropic_messages = self.message_cache.convert_all(conversation, self._convert_message)
         return system_content, anthropic_messages
     
+    def _convert_message(self, message: Message) -> Dict[str, Any]:
+        """Convert a single non-system Message to Anthropic format."""
+        if message.role == "tool":
+            # Convert tool messages to user messages with tool_result
+            return {
+                "role": "user",
+                "content": [{
+                    "type": "tool_result",
+                    "tool_use_id": message.tool_call_id,
+                    "content": message.content
+                }]
+            }
+        elif message.role == "assistant":
+            content = []
+            
+            # Add text content if present
+            if message.content:
+                content.append({
+                    "type": "text",
+                    "text": message.content
+                })
+            
+            # Add tool calls if present
+            if message.tool_calls:
+                for tool_call in message.tool_calls:
+                    try:
+                        arguments = json.loads(tool_call.function.arguments) if isinstance(tool_call.function.arguments, str) else tool_call.function.arguments
+                    except json.JSONDecodeError:
+                        arguments = {}
+                    
+                    content.append({
+                        "type": "tool_use",
+                        "id": tool_call.id,
+                        "name": tool_call.function.name,
+                        "input": arguments
+                    })
+            
+            return {
+                "role": "assistant",
+                "content": content if content else message.content
+            }
+        return {
+            "role": "user",
+            "content": message.content
+        }
+
     def _convert_tools(self, tools: List[Dict]) -> List[Dict]:
         """Convert tools to Anthropic format."""
         anthropic_tools = []
@@ -179,12 +192,15 @@ class AnthropicProvider(LLMProviderInterface):
         if self.enable_prompt_cache and usage_data:
             if hasattr(usage_data, 'cache_creation_input_tokens') and usage_data.cache_creation_input_tokens:
                 self.cache_metrics["cache_creation_input_tokens"] += usage_data.cache_creation_input_tokens
+                _PROMPT_CACHE_TOKENS.labels("cache_creation").inc(usage_data.cache_creation_input_tokens)
                 logger.info(f"Cache creation tokens: {usage_data.cache_creation_input_tokens}")
             if hasattr(usage_data, 'cache_read_input_tokens') and usage_data.cache_read_input_tokens:
                 self.cache_metrics["cache_read_input_tokens"] += usage_data.cache_read_input_tokens
+                _PROMPT_CACHE_TOKENS.labels("cache_read").inc(usage_data.cache_read_input_tokens)
                 logger.info(f"Cache read tokens: {usage_data.cache_read_input_tokens}")
             if hasattr(usage_data, 'input_tokens') and usage_data.input_tokens:
                 self.cache_metrics["total_input_tokens"] += usage_data.input_tokens
+                _PROMPT_CACHE_TOKENS.labels("input").inc(usage_data.input_tokens)
     
     def get_cache_metrics(self) -> Dict[str, int]:
         """Get current cache performance metrics."""
@@ -274,7 +290,7 @@ class AnthropicProvider(LLMProviderInterface):
                 request_params['system'] = system_content
             
             # Process streaming response
-            full_content = ""
+            stream_content = StreamContent()
             chunk_index = 0
             finish_reason = None
             usage_data = None
@@ -284,7 +300,6 @@ class AnthropicProvider(LLMProviderInterface):
                     # Handle different chunk types
                     if chunk.type == "content_block_delta" and chunk.delta.type == "text_delta":
                         token = chunk.delta.text
-                        full_content += token
                         
                         # Trigger on_llm_new_token callback
                         await callback_manager.on_llm_new_token(
@@ -292,10 +307,10 @@ class AnthropicProvider(LLMProviderInterface):
                             run_id=run_id
                         )
                         
-                        # Build response chunk
-                        response_chunk = LLMResponseChunk(
-                            content=full_content,
-                            delta=token,
+                        # Build response chunk (content is read lazily from stream_content)
+                        response_chunk = LLMResponseChunk.from_stream(
+                            stream_content,
+                            token,
                             provider="anthropic",
                             model=model,
                             finish_reason=finish_reason,
@@ -332,7 +347,8 @@ class AnthropicProvider(LLMProviderInterface):
             # Trigger on_llm_end callback
             await callback_manager.on_llm_end(
                 response=LLMResponseChunk(
-                    content=full_content,
+                    content=stream_content.text(),
+                    delta="",
                     provider="anthropic",
                     model=model,
                     finish_reason=finish_reason,
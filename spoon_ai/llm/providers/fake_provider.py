@@ -0,0 +1,157 @@
+"""
+Local fake provider for offline tests and benchmarks.
+
+It answers every request without network access after a simulated latency
+and can emulate a server that throttles, so batching and rate-limit handling
+can be exercised without API keys. Behaviour is configured through
+``extra_params``:
+
+    fake_latency          mean latency in seconds (default 0.05)
+    fake_jitter           relative latency jitter (default 0.2)
+    fake_max_concurrency  concurrent requests accepted before answering 429
+    fake_rpm              requests per minute accepted before answering 429
+    fake_failure_rate     probability of a generic provider error
+    fake_seed             seed for the jitter and failure draws
+"""
+
+import asyncio
+import random
+import time
+from collections import deque
+from datetime import datetime
+from logging import getLogger
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from spoon_ai.callbacks.base import BaseCallbackHandler
+from spoon_ai.schema import LLMResponseChunk, Message, StreamContent
+
+from ..errors import ProviderError, RateLimitError
+from ..interface import LLMProviderInterface, LLMResponse, ProviderCapability, ProviderMetadata
+from ..registry import register_provider
+
+logger = getLogger(__name__)
+
+
+@register_provider("fake", [
+    ProviderCapability.CHAT,
+    ProviderCapability.COMPLETION,
+    ProviderCapability.TOOLS,
+    ProviderCapability.STREAMING
+])
+class FakeProvider(LLMProviderInterface):
+    """Deterministic in-process provider that echoes the last message."""
+
+    def __init__(self):
+        self.model = "fake-model"
+        self.latency = 0.05
+        self.jitter = 0.2
+        self.max_concurrency: Optional[int] = None
+        self.rpm: Optional[int] = None
+        self.failure_rate = 0.0
+        self._random = random.Random()
+        self._in_flight = 0
+        self._recent: deque = deque()
+        self.request_count = 0
+        self.throttled_count = 0
+
+    async def initialize(self, config: Dict[str, Any]) -> None:
+        params = {**config, **(config.get('extra_params') or {})}
+        self.model = config.get('model') or self.model
+        self.latency = float(params.get('fake_latency', self.latency))
+        self.jitter = float(params.get('fake_jitter', self.jitter))
+        self.max_concurrency = params.get('fake_max_concurrency', self.max_concurrency)
+        self.rpm = params.get('fake_rpm', self.rpm)
+        self.failure_rate = float(params.get('fake_failure_rate', self.failure_rate))
+        if params.get('fake_seed') is not None:
+            self._random.seed(params['fake_seed'])
+        logger.info(f"Fake provider initialized (latency={self.latency}s)")
+
+    def _admit(self) -> None:
+        """Raise RateLimitError the way a throttling server would."""
+        now = time.monotonic()
+        while self._recent and now - self._recent[0] > 60:
+            self._recent.popleft()
+        if self.max_concurrency is not None and self._in_flight >= self.max_concurrency:
+            self.throttled_count += 1
+            raise RateLimitError("fake", retry_after=None, context={"reason": "concurrency"})
+        if self.rpm is not None and len(self._recent) >= self.rpm:
+            self.throttled_count += 1
+            retry_after = max(1, int(60 - (now - self._recent[0])))
+            raise RateLimitError("fake", retry_after=retry_after, context={"reason": "rpm"})
+        self._recent.append(now)
+
+    async def _respond(self, messages: List[Message], **kwargs) -> LLMResponse:
+        self._admit()
+        self._in_flight += 1
+        self.request_count += 1
+        try:
+            delay = self.latency * (1 + self._random.uniform(-self.jitter, self.jitter))
+            await asyncio.sleep(max(0.0, delay))
+            if self.failure_rate and self._random.random() < self.failure_rate:
+                raise ProviderError("fake", "Simulated provider failure")
+        finally:
+            self._in_flight -= 1
+
+        prompt = str(messages[-1].content or "") if messages else ""
+        content = f"fake response to: {prompt}"
+        prompt_tokens = sum(len(str(m.content or "")) for m in messages) // 4 + 1
+        completion_tokens = len(content) // 4 + 1
+        return LLMResponse(
+            content=content,
+            provider="fake",
+            model=kwargs.get('model', self.model),
+            finish_reason="stop",
+            native_finish_reason="stop",
+            usage={
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens
+            }
+        )
+
+    async def chat(self, messages: List[Message], **kwargs) -> LLMResponse:
+        return await self._respond(messages, **kwargs)
+
+    async def chat_stream(self, messages: List[Message], callbacks: Optional[List[BaseCallbackHandler]] = None, **kwargs) -> AsyncIterator[LLMResponseChunk]:
+        response = await self._respond(messages, **kwargs)
+        stream_content = StreamContent()
+        words = response.content.split(" ")
+        for index, word in enumerate(words):
+            delta = word if index == 0 else " " + word
+            last = index == len(words) - 1
+            yield LLMResponseChunk.from_stream(
+                stream_content,
+                delta,
+                provider="fake",
+                model=response.model,
+                finish_reason="stop" if last else None,
+                usage=response.usage if last else None,
+                chunk_index=index,
+                timestamp=datetime.now().isoformat()
+            )
+
+    async def completion(self, prompt: str, **kwargs) -> LLMResponse:
+        return await self._respond([Message(role="user", content=prompt)], **kwargs)
+
+    async def chat_with_tools(self, messages: List[Message], tools: List[Dict], **kwargs) -> LLMResponse:
+        return await self._respond(messages, **kwargs)
+
+    def get_metadata(self) -> ProviderMetadata:
+        return ProviderMetadata(
+            name="fake",
+            version="1.0.0",
+            capabilities=[
+                ProviderCapability.CHAT,
+                ProviderCapability.COMPLETION,
+                ProviderCapability.TOOLS,
+                ProviderCapability.STREAMING
+            ],
+            max_tokens=128000,
+            supports_system_messages=True
+        )
+
+    async def health_check(self) -> bool:
+        return True
+
+    async def cleanup(self) -> None:
+        pass
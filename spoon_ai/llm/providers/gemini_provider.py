@@ -14,11 +14,12 @@ from uuid import uuid4
 from google import genai
 from google.genai import types
 
-from spoon_ai.schema import Message, ToolCall, Function, LLMResponseChunk
+from spoon_ai.schema import Message, ToolCall, Function, LLMResponseChunk, StreamContent
 from spoon_ai.callbacks.manager import CallbackManager
 from ..interface import LLMProviderInterface, LLMResponse, ProviderMetadata, ProviderCapability
 from ..errors import ProviderError, AuthenticationError, RateLimitError, ModelNotFoundError, NetworkError
 from ..registry import register_provider
+from ..cache import MessageConversionCache
 
 logger = getLogger(__name__)
 
@@ -40,6 +41,7 @@ class GeminiProvider(LLMProviderInterface):
         self.model: str = ""
         self.max_tokens: int = 4096
         self.temperature: float = 0.3
+        self.message_cache = MessageConversionCache()
         
     async def initialize(self, config: Dict[str, Any]) -> None:
         """Initialize the Gemini provider with configuration."""
@@ -88,9 +90,15 @@ class GeminiProvider(LLMProviderInterface):
         return system_content, user_message
     
     def _convert_messages_for_tools(self, messages: List[Message]) -> tuple[Optional[str], List]:
-        """Convert Message objects to Gemini format for tool calling."""
+        """Convert Message objects to Gemini format for tool calling.
+
+        Messages already converted for an earlier request are reused from
+        ``message_cache``.
+        """
         system_content = ""
-        gemini_messages = []
+        conversation = []
+        # Function names by tool_call_id, for tool results that carry no name
+        tool_names: Dict[str, str] = {}
         
         for message in messages:
             if message.role == "system":
@@ -98,64 +106,66 @@ class GeminiProvider(LLMProviderInterface):
                     system_content += " " + message.content
                 else:
                     system_content = message.content
-            elif message.role == "user":
-                gemini_messages.append(types.Content(
-                    role="user",
-                    parts=[types.Part.from_text(text=message.content)]
-                ))
-            elif message.role == "assistant":
-                if message.tool_calls:
-                    # Convert tool calls to Gemini format
-                    parts = []
-                    if message.content:
-                        parts.append(types.Part.from_text(text=message.content))
-                    
+            elif message.role in ("user", "assistant", "tool"):
+                if message.role == "assistant" and message.tool_calls:
                     for tool_call in message.tool_calls:
-                        args = tool_call.function.get_arguments_dict()
-                        parts.append(types.Part.from_function_call(
-                            name=tool_call.function.name,
-                            args=args
-                        ))
-                    
-                    gemini_messages.append(types.Content(
-                        role="model",
-                        parts=parts
-                    ))
-                else:
-                    gemini_messages.append(types.Content(
-                        role="model",
-                        parts=[types.Part.from_text(text=message.content)]
+                        tool_names[tool_call.id] = tool_call.function.name
+                conversation.append(message)
+        
+        def resolved_name(message: Message) -> Optional[str]:
+            # A nameless tool result is named after a call elsewhere in the
+            # history, so that name is part of its cache key
+            if message.role == "tool" and not message.name:
+                return tool_names.get(message.tool_call_id)
+            return None
+
+        gemini_messages = self.message_cache.convert_all(
+            conversation, lambda message: self._convert_message(message, tool_names), resolved_name
+        )
+        return system_content, gemini_messages
+    
+    @staticmethod
+    def _convert_message(message: Message, tool_names: Dict[str, str]) -> types.Content:
+        """Convert a single non-system Message to Gemini format."""
+        if message.role == "user":
+            return types.Content(
+                role="user",
+                parts=[types.Part.from_text(text=message.content)]
+            )
+        if message.role == "assistant":
+            if message.tool_calls:
+                # Convert tool calls to Gemini format
+                parts = []
+                if message.content:
+                    parts.append(types.Part.from_text(text=message.content))
+                
+                for tool_call in message.tool_calls:
+                    args = tool_call.function.get_arguments_dict()
+                    parts.append(types.Part.from_function_call(
+                        name=tool_call.function.name,
+                        args=args
                     ))
-            elif message.role == "tool":
-                # Convert tool response to Gemini format
-                # Gemini requires a non-empty name for function_response
-                tool_name = message.name
-                if not tool_name:
-                    # Fallback: try to extract tool name from tool_call_id or use a default
-                    if message.tool_call_id:
-                        # Try to find the corresponding tool call in previous messages
-                        for prev_msg in reversed(messages):
-                            if prev_msg.role == "assistant" and prev_msg.tool_calls:
-                                for tool_call in prev_msg.tool_calls:
-                                    if tool_call.id == message.tool_call_id:
-                                        tool_name = tool_call.function.name
-                                        break
-                                if tool_name:
-                                    break
-                    
-                    # If still no name found, use a default
-                    if not tool_name:
-                        tool_name = "unknown_function"
                 
-                gemini_messages.append(types.Content(
-                    role="user",
-                    parts=[types.Part.from_function_response(
-                        name=tool_name,
-                        response={"result": message.content}
-                    )]
-                ))
+                return types.Content(
+                    role="model",
+                    parts=parts
+                )
+            return types.Content(
+                role="model",
+                parts=[types.Part.from_text(text=message.content)]
+            )
         
-        return system_content, gemini_messages
+        # Convert tool response to Gemini format
+        # Gemini requires a non-empty name for function_response; fall back to
+        # the name of the matching tool call, then to a default
+        tool_name = message.name or tool_names.get(message.tool_call_id) or "unknown_function"
+        return types.Content(
+            role="user",
+            parts=[types.Part.from_function_response(
+                name=tool_name,
+                response={"result": message.content}
+            )]
+        )
     
     def _convert_tools_to_gemini(self, tools: List[Dict]) -> List:
         """Convert OpenAI/Anthropic tool format to Gemini format."""
@@ -285,7 +295,7 @@ class GeminiProvider(LLMProviderInterface):
                 generate_config.system_instruction = system_content
             
             # Process streaming response
-            full_content = ""
+            stream_content = StreamContent()
             chunk_index = 0
             finish_reason = None
             usage_data = None
@@ -303,8 +313,6 @@ class GeminiProvider(LLMProviderInterface):
                 if part_response.candidates and part_response.candidates[0].content.parts:
                     chunk = part_response.candidates[0].content.parts[0].text
                     if chunk:
-                        full_content += chunk
-                        
                         # Trigger on_llm_new_token callback
                         await callback_manager.on_llm_new_token(
                             token=chunk,
@@ -324,10 +332,10 @@ class GeminiProvider(LLMProviderInterface):
                                 "total_tokens": part_response.usage_metadata.total_token_count
                             }
                         
-                        # Build response chunk
-                        response_chunk = LLMResponseChunk(
-                            content=full_content,
-                            delta=chunk,
+                        # Build response chunk (content is read lazily from stream_content)
+                        response_chunk = LLMResponseChunk.from_stream(
+                            stream_content,
+                            chunk,
                             provider="gemini",
                             model=model,
                             finish_reason=finish_reason,
@@ -345,7 +353,8 @@ class GeminiProvider(LLMProviderInterface):
             # Trigger on_llm_end callback
             await callback_manager.on_llm_end(
                 response=LLMResponseChunk(
-                    content=full_content,
+                    content=stream_content.text(),
+                    delta="",
                     provider="gemini",
                     model=model,
                     finish_reason=finish_reason,
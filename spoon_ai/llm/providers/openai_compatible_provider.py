@@ -12,7 +12,7 @@ from datetime import datetime
 from openai import AsyncOpenAI
 from openai.types.chat import ChatCompletion
 
-from spoon_ai.schema import Message, ToolCall, Function, LLMResponseChunk
+from spoon_ai.schema import Message, ToolCall, Function, LLMResponseChunk, StreamContent
 from ..interface import LLMProviderInterface, LLMResponse, ProviderMetadata, ProviderCapability
 from ..errors import ProviderError, AuthenticationError, RateLimitError, ModelNotFoundError, NetworkError
 from spoon_ai.callbacks.base import BaseCallbackHandler
@@ -358,7 +358,7 @@ class OpenAICompatibleProvider(LLMProviderInterface):
 
             stream = await self.client.chat.completions.create(**request_kwargs)
             # Process streaming response
-            full_content = ""
+            stream_content = StreamContent()
             chunk_index = 0
             tool_call_accumulator = {}  # For accumulating tool calls
             finish_reason = None  # Initialize finish_reason outside loop
@@ -375,9 +375,9 @@ class OpenAICompatibleProvider(LLMProviderInterface):
                             "total_tokens": chunk.usage.total_tokens
                         }
                         # Yield a final chunk with usage info
-                        response_chunk = LLMResponseChunk(
-                            content=full_content,
-                            delta="",
+                        response_chunk = LLMResponseChunk.from_stream(
+                            stream_content,
+                            "",
                             provider=self.get_provider_name(),
                             model=model,
                             finish_reason=finish_reason,
@@ -400,8 +400,6 @@ class OpenAICompatibleProvider(LLMProviderInterface):
 
                 # Extract token/content
                 token = delta.content or ""
-                if token:
-                    full_content += token
 
                 # Extract finish_reason (preserve once set, don't let None overwrite it)
                 if choice.finish_reason is not None:
@@ -440,18 +438,18 @@ class OpenAICompatibleProvider(LLMProviderInterface):
                             "function": tc_chunk.function.model_dump() if tc_chunk.function else None
                         })
                 
-                # Convert accumulated tool calls to ToolCall objects (build from accumulator each time)
-                tool_calls = [
-                    ToolCall(
-                        id=tc["id"],
-                        type=tc["type"],
-                        function=Function(
-                            name=tc["function"]["name"],
-                            arguments=tc["function"]["arguments"]
+                    # Convert accumulated tool calls to ToolCall objects (only when they changed)
+                    tool_calls = [
+                        ToolCall(
+                            id=tc["id"],
+                            type=tc["type"],
+                            function=Function(
+                                name=tc["function"]["name"],
+                                arguments=tc["function"]["arguments"]
+                            )
                         )
-                    )
-                    for tc in tool_call_accumulator.values()
-                ]
+                        for tc in tool_call_accumulator.values()
+                    ]
                 
                 # Extract usage stats (typically in final chunk)
                 usage = None
@@ -462,10 +460,10 @@ class OpenAICompatibleProvider(LLMProviderInterface):
                         "total_tokens": chunk.usage.total_tokens
                     }
 
-                # Build response chunk
-                response_chunk = LLMResponseChunk(
-                    content=full_content,
-                    delta=token,
+                # Build response chunk (content is read lazily from stream_content)
+                response_chunk = LLMResponseChunk.from_stream(
+                    stream_content,
+                    token,
                     provider=self.get_provider_name(),
                     model=model,
                     finish_reason=finish_reason,
@@ -494,7 +492,7 @@ class OpenAICompatibleProvider(LLMProviderInterface):
 
             # Trigger on_llm_end callback
             final_response = LLMResponse(
-                content=full_content,
+                content=stream_content.text(),
                 provider=self.get_provider_name(),
                 model=model,
                 finish_reason=finish_reason or "stop",
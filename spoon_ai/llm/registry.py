@@ -2,6 +2,7 @@
 LLM Provider Registry for dynamic provider registration and discovery.
 """
 
+from importlib import import_module
 from typing import Dict, Type, List, Optional, Any
 from logging import getLogger
 
@@ -12,10 +13,16 @@ logger = getLogger(__name__)
 
 
 class LLMProviderRegistry:
-    """Registry for managing LLM provider classes and instances."""
+    """Registry for managing LLM provider classes and instances.
+
+    Providers can also be registered lazily, by import path: they count as
+    registered, but their module (and the vendor SDK it imports) is only
+    imported when the provider is first used.
+    """
 
     def __init__(self):
         self._providers: Dict[str, Type[LLMProviderInterface]] = {}
+        self._lazy: Dict[str, str] = {}
         self._instances: Dict[str, LLMProviderInterface] = {}
         self._configs: Dict[str, Dict[str, Any]] = {}
 
@@ -39,8 +46,52 @@ class LLMProviderRegistry:
             logger.warning(f"Provider '{name}' already registered, overwriting")
 
         self._providers[name] = provider_class
+        self._lazy.pop(name, None)
         logger.info(f"Registered provider: {name}")
 
+    def register_lazy(self, name: str, target: str) -> None:
+        """Register a provider class by import path without importing it.
+
+        Args:
+            name: Unique provider name
+            target: ``"package.module:ClassName"`` of the provider class
+
+        Does nothing if a class is already registered under ``name``.
+        """
+        if name not in self._providers:
+            self._lazy[name] = target
+
+    def _load(self, name: str) -> Type[LLMProviderInterface]:
+        """Provider class, importing it first if it was registered lazily.
+
+        Raises:
+            ConfigurationError: If provider not found or cannot be imported
+        """
+        provider_class = self._providers.get(name)
+        if provider_class is not None:
+            return provider_class
+        target = self._lazy.get(name)
+        if target is None:
+            available = ", ".join(self.list_providers())
+            raise ConfigurationError(
+                f"Provider '{name}' not found. Available providers: {available}",
+                context={"requested_provider": name, "available_providers": self.list_providers()}
+            )
+
+        module_name, _, class_name = target.partition(":")
+        try:
+            provider_class = getattr(import_module(module_name), class_name)
+        except (ImportError, AttributeError) as e:
+            raise ConfigurationError(
+                f"Provider '{name}' could not be loaded from {target}: {e}",
+                context={"provider_name": name, "target": target}
+            )
+        # Importing the module registers the class with the global registry
+        # through @register_provider; other registries register it here.
+        if name not in self._providers:
+            self.register(name, provider_class)
+        return self._providers[name]
+
     def get_provider(self, name: str, config: Optional[Dict[str, Any]] = None) -> LLMProviderInterface:
         """Get or create provider instance.
 
@@ -54,11 +105,11 @@ class LLMProviderRegistry:
         Raises:
             ConfigurationError: If provider not found or configuration invalid
         """
-        if name not in self._providers:
-            available = ", ".join(self._providers.keys())
+        if not self.is_registered(name):
+            available = ", ".join(self.list_providers())
             raise ConfigurationError(
                 f"Provider '{name}' not found. Available providers: {available}",
-                context={"requested_provider": name, "available_providers": list(self._providers.keys())}
+                context={"requested_provider": name, "available_providers": self.list_providers()}
             )
 
         # Use provided config or stored config
@@ -75,8 +126,8 @@ class LLMProviderRegistry:
             return self._instances[name]
 
         # Create new instance
+        provider_class = self._load(name)
         try:
-            provider_class = self._providers[name]
             instance = provider_class()
 
             # Initialize with configuration
@@ -98,13 +149,36 @@ class LLMProviderRegistry:
                 context={"provider_name": name, "config": self._configs.get(name)}
             )
 
+    def create_instance(self, name: str) -> LLMProviderInterface:
+        """Create a new, uncached provider instance (e.g. for a provider pool).
+
+        Args:
+            name: Provider name
+
+        Returns:
+            LLMProviderInterface: Uninitialized provider instance
+
+        Raises:
+            ConfigurationError: If provider not found
+        """
+        provider_class = self._load(name)
+        try:
+            return provider_class()
+        except Exception as e:
+            raise ProviderError(
+                name,
+                f"Failed to create provider instance: {str(e)}",
+                original_error=e,
+                context={"provider_name": name}
+            )
+
     def list_providers(self) -> List[str]:
         """List all registered provider names.
 
         Returns:
             List[str]: List of provider names
         """
-        return list(self._providers.keys())
+        return list(self._providers.keys()) + [name for name in self._lazy if name not in self._providers]
 
     def get_capabilities(self, name: str) -> List[ProviderCapability]:
         """Get provider capabilities.
@@ -118,8 +192,7 @@ class LLMProviderRegistry:
         Raises:
             ConfigurationError: If provider not found
         """
-        if name not in self._providers:
-            raise ConfigurationError(f"Provider '{name}' not found")
+        provider_class = self._load(name)
 
         # Try to get capabilities from existing instance first
         if name in self._instances:
@@ -131,7 +204,6 @@ class LLMProviderRegistry:
 
         # If no instance available, try to get declared capabilities from the provider class
         try:
-            provider_class = self._providers[name]
             if hasattr(provider_class, '_declared_capabilities'):
                 logger.debug(f"Using declared capabilities for {name}: {provider_class._declared_capabilities}")
                 return provider_class._declared_capabilities
@@ -151,7 +223,7 @@ class LLMProviderRegistry:
         Returns:
             bool: True if provider is registered
         """
-        return name in self._providers
+        return name in self._providers or name in self._lazy
 
     def unregister(self, name: str) -> None:
         """Unregister a provider.
@@ -171,8 +243,9 @@ class LLMProviderRegistry:
 
             del self._instances[name]
 
-        if name in self._providers:
-            del self._providers[name]
+        if name in self._providers or name in self._lazy:
+            self._providers.pop(name, None)
+            self._lazy.pop(name, None)
             logger.info(f"Unregistered provider: {name}")
 
         if name in self._configs:
@@ -185,6 +258,7 @@ class LLMProviderRegistry:
             self.unregister(name)
 
         self._providers.clear()
+        self._lazy.clear()
         self._configs.clear()
         logger.info("Cleared all providers from registry")
 
@@ -192,6 +266,19 @@ class LLMProviderRegistry:
 # Global registry instance
 _global_registry = LLMProviderRegistry()
 
+# Built-in providers are registered by import path; each provider module is
+# imported (and registers itself through @register_provider) on first use.
+_BUILTIN_PROVIDERS = {
+    "openai": "spoon_ai.llm.providers.openai_provider:OpenAIProvider",
+    "openrouter": "spoon_ai.llm.providers.openrouter_provider:OpenRouterProvider",
+    "deepseek": "spoon_ai.llm.providers.deepseek_provider:DeepSeekProvider",
+    "anthropic": "spoon_ai.llm.providers.anthropic_provider:AnthropicProvider",
+    "gemini": "spoon_ai.llm.providers.gemini_provider:GeminiProvider",
+    "fake": "spoon_ai.llm.providers.fake_provider:FakeProvider",
+}
+for _name, _target in _BUILTIN_PROVIDERS.items():
+    _global_registry.register_lazy(_name, _target)
+
 
 def register_provider(name: str, capabilities: Optional[List[ProviderCapability]] = None):
     """Decorator for automatic provider registration.
@@ -7,11 +7,23 @@ conversation history in chat applications.
 
 from .short_term_manager import ShortTermMemoryManager, TrimStrategy, MessageTokenCounter
 from .remove_message import RemoveMessage, REMOVE_ALL_MESSAGES
+from .tokenizers import (
+    ByteLevelTokenizer,
+    TiktokenTokenizer,
+    TokenizerTokenCounter,
+    get_tokenizer,
+    register_tokenizer,
+)
 
 __all__ = [
     "ShortTermMemoryManager",
     "TrimStrategy",
     "MessageTokenCounter",
+    "TokenizerTokenCounter",
+    "ByteLevelTokenizer",
+    "TiktokenTokenizer",
+    "get_tokenizer",
+    "register_tokenizer",
     "RemoveMessage",
     "REMOVE_ALL_MESSAGES",
 ]
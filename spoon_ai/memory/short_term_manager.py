@@ -7,7 +7,7 @@ from datetime import datetime
 from enum import Enum
 from typing import List, Optional, Dict, Any, Tuple
 
-from spoon_ai.schema import Message, SystemMessage
+from spoon_ai.schema import Message, SystemMessage, message_key
 from spoon_ai.graph.checkpointer import InMemoryCheckpointer
 from spoon_ai.graph.types import StateSnapshot
 from .remove_message import RemoveMessage, REMOVE_ALL_MESSAGES
@@ -23,48 +23,86 @@ class TrimStrategy(str, Enum):
 
 
 class MessageTokenCounter:
-    """Approximate token counter aligned with LangChain semantics."""
+    """Approximate token counter aligned with LangChain semantics.
+
+    Counts are additive per message, and each message's count is cached on the
+    message itself, keyed by its id and a hash of its content, so re-counting a
+    growing history only costs the new or edited messages.
+    """
+
+    # Distinguishes cached counts from different counting schemes
+    cache_namespace = "approx"
 
     async def count_tokens(
         self, messages: List[Message], model: Optional[str] = None
     ) -> int:
-        return self._approximate_count(messages)
+        counts = await self.count_per_message(messages, model)
+        return max(1, sum(counts))
+
+    async def count_per_message(
+        self, messages: List[Message], model: Optional[str] = None
+    ) -> List[int]:
+        """Return the token count of each message, using cached counts where valid."""
+        key = self._cache_key(model)
+        return [self._cached_count(message, key, model) for message in messages]
+
+    def _cache_key(self, model: Optional[str]) -> Any:
+        # The character heuristic does not depend on the model
+        return self.cache_namespace
+
+    def _count_message(self, message: Message, model: Optional[str]) -> int:
+        return self._approximate_message_count(message)
+
+    def _cached_count(self, message: Message, key: Any, model: Optional[str]) -> int:
+        cache = getattr(message, "_token_counts", None)
+        if cache is None:
+            return self._count_message(message, model)
+        fingerprint = _message_fingerprint(message)
+        entry = cache.get(key)
+        if entry is not None and entry[0] == fingerprint:
+            return entry[1]
+        count = self._count_message(message, model)
+        cache[key] = (fingerprint, count)
+        return count
 
     @staticmethod
     def _approximate_count(messages: List[Message]) -> int:
+        total = sum(MessageTokenCounter._approximate_message_count(message) for message in messages)
+        return max(1, total)
+
+    @staticmethod
+    def _approximate_message_count(message: Message) -> int:
         chars_per_token = 4.0
-        extra_tokens_per_message = 3.0
-        token_count = 0.0
+        extra_tokens_per_message = 3
+        message_chars = 0
 
-        for message in messages:
-            message_chars = 0
+        content = message.content
+        if isinstance(content, str):
+            message_chars += len(content)
+        elif content is not None:
+            message_chars += len(repr(content))
 
-            content = message.content
-            if isinstance(content, str):
-                message_chars += len(content)
-            elif content is not None:
-                message_chars += len(repr(content))
+        if (
+            message.role == "assistant"
+            and message.tool_calls
+            and not isinstance(message.content, list)
+        ):
+            message_chars += len(repr(message.tool_calls))
 
-            if (
-                message.role == "assistant"
-                and message.tool_calls
-                and not isinstance(message.content, list)
-            ):
-                message_chars += len(repr(message.tool_calls))
+        if message.role == "tool" and message.tool_call_id:
+            message_chars += len(message.tool_call_id)
 
-            if message.role == "tool" and message.tool_call_id:
-                message_chars += len(message.tool_call_id)
+        message_chars += len(message.role or "")
 
-            message_chars += len(message.role or "")
+        if message.name:
+            message_chars += len(message.name)
 
-            if message.name:
-                message_chars += len(message.name)
+        return math.ceil(message_chars / chars_per_token) + extra_tokens_per_message
 
-            token_count += math.ceil(message_chars / chars_per_token)
-            token_count += extra_tokens_per_message
 
-        total = math.ceil(token_count)
-        return max(1, total)
+def _message_fingerprint(message: Message, include_id: bool = True) -> int:
+    """Hash of the message id and everything that affects its token count."""
+    return hash(message_key(message, include_id))
 
 
 def _ensure_message_ids(messages: List[Message]) -> None:
@@ -87,6 +125,21 @@ class ShortTermMemoryManager:
         self.token_counter = token_counter or MessageTokenCounter()
         self.default_trim_strategy = default_trim_strategy
 
+    async def _message_token_counts(
+        self, messages: List[Message], model: Optional[str]
+    ) -> List[int]:
+        """Per-message token counts from the configured counter.
+
+        Counters that only implement ``count_tokens`` are asked once per message.
+        """
+        counter = self.token_counter
+        if isinstance(counter, MessageTokenCounter) and (
+            type(counter).count_tokens is MessageTokenCounter.count_tokens
+            or type(counter).count_per_message is not MessageTokenCounter.count_per_message
+        ):
+            return await counter.count_per_message(messages, model)
+        return [await counter.count_tokens([message], model) for message in messages]
+
     async def trim_messages(
         self,
         messages: List[Message],
@@ -104,11 +157,12 @@ class ShortTermMemoryManager:
         if strategy not in {TrimStrategy.FROM_END, TrimStrategy.FROM_START}:
             raise ValueError(f"Unsupported trim strategy: {strategy}")
 
-        total_tokens = await self.token_counter.count_tokens(messages, model)
-        if total_tokens <= max_tokens:
+        counts = await self._message_token_counts(messages, model)
+        if max(1, sum(counts)) <= max_tokens:
             return messages
 
         system_message: Optional[Message] = None
+        system_cost = 0
         remaining = messages
         if (
             keep_system
@@ -117,24 +171,27 @@ class ShortTermMemoryManager:
             and messages[0].role == "system"
         ):
             system_message = messages[0]
+            system_cost = counts[0]
             remaining = messages[1:]
+            counts = counts[1:]
 
+        # Counts are additive, so a running sum replaces re-counting each candidate
         if strategy == TrimStrategy.FROM_END:
             kept: List[Message] = []
-            for message in reversed(remaining):
-                trial = [message] + kept
-                candidate = ([system_message] if system_message else []) + trial
-                token_cost = await self.token_counter.count_tokens(candidate, model)
-                if token_cost <= max_tokens or not kept:
-                    kept = trial
+            kept_cost = system_cost
+            for message, cost in zip(reversed(remaining), reversed(counts)):
+                if max(1, kept_cost + cost) <= max_tokens or not kept:
+                    kept.append(message)
+                    kept_cost += cost
+            kept.reverse()
             trimmed = ([system_message] if system_message else []) + kept
         else:
             kept: List[Message] = []
-            for message in remaining:
-                trial = kept + [message]
-                token_cost = await self.token_counter.count_tokens(trial, model)
-                if token_cost <= max_tokens or not kept:
-                    kept = trial
+            kept_cost = 0
+            for message, cost in zip(remaining, counts):
+                if max(1, kept_cost + cost) <= max_tokens or not kept:
+                    kept.append(message)
+                    kept_cost += cost
                 else:
                     break
             trimmed = kept
@@ -171,8 +228,8 @@ class ShortTermMemoryManager:
 
         _ensure_message_ids(messages)
 
-        total_tokens = await self.token_counter.count_tokens(messages, summary_model)
-        if total_tokens <= max_tokens_before_summary:
+        counts = await self._message_token_counts(messages, summary_model)
+        if max(1, sum(counts)) <= max_tokens_before_summary:
             return messages, [], existing_summary or None
 
         if existing_summary:
@@ -0,0 +1,315 @@
+"""Tokenizer backends for exact token budgets in short-term memory.
+
+Tokenizers are looked up by model family. BPE vocabularies are loaded from
+local ``.tiktoken`` files (``<vocab_dir>/<encoding>.tiktoken``), never fetched
+over the network; when no vocabulary is available the byte-level estimator is
+used instead.
+"""
+
+import logging
+import math
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Protocol, Sequence, Tuple
+
+from spoon_ai.schema import Message
+
+from .short_term_manager import MessageTokenCounter, _message_fingerprint
+
+logger = logging.getLogger(__name__)
+
+VOCAB_DIR_ENV = "SPOON_TOKENIZER_VOCAB_DIR"
+
+# Model name prefix -> tokenizer family, longest prefix wins
+MODEL_FAMILIES: Dict[str, str] = {
+    "gpt-4o": "o200k_base",
+    "gpt-4.1": "o200k_base",
+    "gpt-4.5": "o200k_base",
+    "gpt-5": "o200k_base",
+    "chatgpt-4o": "o200k_base",
+    "o1": "o200k_base",
+    "o3": "o200k_base",
+    "o4": "o200k_base",
+    "gpt-4": "cl100k_base",
+    "gpt-3.5": "cl100k_base",
+    "text-embedding-3": "cl100k_base",
+    "text-embedding-ada": "cl100k_base",
+}
+
+# Split patterns and special tokens for the BPE encodings we can load offline
+# (same values as tiktoken_ext.openai_public)
+_BPE_SPECS: Dict[str, Tuple[str, Dict[str, int]]] = {
+    "cl100k_base": (
+        r"""'(?i:[sdmt]|ll|ve|re)|[^\r\n\p{L}\p{N}]?+\p{L}++|\p{N}{1,3}+| ?[^\s\p{L}\p{N}]++[\r\n]*+|\s++$|\s*[\r\n]|\s+(?!\S)|\s""",
+        {
+            "<|endoftext|>": 100257,
+            "<|fim_prefix|>": 100258,
+            "<|fim_middle|>": 100259,
+            "<|fim_suffix|>": 100260,
+            "<|endofprompt|>": 100276,
+        },
+    ),
+    "o200k_base": (
+        "|".join([
+            r"""[^\r\n\p{L}\p{N}]?[\p{Lu}\p{Lt}\p{Lm}\p{Lo}\p{M}]*[\p{Ll}\p{Lm}\p{Lo}\p{M}]+(?i:'s|'t|'re|'ve|'m|'ll|'d)?""",
+            r"""[^\r\n\p{L}\p{N}]?[\p{Lu}\p{Lt}\p{Lm}\p{Lo}\p{M}]+[\p{Ll}\p{Lm}\p{Lo}\p{M}]*(?i:'s|'t|'re|'ve|'m|'ll|'d)?""",
+            r"""\p{N}{1,3}""",
+            r""" ?[^\s\p{L}\p{N}]+[\r\n/]*""",
+            r"""\s*[\r\n]+""",
+            r"""\s+(?!\S)""",
+            r"""\s+""",
+        ]),
+        {"<|endoftext|>": 199999, "<|endofprompt|>": 200018},
+    ),
+}
+
+
+class Tokenizer(Protocol):
+    """Counts tokens in text."""
+
+    name: str
+
+    def count(self, text: str) -> int:
+        ...
+
+    def count_batch(self, texts: Sequence[str]) -> List[int]:
+        ...
+
+
+class ByteLevelTokenizer:
+    """Fast estimator working on UTF-8 byte lengths.
+
+    ASCII text averages about four characters per token. Multi-byte characters
+    (CJK in particular) are charged for their extra bytes, which keeps Chinese
+    and Japanese close to what byte-level BPE vocabularies produce instead of
+    undercounting them four-fold.
+    """
+
+    name = "byte_level"
+
+    def __init__(self, chars_per_token: float = 4.0, extra_bytes_per_token: float = 2.0):
+        self.chars_per_token = chars_per_token
+        self.extra_bytes_per_token = extra_bytes_per_token
+
+    def count(self, text: str) -> int:
+        if not text:
+            return 0
+        chars = len(text)
+        if text.isascii():
+            return math.ceil(chars / self.chars_per_token)
+        extra_bytes = len(text.encode("utf-8", "surrogatepass")) - chars
+        return math.ceil(chars / self.chars_per_token + extra_bytes / self.extra_bytes_per_token)
+
+    def count_batch(self, texts: Sequence[str]) -> List[int]:
+        return [self.count(text) for text in texts]
+
+
+class TiktokenTokenizer:
+    """Exact BPE token counts using a tiktoken encoding loaded from a local vocab file."""
+
+    def __init__(self, encoding: Any):
+        self._encoding = encoding
+        self.name = encoding.name
+
+    @classmethod
+    def from_vocab_file(cls, encoding_name: str, path: str) -> "TiktokenTokenizer":
+        if encoding_name not in _BPE_SPECS:
+            raise ValueError(f"Unknown BPE encoding '{encoding_name}'")
+        import tiktoken
+        from tiktoken.load import load_tiktoken_bpe
+
+        pat_str, special_tokens = _BPE_SPECS[encoding_name]
+        encoding = tiktoken.Encoding(
+            name=encoding_name,
+            pat_str=pat_str,
+            mergeable_ranks=load_tiktoken_bpe(path),
+            special_tokens=special_tokens,
+        )
+        return cls(encoding)
+
+    def count(self, text: str) -> int:
+        if not text:
+            return 0
+        return len(self._encoding.encode_ordinary(text))
+
+    def count_batch(self, texts: Sequence[str]) -> List[int]:
+        # tiktoken encodes batches on its own thread pool
+        return [len(tokens) for tokens in self._encoding.encode_ordinary_batch(list(texts))]
+
+
+_registry_lock = threading.Lock()
+_factories: Dict[str, Callable[[], Tokenizer]] = {}
+_instances: Dict[Tuple[str, Optional[str]], Tokenizer] = {}
+_fallback = ByteLevelTokenizer()
+
+
+def register_tokenizer(
+    family: str,
+    factory: Callable[[], Tokenizer],
+    model_prefixes: Sequence[str] = (),
+) -> None:
+    """Register a tokenizer factory for ``family`` and map model name prefixes to it."""
+    with _registry_lock:
+        _factories[family] = factory
+        for key in [key for key in _instances if key[0] == family]:
+            del _instances[key]
+        for prefix in model_prefixes:
+            MODEL_FAMILIES[prefix.lower()] = family
+
+
+def resolve_family(model: Optional[str]) -> Optional[str]:
+    """Return the tokenizer family for a model name, or None if it is unknown."""
+    if not model:
+        return None
+    name = model.lower().rsplit("/", 1)[-1]
+    best: Optional[str] = None
+    for prefix in MODEL_FAMILIES:
+        if name.startswith(prefix) and (best is None or len(prefix) > len(best)):
+            best = prefix
+    return MODEL_FAMILIES[best] if best else None
+
+
+def _load_bpe(family: str, vocab_dir: Optional[str]) -> Optional[Tokenizer]:
+    if family not in _BPE_SPECS or not vocab_dir:
+        return None
+    path = os.path.join(vocab_dir, f"{family}.tiktoken")
+    if not os.path.isfile(path):
+        return None
+    try:
+        return TiktokenTokenizer.from_vocab_file(family, path)
+    except Exception as exc:
+        logger.warning("Failed to load BPE vocab %s: %s", path, exc)
+        return None
+
+
+def get_tokenizer(model: Optional[str] = None, vocab_dir: Optional[str] = None) -> Tokenizer:
+    """Return the tokenizer for ``model``'s family, falling back to the byte-level estimator."""
+    family = resolve_family(model)
+    if family is None:
+        return _fallback
+    vocab_dir = vocab_dir or os.environ.get(VOCAB_DIR_ENV)
+    key = (family, vocab_dir)
+    with _registry_lock:
+        tokenizer = _instances.get(key)
+        if tokenizer is None:
+            factory = _factories.get(family)
+            tokenizer = factory() if factory else _load_bpe(family, vocab_dir)
+            if tokenizer is None:
+                logger.info("No vocab for tokenizer family '%s'; using byte-level estimates", family)
+                tokenizer = _fallback
+            _instances[key] = tokenizer
+    return tokenizer
+
+
+class TokenizerTokenCounter(MessageTokenCounter):
+    """Token counter backed by the tokenizer registry.
+
+    Per-message counts are cached on each message like the base class does,
+    and additionally in a bounded LRU keyed by tokenizer and message
+    fingerprint, so identical messages rebuilt every turn (e.g. from dicts)
+    are not re-tokenized. Cache misses in a list are tokenized in one batch.
+    """
+
+    cache_namespace = "tokenizer"
+    tokens_per_message = 3
+    tokens_per_name = 1
+
+    def __init__(
+        self,
+        default_model: Optional[str] = None,
+        *,
+        vocab_dir: Optional[str] = None,
+        cache_size: int = 4096,
+    ):
+        self.default_model = default_model
+        self.vocab_dir = vocab_dir
+        self.cache_size = max(0, cache_size)
+        self._lru: "OrderedDict[Tuple[str, int], int]" = OrderedDict()
+        self._lru_lock = threading.Lock()
+
+    def tokenizer_for(self, model: Optional[str]) -> Tokenizer:
+        return get_tokenizer(model or self.default_model, self.vocab_dir)
+
+    def _cache_key(self, model: Optional[str]) -> Any:
+        return (self.cache_namespace, self.tokenizer_for(model).name)
+
+    def _message_texts(self, message: Message) -> List[str]:
+        texts = [message.role or ""]
+        content = message.content
+        if isinstance(content, str):
+            texts.append(content)
+        elif content is not None:
+            texts.append(repr(content))
+        if message.role == "assistant" and message.tool_calls:
+            texts.append(repr(message.tool_calls))
+        if message.role == "tool" and message.tool_call_id:
+            texts.append(message.tool_call_id)
+        if message.name:
+            texts.append(message.name)
+        return texts
+
+    def _overhead(self, message: Message) -> int:
+        return self.tokens_per_message + (self.tokens_per_name if message.name else 0)
+
+    def _count_message(self, message: Message, model: Optional[str]) -> int:
+        tokenizer = self.tokenizer_for(model)
+        return sum(tokenizer.count_batch(self._message_texts(message))) + self._overhead(message)
+
+    def _lru_get(self, key: Tuple[str, int]) -> Optional[int]:
+        with self._lru_lock:
+            count = self._lru.get(key)
+            if count is not None:
+                self._lru.move_to_end(key)
+            return count
+
+    def _lru_put(self, key: Tuple[str, int], count: int) -> None:
+        if not self.cache_size:
+            return
+        with self._lru_lock:
+            self._lru[key] = count
+            self._lru.move_to_end(key)
+            while len(self._lru) > self.cache_size:
+                self._lru.popitem(last=False)
+
+    async def count_per_message(
+        self, messages: List[Message], model: Optional[str] = None
+    ) -> List[int]:
+        tokenizer = self.tokenizer_for(model)
+        key = (self.cache_namespace, tokenizer.name)
+        counts: List[Optional[int]] = [None] * len(messages)
+        misses: List[Tuple[int, int]] = []
+        for idx, message in enumerate(messages):
+            fingerprint = _message_fingerprint(message)
+            cache = getattr(message, "_token_counts", None)
+            entry = cache.get(key) if cache is not None else None
+            if entry is not None and entry[0] == fingerprint:
+                counts[idx] = entry[1]
+                continue
+            # Content-only key: rebuilt messages get fresh ids but the same count
+            count = self._lru_get((tokenizer.name, _message_fingerprint(message, include_id=False)))
+            if count is not None:
+                counts[idx] = count
+                if cache is not None:
+                    cache[key] = (fingerprint, count)
+                continue
+            misses.append((idx, fingerprint))
+
+        if misses:
+            # One batch call for every text of every uncached message
+            texts: List[str] = []
+            spans: List[Tuple[int, int]] = []
+            for idx, _ in misses:
+                message_texts = self._message_texts(messages[idx])
+                spans.append((len(texts), len(texts) + len(message_texts)))
+                texts.extend(message_texts)
+            text_counts = tokenizer.count_batch(texts)
+            for (idx, fingerprint), (start, end) in zip(misses, spans):
+                message = messages[idx]
+                count = sum(text_counts[start:end]) + self._overhead(message)
+                counts[idx] = count
+                self._lru_put((tokenizer.name, _message_fingerprint(message, include_id=False)), count)
+                cache = getattr(message, "_token_counts", None)
+                if cache is not None:
+                    cache[key] = (fingerprint, count)
+        return counts  # type: ignore[return-value]
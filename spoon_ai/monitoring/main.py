@@ -42,6 +42,10 @@ app.add_middleware(
 from spoon_ai.monitoring.api.routes import router as monitoring_router
 app.include_router(monitoring_router)
 
+# Prometheus/OpenMetrics scrape endpoint for SDK instrumentation
+from spoon_ai.telemetry import metrics_router
+app.include_router(metrics_router())
+
 # Add health check endpoint
 @app.get("/health", tags=["health"])
 async def health_check():
@@ -4,6 +4,7 @@ import uvicorn
 from fastapi import FastAPI
 
 from spoon_ai.payments.server import create_paywalled_router
+from spoon_ai.telemetry import metrics_router
 
 app = FastAPI(
     title="SpoonOS x402 Agent Gateway",
@@ -12,6 +13,7 @@ app = FastAPI(
 )
 
 app.include_router(create_paywalled_router())
+app.include_router(metrics_router())
 
 
 @app.get("/health", tags=["health"])
@@ -1,10 +1,10 @@
 import json
 from enum import Enum
-from typing import Any, List, Literal, Optional, Union
+from typing import Any, Dict, List, Literal, Optional, Tuple, Union
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr, computed_field
 
 
 class Function(BaseModel):
@@ -90,6 +90,29 @@ class Message(BaseModel):
     name: Optional[str] = Field(default=None)
     tool_call_id: Optional[str] = Field(default=None)
 
+    # Token counts cached by MessageTokenCounter: cache key -> (fingerprint, count)
+    _token_counts: Dict[Any, Tuple[int, int]] = PrivateAttr(default_factory=dict)
+
+def message_key(message: Message, include_id: bool = True) -> Tuple[Any, ...]:
+    """Hashable identity of a message: its id and everything a provider sends.
+
+    Equal keys mean the message converts, and counts tokens, identically.
+    ``str`` hashes are cached by the interpreter, so hashing the key is O(1)
+    for content that has been hashed before.
+    """
+    content = message.content
+    tool_calls = message.tool_calls
+    return (
+        message.id if include_id else None,
+        message.role,
+        content if isinstance(content, str) or content is None else repr(content),
+        message.name,
+        message.tool_call_id,
+        tuple(
+            (call.id, call.type, call.function.name, call.function.arguments) for call in tool_calls
+        ) if tool_calls else None,
+    )
+
 class SystemMessage(Message):
     role: ROLE_TYPE = Field(default=Role.SYSTEM.value)  # type: ignore
 
@@ -115,12 +138,50 @@ class LLMResponse(BaseModel):
     finish_reason: Optional[str] = Field(default=None)
     native_finish_reason: Optional[str] = Field(default=None)
 
+class StreamContent:
+    """Append-only text of a streaming response.
+
+    Providers append each delta (O(1)) instead of re-concatenating the whole
+    text per chunk; the parts are joined only when someone reads the text.
+    """
+
+    __slots__ = ("_parts", "_length")
+
+    def __init__(self):
+        self._parts: List[str] = []
+        self._length = 0
+
+    def append(self, delta: str) -> int:
+        """Add a delta and return the offset it starts at."""
+        offset = self._length
+        if delta:
+            self._parts.append(delta)
+            self._length += len(delta)
+        return offset
+
+    def __len__(self) -> int:
+        return self._length
+
+    def text(self, end: Optional[int] = None) -> str:
+        """Get the text, or its first ``end`` characters."""
+        if len(self._parts) > 1:
+            self._parts[:] = ["".join(self._parts)]
+        full = self._parts[0] if self._parts else ""
+        return full if end is None or end >= len(full) else full[:end]
+
+
 class LLMResponseChunk(BaseModel):
-    """Enhanced LLM streaming response chunk."""
+    """Enhanced LLM streaming response chunk.
+
+    A chunk carries its ``delta`` and the ``offset`` of that delta in the
+    full response. ``content`` (the text accumulated so far) is still
+    available but is computed on first access from the stream's shared
+    ``StreamContent``, so consumers that only read deltas never pay for it.
+    """
     
     # Core content
-    content: str = Field(..., description="Accumulated content so far")
     delta: str = Field(..., description="Incremental content in this chunk")
+    offset: int = Field(default=0, description="Position of delta in the accumulated content")
     
     # Provider information
     provider: str = Field(..., description="Provider name")
@@ -161,3 +222,39 @@ class LLMResponseChunk(BaseModel):
         default=None,
         description="ISO format timestamp"
     )
+
+    _content: Optional[str] = PrivateAttr(default=None)
+    _stream: Optional[StreamContent] = PrivateAttr(default=None)
+
+    def __init__(self, content: Optional[str] = None, stream: Optional[StreamContent] = None, **data):
+        super().__init__(**data)
+        self._content = content
+        self._stream = stream
+
+    @classmethod
+    def from_stream(cls, stream: StreamContent, delta: str, **fields) -> "LLMResponseChunk":
+        """Append ``delta`` to ``stream`` and build the chunk for it.
+
+        Args:
+            stream: Content shared by all chunks of one response
+            delta: New text in this chunk (may be empty)
+            **fields: Remaining chunk fields (provider, model, finish_reason, ...)
+
+        Returns:
+            LLMResponseChunk: Chunk whose ``content`` is read lazily from ``stream``
+        """
+        return cls(delta=delta, offset=stream.append(delta), stream=stream, **fields)
+
+    @computed_field(description="Accumulated content so far")
+    @property
+    def content(self) -> str:
+        if self._content is None:
+            if self._stream is not None:
+                self._content = self._stream.text(self.offset + len(self.delta))
+            else:
+                return self.delta
+        return self._content
+
+    @content.setter
+    def content(self, value: str) -> None:
+        self._content = value
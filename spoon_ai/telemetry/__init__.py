@@ -0,0 +1,49 @@
+"""
+Runtime telemetry for SpoonAI: a shared metrics registry, span tracing and their exporters.
+"""
+
+from .metrics import (
+    DEFAULT_BUCKETS,
+    REGISTRY,
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+    get_registry,
+    metrics_router,
+)
+from .tracing import (
+    InMemorySpanExporter,
+    JsonlSpanExporter,
+    OTLPHttpSpanExporter,
+    Span,
+    SpanExporter,
+    Tracer,
+    configure_tracing,
+    current_span,
+    get_tracer,
+    start_span,
+    traced,
+)
+
+__all__ = [
+    "DEFAULT_BUCKETS",
+    "REGISTRY",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "MetricsRegistry",
+    "get_registry",
+    "metrics_router",
+    "InMemorySpanExporter",
+    "JsonlSpanExporter",
+    "OTLPHttpSpanExporter",
+    "Span",
+    "SpanExporter",
+    "Tracer",
+    "configure_tracing",
+    "current_span",
+    "get_tracer",
+    "start_span",
+    "traced",
+]
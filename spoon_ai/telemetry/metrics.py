@@ -0,0 +1,330 @@
+"""
+In-process instrumentation registry with Prometheus/OpenMetrics text export.
+
+Hot paths (LLM requests, graph nodes, agent runs, MCP sessions) write to
+counters, gauges and histograms in a shared registry; ``metrics_router``
+exposes it on any FastAPI app so throughput problems can be found from a
+scrape instead of a profiler::
+
+    from spoon_ai.telemetry import metrics_router
+    app.include_router(metrics_router())
+
+Metrics are cheap to update (a dict lookup and a locked add), label values
+are cached per metric, and nothing is exported unless scraped.
+"""
+
+import math
+import threading
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Seconds; covers sub-millisecond tool calls up to multi-minute agent runs
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if value == -math.inf:
+        return "-Inf"
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(pairs: Sequence[Tuple[str, str]]) -> str:
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+class _CounterChild:
+    __slots__ = ("_lock", "value")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only be incremented by non-negative amounts")
+        with self._lock:
+            self.value += amount
+
+
+class _GaugeChild:
+    __slots__ = ("_lock", "value")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.value = 0.0
+
+    def set(self, value: float) -> None:
+        self.value = float(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value -= amount
+
+
+class _HistogramChild:
+    __slots__ = ("_lock", "_upper_bounds", "counts", "sum", "count")
+
+    def __init__(self, upper_bounds: Tuple[float, ...]):
+        self._lock = threading.Lock()
+        self._upper_bounds = upper_bounds
+        self.counts = [0] * (len(upper_bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self._upper_bounds, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+
+class _Metric:
+    """A metric family: one child per distinct label-value tuple."""
+
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+        if not self.labelnames:
+            self._unlabelled = self._child(())
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def _child(self, key: Tuple[str, ...]):
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def labels(self, *values, **labels):
+        """Get the child for a set of label values (positional or by name)."""
+        if labels:
+            values = tuple(str(labels[name]) for name in self.labelnames)
+        else:
+            values = tuple(str(value) for value in values)
+        if len(values) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {values}")
+        return self._child(values)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._children.clear()
+            if not self.labelnames:
+                self._unlabelled = self._child(())
+
+    def samples(self) -> Iterable[Tuple[str, Tuple[Tuple[str, str], ...], float]]:
+        """Yield (suffix, label pairs, value) for every child."""
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonically increasing count, exported as ``<name>_total``."""
+
+    type_name = "counter"
+
+    def _new_child(self):
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._unlabelled.inc(amount)
+
+    def samples(self):
+        for key, child in list(self._children.items()):
+            yield "_total", tuple(zip(self.labelnames, key)), child.value
+
+
+class Gauge(_Metric):
+    """Value that can go up and down."""
+
+    type_name = "gauge"
+
+    def _new_child(self):
+        return _GaugeChild()
+
+    def set(self, value: float) -> None:
+        self._unlabelled.set(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._unlabelled.inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self._unlabelled.dec(amount)
+
+    def samples(self):
+        for key, child in list(self._children.items()):
+            yield "", tuple(zip(self.labelnames, key)), child.value
+
+
+class Histogram(_Metric):
+    """Distribution of observations in fixed cumulative buckets."""
+
+    type_name = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.upper_bounds = tuple(sorted(float(b) for b in buckets if b != math.inf))
+        super().__init__(name, documentation, labelnames)
+
+    def _new_child(self):
+        return _HistogramChild(self.upper_bounds)
+
+    def observe(self, value: float) -> None:
+        self._unlabelled.observe(value)
+
+    def samples(self):
+        for key, child in list(self._children.items()):
+            with child._lock:
+                counts, total, count = list(child.counts), child.sum, child.count
+            labels = tuple(zip(self.labelnames, key))
+            cumulative = 0
+            for bound, bucket_count in zip(self.upper_bounds + (math.inf,), counts):
+                cumulative += bucket_count
+                yield "_bucket", labels + (("le", _format_value(bound)),), cumulative
+            yield "_count", labels, count
+            yield "_sum", labels, total
+
+
+class MetricsRegistry:
+    """Named collection of metrics rendered together on scrape.
+
+    ``counter``/``gauge``/``histogram`` are get-or-create, so modules can
+    declare their metrics at import time without coordinating.
+    """
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls, name: str, documentation: str, labelnames: Sequence[str], **kwargs) -> _Metric:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, documentation, labelnames, **kwargs)
+            elif type(metric) is not cls or metric.labelnames != tuple(labelnames):
+                raise ValueError(f"Metric {name} is already registered as a {metric.type_name} "
+                                 f"with labels {metric.labelnames}")
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._get_or_create(Gauge, name, documentation, labelnames)
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._get_or_create(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def get(self, name: str) -> Optional[_Metric]:
+        return self._metrics.get(name)
+
+    def metrics(self) -> List[_Metric]:
+        with self._lock:
+            return list(self._metrics.values())
+
+    def get_sample_value(self, name: str, labels: Optional[Dict[str, str]] = None) -> Optional[float]:
+        """Look up one exported sample, e.g. ``("spoon_llm_requests_total", {"provider": "openai"})``.
+
+        Args:
+            name: Sample name including any suffix (``_total``, ``_count``, ``_bucket``...)
+            labels: Exact label set of the sample
+
+        Returns:
+            Optional[float]: Sample value, or None if it has not been recorded
+        """
+        expected = {key: str(value) for key, value in (labels or {}).items()}
+        for metric in self.metrics():
+            if not name.startswith(metric.name):
+                continue
+            for suffix, pairs, value in metric.samples():
+                if metric.name + suffix == name and dict(pairs) == expected:
+                    return value
+        return None
+
+    def render(self, openmetrics: bool = True) -> str:
+        """Render all metrics in the OpenMetrics (default) or Prometheus 0.0.4 text format.
+
+        Args:
+            openmetrics: False for the classic Prometheus text format
+
+        Returns:
+            str: Exposition text
+        """
+        lines: List[str] = []
+        for metric in sorted(self.metrics(), key=lambda m: m.name):
+            # Prometheus 0.0.4 names counter families with their _total suffix
+            family = metric.name if openmetrics or metric.type_name != "counter" else metric.name + "_total"
+            lines.append(f"# HELP {family} {_escape(metric.documentation)}")
+            lines.append(f"# TYPE {family} {metric.type_name}")
+            for suffix, pairs, value in metric.samples():
+                lines.append(f"{metric.name}{suffix}{_format_labels(pairs)} {_format_value(value)}")
+        if openmetrics:
+            lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def clear(self) -> None:
+        """Reset every metric's values, keeping the registrations."""
+        for metric in self.metrics():
+            metric.clear()
+
+
+REGISTRY = MetricsRegistry()
+
+
+def get_registry() -> MetricsRegistry:
+    """Get the process-wide registry the SDK's instrumentation writes to."""
+    return REGISTRY
+
+
+def metrics_router(registry: Optional[MetricsRegistry] = None, path: str = "/metrics"):
+    """Build a FastAPI router serving the registry in the text exposition format.
+
+    The format follows the scraper's ``Accept`` header: OpenMetrics when it
+    is requested (as Prometheus does by default), Prometheus 0.0.4 otherwise.
+
+    Args:
+        registry: Registry to expose (the process-wide one by default)
+        path: Endpoint path
+
+    Returns:
+        APIRouter: Router to pass to ``app.include_router``
+    """
+    from fastapi import APIRouter, Request
+    from fastapi.responses import Response
+
+    registry = registry or REGISTRY
+    router = APIRouter(tags=["metrics"])
+
+    @router.get(path, include_in_schema=False)
+    async def metrics(request: Request) -> Response:
+        openmetrics = "application/openmetrics-text" in request.headers.get("accept", "")
+        return Response(
+            content=registry.render(openmetrics=openmetrics),
+            media_type=OPENMETRICS_CONTENT_TYPE if openmetrics else PROMETHEUS_CONTENT_TYPE,
+        )
+
+    return router
@@ -0,0 +1,433 @@
+"""
+Lightweight span tracing with ``contextvars`` propagation.
+
+A span records the name, timing, attributes and outcome of one unit of work
+(an agent run, a graph node, an LLM request, a tool call). The active span
+is kept in a context variable, so spans opened inside it - including in
+tasks created while it is active - become its children without passing
+anything explicitly::
+
+    from spoon_ai.telemetry import configure_tracing, JsonlSpanExporter
+
+    configure_tracing(JsonlSpanExporter("traces.jsonl"), sample_ratio=0.1)
+
+Tracing is off until an exporter is configured; spans are then no-ops that
+never touch the context. Sampling is decided once per trace from the trace
+id, so a trace is either recorded completely or not at all.
+Set ``SPOON_TRACE_FILE`` or ``SPOON_TRACE_OTLP_ENDPOINT`` (and optionally
+``SPOON_TRACE_SAMPLE_RATIO``) to enable it without code changes.
+"""
+
+import atexit
+import functools
+import json
+import os
+import queue
+import random
+import threading
+import time
+import urllib.request
+from contextlib import contextmanager
+from contextvars import ContextVar
+from logging import getLogger
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+logger = getLogger(__name__)
+
+_MAX_ATTRIBUTE_CHARS = 500
+
+
+def _attribute_value(value: Any) -> Any:
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    text = value if isinstance(value, str) else repr(value)
+    return text if len(text) <= _MAX_ATTRIBUTE_CHARS else text[:_MAX_ATTRIBUTE_CHARS] + "..."
+
+
+class Span:
+    """One timed operation in a trace."""
+
+    __slots__ = ("name", "trace_id", "span_id", "parent_id", "start_ns", "end_ns",
+                 "attributes", "status", "error", "_tracer")
+
+    recording = True
+
+    def __init__(self, tracer: "Tracer", name: str, trace_id: str, parent_id: Optional[str],
+                 attributes: Optional[Dict[str, Any]] = None):
+        self._tracer = tracer
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_id = parent_id
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.attributes: Dict[str, Any] = {}
+        self.status = "unset"
+        self.error: Optional[str] = None
+        if attributes:
+            self.set_attributes(attributes)
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = _attribute_value(value)
+
+    def set_attributes(self, attributes: Dict[str, Any]) -> None:
+        for key, value in attributes.items():
+            self.attributes[key] = _attribute_value(value)
+
+    def record_exception(self, error: BaseException) -> None:
+        self.status = "error"
+        self.error = f"{type(error).__name__}: {error}"[:_MAX_ATTRIBUTE_CHARS]
+
+    def end(self) -> None:
+        if self.end_ns is not None:
+            return
+        self.end_ns = time.time_ns()
+        if self.status == "unset":
+            self.status = "ok"
+        self._tracer._export(self)
+
+    @property
+    def duration(self) -> float:
+        """Duration in seconds (up to now while the span is open)."""
+        return ((self.end_ns or time.time_ns()) - self.start_ns) / 1e9
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_time_unix_nano": self.start_ns,
+            "end_time_unix_nano": self.end_ns,
+            "duration_ms": round(self.duration * 1000, 3),
+            "status": self.status,
+            "error": self.error,
+            "attributes": self.attributes,
+        }
+
+
+class _NonRecordingSpan:
+    """Span stand-in for unsampled traces; keeps the trace id so children stay unsampled."""
+
+    __slots__ = ("trace_id",)
+
+    recording = False
+    span_id = None
+
+    def __init__(self, trace_id: Optional[str] = None):
+        self.trace_id = trace_id
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def set_attributes(self, attributes: Dict[str, Any]) -> None:
+        pass
+
+    def record_exception(self, error: BaseException) -> None:
+        pass
+
+    def end(self) -> None:
+        pass
+
+
+_NOOP_SPAN = _NonRecordingSpan()
+
+_current_span: ContextVar[Optional[Any]] = ContextVar("spoon_current_span", default=None)
+
+
+def current_span():
+    """Get the active span (a no-op span when nothing is being traced)."""
+    return _current_span.get() or _NOOP_SPAN
+
+
+class SpanExporter:
+    """Receives finished spans. ``export`` must not block for long."""
+
+    def export(self, spans: List[Span]) -> None:
+        raise NotImplementedError
+
+    def shutdown(self) -> None:
+        pass
+
+
+class InMemorySpanExporter(SpanExporter):
+    """Keeps finished spans in a list, for tests and ad-hoc inspection."""
+
+    def __init__(self):
+        self.spans: List[Span] = []
+
+    def export(self, spans: List[Span]) -> None:
+        self.spans.extend(spans)
+
+    def clear(self) -> None:
+        self.spans.clear()
+
+
+class JsonlSpanExporter(SpanExporter):
+    """Appends one JSON object per finished span to a local file."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = open(path, "a", encoding="utf-8")
+
+    def export(self, spans: List[Span]) -> None:
+        lines = "".join(json.dumps(span.to_dict(), default=str) + "\n" for span in spans)
+        with self._lock:
+            self._file.write(lines)
+            self._file.flush()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+def to_otlp(spans: List[Span], service_name: str = "spoon-ai") -> Dict[str, Any]:
+    """Encode spans as an OTLP/HTTP JSON ``ExportTraceServiceRequest``."""
+
+    def attribute(key: str, value: Any) -> Dict[str, Any]:
+        if isinstance(value, bool):
+            encoded = {"boolValue": value}
+        elif isinstance(value, int):
+            encoded = {"intValue": str(value)}
+        elif isinstance(value, float):
+            encoded = {"doubleValue": value}
+        else:
+            encoded = {"stringValue": "" if value is None else str(value)}
+        return {"key": key, "value": encoded}
+
+    return {
+        "resourceSpans": [{
+            "resource": {"attributes": [attribute("service.name", service_name)]},
+            "scopeSpans": [{
+                "scope": {"name": "spoon_ai"},
+                "spans": [{
+                    "traceId": span.trace_id,
+                    "spanId": span.span_id,
+                    "parentSpanId": span.parent_id or "",
+                    "name": span.name,
+                    "kind": 1,
+                    "startTimeUnixNano": str(span.start_ns),
+                    "endTimeUnixNano": str(span.end_ns),
+                    "attributes": [attribute(k, v) for k, v in span.attributes.items()],
+                    "status": {"code": 2, "message": span.error or ""} if span.status == "error" else {"code": 1},
+                } for span in spans],
+            }],
+        }]
+    }
+
+
+class OTLPHttpSpanExporter(SpanExporter):
+    """Posts spans as OTLP/HTTP JSON to a collector (e.g. ``http://localhost:4318/v1/traces``).
+
+    Spans are queued and sent in batches from a background thread, so the
+    traced code never waits on the network. When the queue is full new
+    spans are dropped and counted in ``dropped``.
+    """
+
+    def __init__(self, endpoint: str, service_name: str = "spoon-ai", batch_size: int = 256,
+                 flush_interval: float = 2.0, max_queue_size: int = 10000, timeout: float = 5.0,
+                 headers: Optional[Dict[str, str]] = None):
+        self.endpoint = endpoint
+        self.service_name = service_name
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.timeout = timeout
+        self.headers = {"Content-Type": "application/json", **(headers or {})}
+        self.dropped = 0
+        self.failed_batches = 0
+        self._queue: "queue.Queue[Optional[Span]]" = queue.Queue(max_queue_size)
+        self._worker = threading.Thread(target=self._run, name="spoon-otlp-exporter", daemon=True)
+        self._worker.start()
+
+    def export(self, spans: List[Span]) -> None:
+        for span in spans:
+            try:
+                self._queue.put_nowait(span)
+            except queue.Full:
+                self.dropped += 1
+
+    def _run(self) -> None:
+        batch: List[Span] = []
+        last_flush = time.monotonic()
+        while True:
+            try:
+                span = self._queue.get(timeout=max(0.0, self.flush_interval - (time.monotonic() - last_flush)))
+            except queue.Empty:
+                span = False
+            if span is None:
+                self._send(batch)
+                return
+            if span:
+                batch.append(span)
+            if len(batch) >= self.batch_size or time.monotonic() - last_flush >= self.flush_interval:
+                self._send(batch)
+                batch = []
+                last_flush = time.monotonic()
+
+    def _send(self, batch: List[Span]) -> None:
+        if not batch:
+            return
+        body = json.dumps(to_otlp(batch, self.service_name)).encode("utf-8")
+        request = urllib.request.Request(self.endpoint, data=body, headers=self.headers, method="POST")
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout):
+                pass
+        except Exception as e:
+            self.failed_batches += 1
+            logger.debug(f"Failed to export {len(batch)} spans to {self.endpoint}: {e}")
+
+    def shutdown(self) -> None:
+        if self._worker.is_alive():
+            self._queue.put(None)
+            self._worker.join(self.timeout)
+
+
+class Tracer:
+    """Creates spans, applies sampling and hands finished spans to the exporter."""
+
+    def __init__(self, exporter: Optional[SpanExporter] = None, sample_ratio: float = 1.0):
+        if not 0.0 <= sample_ratio <= 1.0:
+            raise ValueError("sample_ratio must be between 0 and 1")
+        self.exporter = exporter
+        self.sample_ratio = sample_ratio
+        # Trace ids at or below this bound are sampled (same rule as OpenTelemetry's ratio sampler)
+        self._sample_bound = int(sample_ratio * (2 ** 64 - 1))
+
+    @property
+    def enabled(self) -> bool:
+        return self.exporter is not None
+
+    def _sampled(self, trace_id: str) -> bool:
+        return int(trace_id[-16:], 16) <= self._sample_bound
+
+    def _new_span(self, name: str, attributes: Optional[Dict[str, Any]]):
+        parent = _current_span.get()
+        if parent is None:
+            trace_id = f"{random.getrandbits(128):032x}"
+            if not self._sampled(trace_id):
+                return _NonRecordingSpan(trace_id)
+            return Span(self, name, trace_id, None, attributes)
+        if not parent.recording:
+            return parent
+        return Span(self, name, parent.trace_id, parent.span_id, attributes)
+
+    @contextmanager
+    def start_span(self, name: str, attributes: Optional[Dict[str, Any]] = None) -> Iterator[Any]:
+        """Open a span as a child of the active one and make it active for the block.
+
+        Exceptions escaping the block mark the span as failed and are re-raised.
+
+        Args:
+            name: Span name, e.g. ``"llm.chat"``
+            attributes: Initial attributes
+
+        Yields:
+            Span: The span (a no-op span when tracing is off or the trace is unsampled)
+        """
+        if self.exporter is None:
+            yield _NOOP_SPAN
+            return
+        span = self._new_span(name, attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.record_exception(e)
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end()
+
+    def _export(self, span: Span) -> None:
+        exporter = self.exporter
+        if exporter is None:
+            return
+        try:
+            exporter.export([span])
+        except Exception as e:
+            logger.debug(f"Span export failed: {e}")
+
+    def shutdown(self) -> None:
+        if self.exporter is not None:
+            self.exporter.shutdown()
+
+
+_tracer: Optional[Tracer] = None
+
+
+def configure_tracing(exporter: Optional[SpanExporter] = None, sample_ratio: float = 1.0) -> Tracer:
+    """Install the process-wide tracer. Pass no exporter to turn tracing off.
+
+    Args:
+        exporter: Where finished spans go
+        sample_ratio: Fraction of traces to record (0 to 1)
+
+    Returns:
+        Tracer: The installed tracer
+    """
+    global _tracer
+    previous = _tracer
+    _tracer = Tracer(exporter, sample_ratio)
+    if previous is not None and previous.exporter is not exporter:
+        previous.shutdown()
+    return _tracer
+
+
+def _tracer_from_env() -> Tracer:
+    sample_ratio = float(os.getenv("SPOON_TRACE_SAMPLE_RATIO", "1.0"))
+    if os.getenv("SPOON_TRACE_OTLP_ENDPOINT"):
+        return Tracer(OTLPHttpSpanExporter(os.environ["SPOON_TRACE_OTLP_ENDPOINT"]), sample_ratio)
+    if os.getenv("SPOON_TRACE_FILE"):
+        return Tracer(JsonlSpanExporter(os.environ["SPOON_TRACE_FILE"]), sample_ratio)
+    return Tracer()
+
+
+def get_tracer() -> Tracer:
+    """Get the process-wide tracer, configured from the environment on first use."""
+    global _tracer
+    if _tracer is None:
+        _tracer = _tracer_from_env()
+    return _tracer
+
+
+@atexit.register
+def _shutdown_tracer() -> None:
+    # Flush buffered spans (file handles, OTLP queue) at interpreter exit
+    if _tracer is not None:
+        _tracer.shutdown()
+
+
+def start_span(name: str, attributes: Optional[Dict[str, Any]] = None):
+    """Open a span on the process-wide tracer; see ``Tracer.start_span``."""
+    return get_tracer().start_span(name, attributes)
+
+
+def traced(name: str, attributes: Optional[Callable[..., Dict[str, Any]]] = None):
+    """Decorate a coroutine function so each call runs in a span.
+
+    Args:
+        name: Span name
+        attributes: Optional callable receiving the call's arguments and
+            returning span attributes. If it raises, the span is recorded
+            without attributes; the call itself is never affected
+
+    Returns:
+        Callable: Decorator
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            tracer = get_tracer()
+            if tracer.exporter is None:
+                return await func(*args, **kwargs)
+            span_attributes = None
+            if attributes:
+                try:
+                    span_attributes = attributes(*args, **kwargs)
+                except Exception as e:
+                    logger.debug(f"Failed to extract attributes for span '{name}': {e}")
+            with tracer.start_span(name, span_attributes):
+                return await func(*args, **kwargs)
+        return wrapper
+    return decorator
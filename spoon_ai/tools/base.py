@@ -8,6 +8,14 @@ class BaseTool(ABC, BaseModel):
     name: str = Field(description="The name of the tool")
     description: str = Field(description="A description of the tool")
     parameters: dict = Field(description="The parameters of the tool")
+    # Execution hints for agents that run several tool calls of one turn concurrently
+    serial: bool = Field(
+        default=False,
+        description="Run alone and in call order, never alongside other tool calls (e.g. it has side effects)",
+    )
+    call_timeout: Optional[float] = Field(
+        default=None, description="Seconds a call may run before it is abandoned; overrides the agent default"
+    )
 
     model_config = {
         "arbitrary_types_allowed": True
@@ -2,7 +2,6 @@
 from typing import Union, Dict, Any, Optional, List
 import asyncio
 import os
-import time
 import logging
 
 from fastmcp.client.transports import (PythonStdioTransport, SSETransport, WSTransport, NpxStdioTransport,
@@ -12,6 +11,8 @@ from pydantic import Field
 
 from .base import BaseTool
 from ..agents.mcp_client_mixin import MCPClientMixin
+from ..agents.mcp_schema_registry import SCHEMA_REGISTRY, ToolSchema
+from ..telemetry import traced
 
 logger = logging.getLogger(__name__)
 
@@ -54,13 +55,13 @@ class MCPTool(BaseTool, MCPClientMixin):
             mcp_config=mcp_config
         )
 
-        MCPClientMixin.__init__(self, transport_obj)
+        # Support legacy/alias keys from config
+        self._health_check_interval = mcp_config.get('health_check_interval', 300)
+        MCPClientMixin.__init__(self, transport_obj, health_check_interval=self._health_check_interval)
 
         self._parameters_loaded = False
         self._parameters_loading = False
-        self._last_health_check = 0
-        # Support legacy/alias keys from config
-        self._health_check_interval = mcp_config.get('health_check_interval', 300)
+        self._schema: Optional[ToolSchema] = None
         # Prefer explicit connection_timeout, fall back to generic timeout
         self._connection_timeout = mcp_config.get('connection_timeout', mcp_config.get('timeout', 30))
         # Also apply per-transport override if present
@@ -134,58 +135,21 @@ class MCPTool(BaseTool, MCPClientMixin):
             retry_count = 0
             while retry_count < self._max_retries:
                 try:
-                    async with self.get_session() as session:
-                        tools = await asyncio.wait_for(session.list_tools(), timeout=self._connection_timeout)
-                        if tools:
-                            target_tool = None
-                            for tool in tools:
-                                if getattr(tool, 'name', '') == self.name:
-                                    target_tool = tool
-                                    break
-
-                            if not target_tool and tools:
-                                target_tool = tools[0]
-
-                            if target_tool:
-                                input_schema = None
-                                tool_description = None
-                                actual_tool_name = getattr(target_tool, 'name', None)
-
-                                if hasattr(target_tool, 'inputSchema'):
-                                    input_schema = target_tool.inputSchema
-                                    tool_description = getattr(target_tool, 'description', None)
-                                elif hasattr(target_tool, 'dict'):
-                                    tool_dict = target_tool.dict()
-                                    input_schema = tool_dict.get('inputSchema')
-                                    tool_description = tool_dict.get('description')
-                                else:
-                                    input_schema = getattr(target_tool, 'parameters', None)
-                                    tool_description = getattr(target_tool, 'description', None)
-
-                                # If the actual server tool name differs from our current name,
-                                # update this tool's name so downstream exposure uses the real name.
-                                if actual_tool_name and actual_tool_name != self.name:
-                                    object.__setattr__(self, 'name', actual_tool_name)
-
-                                if input_schema:
-                                    self.parameters = input_schema
-                                    logger.debug(f"Applied dynamic schema from MCP server for tool '{self.name}': {input_schema}")
-                                else:
-                                    logger.warning(f"No input schema found for MCP tool '{self.name}'")
-
-                                if tool_description:
-                                    self.description = tool_description
-                                    logger.debug(f"Updated description for tool '{self.name}': {tool_description}")
-
-                                self._parameters_loaded = True
-                                logger.debug(f"Successfully configured parameters for tool '{self.name}' from MCP server.")
-                                return
-                            else:
-                                logger.warning(f"No matching tool found for '{self.name}' on MCP server")
-                                return
-                        else:
-                            logger.warning(f"No tools available from MCP server for '{self.name}'")
-                            return
+                    # One listing per server, shared with every tool and agent using it
+                    schemas = await asyncio.wait_for(
+                        SCHEMA_REGISTRY.get(self._server_key, self.list_mcp_tools),
+                        timeout=self._connection_timeout,
+                    )
+                    if not schemas:
+                        logger.warning(f"No tools available from MCP server for '{self.name}'")
+                        return
+
+                    # Fall back to the server's first tool when no name matches
+                    schema = schemas.get(self.name) or next(iter(schemas.tools.values()))
+                    self._apply_schema(schema)
+                    self._parameters_loaded = True
+                    logger.debug(f"Successfully configured parameters for tool '{self.name}' from MCP server.")
+                    return
 
                 except asyncio.TimeoutError:
                     retry_count += 1
@@ -212,6 +176,33 @@ class MCPTool(BaseTool, MCPClientMixin):
         finally:
             self._parameters_loading = False
 
+    def _apply_schema(self, schema: ToolSchema) -> None:
+        """Adopt a server tool schema from the shared registry."""
+        # If the actual server tool name differs from our current name,
+        # update this tool's name so downstream exposure uses the real name.
+        if schema.name != self.name:
+            object.__setattr__(self, 'name', schema.name)
+        self.parameters = schema.parameters
+        if schema.description:
+            self.description = schema.description
+        self._schema = schema
+        logger.debug(f"Applied dynamic schema from MCP server for tool '{self.name}': {schema.parameters}")
+
+    def to_param(self) -> dict:
+        """Function spec of this tool, reusing the registry's prebuilt spec while
+        the tool still matches it and picking up background schema refreshes."""
+        schema = self._schema
+        if schema is None:
+            return super().to_param()
+        current = SCHEMA_REGISTRY.peek(self._server_key)
+        latest = current.get(schema.name) if current is not None else None
+        if latest is not None and latest is not schema and self.parameters is schema.parameters:
+            self._apply_schema(latest)
+            schema = latest
+        if self.name == schema.name and self.parameters is schema.parameters and self.description == schema.description:
+            return schema.spec
+        return super().to_param()
+
     async def ensure_parameters_loaded(self):
         if self._parameters_loaded:
             return
@@ -231,9 +222,6 @@ class MCPTool(BaseTool, MCPClientMixin):
         try:
             await self.ensure_parameters_loaded()
 
-            if not await self._check_mcp_health():
-                raise ConnectionError(f"MCP server for '{self.name}' is not healthy")
-
             # Remove tool_name from kwargs if it exists to avoid duplicate parameter
             final_args = {k: v for k, v in kwargs.items() if k != 'tool_name'}
 
@@ -261,7 +249,6 @@ class MCPTool(BaseTool, MCPClientMixin):
                         wait_time = 2 ** retry_count
                         logger.warning(f"MCP connection error for '{actual_tool_name}', retrying in {wait_time}s (attempt {retry_count}/{self._max_retries})")
                         await asyncio.sleep(wait_time)
-                        self._last_health_check = 0
                     else:
                         logger.error(f"MCP tool '{actual_tool_name}' failed after {self._max_retries} connection retries")
                         raise
@@ -278,23 +265,17 @@ class MCPTool(BaseTool, MCPClientMixin):
             raise RuntimeError(error_msg) from e
 
     async def _check_mcp_health(self) -> bool:
-        current_time = time.time()
-        if current_time - self._last_health_check < self._health_check_interval:
-            return True
+        """Health of the server as last seen by the session pool.
 
-        try:
-            async with self.get_session() as session:
-                tools = await asyncio.wait_for(session.list_tools(), timeout=min(10, max(5, int(self._connection_timeout))))
-                self._last_health_check = current_time
-                logger.debug(f"MCP health check passed for '{self.name}' - {len(tools) if tools else 0} tools available")
-                return True
-        except asyncio.TimeoutError:
-            logger.warning(f"MCP health check timeout for '{self.name}'")
-            return False
-        except Exception as e:
-            logger.warning(f"MCP health check failed for '{self.name}': {e}")
-            return False
+        Checks run in the pool's background task, so this never does I/O;
+        a server whose session dropped is reconnected on the next request.
+        """
+        healthy = self._session_pool.is_healthy(self._server_key)
+        if not healthy:
+            logger.debug(f"MCP server for '{self.name}' failed its last health check")
+        return healthy
 
+    @traced("mcp.call_tool", lambda self, tool_name, **kwargs: {"tool": tool_name, "mcp.server": self.name})
     async def call_mcp_tool(self, tool_name: str, **kwargs):
         """Override the mixin method to add tool-specific error handling."""
         try:
@@ -338,6 +319,9 @@ class MCPTool(BaseTool, MCPClientMixin):
         except asyncio.TimeoutError:
             logger.error(f"MCP tool '{tool_name}' call timed out after {self._connection_timeout}s")
             raise
+        except ConnectionError as e:
+            logger.error(f"MCP tool '{tool_name}' lost its server connection: {e}")
+            raise
         except asyncio.CancelledError:
             logger.warning(f"MCP tool '{tool_name}' call was cancelled")
             raise
@@ -351,22 +335,14 @@ class MCPTool(BaseTool, MCPClientMixin):
             if not await self._check_mcp_health():
                 raise ConnectionError(f"MCP server for '{self.name}' is not healthy")
 
-            async with self.get_session() as session:
-                tools = await asyncio.wait_for(session.list_tools(), timeout=self._connection_timeout)
-                if not tools:
-                    return []
-
-                # Convert tools to a list of dictionaries
-                tool_list = []
-                for tool in tools:
-                    tool_dict = {
-                        "name": getattr(tool, 'name', ''),
-                        "description": getattr(tool, 'description', ''),
-                        "inputSchema": getattr(tool, 'inputSchema', None)
-                    }
-                    tool_list.append(tool_dict)
-
-                return tool_list
+            schemas = await asyncio.wait_for(
+                SCHEMA_REGISTRY.get(self._server_key, self.list_mcp_tools),
+                timeout=self._connection_timeout,
+            )
+            return [
+                {"name": schema.name, "description": schema.description, "inputSchema": schema.parameters}
+                for schema in schemas.tools.values()
+            ]
 
         except Exception as e:
             logger.error(f"Failed to list available tools: {e}")
@@ -0,0 +1,305 @@
+"""
+Offline, in-process semantic index over tool descriptions.
+
+Tools are embedded by a pluggable local embedding function (by default
+``HashedNgramEmbedder``: hashed word, word-pair and character n-gram
+features, TF-IDF weighted by the index) and scored against a query by
+cosine similarity through an inverted index. Embeddings are cached by
+(embedder, text hash) in memory and, optionally, in a SQLite file, so
+re-indexing only embeds tools whose text changed.
+"""
+
+import hashlib
+import heapq
+import json
+import math
+import os
+import re
+import sqlite3
+import threading
+import zlib
+from collections import Counter
+from logging import getLogger
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+logger = getLogger(__name__)
+
+# Sparse vectors map feature ids to weights
+SparseVector = Dict[int, float]
+Embedder = Callable[[List[str]], List[Union[Mapping[int, float], Sequence[float]]]]
+
+_WORD = re.compile(r"[a-z0-9]+")
+_CAMEL = re.compile(r"(?<=[a-z0-9])(?=[A-Z])")
+
+
+def _tokens(text: str) -> List[str]:
+    return _WORD.findall(_CAMEL.sub(" ", text).lower())
+
+
+class HashedNgramEmbedder:
+    """Bag of hashed word, word-pair and character trigram features.
+
+    Needs no model or network; words sharing a stem (``price``/``prices``)
+    overlap through their trigrams. Features are hashed with CRC32, so
+    vectors are stable across processes and can be cached on disk.
+
+    Args:
+        dim: Number of hash buckets
+    """
+
+    # Term-frequency vectors; the index weights them by inverse document frequency
+    use_idf = True
+
+    def __init__(self, dim: int = 1 << 20):
+        self.dim = dim
+        self.embedder_id = f"hashed-ngram-v1-{dim}"
+
+    def _feature(self, kind: str, value: str) -> int:
+        return zlib.crc32(f"{kind}:{value}".encode()) % self.dim
+
+    def embed(self, text: str) -> SparseVector:
+        words = _tokens(text)
+        counts: Counter = Counter()
+        for word in words:
+            counts[self._feature("w", word)] += 1.0
+            padded = f"#{word}#"
+            for i in range(len(padded) - 2):
+                counts[self._feature("c", padded[i:i + 3])] += 0.25
+        for first, second in zip(words, words[1:]):
+            counts[self._feature("b", f"{first} {second}")] += 0.5
+        # Sublinear term frequency
+        return {feature: 1.0 + math.log(count) if count >= 1 else count for feature, count in counts.items()}
+
+    def __call__(self, texts: List[str]) -> List[SparseVector]:
+        return [self.embed(text) for text in texts]
+
+
+def _as_sparse(vector: Union[Mapping[int, float], Sequence[float]]) -> SparseVector:
+    if isinstance(vector, Mapping):
+        return {int(feature): float(weight) for feature, weight in vector.items() if weight}
+    return {i: float(weight) for i, weight in enumerate(vector) if weight}
+
+
+def _normalize(vector: SparseVector) -> SparseVector:
+    norm = math.sqrt(sum(weight * weight for weight in vector.values()))
+    return {feature: weight / norm for feature, weight in vector.items()} if norm else {}
+
+
+def tool_text(name: str, description: Optional[str], parameters: Optional[Dict[str, Any]] = None) -> str:
+    """Text a tool is indexed by: its name, description and parameter names
+    and descriptions."""
+    parts = [name.replace("_", " ").replace("-", " "), description or ""]
+    properties = (parameters or {}).get("properties") or {}
+    if isinstance(properties, dict):
+        for param, schema in properties.items():
+            parts.append(param.replace("_", " "))
+            if isinstance(schema, dict) and schema.get("description"):
+                parts.append(str(schema["description"]))
+    return "\n".join(parts)
+
+
+def spec_text(spec: Dict[str, Any]) -> str:
+    """``tool_text`` of a provider function spec (``{"type": "function", ...}``)."""
+    function = spec.get("function", spec)
+    return tool_text(function.get("name", ""), function.get("description"), function.get("parameters"))
+
+
+class EmbeddingCache:
+    """Embeddings by key, in memory and optionally persisted to SQLite.
+
+    Args:
+        path: SQLite file to persist embeddings to; None keeps them in
+            memory only
+        max_entries: Embeddings kept in memory (oldest dropped first)
+    """
+
+    def __init__(self, path: Optional[str] = None, max_entries: int = 100_000):
+        self.path = path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._memory: Dict[str, SparseVector] = {}
+        self._lock = threading.RLock()
+        self._conn = None
+        if path:
+            self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector TEXT NOT NULL)")
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, SparseVector]:
+        found: Dict[str, SparseVector] = {}
+        missing = []
+        with self._lock:
+            for key in keys:
+                vector = self._memory.get(key)
+                if vector is None:
+                    missing.append(key)
+                else:
+                    found[key] = vector
+            if missing and self._conn is not None:
+                for start in range(0, len(missing), 500):
+                    batch = missing[start:start + 500]
+                    rows = self._conn.execute(
+                        f"SELECT key, vector FROM embeddings WHERE key IN ({','.join('?' * len(batch))})", batch
+                    ).fetchall()
+                    for key, payload in rows:
+                        vector = found[key] = {int(feature): weight for feature, weight in json.loads(payload)}
+                        self._remember(key, vector)
+            self.hits += len(found)
+            self.misses += sum(1 for key in missing if key not in found)
+        return found
+
+    def put_many(self, items: Mapping[str, SparseVector]) -> None:
+        with self._lock:
+            for key, vector in items.items():
+                self._remember(key, vector)
+            if self._conn is not None and items:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                    [(key, json.dumps([[feature, weight] for feature, weight in vector.items()]))
+                     for key, vector in items.items()],
+                )
+
+    def _remember(self, key: str, vector: SparseVector) -> None:
+        self._memory[key] = vector
+        if len(self._memory) > self.max_entries:
+            del self._memory[next(iter(self._memory))]
+
+    def __len__(self) -> int:
+        return len(self._memory)
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+# Shared by indexes that are not given their own cache
+_SHARED_CACHE = EmbeddingCache()
+
+# Persistent caches by file, so indexes (e.g. one per agent) share one connection
+_PATH_CACHES: Dict[str, EmbeddingCache] = {}
+_PATH_CACHES_LOCK = threading.Lock()
+
+
+def cache_for_path(path: str) -> EmbeddingCache:
+    """Process-wide ``EmbeddingCache`` persisted to ``path``.
+
+    A closed cache is replaced by a fresh one on the next call.
+    """
+    key = os.path.abspath(path)
+    with _PATH_CACHES_LOCK:
+        cache = _PATH_CACHES.get(key)
+        if cache is None or cache._conn is None:
+            cache = _PATH_CACHES[key] = EmbeddingCache(path)
+        return cache
+
+
+class ToolIndex:
+    """Top-k tool retrieval by cosine similarity of local embeddings.
+
+    Args:
+        embedder: Embedding function over a batch of texts, returning sparse
+            (``{feature: weight}``) or dense vectors. Optional attributes:
+            ``embedder_id`` (namespaces cached embeddings) and ``use_idf``
+            (weight features by inverse document frequency). Defaults to
+            ``HashedNgramEmbedder``
+        cache: Embedding cache; defaults to the process-wide cache of
+            ``cache_path`` (see ``cache_for_path``) when a path is given,
+            else a process-wide in-memory cache
+        cache_path: SQLite file to persist embeddings to
+    """
+
+    def __init__(self,
+                 embedder: Optional[Embedder] = None,
+                 cache: Optional[EmbeddingCache] = None,
+                 cache_path: Optional[str] = None):
+        self.embedder = embedder or HashedNgramEmbedder()
+        self.embedder_id = getattr(self.embedder, "embedder_id", None) or getattr(
+            self.embedder, "__qualname__", type(self.embedder).__qualname__)
+        self.use_idf = bool(getattr(self.embedder, "use_idf", False))
+        self.cache = cache or (cache_for_path(cache_path) if cache_path else _SHARED_CACHE)
+        self.embedded = 0
+        self._documents: Dict[str, Tuple[str, SparseVector]] = {}
+        self._postings: Optional[Dict[int, List[Tuple[str, float]]]] = None
+        self._idf: Dict[int, float] = {}
+
+    def _key(self, text: str) -> str:
+        return f"{self.embedder_id}:{hashlib.sha256(text.encode()).hexdigest()}"
+
+    def update(self, documents: Mapping[str, str]) -> int:
+        """Index exactly these ``{tool name: text}`` documents.
+
+        Only texts without a cached embedding are embedded, in one batch.
+
+        Returns:
+            int: Number of texts embedded
+        """
+        changed = {}
+        for name, text in documents.items():
+            key = self._key(text)
+            current = self._documents.get(name)
+            if current is None or current[0] != key:
+                changed[name] = (key, text)
+        removed = self._documents.keys() - documents.keys()
+        if not changed and not removed:
+            return 0
+
+        cached = self.cache.get_many([key for key, _ in changed.values()])
+        missing = {key: text for key, text in changed.values() if key not in cached}
+        if missing:
+            vectors = self.embedder(list(missing.values()))
+            fresh = {key: _as_sparse(vector) for key, vector in zip(missing, vectors)}
+            self.cache.put_many(fresh)
+            cached.update(fresh)
+            self.embedded += len(fresh)
+
+        for name in removed:
+            del self._documents[name]
+        for name, (key, _) in changed.items():
+            self._documents[name] = (key, cached[key])
+        self._postings = None
+        return len(missing)
+
+    def _build(self) -> Dict[int, List[Tuple[str, float]]]:
+        self._idf = {}
+        if self.use_idf:
+            total = len(self._documents)
+            frequency: Counter = Counter()
+            for _, vector in self._documents.values():
+                frequency.update(vector.keys())
+            self._idf = {feature: math.log((total + 1) / (count + 1)) + 1.0 for feature, count in frequency.items()}
+        postings: Dict[int, List[Tuple[str, float]]] = {}
+        for name, (_, vector) in self._documents.items():
+            for feature, weight in self._weigh(vector).items():
+                postings.setdefault(feature, []).append((name, weight))
+        return postings
+
+    def _weigh(self, vector: SparseVector) -> SparseVector:
+        if self.use_idf:
+            # Features no indexed tool has cannot contribute to a score
+            vector = {feature: weight * self._idf[feature] for feature, weight in vector.items() if feature in self._idf}
+        return _normalize(vector)
+
+    def search(self, query: str, top_k: int = 5) -> List[Tuple[str, float]]:
+        """Most similar tools to ``query``, best first.
+
+        Returns:
+            List[Tuple[str, float]]: ``(tool name, cosine similarity)`` pairs
+            with a positive score, at most ``top_k``
+        """
+        if self._postings is None:
+            self._postings = self._build()
+        query_vector = self._weigh(_as_sparse(self.embedder([query])[0]))
+        scores: Dict[str, float] = {}
+        for feature, weight in query_vector.items():
+            for name, doc_weight in self._postings.get(feature, ()):
+                scores[name] = scores.get(name, 0.0) + weight * doc_weight
+        return heapq.nlargest(top_k, ((name, score) for name, score in scores.items() if score > 0),
+                              key=lambda item: item[1])
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._documents
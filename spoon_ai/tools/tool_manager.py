@@ -1,37 +1,20 @@
-import os
-from typing import Any, Dict, Iterator, List
-
-from openai import OpenAI
-import pinecone
+from typing import Any, Dict, Iterator, List, Optional
 
 from spoon_ai.tools.base import BaseTool, ToolFailure, ToolResult
+from spoon_ai.tools.tool_index import Embedder, ToolIndex, tool_text
 
 
 class ToolManager:
     def __init__(self, tools: List[BaseTool]):
         self.tools = tools
         self.tool_map = {tool.name: tool for tool in tools}
+        self.tool_index: Optional[ToolIndex] = None
         self.indexed = False
 
     def reindex(self) -> None:
         """Rebuild the internal name->tool mapping. Useful if tools have been renamed dynamically."""
         self.tool_map = {tool.name: tool for tool in self.tools}
-
-
-    def _lazy_init_pinecone(self):
-        if not hasattr(self, "pc"):
-            pinecone.init(api_key=os.getenv("PINECONE_API_KEY"))
-            index_name = "dex-tools"
-
-            if index_name not in pinecone.list_indexes():
-                pinecone.create_index(
-                    name=index_name,
-                    dimension=3072,
-                    metric="cosine"
-                )
-
-            self.index = pinecone.Index(index_name)
-            self.embedding_client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        self.indexed = False
 
     def __getitem__(self, name: str) -> BaseTool:
         return self.tool_map[name]
@@ -70,6 +53,7 @@ class ToolManager:
     def add_tool(self, tool: BaseTool) -> None:
         self.tools.append(tool)
         self.tool_map[tool.name] = tool
+        self.indexed = False
 
     def add_tools(self, *tools: BaseTool) -> None:
         for tool in tools:
@@ -78,48 +62,35 @@ class ToolManager:
     def remove_tool(self, name: str) -> None:
         self.tools = [tool for tool in self.tools if tool.name != name]
         del self.tool_map[name]
+        self.indexed = False
 
-    def index_tools(self):
-        self._lazy_init_pinecone()
-        vectors = []
-        for tool in self.tools:
-            embedding_vector = self.embedding_client.embeddings.create(
-                input=tool.description,
-                model="text-embedding-3-large"
-            )
-            vectors.append(
-                {
-                    "id": tool.name,
-                    "values": embedding_vector.data[0].embedding,
-                    "metadata": {
-                        "name": tool.name,
-                        "description": tool.description
-                    }
-                }
-            )
-        self.index.upsert(vectors=vectors, namespace="dex-tools-test")
+    def index_tools(self, embedder: Optional[Embedder] = None, cache_path: Optional[str] = None) -> None:
+        """Build (or refresh) the local semantic index over the tools.
+
+        Only tools whose name, description or parameters changed since they
+        were last embedded are embedded again.
+
+        Args:
+            embedder: Local embedding function (see ``ToolIndex``); defaults
+                to hashed n-gram TF-IDF
+            cache_path: SQLite file to persist embeddings to
+        """
+        index = self.tool_index
+        if (index is None
+                or (embedder is not None and embedder is not index.embedder)
+                or (cache_path is not None and cache_path != index.cache.path)):
+            self.tool_index = ToolIndex(embedder=embedder, cache_path=cache_path)
+        self.tool_index.update({
+            tool.name: tool_text(tool.name, tool.description, tool.parameters) for tool in self.tools
+        })
         self.indexed = True
 
-    def query_tools(self, query: str, top_k: int = 5, rerank_k: int = 20) -> List[BaseTool]:
+    def query_tools(self, query: str, top_k: int = 5, rerank_k: int = 20) -> List[str]:
+        """Names of the ``top_k`` tools most relevant to ``query``, best first.
+
+        ``rerank_k`` is accepted for compatibility; the local index scores
+        every tool.
+        """
         if not self.indexed:
             self.index_tools()
-        embedding_vector = self.embedding_client.embeddings.create(
-            input=query,
-            model="text-embedding-3-large"
-        )
-        results = self.index.query(
-            namespace="dex-tools-test",
-            top_k=rerank_k,
-            include_metadata=True,
-            include_values=False,
-            vector=embedding_vector.data[0].embedding
-        )
-        print(results)
-        doc_to_tool = {}
-        for match in results["matches"]:
-            doc_to_tool[match["metadata"]["description"]] = match["id"]
-
-        result_tool_names = []
-        for match in results["matches"][:top_k]:
-            result_tool_names.append(match["id"])
-        return result_tool_names
\ No newline at end of file
+        return [name for name, _ in self.tool_index.search(query, top_k=top_k)]
@@ -7,27 +7,36 @@ storage, and social media tools.
 """
 
 import logging
-from typing import List, Optional, Dict, Any
+from typing import Callable, Iterable, List, Optional, Dict, Any
 from spoon_ai.tools.base import BaseTool
 from spoon_ai.tools.tool_manager import ToolManager
 
 logger = logging.getLogger(__name__)
 
-def get_all_toolkit_tools() -> List[BaseTool]:
+def get_all_toolkit_tools(categories: Optional[Iterable[str]] = None) -> List[BaseTool]:
     """
-    Import and return all available tools from spoon-toolkit.
+    Import and return the available tools from spoon-toolkit.
+
+    Only the spoon-toolkit modules of the requested categories are imported.
+
+    Args:
+        categories: Tool categories to load (see ``ToolkitConfig.TOOL_CATEGORIES``),
+            or None for all of them
 
     Returns:
-        List[BaseTool]: List of instantiated tools from all modules
+        List[BaseTool]: List of instantiated tools from the requested categories
+
+    Raises:
+        ValueError: If a category is unknown
     """
-    all_tools = []
+    selected = list(TOOLKIT_LOADERS) if categories is None else list(categories)
+    unknown = [category for category in selected if category not in TOOLKIT_LOADERS]
+    if unknown:
+        raise ValueError(f"Unknown toolkit categories: {unknown}. Available: {list(TOOLKIT_LOADERS)}")
 
-    # Get tools from each module
-    all_tools.extend(get_crypto_tools())
-    all_tools.extend(get_security_tools())
-    all_tools.extend(get_data_platform_tools())
-    all_tools.extend(get_storage_tools())
-    all_tools.extend(get_social_media_tools())
+    all_tools = []
+    for category in selected:
+        all_tools.extend(TOOLKIT_LOADERS[category]())
 
     logger.info(f"🔧 Loaded {len(all_tools)} total toolkit tools successfully")
     return all_tools
@@ -296,27 +305,42 @@ def get_social_media_tools() -> List[BaseTool]:
 
     return social_tools
 
-def create_comprehensive_tool_manager() -> ToolManager:
+# Tool category -> loader. Each loader imports its spoon-toolkit modules
+# when called, so toolkits are only discovered for the categories in use.
+TOOLKIT_LOADERS: Dict[str, Callable[[], List[BaseTool]]] = {
+    "crypto": get_crypto_tools,
+    "security": get_security_tools,
+    "data_platforms": get_data_platform_tools,
+    "storage": get_storage_tools,
+    "social_media": get_social_media_tools,
+}
+
+def create_comprehensive_tool_manager(categories: Optional[Iterable[str]] = None) -> ToolManager:
     """
-    Create a ToolManager instance with all toolkit tools loaded.
+    Create a ToolManager instance with toolkit tools loaded.
+
+    Args:
+        categories: Tool categories to load, or None for all of them
 
     Returns:
-        ToolManager: Tool manager with all toolkit tools
+        ToolManager: Tool manager with the toolkit tools
     """
-    all_tools = get_all_toolkit_tools()
+    all_tools = get_all_toolkit_tools(categories)
     return ToolManager(all_tools)
 
-def add_all_toolkit_tools_to_manager(tool_manager: ToolManager) -> ToolManager:
+def add_all_toolkit_tools_to_manager(tool_manager: ToolManager,
+                                     categories: Optional[Iterable[str]] = None) -> ToolManager:
     """
-    Add all toolkit tools to an existing ToolManager instance.
+    Add toolkit tools to an existing ToolManager instance.
 
     Args:
         tool_manager (ToolManager): Existing tool manager
+        categories: Tool categories to add, or None for all of them
 
     Returns:
-        ToolManager: Updated tool manager with all toolkit tools
+        ToolManager: Updated tool manager with the toolkit tools
     """
-    all_tools = get_all_toolkit_tools()
+    all_tools = get_all_toolkit_tools(categories)
     tool_manager.add_tools(*all_tools)
     return tool_manager
 
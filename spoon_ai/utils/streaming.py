@@ -17,12 +17,17 @@ class StreamOutcome:
     finish_reason: Optional[str] = None
     usage: Optional[dict] = None
     tool_calls: List[ToolCall] = field(default_factory=list)
+    # Deltas not yet joined into content; joined once in build_response
+    _parts: List[str] = field(default_factory=list, repr=False)
+    _length: int = field(default=0, repr=False)
 
     def update_from_chunk(self, chunk: LLMResponseChunk) -> None:
-        if chunk.content:
-            self.content = chunk.content
-        elif chunk.delta:
-            self.content += chunk.delta
+        if chunk.delta:
+            self._parts.append(chunk.delta)
+            self._length += len(chunk.delta)
+        elif chunk.content and len(chunk.content) > self._length:
+            # A chunk that carries only accumulated content
+            self.content, self._parts, self._length = chunk.content, [], len(chunk.content)
 
         if chunk.finish_reason:
             self.finish_reason = chunk.finish_reason
@@ -31,9 +36,14 @@ class StreamOutcome:
         if chunk.tool_calls:
             self.tool_calls = chunk.tool_calls
 
+    def _join(self) -> None:
+        if self._parts:
+            self.content += "".join(self._parts)
+            self._parts = []
+
     def update_from_response(self, response: LLMResponse) -> None:
         if getattr(response, "content", None):
-            self.content = response.content
+            self.content, self._parts, self._length = response.content, [], len(response.content)
         finish = getattr(response, "finish_reason", None) or getattr(
             response, "native_finish_reason", None
         )
@@ -43,6 +53,7 @@ class StreamOutcome:
             self.tool_calls = response.tool_calls
 
     def build_response(self) -> LLMResponse:
+        self._join()
         finish = self.finish_reason or "stop"
         return LLMResponse(
             content=self.content,
@@ -0,0 +1,131 @@
+"""
+Tests for batched, non-blocking token callback dispatch.
+"""
+
+import asyncio
+import threading
+import time
+from uuid import uuid4
+
+import pytest
+
+from spoon_ai.callbacks import (
+    BaseCallbackHandler,
+    CallbackManager,
+    StreamingStatisticsCallback,
+    TokenBatch,
+    TokenDispatch,
+)
+from spoon_ai.schema import LLMResponse
+
+
+class SlowBatchHandler(BaseCallbackHandler):
+    def __init__(self, policy: TokenDispatch, delay: float = 0.0):
+        self.token_dispatch = policy
+        self.delay = delay
+        self.batches = []
+        self.ended_with = None
+
+    async def on_llm_token_batch(self, batch: TokenBatch) -> None:
+        await asyncio.sleep(self.delay)
+        self.batches.append(batch)
+
+    async def on_llm_end(self, response, *, run_id, **kwargs) -> None:
+        self.ended_with = "".join(batch.text for batch in self.batches)
+
+
+class SyncTokenHandler(BaseCallbackHandler):
+    token_dispatch = TokenDispatch(max_batch=10, max_delay=1.0)
+
+    def __init__(self):
+        self.tokens = []
+        self.threads = set()
+
+    def on_llm_new_token(self, token, **kwargs) -> None:
+        self.tokens.append(token)
+        self.threads.add(threading.current_thread().name)
+
+
+class DirectHandler(BaseCallbackHandler):
+    def __init__(self):
+        self.tokens = []
+
+    async def on_llm_new_token(self, token, **kwargs) -> None:
+        self.tokens.append(token)
+
+
+@pytest.mark.asyncio
+async def test_producer_never_waits_on_slow_handler():
+    handler = SlowBatchHandler(TokenDispatch(max_batch=50, max_delay=0.01), delay=0.05)
+    direct = DirectHandler()
+    manager = CallbackManager([handler, direct])
+    tokens = [f"t{i} " for i in range(500)]
+
+    start = time.perf_counter()
+    for token in tokens:
+        await manager.on_llm_new_token(token, run_id=uuid4())
+    produced = time.perf_counter() - start
+    await manager.on_llm_end(None, run_id=uuid4())
+
+    # Ten batches at 50 ms each would take half a second if the producer waited
+    assert produced < 0.25
+    assert handler.ended_with == "".join(tokens)
+    assert sum(batch.count for batch in handler.batches) == 500
+    assert direct.tokens == tokens
+
+
+@pytest.mark.asyncio
+async def test_sync_handlers_run_batched_on_worker_thread():
+    handler = SyncTokenHandler()
+    manager = CallbackManager([handler])
+    for i in range(25):
+        await manager.on_llm_new_token(str(i), run_id=None)
+    assert handler.tokens == []
+
+    await manager.on_llm_end(None, run_id=uuid4())
+    assert handler.tokens == [str(i) for i in range(25)]
+    assert handler.threads == {"spoon-callbacks_0"}
+
+
+@pytest.mark.asyncio
+async def test_overflow_policies():
+    coalescing = SlowBatchHandler(TokenDispatch(max_batch=5, max_delay=0.001, max_queue=5), delay=0.02)
+    dropping = SlowBatchHandler(
+        TokenDispatch(max_batch=5, max_delay=0.001, max_queue=5, overflow="drop"), delay=0.02
+    )
+    manager = CallbackManager([coalescing, dropping])
+    tokens = [chr(ord("a") + i % 26) for i in range(200)]
+    for token in tokens:
+        await manager.on_llm_new_token(token)
+    await manager.on_llm_error(RuntimeError("stop"), run_id=uuid4())
+
+    # Coalescing keeps all the text in fewer events
+    assert "".join(batch.text for batch in coalescing.batches) == "".join(tokens)
+    assert all(len(batch.tokens) <= 5 for batch in coalescing.batches)
+    assert sum(batch.count for batch in coalescing.batches) == 200
+
+    # Dropping loses events but reports how many
+    delivered = sum(batch.count for batch in dropping.batches)
+    dropped = sum(batch.dropped for batch in dropping.batches)
+    assert delivered < 200 and delivered + dropped == 200
+    assert manager._token_queues[id(dropping)].dropped == dropped
+
+
+def test_invalid_policy():
+    with pytest.raises(ValueError):
+        TokenDispatch(overflow="block")
+
+
+@pytest.mark.asyncio
+async def test_statistics_callback_counts_batched_tokens():
+    stats = StreamingStatisticsCallback(auto_print=False)
+    manager = CallbackManager([stats])
+    run_id = uuid4()
+
+    await manager.on_llm_start(run_id=run_id, messages=[], model="m", provider="p")
+    for i in range(300):
+        await manager.on_llm_new_token(f"{i} ", run_id=run_id)
+    await manager.on_llm_end(LLMResponse(content="done", provider="p", model="m"), run_id=run_id)
+
+    assert stats.token_count == stats.chunk_count == 300
+    assert stats.last_response.content == "done"
@@ -21,6 +21,7 @@ from spoon_ai.graph import (
     StateGraph, 
     CompiledGraph,
     InMemoryCheckpointer,
+    SQLiteCheckpointer,
     Command,
     StateSnapshot,
     interrupt,
@@ -30,7 +31,9 @@ from spoon_ai.graph import (
     InterruptError,
     GraphConfigurationError,
     StateValidationError,
-    CheckpointError
+    CheckpointError,
+    DeltaStateSnapshot,
+    END,
 )
 
 
@@ -386,5 +389,579 @@ class TestCompiledGraph:
         assert checkpoints[0] == snapshot
 
 
+class TestInMemoryCheckpointerEviction:
+    """Test LRU, TTL and per-thread limits of the in-memory checkpointer."""
+
+    @staticmethod
+    def _snapshot(step, created_at=None):
+        from datetime import datetime
+        return StateSnapshot(
+            values={"step": step},
+            next=("n",),
+            config={},
+            metadata={"checkpoint_id": f"c{step}"},
+            created_at=created_at or datetime.now(),
+        )
+
+    def test_lru_thread_eviction_and_lookup_by_id(self):
+        checkpointer = InMemoryCheckpointer(max_checkpoints_per_thread=2, max_threads=2)
+        for step in range(3):
+            checkpointer.save_checkpoint("a", self._snapshot(step))
+        checkpointer.save_checkpoint("b", self._snapshot(0))
+        # Reading "a" makes "b" the least recently used thread
+        assert checkpointer.get_checkpoint("a", "c2").values == {"step": 2}
+        assert checkpointer.get_checkpoint("a", "c0") is None
+        checkpointer.save_checkpoint("c", self._snapshot(0))
+
+        assert list(checkpointer.checkpoints) == ["a", "c"]
+        assert [s.values["step"] for s in checkpointer.list_checkpoints("a")] == [1, 2]
+
+    def test_ttl_expiry(self):
+        from datetime import datetime, timedelta
+        checkpointer = InMemoryCheckpointer(ttl_seconds=60)
+        old = datetime.now() - timedelta(seconds=120)
+        checkpointer.save_checkpoint("stale", self._snapshot(0, created_at=old))
+        checkpointer.save_checkpoint("mixed", self._snapshot(0, created_at=old))
+        checkpointer.save_checkpoint("mixed", self._snapshot(1))
+
+        assert checkpointer.get_checkpoint("stale") is None
+        assert "stale" not in checkpointer.checkpoints
+        assert [s.values["step"] for s in checkpointer.list_checkpoints("mixed")] == [1]
+
+    def test_ttl_heap_tracks_live_threads_not_saves(self):
+        from datetime import datetime, timedelta
+        checkpointer = InMemoryCheckpointer(max_checkpoints_per_thread=10, max_threads=5, ttl_seconds=3600)
+        for step in range(1000):
+            checkpointer.save_checkpoint("busy", self._snapshot(step))
+        assert len(checkpointer._expiry) == 1
+
+        # Threads dropped by LRU eviction or clear_thread leave no lasting entries
+        for thread in range(1000):
+            checkpointer.save_checkpoint(f"t{thread}", self._snapshot(0))
+        checkpointer.clear_thread("t999")
+        assert len(checkpointer.checkpoints) == 4
+        assert len(checkpointer._expiry) <= 2 * 4 + 65
+
+        # An expired entry is replaced by one for the thread's new oldest snapshot
+        checkpointer.save_checkpoint("mixed", self._snapshot(0, created_at=datetime.now() - timedelta(minutes=30)))
+        checkpointer.save_checkpoint("mixed", self._snapshot(1))
+        checkpointer.ttl_seconds = 60
+        checkpointer.save_checkpoint("other", self._snapshot(0))
+        assert [s.values["step"] for s in checkpointer.list_checkpoints("mixed")] == [1]
+        assert sorted(checkpointer._expiry_live) == sorted(checkpointer.checkpoints)
+
+
+class TestCopyOnWriteCheckpoints:
+    """Test structural-sharing checkpoints written by invoke."""
+
+    @pytest.mark.asyncio
+    async def test_checkpoints_store_only_changed_keys(self):
+        graph = StateGraph(BasicState)
+
+        def node_a(state):
+            return {"counter": state["counter"] + 1, "messages": ["a"]}
+
+        def node_b(state):
+            return {"counter": state["counter"] * 2}
+
+        graph.add_node("node_a", node_a)
+        graph.add_node("node_b", node_b)
+        graph.add_edge("node_a", "node_b")
+        graph.add_edge("node_b", END)
+        graph.set_entry_point("node_a")
+
+        compiled = graph.compile()
+        config = {"configurable": {"thread_id": "cow_thread"}}
+        await compiled.invoke({"counter": 5, "messages": ["start"], "data": {"big": "x" * 100}}, config)
+
+        history = graph.get_state_history(config)
+        assert len(history) == 2
+        first, second = history
+        assert isinstance(second, DeltaStateSnapshot)
+        assert first.is_keyframe and not second.is_keyframe
+        # "data" was untouched by node_a, so it is shared with the parent
+        assert "data" not in second.delta
+        assert set(second.delta) == {"counter", "messages"}
+        assert second.values == {"counter": 6, "messages": ["start", "a"], "data": {"big": "x" * 100}}
+        assert first.values["messages"] == ["start"]
+
+        latest = graph.get_state(config)
+        assert latest is second
+        assert latest.parent_config["configurable"]["checkpoint_id"] == first.metadata["checkpoint_id"]
+
+    def test_keyframes_bound_delta_chains(self):
+        from spoon_ai.graph.snapshots import SnapshotChain
+
+        chain = SnapshotChain("t", keyframe_interval=2)
+        state = {"messages": []}
+        snaps = []
+        for i in range(5):
+            state = {"messages": state["messages"] + [i]}
+            snaps.append(chain.snapshot(state, next=("n",), config={}, metadata={}))
+
+        assert [s.is_keyframe for s in snaps] == [True, False, False, True, False]
+        assert snaps[4].values == {"messages": [0, 1, 2, 3, 4]}
+        assert snaps[2].values == {"messages": [0, 1, 2]}
+
+
+class TestSQLiteCheckpointer:
+    """Test the persistent SQLite checkpointer."""
+
+    @staticmethod
+    def _snapshot(counter, checkpoint_id=None):
+        from datetime import datetime
+        metadata = {"iteration": counter}
+        if checkpoint_id:
+            metadata["checkpoint_id"] = checkpoint_id
+        return StateSnapshot(
+            values={"counter": counter, "messages": ["m"] * counter},
+            next=("node_a",),
+            config={"configurable": {"thread_id": "t"}},
+            metadata=metadata,
+            created_at=datetime.now(),
+        )
+
+    def test_roundtrip_survives_reopen(self, tmp_path):
+        path = str(tmp_path / "checkpoints.db")
+        checkpointer = SQLiteCheckpointer(path)
+        checkpointer.save_checkpoint("t", self._snapshot(1, "c1"))
+        checkpointer.save_checkpoint("t", self._snapshot(2, "c2"))
+        checkpointer.close()
+
+        reopened = SQLiteCheckpointer(path)
+        latest = reopened.get_checkpoint("t")
+        assert latest.values == {"counter": 2, "messages": ["m", "m"]}
+        assert latest.next == ("node_a",)
+        assert reopened.get_checkpoint("t", "c1").values["counter"] == 1
+        assert [s.metadata["checkpoint_id"] for s in reopened.list_checkpoints("t")] == ["c1", "c2"]
+
+        tuple_ = reopened.get_checkpoint_tuple({"configurable": {"thread_id": "t", "checkpoint_id": "c2"}})
+        assert tuple_.checkpoint["id"] == "c2"
+        assert len(reopened.iter_checkpoint_history({"configurable": {"thread_id": "t"}})) == 2
+
+        reopened.clear_thread("t")
+        assert reopened.get_checkpoint("t") is None
+
+    def test_batch_and_limits(self, tmp_path):
+        checkpointer = SQLiteCheckpointer(str(tmp_path / "cp.db"), max_checkpoints_per_thread=2, max_threads=2)
+        with checkpointer.batch():
+            for i in range(5):
+                checkpointer.save_checkpoint("a", self._snapshot(i))
+            # Nothing is written until the batch exits
+            assert checkpointer.get_checkpoint("a") is None
+        assert [s.values["counter"] for s in checkpointer.list_checkpoints("a")] == [3, 4]
+
+        checkpointer.save_checkpoint("b", self._snapshot(1))
+        checkpointer.save_checkpoint("c", self._snapshot(1))
+        assert checkpointer.get_checkpoint("a") is None
+        assert checkpointer.get_checkpoint("c") is not None
+
+    @pytest.mark.asyncio
+    async def test_graph_resume_with_sqlite(self, tmp_path):
+        graph = StateGraph(BasicState, checkpointer=SQLiteCheckpointer(str(tmp_path / "graph.db")))
+        graph.add_node("inc", lambda state: {"counter": state["counter"] + 1})
+        graph.add_edge("inc", END)
+        graph.set_entry_point("inc")
+        config = {"configurable": {"thread_id": "sqlite_thread"}}
+        result = await graph.compile().invoke({"counter": 1, "messages": [], "data": {}}, config)
+
+        assert result["counter"] == 2
+        state = graph.get_state(config)
+        assert state.values["counter"] == 1
+        assert state.next == ("inc",)
+
+    @pytest.mark.asyncio
+    async def test_graph_commits_once_per_superstep(self, tmp_path):
+        path = str(tmp_path / "graph.db")
+        checkpointer = SQLiteCheckpointer(path)
+        commits = []
+        write = checkpointer._write
+        checkpointer._write = lambda items: commits.append(len(items)) or write(items)
+
+        sub = StateGraph(BasicState, checkpointer=checkpointer)
+        sub.add_node("noop", lambda state: {})
+        sub.set_entry_point("noop")
+        subgraph = sub.compile()
+        seen = []
+
+        async def ask(state):
+            # The checkpoint taken before this node is already visible to other workers
+            other = SQLiteCheckpointer(path)
+            seen.append(len(other.list_checkpoints("superstep_thread")))
+            other.close()
+            await subgraph.invoke({"counter": 0, "messages": [], "data": {}}, {"configurable": {"thread_id": "sub_thread"}})
+            interrupt({"question": "continue?"})
+            return {}
+
+        graph = StateGraph(BasicState, checkpointer=checkpointer)
+        graph.add_node("inc", lambda state: {"counter": state["counter"] + 1})
+        graph.add_node("ask", ask)
+        graph.add_edge("inc", "ask")
+        graph.set_entry_point("inc")
+        config = {"configurable": {"thread_id": "superstep_thread"}}
+        result = await graph.compile().invoke({"counter": 1, "messages": [], "data": {}}, config)
+
+        assert "__interrupt__" in result
+        assert seen == [2]
+        # Each pre-node checkpoint commits on its own; the subgraph's save and the
+        # interrupt record made during the last superstep commit together
+        assert commits == [1, 1, 2]
+        assert len(checkpointer.list_checkpoints("superstep_thread")) == 3
+        assert len(checkpointer.list_checkpoints("sub_thread")) == 1
+
+    @pytest.mark.asyncio
+    async def test_checkpointer_without_batch(self):
+        class DictCheckpointer:
+            def __init__(self):
+                self.threads = {}
+
+            def save_checkpoint(self, thread_id, snapshot):
+                self.threads.setdefault(thread_id, []).append(snapshot)
+
+            def get_checkpoint(self, thread_id, checkpoint_id=None):
+                snapshots = self.threads.get(thread_id, [])
+                return snapshots[-1] if snapshots else None
+
+            def list_checkpoints(self, thread_id):
+                return list(self.threads.get(thread_id, []))
+
+            def clear_thread(self, thread_id):
+                self.threads.pop(thread_id, None)
+
+        checkpointer = DictCheckpointer()
+        graph = StateGraph(BasicState, checkpointer=checkpointer)
+        graph.add_node("inc", lambda state: {"counter": state["counter"] + 1})
+        graph.set_entry_point("inc")
+        config = {"configurable": {"thread_id": "duck_thread"}}
+        result = await graph.compile().invoke({"counter": 1, "messages": [], "data": {}}, config)
+
+        assert result["counter"] == 2
+        assert len(checkpointer.list_checkpoints("duck_thread")) == 1
+
+
+def _cpu_square(state):
+    # Module-level so it can be pickled into a worker process
+    import os
+    return {"squares": [state["counter"] ** 2], "worker_pid": os.getpid()}
+
+
+class TestSuperstepParallel:
+    """Test isolated branch state and enforced limits in parallel groups."""
+
+    @staticmethod
+    def _build(branches, config=None, cpu_bound=()):
+        graph = StateGraph(dict)
+        graph.add_node("fan_out", lambda state: {})
+        for name, fn in branches.items():
+            graph.add_node(name, fn, cpu_bound=name in cpu_bound)
+        graph.add_edge("fan_out", list(branches)[0])
+        graph.add_parallel_group("group", list(branches), config)
+        graph.add_edge(list(branches)[0], END)
+        graph.set_entry_point("fan_out")
+        return graph.compile()
+
+    @pytest.mark.asyncio
+    async def test_branches_are_isolated_and_merged_in_declaration_order(self):
+        async def slow(state):
+            await asyncio.sleep(0.02)
+            state["items"].append("leaked")
+            return {"items": ["slow"], "winner": "slow"}
+
+        async def fast(state):
+            return {"items": ["fast"], "winner": "fast"}
+
+        def writer(state):
+            state["winner"] = "direct"
+
+        compiled = self._build({"slow": slow, "fast": fast})
+        result = await compiled.invoke({"items": []})
+        # Merged in declaration order although "fast" finished first
+        assert result["items"] == ["slow", "fast"]
+        assert result["winner"] == "fast"
+
+        compiled = self._build({"slow": slow, "writer": writer})
+        with pytest.raises(GraphExecutionError):
+            await compiled.invoke({"items": []})
+
+    @pytest.mark.asyncio
+    async def test_max_in_flight_and_rate_limit(self):
+        from spoon_ai.graph.config import ParallelGroupConfig
+
+        active = {"now": 0, "peak": 0}
+
+        def make_branch(i):
+            async def branch(state):
+                active["now"] += 1
+                active["peak"] = max(active["peak"], active["now"])
+                await asyncio.sleep(0.01)
+                active["now"] -= 1
+                return {f"b{i}": True}
+            return branch
+
+        branches = {f"b{i}": make_branch(i) for i in range(6)}
+        compiled = self._build(branches, ParallelGroupConfig(max_in_flight=2))
+        result = await compiled.invoke({})
+        assert active["peak"] == 2
+        assert all(result[f"b{i}"] for i in range(6))
+
+        compiled = self._build(branches, ParallelGroupConfig(rate_limit_per_second=50))
+        await compiled.invoke({})
+        # The first run fits in the initial burst; with the bucket drained the
+        # next 6 branches need at least 5 refill intervals
+        compiled._group_rate_limiters["group"]._tokens = 0
+        start = asyncio.get_running_loop().time()
+        await compiled.invoke({})
+        assert asyncio.get_running_loop().time() - start >= 5 / 50 * 0.9
+
+    @pytest.mark.asyncio
+    async def test_cpu_bound_branch_runs_in_process_pool(self):
+        import os
+
+        compiled = self._build({"square": _cpu_square, "noop": lambda state: {}}, cpu_bound={"square"})
+        try:
+            result = await compiled.invoke({"counter": 7})
+        finally:
+            compiled.close()
+        assert result["squares"] == [49]
+        assert result["worker_pid"] != os.getpid()
+
+    @pytest.mark.asyncio
+    async def test_process_pool_is_released(self):
+        import gc
+
+        async with self._build({"square": _cpu_square}, cpu_bound={"square"}) as compiled:
+            await compiled.invoke({"counter": 3})
+            pool = compiled._process_pool
+        assert compiled._process_pool is None
+        with pytest.raises(RuntimeError):
+            pool.submit(_cpu_square, {"counter": 1})
+
+        # A graph that is never closed releases its workers when collected
+        compiled = self._build({"square": _cpu_square}, cpu_bound={"square"})
+        await compiled.invoke({"counter": 3})
+        pool = compiled._process_pool
+        del compiled
+        gc.collect()
+        with pytest.raises(RuntimeError):
+            pool.submit(_cpu_square, {"counter": 1})
+
+
+class TestParallelGroupResilience:
+    """Test retries and the circuit breaker of parallel groups."""
+
+    @pytest.mark.asyncio
+    async def test_retry_with_backoff_then_success(self):
+        from spoon_ai.graph.config import ParallelGroupConfig, ParallelRetryPolicy
+
+        calls = {"flaky": 0}
+
+        async def flaky(state):
+            calls["flaky"] += 1
+            if calls["flaky"] < 3:
+                raise RuntimeError("upstream 503")
+            return {"flaky": "ok"}
+
+        policy = ParallelRetryPolicy(max_retries=2, backoff_initial=0.001, backoff_max=0.01)
+        compiled = TestSuperstepParallel._build(
+            {"flaky": flaky, "stable": lambda state: {"stable": "ok"}},
+            ParallelGroupConfig(retry_policy=policy),
+        )
+        result = await compiled.invoke({})
+
+        assert result["flaky"] == "ok" and calls["flaky"] == 3
+        group = compiled.get_execution_metrics()["parallel_groups"]["group"]
+        assert group["retries"] == 2
+        assert group["branch_failures"] == 0
+
+    @pytest.mark.asyncio
+    async def test_circuit_breaker_opens_and_short_circuits(self):
+        from spoon_ai.graph.config import ParallelGroupConfig
+
+        calls = {"dead": 0}
+
+        async def dead(state):
+            calls["dead"] += 1
+            raise RuntimeError("connection refused")
+
+        config = ParallelGroupConfig(
+            error_strategy="collect_errors",
+            circuit_breaker_threshold=2,
+            circuit_breaker_cooldown=60,
+        )
+        compiled = TestSuperstepParallel._build({"dead_a": dead, "dead_b": dead}, config)
+
+        first = await compiled.invoke({})
+        assert len(first["__errors__"]) == 2
+        second = await compiled.invoke({})
+        # The open circuit skips the group without calling upstream again
+        assert calls["dead"] == 2
+        assert "circuit breaker is open" in second["__errors__"][0]["error"]
+
+        group = compiled.get_execution_metrics()["parallel_groups"]["group"]
+        assert group["short_circuited"] == 1
+        assert group["circuit_breaker"]["state"] == "open"
+        assert group["circuit_breaker"]["trips"] == 1
+
+        # After the cooldown one probe superstep is let through
+        compiled._group_breakers["group"].opened_at -= 61
+        await compiled.invoke({})
+        assert calls["dead"] == 4
+
+
+class TestCompiledRouting:
+    """Test the routing table built by compile()."""
+
+    @pytest.mark.asyncio
+    async def test_routing_table_and_metrics(self):
+        graph = StateGraph(dict)
+        for name in ("start", "prices", "news", "done"):
+            graph.add_node(name, lambda state: {})
+        graph.add_pattern_routing("start", r"\bprice", "prices", priority=5)
+        graph.add_routing_rule("start", "headline", "news", priority=1)
+        graph.add_edge("prices", "done")
+        graph.add_edge("news", "done")
+        graph.add_edge("done", END)
+        graph.set_entry_point("start")
+        compiled = graph.compile()
+
+        table = compiled._routing
+        assert table.direct["prices"] == "done"
+        assert [target for _, _, target in table.rules["start"]] == ["prices", "news"]
+
+        await compiled.invoke({"user_query": "BTC price today"})
+        await compiled.invoke({"user_query": "latest headline"})
+
+        routing = compiled.get_execution_metrics()["routing"]
+        assert routing["hops"] == 6
+        assert routing["by_source"] == {"rule": 2, "direct_edge": 4}
+        assert routing["avg_time"] >= 0
+
+    @pytest.mark.asyncio
+    async def test_table_is_rebuilt_when_graph_changes_after_compile(self):
+        graph = StateGraph(dict)
+        graph.add_node("a", lambda state: {"path": ["a"]})
+        graph.add_node("b", lambda state: {"path": ["b"]})
+        graph.set_entry_point("a")
+        compiled = graph.compile()
+
+        assert (await compiled.invoke({"path": []}))["path"] == ["a"]
+        graph.add_edge("a", "b")
+        assert (await compiled.invoke({"path": []}))["path"] == ["a", "b"]
+
+    def test_allowed_targets_follow_the_snapshotted_router_config(self):
+        from spoon_ai.graph.config import GraphConfig, RouterConfig
+
+        graph = StateGraph(dict)
+        graph.add_node("a", lambda state: {})
+        graph.add_node("b", lambda state: {})
+        graph.set_entry_point("a")
+        graph.config = GraphConfig(router=RouterConfig(allowed_targets=["a"]))
+        compiled = graph.compile()
+        assert compiled._routing_table().is_allowed("a") and not compiled._routing_table().is_allowed("b")
+
+        # Mutated in place: the table keeps a consistent snapshot until it is rebuilt
+        graph.config.router.allowed_targets.append("b")
+        table = compiled._routing_table()
+        assert not table.is_allowed("b") and table.router_config.allowed_targets == ["a"]
+        graph.add_edge("a", "b")
+        assert compiled._routing_table().is_allowed("b")
+
+
+class TestGraphStreaming:
+    """Test stream modes, backpressure and shared invoke semantics."""
+
+    @staticmethod
+    def _build(*nodes, config=None):
+        graph = StateGraph(dict)
+        for name, fn in nodes:
+            graph.add_node(name, fn)
+        for (src, _), (dst, _) in zip(nodes, nodes[1:]):
+            graph.add_edge(src, dst)
+        graph.add_edge(nodes[-1][0], END)
+        graph.set_entry_point(nodes[0][0])
+        if config is not None:
+            graph.config = config
+        return graph.compile()
+
+    @pytest.mark.asyncio
+    async def test_values_and_updates_modes(self):
+        compiled = self._build(
+            ("a", lambda state: {"counter": state["counter"] + 1, "log": ["a"]}),
+            ("b", lambda state: {"counter": state["counter"] * 2, "log": ["b"]}),
+        )
+
+        values = [chunk async for chunk in compiled.stream({"counter": 5, "log": []})]
+        assert [chunk["counter"] for chunk in values] == [6, 12]
+        assert values[-1] == await compiled.invoke({"counter": 5, "log": []})
+
+        updates = [chunk async for chunk in compiled.stream({"counter": 5, "log": []}, stream_mode="updates")]
+        assert updates == [{"a": {"counter": 6, "log": ["a"]}}, {"b": {"counter": 12, "log": ["b"]}}]
+
+        with pytest.raises(ValueError):
+            async for _ in compiled.stream({}, stream_mode="debug"):
+                pass
+
+    @pytest.mark.asyncio
+    async def test_messages_mode_relays_llm_tokens(self):
+        from spoon_ai.callbacks import CallbackManager, get_inheritable_callbacks
+
+        async def llm_node(state):
+            # Stand-in for a provider's chat_stream: tokens go to the inherited callbacks
+            manager = CallbackManager.from_callbacks(get_inheritable_callbacks())
+            for token in ("Hel", "lo"):
+                await manager.on_llm_new_token(token)
+            return {"answer": "Hello"}
+
+        compiled = self._build(("llm", llm_node), ("after", lambda state: {"done": True}))
+        events = [event async for event in compiled.stream({}, stream_mode=["messages", "updates"])]
+
+        assert events[:2] == [
+            ("messages", ("Hel", {"node": "llm", "run_id": None})),
+            ("messages", ("lo", {"node": "llm", "run_id": None})),
+        ]
+        assert events[2:] == [("updates", {"llm": {"answer": "Hello"}}), ("updates", {"after": {"done": True}})]
+        assert get_inheritable_callbacks() == []
+
+    @pytest.mark.asyncio
+    async def test_bounded_buffer_applies_backpressure(self):
+        from spoon_ai.graph.config import GraphConfig
+
+        executed = []
+
+        def step(name):
+            return name, lambda state: executed.append(name) or {"last": name}
+
+        compiled = self._build(*(step(f"n{i}") for i in range(10)), config=GraphConfig(stream_buffer_size=1))
+        stream = compiled.stream({}, stream_mode="updates")
+        first = await stream.__anext__()
+        await asyncio.sleep(0.05)
+        assert first == {"n0": {"last": "n0"}}
+        # One event buffered, one blocked in put(): the graph cannot run ahead
+        assert len(executed) <= 3
+        await stream.aclose()
+        await asyncio.sleep(0.01)
+        assert len(executed) <= 3
+
+    @pytest.mark.asyncio
+    async def test_stream_checkpoints_and_interrupts_like_invoke(self):
+        def ask(state):
+            interrupt({"question": "continue?"})
+            return {}
+
+        compiled = self._build(("prepare", lambda state: {"ready": True}), ("ask", ask))
+        config = {"configurable": {"thread_id": "stream-thread"}}
+        events = [event async for event in compiled.stream({}, config, stream_mode="updates")]
+
+        assert events[0] == {"prepare": {"ready": True}}
+        assert events[1]["type"] == "interrupt"
+        assert events[1]["node"] == "ask"
+        assert events[1]["interrupt_data"] == {"question": "continue?"}
+
+        history = compiled.graph.checkpointer.list_checkpoints("stream-thread")
+        assert [snap.metadata["node"] for snap in history] == ["prepare", "ask", "ask"]
+        assert history[-1].metadata["status"] == "interrupted"
+        assert history[-1].values["ready"] is True
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
@@ -0,0 +1,102 @@
+"""
+Tests for lazy package imports and deferred provider registration.
+"""
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+from spoon_ai.llm.errors import ConfigurationError
+from spoon_ai.llm.registry import LLMProviderRegistry
+from spoon_ai.tools.toolkit_integration import TOOLKIT_LOADERS, get_all_toolkit_tools
+
+SDKS = ["openai", "anthropic", "google.genai", "pinecone"]
+
+
+def _run(code: str) -> dict:
+    """Run ``code`` in a fresh interpreter; it prints one JSON document."""
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def test_entry_points_do_not_import_provider_sdks():
+    result = _run(f"""
+import json, sys, time
+start = time.perf_counter()
+import spoon_ai
+elapsed = time.perf_counter() - start
+import spoon_ai.chat, spoon_ai.agents.toolcall, spoon_ai.tools
+print(json.dumps({{"ms": elapsed * 1000, "sdks": [m for m in {SDKS!r} if m in sys.modules]}}))
+""")
+    assert result["sdks"] == []
+    # Generous: the package itself imports in tens of milliseconds
+    assert result["ms"] < 1000
+
+
+def test_lazy_attributes_resolve():
+    result = _run("""
+import json, spoon_ai, spoon_ai.llm, spoon_ai.agents
+from spoon_ai.chat import ChatBot
+from spoon_ai.llm.manager import LLMManager
+from spoon_ai.agents.toolcall import ToolCallAgent
+print(json.dumps({
+    "chatbot": spoon_ai.ChatBot is ChatBot,
+    "manager": spoon_ai.llm.LLMManager is LLMManager,
+    "agent": spoon_ai.agents.ToolCallAgent is ToolCallAgent,
+    "dir": "ChatBot" in dir(spoon_ai) and "OpenAIProvider" in dir(spoon_ai.llm),
+}))
+""")
+    assert all(result.values()), result
+
+    import spoon_ai
+    with pytest.raises(AttributeError):
+        spoon_ai.NotAnExport
+
+
+def test_builtin_providers_are_imported_on_first_use():
+    result = _run("""
+import json, sys
+from spoon_ai.llm import get_global_registry
+registry = get_global_registry()
+listed = registry.list_providers()
+before = "spoon_ai.llm.providers.openai_provider" in sys.modules
+capabilities = registry.get_capabilities("openai")
+print(json.dumps({
+    "listed": listed,
+    "before": before,
+    "after": "spoon_ai.llm.providers.openai_provider" in sys.modules,
+    "anthropic": "anthropic" in sys.modules,
+    "capabilities": len(capabilities),
+}))
+""")
+    assert {"openai", "anthropic", "gemini", "deepseek", "openrouter"} <= set(result["listed"])
+    assert not result["before"] and result["after"] and not result["anthropic"]
+    assert result["capabilities"] > 0
+
+
+def test_lazy_registration_in_own_registry():
+    registry = LLMProviderRegistry()
+    registry.register_lazy("fake", "spoon_ai.llm.providers.fake_provider:FakeProvider")
+    registry.register_lazy("missing", "spoon_ai.llm.providers.no_such_provider:NoSuchProvider")
+    assert registry.is_registered("fake") and registry.list_providers() == ["fake", "missing"]
+
+    from spoon_ai.llm.providers.fake_provider import FakeProvider
+    assert isinstance(registry.create_instance("fake"), FakeProvider)
+    with pytest.raises(ConfigurationError):
+        registry.create_instance("missing")
+
+    registry.unregister("missing")
+    assert registry.list_providers() == ["fake"]
+
+
+def test_toolkit_discovery_by_category(monkeypatch):
+    with pytest.raises(ValueError):
+        get_all_toolkit_tools(["no_such_category"])
+
+    loaded = []
+    for category in list(TOOLKIT_LOADERS):
+        monkeypatch.setitem(TOOLKIT_LOADERS, category, lambda category=category: loaded.append(category) or [])
+    assert isinstance(get_all_toolkit_tools(["storage"]), list)
+    assert loaded == ["storage"]
@@ -0,0 +1,123 @@
+"""
+Tests for LLMManager.chat_batch: ordering, AIMD throttling and checkpoint resume.
+"""
+
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from spoon_ai.llm.batch import AdaptiveConcurrency, BatchRequest, BatchRunner, FAILED, SUCCESS, THROTTLED
+from spoon_ai.llm.config import ConfigurationManager
+from spoon_ai.llm.manager import LLMManager
+from spoon_ai.llm.monitoring import DebugLogger, MetricsCollector
+from spoon_ai.llm.providers.fake_provider import FakeProvider
+from spoon_ai.llm.registry import LLMProviderRegistry
+from spoon_ai.schema import Message
+
+
+def _manager(**fake_params):
+    config_manager = Mock(spec=ConfigurationManager)
+    config_manager.list_configured_providers.return_value = ["fake"]
+    config_manager.get_default_provider.return_value = "fake"
+    config_manager.get_fallback_chain.return_value = ["fake"]
+    config_manager.load_provider_config.return_value = Mock(model_dump=Mock(return_value={
+        "api_key": "offline",
+        "extra_params": {"fake_latency": 0.005, "fake_seed": 1, **fake_params},
+    }))
+    registry = LLMProviderRegistry()
+    registry.register("fake", FakeProvider)
+    debug_logger = Mock(spec=DebugLogger)
+    debug_logger.log_request.return_value = "request_123"
+    return LLMManager(
+        config_manager=config_manager,
+        debug_logger=debug_logger,
+        metrics_collector=MetricsCollector(),
+        response_normalizer=Mock(normalize_response=Mock(side_effect=lambda x: x)),
+        registry=registry,
+    )
+
+
+def _requests(n):
+    return [[Message(role="user", content=f"doc {i}")] for i in range(n)]
+
+
+@pytest.mark.asyncio
+async def test_adaptive_concurrency_aimd():
+    limiter = AdaptiveConcurrency(8)
+    epochs = [await limiter.acquire() for _ in range(8)]
+    # A burst of 429s from requests started in the same epoch halves the limit once
+    for epoch in epochs[:4]:
+        await limiter.release(epoch, THROTTLED)
+    assert int(limiter.limit) == 4 and limiter.decreases == 1
+
+    await limiter.release(epochs[4], FAILED)
+    assert int(limiter.limit) == 4
+    for epoch in epochs[5:]:
+        await limiter.release(epoch, SUCCESS)
+    assert 4 < limiter.limit < 5
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("ordered", [True, False])
+async def test_chat_batch_yields_every_result(ordered):
+    manager = _manager()
+    results = [r async for r in manager.chat_batch(_requests(20), max_concurrency=5, ordered=ordered)]
+
+    assert sorted(r.index for r in results) == list(range(20))
+    if ordered:
+        assert [r.index for r in results] == list(range(20))
+    assert all(r.ok and r.response.content == f"fake response to: doc {r.index}" for r in results)
+
+
+@pytest.mark.asyncio
+async def test_throttling_reduces_concurrency_and_retries():
+    manager = _manager(fake_max_concurrency=3)
+    runner = BatchRunner(manager, _requests(30), max_concurrency=12, retry_backoff=0.005, max_retries=20)
+    results = [r async for r in runner.run()]
+
+    assert all(r.ok for r in results)
+    assert runner.stats["throttled"] > 0 and runner.stats["completed"] == 30
+    assert runner.limiter.decreases >= 1
+    assert runner.limiter.limit < 12
+
+
+@pytest.mark.asyncio
+async def test_failures_do_not_stop_the_batch():
+    manager = _manager(fake_failure_rate=1.0)
+    requests = [BatchRequest([Message(role="user", content=f"q{i}")], request_id=f"job-{i}") for i in range(3)]
+    results = [r async for r in manager.chat_batch(requests, ordered=True)]
+
+    assert [r.request_id for r in results] == ["job-0", "job-1", "job-2"]
+    assert all(not r.ok and r.attempts == 1 for r in results)
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_resume(tmp_path):
+    path = str(tmp_path / "batch.jsonl")
+    manager = _manager()
+    requests = [{"messages": [{"role": "user", "content": f"doc {i}"}], "temperature": 0} for i in range(12)]
+
+    seen = []
+    async for result in manager.chat_batch(requests, max_concurrency=2, checkpoint_path=path):
+        seen.append(result.index)
+        if len(seen) == 4:
+            break  # the process "crashes" here
+
+    with open(path, "a") as f:
+        f.write('{"index": 11, "resp')  # torn write
+
+    results = [r async for r in manager.chat_batch(requests, max_concurrency=2, checkpoint_path=path, ordered=True)]
+
+    assert [r.index for r in results] == list(range(12))
+    resumed = [r.index for r in results if r.resumed]
+    assert set(seen) <= set(resumed)
+    assert all(r.response.content == f"fake response to: doc {r.index}" for r in results)
+    with open(path) as f:
+        lines = f.read().splitlines()
+    assert json.loads(lines[0])["batch"]
+    assert sum(1 for line in lines[1:] if line.startswith('{"index"') and line.endswith("}")) == 12
+
+    with pytest.raises(ValueError):
+        async for _ in manager.chat_batch(requests[:3], checkpoint_path=path):
+            pass
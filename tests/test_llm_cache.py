@@ -0,0 +1,180 @@
+"""
+Tests for the LLM response cache: LRU order, TTL, disk tier and single-flight.
+"""
+
+import asyncio
+import threading
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from spoon_ai.llm.cache import CachedLLMManager, DiskCacheTier, LLMResponseCache
+from spoon_ai.llm.interface import LLMResponse
+from spoon_ai.schema import Message
+
+
+def _messages(text: str):
+    return [Message(role="user", content=text)]
+
+
+def _response(text: str) -> LLMResponse:
+    return LLMResponse(content=text, provider="test", model="m", finish_reason="stop", native_finish_reason="stop")
+
+
+class TestMemoryTier:
+
+    def test_lru_eviction_follows_access_order(self):
+        cache = LLMResponseCache(max_size=2)
+        cache.put(_messages("a"), "p", _response("A"))
+        cache.put(_messages("b"), "p", _response("B"))
+        assert cache.get(_messages("a"), "p").content == "A"
+
+        cache.put(_messages("c"), "p", _response("C"))
+        assert cache.get(_messages("b"), "p") is None
+        assert cache.get(_messages("a"), "p").content == "A"
+        assert cache.get_stats()["evictions"] == 1
+        assert cache.get_stats()["size"] == 2
+
+    def test_per_entry_ttl(self):
+        cache = LLMResponseCache(default_ttl=3600)
+        cache.put(_messages("short"), "p", _response("S"), ttl=10)
+        cache.put(_messages("long"), "p", _response("L"))
+        for entry in cache._cache.values():
+            entry.timestamp -= 60
+
+        assert cache.get(_messages("short"), "p") is None
+        assert cache.get(_messages("long"), "p").content == "L"
+        # An explicit ttl on get still overrides
+        assert cache.get(_messages("long"), "p", ttl=30) is None
+
+
+class TestDiskTier:
+
+    def test_survives_restart(self, tmp_path):
+        path = str(tmp_path / "cache.db")
+        first = LLMResponseCache(disk_path=path)
+        first.put(_messages("warm"), "p", _response("W"), temperature=0.1)
+        first.disk.close()
+
+        second = LLMResponseCache(disk_path=path)
+        assert second.get(_messages("warm"), "p", temperature=0.1).content == "W"
+        assert second.get(_messages("warm"), "p", temperature=0.2) is None
+        stats = second.get_stats()
+        assert stats["disk_hits"] == 1 and stats["size"] == 1
+
+    def test_bounded_by_bytes(self, tmp_path):
+        disk = DiskCacheTier(str(tmp_path / "cache.db"), max_bytes=4000, compress_threshold=10**9)
+        cache = LLMResponseCache(max_size=1, disk=disk)
+        for i in range(20):
+            cache.put(_messages(f"q{i}"), "p", _response("x" * 500))
+
+        entries, size = disk.stats()
+        assert 0 < size <= 4000
+        assert entries < 20
+        # Newest entries are kept, oldest evicted
+        assert cache.get(_messages("q19"), "p") is not None
+        assert cache.get(_messages("q0"), "p") is None
+
+    def test_byte_total_is_tracked_without_scans(self, tmp_path):
+        disk = DiskCacheTier(str(tmp_path / "cache.db"), max_bytes=4000, compress_threshold=10**9)
+        statements = []
+        disk._conn.set_trace_callback(statements.append)
+        cache = LLMResponseCache(max_size=1, disk=disk)
+        for i in range(20):
+            cache.put(_messages(f"q{i}"), "p", _response("x" * 500))
+        cache.put(_messages("q19"), "p", _response("y" * 500))
+
+        assert not [sql for sql in statements if "SUM(size)" in sql]
+        assert disk._bytes == disk.stats()[1] <= 4000
+
+    @pytest.mark.asyncio
+    async def test_get_or_compute_keeps_disk_io_off_the_loop(self, tmp_path):
+        cache = LLMResponseCache(disk_path=str(tmp_path / "cache.db"))
+        loop_thread = threading.get_ident()
+        threads = []
+        for name in ("get", "put"):
+            method = getattr(cache.disk, name)
+            setattr(cache.disk, name, lambda *args, _method=method: threads.append(threading.get_ident()) or _method(*args))
+
+        compute = AsyncMock(return_value=_response("fresh"))
+        assert (await cache.get_or_compute(_messages("q"), "p", compute)).content == "fresh"
+        cache._cache.clear()
+        assert (await cache.get_or_compute(_messages("q"), "p", compute)).content == "fresh"
+
+        assert compute.await_count == 1
+        assert len(threads) == 3 and loop_thread not in threads
+        assert cache.get_stats()["disk_hits"] == 1
+
+
+class TestSingleFlight:
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_requests_share_one_call(self):
+        cache = LLMResponseCache()
+        calls = 0
+
+        async def compute():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return _response("shared")
+
+        results = await asyncio.gather(*(cache.get_or_compute(_messages("q"), "p", compute) for _ in range(10)))
+        assert calls == 1
+        assert {r.content for r in results} == {"shared"}
+        assert cache.get_stats()["coalesced"] == 9
+
+    @pytest.mark.asyncio
+    async def test_failures_are_shared_but_not_cached(self):
+        cache = LLMResponseCache()
+        calls = 0
+
+        async def failing():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+
+        results = await asyncio.gather(
+            *(cache.get_or_compute(_messages("q"), "p", failing) for _ in range(3)), return_exceptions=True
+        )
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert calls == 1
+
+        compute = AsyncMock(return_value=_response("ok"))
+        assert (await cache.get_or_compute(_messages("q"), "p", compute)).content == "ok"
+
+    @pytest.mark.asyncio
+    async def test_waiter_takes_over_when_leader_is_cancelled(self):
+        cache = LLMResponseCache()
+        started = asyncio.Event()
+
+        async def slow():
+            started.set()
+            await asyncio.sleep(10)
+
+        async def fast():
+            return _response("fast")
+
+        leader = asyncio.create_task(cache.get_or_compute(_messages("q"), "p", slow))
+        await started.wait()
+        waiter = asyncio.create_task(cache.get_or_compute(_messages("q"), "p", fast))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert (await waiter).content == "fast"
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+
+
+@pytest.mark.asyncio
+async def test_cached_manager_chat_with_tools():
+    manager = Mock()
+    manager.chat_with_tools = AsyncMock(return_value=_response("tool"))
+    cached = CachedLLMManager(manager, cache=LLMResponseCache())
+    tools = [{"type": "function", "function": {"name": "f"}}]
+
+    for _ in range(2):
+        response = await cached.chat_with_tools(_messages("q"), tools, provider="openai")
+    assert response.content == "tool"
+    manager.chat_with_tools.assert_awaited_once_with(_messages("q"), tools, provider="openai")
@@ -0,0 +1,192 @@
+"""
+Tests for single-flight coalescing of identical concurrent LLM requests.
+"""
+
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+
+from spoon_ai.llm.coalescing import RequestCoalescer
+from spoon_ai.llm.config import ConfigurationManager
+from spoon_ai.llm.interface import LLMProviderInterface, LLMResponse
+from spoon_ai.llm.manager import LLMManager
+from spoon_ai.llm.monitoring import DebugLogger, MetricsCollector
+from spoon_ai.llm.registry import LLMProviderRegistry
+from spoon_ai.schema import Message
+
+
+class TestRequestCoalescer:
+
+    @pytest.mark.asyncio
+    async def test_identical_keys_share_one_call(self):
+        coalescer = RequestCoalescer()
+        calls = 0
+
+        async def compute():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return calls
+
+        results = await asyncio.gather(*(coalescer.run("k", compute) for _ in range(4)), coalescer.run("other", compute))
+        assert calls == 2
+        assert results[:4] == [results[0]] * 4
+        stats = coalescer.get_stats()
+        assert stats["coalesced"] == 3 and stats["in_flight"] == 0
+        assert stats["coalescing_ratio"] == pytest.approx(3 / 5)
+
+    @pytest.mark.asyncio
+    async def test_cancellation_is_reference_counted(self):
+        coalescer = RequestCoalescer()
+        started = asyncio.Event()
+        finished = asyncio.Event()
+        cancelled = []
+
+        async def compute():
+            started.set()
+            try:
+                await finished.wait()
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+            return "done"
+
+        first = asyncio.create_task(coalescer.run("k", compute))
+        await started.wait()
+        second = asyncio.create_task(coalescer.run("k", compute))
+        await asyncio.sleep(0)
+
+        # The first caller giving up does not cancel the shared call
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        assert not cancelled
+        finished.set()
+        assert await second == "done"
+
+        # When the last caller gives up, the call is cancelled
+        finished.clear()
+        started.clear()
+        only = asyncio.create_task(coalescer.run("k", compute))
+        await started.wait()
+        only.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await only
+        await asyncio.sleep(0)
+        assert cancelled == [True]
+        assert coalescer.get_stats()["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_failures_reach_every_caller(self):
+        coalescer = RequestCoalescer()
+
+        async def failing():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+
+        results = await asyncio.gather(*(coalescer.run("k", failing) for _ in range(3)), return_exceptions=True)
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert coalescer.get_stats()["in_flight"] == 0
+
+
+class CountingProvider(LLMProviderInterface):
+    calls = 0
+
+    async def initialize(self, config):
+        pass
+
+    async def chat(self, messages, **kwargs):
+        CountingProvider.calls += 1
+        await asyncio.sleep(0.01)
+        return LLMResponse(content=messages[-1].content, provider="counting", model="m",
+                           finish_reason="stop", native_finish_reason="stop")
+
+    async def chat_stream(self, messages, callbacks=None, **kwargs):
+        yield None
+
+    async def completion(self, prompt, **kwargs):
+        raise NotImplementedError
+
+    async def chat_with_tools(self, messages, tools, **kwargs):
+        return await self.chat(messages, **kwargs)
+
+    def get_metadata(self):
+        return Mock()
+
+    async def health_check(self):
+        return True
+
+    async def cleanup(self):
+        pass
+
+
+@pytest.fixture
+def llm_manager():
+    config_manager = Mock(spec=ConfigurationManager)
+    config_manager.list_configured_providers.return_value = ["counting"]
+    config_manager.get_default_provider.return_value = "counting"
+    config_manager.get_fallback_chain.return_value = ["counting"]
+    config_manager.load_provider_config.return_value = Mock(model_dump=Mock(return_value={}))
+    registry = LLMProviderRegistry()
+    registry.register("counting", CountingProvider)
+    debug_logger = Mock(spec=DebugLogger)
+    debug_logger.log_request.return_value = "request_123"
+    CountingProvider.calls = 0
+    return LLMManager(
+        config_manager=config_manager,
+        debug_logger=debug_logger,
+        metrics_collector=MetricsCollector(),
+        response_normalizer=Mock(normalize_response=Mock(side_effect=lambda x: x)),
+        registry=registry,
+    )
+
+
+@pytest.mark.asyncio
+async def test_manager_coalesces_identical_chats(llm_manager):
+    llm_manager.enable_coalescing()
+    same = [Message(role="user", content="same")]
+    responses = await asyncio.gather(
+        *(llm_manager.chat(same, temperature=0) for _ in range(5)),
+        llm_manager.chat(same, temperature=1),
+        llm_manager.chat([Message(role="user", content="different")], temperature=0),
+    )
+
+    assert CountingProvider.calls == 3
+    assert [r.content for r in responses] == ["same"] * 6 + ["different"]
+    # Callers get their own response objects
+    assert len({id(r) for r in responses}) == len(responses)
+    assert llm_manager.get_stats()["manager"]["coalescing"]["coalesced"] == 4
+
+
+@pytest.mark.asyncio
+async def test_manager_coalescing_can_be_disabled(llm_manager):
+    llm_manager.disable_coalescing()
+    same = [Message(role="user", content="same")]
+    await asyncio.gather(*(llm_manager.chat(same) for _ in range(3)))
+    assert CountingProvider.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_manager_coalescing_is_opt_in(llm_manager, monkeypatch):
+    assert not llm_manager.coalescing_enabled
+    same = [Message(role="user", content="same")]
+    await asyncio.gather(*(llm_manager.chat(same, temperature=0) for _ in range(3)))
+    assert CountingProvider.calls == 3
+
+    monkeypatch.setenv("LLM_REQUEST_COALESCING", "true")
+    assert ConfigurationManager().get_request_coalescing()
+    monkeypatch.setenv("LLM_REQUEST_COALESCING", "0")
+    assert not ConfigurationManager().get_request_coalescing()
+
+
+@pytest.mark.asyncio
+async def test_manager_never_coalesces_sampled_chats(llm_manager):
+    llm_manager.enable_coalescing()
+    same = [Message(role="user", content="same")]
+    await asyncio.gather(
+        *(llm_manager.chat(same, temperature=0.7) for _ in range(3)),
+        *(llm_manager.chat(same, temperature=0, n=2) for _ in range(2)),
+    )
+    assert CountingProvider.calls == 5
+    assert llm_manager.get_stats()["manager"]["coalescing"]["coalesced"] == 0
@@ -0,0 +1,131 @@
+"""
+Tests for per-message conversion caching and cached provider configs.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from spoon_ai.llm.cache import MessageConversionCache
+from spoon_ai.llm.config import ConfigurationManager
+from spoon_ai.llm.manager import LLMManager
+from spoon_ai.llm.monitoring import DebugLogger, MetricsCollector
+from spoon_ai.llm.providers.anthropic_provider import AnthropicProvider
+from spoon_ai.llm.providers.fake_provider import FakeProvider
+from spoon_ai.llm.providers.gemini_provider import GeminiProvider
+from spoon_ai.llm.registry import LLMProviderRegistry
+from spoon_ai.schema import Function, Message, ToolCall
+
+
+def _history(turns):
+    messages = [Message(id="sys", role="system", content="You are terse.")]
+    for turn in range(turns):
+        call = ToolCall(id=f"call-{turn}", function=Function(name="lookup", arguments=f'{{"q": {turn}}}'))
+        messages += [
+            Message(id=f"u{turn}", role="user", content=f"question {turn}"),
+            Message(id=f"a{turn}", role="assistant", content="", tool_calls=[call]),
+            Message(id=f"t{turn}", role="tool", content=f"result {turn}", tool_call_id=f"call-{turn}"),
+        ]
+    return messages
+
+
+def test_gemini_conversion_reuses_seen_messages():
+    provider = GeminiProvider()
+    uncached = GeminiProvider()
+    uncached.message_cache = MessageConversionCache(max_entries=0)
+    history = _history(10)
+
+    system, first = provider._convert_messages_for_tools(history)
+    assert system == "You are terse."
+    assert provider.message_cache.misses == len(history) - 1
+    # Nameless tool results are named after the matching tool call
+    assert first[2].parts[0].function_response.name == "lookup"
+
+    history += [Message(id="u-next", role="user", content="and now?")]
+    _, second = provider._convert_messages_for_tools(history)
+    assert provider.message_cache.misses == len(history) - 1
+    assert provider.message_cache.hits == len(history) - 2
+    assert second == uncached._convert_messages_for_tools(history)[1]
+    assert all(a is b for a, b in zip(first, second))
+
+    # Rebuilt messages with the same id and content still hit; edits do not
+    rebuilt = [Message(**message.model_dump()) for message in history]
+    rebuilt[-1].content = "edited"
+    _, third = provider._convert_messages_for_tools(rebuilt)
+    assert provider.message_cache.misses == len(history)
+    assert third[-1].parts[0].text == "edited"
+
+
+def test_gemini_nameless_tool_result_depends_on_its_history():
+    provider = GeminiProvider()
+    result = Message(id="t", role="tool", content="42", tool_call_id="call-1")
+
+    def history(name):
+        call = ToolCall(id="call-1", function=Function(name=name, arguments="{}"))
+        return [Message(id="a", role="assistant", content="", tool_calls=[call]), result]
+
+    _, orphan = provider._convert_messages_for_tools([result])
+    _, first = provider._convert_messages_for_tools(history("lookup"))
+    _, second = provider._convert_messages_for_tools(history("quote"))
+    assert orphan[0].parts[0].function_response.name == "unknown_function"
+    assert first[1].parts[0].function_response.name == "lookup"
+    assert second[1].parts[0].function_response.name == "quote"
+
+
+def test_anthropic_conversion_reuses_seen_messages():
+    provider = AnthropicProvider()
+    history = _history(5)
+
+    system, first = provider._convert_messages(history)
+    system, second = provider._convert_messages(history)
+
+    assert system == "You are terse."
+    assert second == first
+    assert all(a is b for a, b in zip(first, second))
+    assert provider.message_cache.hits == len(history) - 1
+    assert second[1]["content"][0] == {"type": "tool_use", "id": "call-0", "name": "lookup", "input": {"q": 0}}
+
+
+def test_conversion_cache_is_bounded():
+    cache = MessageConversionCache(max_entries=3)
+    for i in range(5):
+        cache.convert(Message(id=str(i), role="user", content="same"), lambda m: m.id)
+    assert len(cache) == 3
+    assert cache.convert(Message(id="4", role="user", content="same"), lambda m: "miss") == "4"
+    assert cache.convert(Message(id="0", role="user", content="same"), lambda m: "miss") == "miss"
+
+
+@pytest.mark.asyncio
+async def test_manager_builds_provider_config_once():
+    config = Mock(model_dump=Mock(return_value={"api_key": "offline", "extra_params": {"fake_latency": 0}}))
+    config_manager = Mock(spec=ConfigurationManager)
+    config_manager.list_configured_providers.return_value = ["fake"]
+    config_manager.get_default_provider.return_value = "fake"
+    config_manager.get_fallback_chain.return_value = ["fake"]
+    config_manager.load_provider_config.return_value = config
+    registry = LLMProviderRegistry()
+    registry.register("fake", FakeProvider)
+    manager = LLMManager(
+        config_manager=config_manager,
+        debug_logger=DebugLogger(),
+        metrics_collector=MetricsCollector(),
+        response_normalizer=Mock(normalize_response=Mock(side_effect=lambda x: x)),
+        registry=registry,
+    )
+    manager.disable_coalescing()
+
+    for i in range(5):
+        await manager.chat([Message(role="user", content=f"hi {i}")])
+    dumps = config.model_dump.call_count
+
+    for i in range(5):
+        await manager.chat([Message(role="user", content=f"again {i}")])
+    assert config.model_dump.call_count == dumps
+
+    # A reloaded config is picked up
+    reloaded = Mock(model_dump=Mock(return_value={"api_key": "new", "extra_params": {"fake_latency": 0}}))
+    config_manager.load_provider_config.return_value = reloaded
+    await manager.chat([Message(role="user", content="after reload")])
+    assert manager._get_provider_config("fake")["api_key"] == "new"
+    with pytest.raises(TypeError):
+        manager._get_provider_config("fake")["api_key"] = "mutated"
@@ -338,6 +338,60 @@ class TestFallbackStrategy:
                 ["provider1", "provider2"], mock_operation
             )
 
+    @pytest.mark.asyncio
+    async def test_hedge_wins_and_loser_is_cancelled(self, fallback_strategy):
+        """Test hedging to the second provider when the first is slow."""
+        cancelled = []
+
+        async def mock_operation(provider):
+            try:
+                await asyncio.sleep(10 if provider == "slow" else 0.01)
+            except asyncio.CancelledError:
+                cancelled.append(provider)
+                raise
+            return f"Success from {provider}"
+
+        result = await fallback_strategy.execute_with_hedging(
+            ["slow", "fast"], mock_operation, lambda provider: 0.01
+        )
+
+        assert result == "Success from fast"
+        assert cancelled == ["slow"]
+        assert fallback_strategy.hedged_requests == 1
+        assert fallback_strategy.hedge_wins == 1
+
+    @pytest.mark.asyncio
+    async def test_no_hedge_when_first_provider_is_fast(self, fallback_strategy):
+        """Test that fast responses never start a hedge."""
+        calls = []
+
+        async def mock_operation(provider):
+            calls.append(provider)
+            return f"Success from {provider}"
+
+        result = await fallback_strategy.execute_with_hedging(
+            ["provider1", "provider2"], mock_operation, lambda provider: 1.0
+        )
+
+        assert result == "Success from provider1"
+        assert calls == ["provider1"]
+        assert fallback_strategy.hedged_requests == 0
+
+    @pytest.mark.asyncio
+    async def test_hedging_falls_through_when_both_fail(self, fallback_strategy):
+        """Test that the rest of the chain is tried after both hedged calls fail."""
+        async def mock_operation(provider):
+            await asyncio.sleep(0.02)
+            if provider != "provider3":
+                raise Exception(f"{provider} failed")
+            return f"Success from {provider}"
+
+        result = await fallback_strategy.execute_with_hedging(
+            ["provider1", "provider2", "provider3"], mock_operation, lambda provider: 0.01
+        )
+
+        assert result == "Success from provider3"
+
 
 class TestLoadBalancer:
     """Test load balancer."""
@@ -406,6 +460,36 @@ class TestLoadBalancer:
         assert "provider2" not in selections
         assert all(s in ["provider1", "provider3"] for s in selections)
 
+    def test_latency_ranking(self):
+        """Test ordering providers by rolling p50 latency."""
+        metrics = MetricsCollector()
+        load_balancer = LoadBalancer(metrics, min_latency_samples=3)
+        for _ in range(5):
+            metrics.record_latency("provider1", 0.9)
+            metrics.record_latency("provider2", 0.1)
+            metrics.record_latency("provider3", 0.5)
+
+        providers = ["provider1", "provider2", "provider3", "provider4"]
+        # Unmeasured provider4 goes first so it gets sampled
+        assert load_balancer.rank_by_latency(providers) == ["provider4", "provider2", "provider3", "provider1"]
+
+        load_balancer.update_provider_health("provider2", False)
+        assert load_balancer.rank_by_latency(providers[:3]) == ["provider3", "provider1", "provider2"]
+        assert load_balancer.select_provider(providers[:3], "latency") == "provider3"
+
+    def test_latency_percentiles(self):
+        """Test the rolling latency window."""
+        metrics = MetricsCollector(latency_samples=100)
+        assert metrics.get_latency_percentiles("provider1") is None
+        for i in range(1, 201):
+            metrics.record_latency("provider1", i / 1000, model="m")
+
+        percentiles = metrics.get_latency_percentiles("provider1", "m")
+        assert percentiles["samples"] == 100
+        assert percentiles["p50"] == pytest.approx(0.15, abs=0.002)
+        assert percentiles["p95"] == pytest.approx(0.195, abs=0.002)
+        assert metrics.get_latency_percentiles("provider1")["samples"] == 100
+
 
 class TestConfigurationPlaceholders:
     """Ensure placeholder values are surfaced as configuration errors."""
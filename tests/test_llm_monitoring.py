@@ -0,0 +1,195 @@
+"""
+Tests for bounded LLM metrics: histograms, the sample ring and the redacting request log.
+"""
+
+import gc
+import random
+import time
+import tracemalloc
+from unittest.mock import Mock
+
+import pytest
+
+from spoon_ai.llm.config import ConfigurationManager
+from spoon_ai.llm.manager import LLMManager
+from spoon_ai.llm.monitoring import (
+    MAX_ERROR_KINDS,
+    DebugLogger,
+    LatencyHistogram,
+    MetricsCollector,
+    MetricsRing,
+    redact_params,
+)
+from spoon_ai.llm.providers.fake_provider import FakeProvider
+from spoon_ai.llm.registry import LLMProviderRegistry
+from spoon_ai.schema import Message
+
+
+def test_histogram_percentiles_within_bucket_precision():
+    rng = random.Random(7)
+    samples = [rng.lognormvariate(-2, 1) for _ in range(20000)]
+    histogram = LatencyHistogram()
+    for value in samples:
+        histogram.record(value)
+
+    ordered = sorted(samples)
+    summary = histogram.summary()
+    assert summary["count"] == len(samples)
+    for key, p in (("p50", 0.50), ("p95", 0.95), ("p99", 0.99)):
+        exact = ordered[int(p * (len(ordered) - 1))]
+        assert summary[key] == pytest.approx(exact, rel=0.04)
+    assert summary["max"] == pytest.approx(max(samples), rel=0.04)
+
+    histogram.reset()
+    assert histogram.summary()["count"] == 0
+
+
+def test_histogram_clamps_out_of_range_values():
+    histogram = LatencyHistogram(max_seconds=10)
+    histogram.record(-1)
+    histogram.record(10**6)
+    assert histogram.summary()["count"] == 2
+    assert histogram.percentile(100) <= 10 * 1.05
+
+
+def test_ring_is_bounded_and_keeps_newest_samples():
+    ring = MetricsRing(4)
+    for i in range(10):
+        ring.append(float(i), "openai", "chat", "m", 0.1 * i, i % 2 == 0, i, None)
+
+    assert ring.size == 4
+    rows = [ring.row(slot) for slot in ring.indices()]
+    assert [row["tokens"] for row in rows] == [6, 7, 8, 9]
+    assert rows[0]["provider"] == "openai" and rows[0]["success"] is True
+
+
+def test_collector_memory_is_flat():
+    collector = MetricsCollector(max_samples=1000)
+    for i in range(2000):
+        collector.record_request("openai", "chat", 0.1, True, tokens=10, model="gpt-4.1")
+
+    # Full collections also empty the interpreter's free lists, which would
+    # otherwise count as growth depending on what ran before
+    tracemalloc.start()
+    gc.collect()
+    before = tracemalloc.take_snapshot()
+    for i in range(20000):
+        collector.record_request("openai", "chat", 0.1, i % 10 != 0, tokens=10, model="gpt-4.1",
+                                 error=None if i % 10 else "Rate limited")
+    gc.collect()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    growth = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    assert growth < 64 * 1024
+    assert len(collector.get_rolling_metrics()) == 1000
+
+
+def test_rolling_window_filters_at_read_time(monkeypatch):
+    collector = MetricsCollector(window_size=60)
+    now = time.time()
+    monkeypatch.setattr("spoon_ai.llm.monitoring.time.time", lambda: now - 120)
+    collector.record_request("openai", "chat", 0.1, True)
+    monkeypatch.setattr("spoon_ai.llm.monitoring.time.time", lambda: now)
+    collector.record_request("openai", "chat", 0.2, True)
+    collector.record_request("anthropic", "chat_stream", 0.3, True)
+
+    assert len(collector.get_rolling_metrics()) == 2
+    assert [m["duration"] for m in collector.get_rolling_metrics(provider="openai")] == [0.2]
+    assert collector.get_rolling_metrics(method="chat_stream")[0]["provider"] == "anthropic"
+    assert collector.get_rolling_metrics(provider="unknown") == []
+    assert collector.get_summary()["metrics_count"] == 2
+
+
+def test_error_kinds_are_capped():
+    collector = MetricsCollector()
+    for i in range(MAX_ERROR_KINDS + 20):
+        collector.record_request("openai", "chat", 0.1, False, error=f"error {i}")
+
+    errors = collector.get_provider_stats("openai").errors
+    assert len(errors) == MAX_ERROR_KINDS + 1
+    assert errors["other"] == 20
+
+
+def test_latency_summary_and_reset():
+    collector = MetricsCollector()
+    for i in range(100):
+        collector.record_request("openai", "chat", 0.01 * (i + 1), True)
+
+    percentiles = collector.get_latency_percentiles("openai")
+    assert percentiles["p50"] <= percentiles["p95"] <= percentiles["p99"]
+    assert collector.get_summary()["latency"]["openai"]["count"] == 100
+
+    collector.reset_stats("openai")
+    assert collector.get_latency_histogram("openai") is None
+    assert collector.get_latency_percentiles("openai") is None
+
+
+def test_redact_params_masks_secrets_and_summarizes_messages():
+    params = {
+        "api_key": "sk-secret",
+        "extra_headers": {"Authorization": "Bearer abc"},
+        "messages": [{"role": "user", "content": "x" * 1000}],
+        "tools": [{"name": "a"}, {"name": "b"}],
+        "temperature": 0.2,
+        "max_tokens": 100,
+        "prompt": "p" * 1000,
+    }
+    redacted = redact_params(params)
+
+    assert redacted["api_key"] == "***"
+    assert redacted["extra_headers"]["Authorization"] == "***"
+    assert redacted["messages"] == {"count": 1, "chars": 1000}
+    assert redacted["tools"] == {"count": 2}
+    assert redacted["temperature"] == 0.2 and redacted["max_tokens"] == 100
+    assert len(redacted["prompt"]) < 300
+    assert "sk-secret" not in repr(redacted)
+
+
+def test_debug_logger_bounds_active_requests():
+    debug_logger = DebugLogger(max_history=10, max_active=5)
+    ids = [debug_logger.log_request("openai", "chat", {"api_key": "sk-secret"}) for _ in range(8)]
+
+    assert list(debug_logger.active_requests) == ids[3:]
+    assert debug_logger.dropped_active == 3
+    assert debug_logger.active_requests[ids[-1]].metadata["params"]["api_key"] == "***"
+
+
+class TestStreamLogging:
+
+    @pytest.fixture
+    def llm_manager(self):
+        config_manager = Mock(spec=ConfigurationManager)
+        config_manager.list_configured_providers.return_value = ["fake"]
+        config_manager.get_default_provider.return_value = "fake"
+        config_manager.get_fallback_chain.return_value = ["fake"]
+        config_manager.load_provider_config.return_value = Mock(model_dump=Mock(return_value={
+            "api_key": "offline", "extra_params": {"fake_latency": 0.001},
+        }))
+        registry = LLMProviderRegistry()
+        registry.register("fake", FakeProvider)
+        return LLMManager(
+            config_manager=config_manager,
+            debug_logger=DebugLogger(),
+            metrics_collector=MetricsCollector(),
+            response_normalizer=Mock(normalize_response=Mock(side_effect=lambda x: x)),
+            registry=registry,
+        )
+
+    @pytest.mark.asyncio
+    async def test_completed_stream_is_logged(self, llm_manager):
+        chunks = [c async for c in llm_manager.chat_stream([Message(role="user", content="hi there")])]
+
+        assert chunks[-1].finish_reason == "stop"
+        assert llm_manager.debug_logger.active_requests == {}
+        entry = llm_manager.debug_logger.request_history[-1]
+        assert entry.success and entry.total_tokens == chunks[-1].usage["total_tokens"]
+
+    @pytest.mark.asyncio
+    async def test_abandoned_stream_is_not_left_active(self, llm_manager):
+        stream = llm_manager.chat_stream([Message(role="user", content="hi there")])
+        await stream.__anext__()
+        await stream.aclose()
+
+        assert llm_manager.debug_logger.active_requests == {}
+        assert llm_manager.debug_logger.request_history[-1].error == "cancelled"
@@ -0,0 +1,202 @@
+"""
+Tests for provider pools: token buckets, least-loaded dispatch and queueing.
+"""
+
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+
+from spoon_ai.llm.config import ConfigurationManager
+from spoon_ai.llm.errors import RateLimitError
+from spoon_ai.llm.interface import LLMProviderInterface, LLMResponse
+from spoon_ai.llm.manager import LLMManager
+from spoon_ai.llm.monitoring import DebugLogger, MetricsCollector
+from spoon_ai.llm.pool import PoolMember, ProviderPool, TokenBucket, member_configs
+from spoon_ai.llm.registry import LLMProviderRegistry
+from spoon_ai.schema import LLMResponseChunk, Message
+
+
+class KeyedProvider(LLMProviderInterface):
+    """Provider that answers with the API key it was initialized with."""
+
+    rate_limited_keys = set()
+
+    def __init__(self):
+        self.api_key = None
+
+    async def initialize(self, config):
+        self.api_key = config.get("api_key")
+
+    async def chat(self, messages, **kwargs):
+        await asyncio.sleep(0.01)
+        if self.api_key in self.rate_limited_keys:
+            raise RateLimitError("pooled", retry_after=60)
+        return LLMResponse(content=self.api_key, provider="pooled", model="m",
+                           finish_reason="stop", native_finish_reason="stop",
+                           usage={"total_tokens": 10})
+
+    async def chat_stream(self, messages, callbacks=None, **kwargs):
+        await asyncio.sleep(0.01)
+        yield LLMResponseChunk(content=self.api_key, delta=self.api_key, provider="pooled", model="m",
+                               usage={"total_tokens": 10})
+
+    async def completion(self, prompt, **kwargs):
+        return await self.chat([Message(role="user", content=prompt)], **kwargs)
+
+    async def chat_with_tools(self, messages, tools, **kwargs):
+        return await self.chat(messages, **kwargs)
+
+    def get_metadata(self):
+        return Mock()
+
+    async def health_check(self):
+        return True
+
+    async def cleanup(self):
+        pass
+
+
+def _member(member_id, **limits):
+    return PoolMember(member_id, KeyedProvider(), {"api_key": member_id}, **limits)
+
+
+def test_member_configs_inherit_provider_settings():
+    config = {"api_key": "k0", "model": "m", "max_concurrency": 4, "instances": []}
+    assert member_configs({"api_key": "k0", "instances": []}) == []
+    assert member_configs(config) == [{"api_key": "k0", "model": "m", "max_concurrency": 4}]
+
+    config["instances"] = [{"api_key": "k1"}, {"api_key": "k2", "base_url": "https://b", "max_concurrency": 1}]
+    configs = member_configs(config)
+    assert [c["api_key"] for c in configs] == ["k1", "k2"]
+    assert configs[0]["max_concurrency"] == 4 and configs[1]["max_concurrency"] == 1
+    assert configs[1]["base_url"] == "https://b" and configs[0]["model"] == "m"
+
+
+def test_token_bucket_delay_and_debt():
+    bucket = TokenBucket(6000)
+    assert bucket.delay(6000) == 0
+    bucket.consume(6000)
+    assert bucket.delay(100) == pytest.approx(1.0, abs=0.05)
+    # Reconciled usage above the estimate leaves a debt to pay back first
+    bucket.consume(100)
+    assert bucket.delay(100) == pytest.approx(2.0, abs=0.05)
+    # Requests bigger than the capacity wait for a full bucket, not forever
+    assert bucket.delay(10**9) == pytest.approx(61.0, abs=0.1)
+
+
+class TestProviderPool:
+
+    @pytest.mark.asyncio
+    async def test_least_loaded_dispatch_and_queueing(self):
+        members = [_member("a", max_concurrency=1), _member("b", max_concurrency=2)]
+        pool = ProviderPool("pooled", members)
+        peak = {"a": 0, "b": 0}
+
+        async def request():
+            async with pool.acquire() as lease:
+                member = lease.member
+                peak[member.member_id] = max(peak[member.member_id], member.in_flight)
+                await asyncio.sleep(0.01)
+                return member.member_id
+
+        used = await asyncio.gather(*(request() for _ in range(12)))
+        assert set(used) == {"a", "b"}
+        assert peak == {"a": 1, "b": 2}
+        assert pool.queued_requests > 0
+        assert pool.in_flight == 0 and pool.waiting == 0
+
+    @pytest.mark.asyncio
+    async def test_waits_for_token_budget(self):
+        pool = ProviderPool("pooled", [_member("a", tokens_per_minute=6000)])
+        async with pool.acquire(estimated_tokens=6000):
+            pass
+
+        start = asyncio.get_running_loop().time()
+        async with pool.acquire(estimated_tokens=10):
+            pass
+        # 10 tokens at 100 tokens/s
+        assert asyncio.get_running_loop().time() - start >= 0.08
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_releases_nothing(self):
+        pool = ProviderPool("pooled", [_member("a", max_concurrency=1)])
+        async with pool.acquire():
+            waiter = asyncio.create_task(pool.acquire().__aenter__())
+            await asyncio.sleep(0.01)
+            waiter.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiter
+        assert pool.in_flight == 0 and pool.waiting == 0
+
+
+class TestManagerPools:
+
+    @pytest.fixture
+    def llm_manager(self):
+        config_manager = Mock(spec=ConfigurationManager)
+        config_manager.list_configured_providers.return_value = ["pooled"]
+        config_manager.get_default_provider.return_value = "pooled"
+        config_manager.get_fallback_chain.return_value = ["pooled"]
+        config_manager.load_provider_config.return_value = Mock(model_dump=Mock(return_value={
+            "api_key": "k1",
+            "max_concurrency": 2,
+            "instances": [{"api_key": "k1"}, {"api_key": "k2"}],
+        }))
+        registry = LLMProviderRegistry()
+        registry.register("pooled", KeyedProvider)
+        debug_logger = Mock(spec=DebugLogger)
+        debug_logger.log_request.return_value = "request_123"
+        manager = LLMManager(
+            config_manager=config_manager,
+            debug_logger=debug_logger,
+            metrics_collector=MetricsCollector(),
+            response_normalizer=Mock(normalize_response=Mock(side_effect=lambda x: x)),
+            registry=registry,
+        )
+        KeyedProvider.rate_limited_keys = set()
+        return manager
+
+    @pytest.mark.asyncio
+    async def test_requests_spread_over_instances(self, llm_manager):
+        responses = await asyncio.gather(*(
+            llm_manager.chat([Message(role="user", content=f"Hello {i}")]) for i in range(8)
+        ))
+
+        assert {r.content for r in responses} == {"k1", "k2"}
+        pool_stats = llm_manager.get_stats()["manager"]["provider_pools"]["pooled"]
+        assert pool_stats["queued_requests"] > 0
+        assert sum(m["total_requests"] for m in pool_stats["members"].values()) == 8
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_instance_cools_down(self, llm_manager):
+        messages = [Message(role="user", content="Hello")]
+        KeyedProvider.rate_limited_keys = {"k1"}
+        with pytest.raises(Exception):
+            await llm_manager.chat(messages)
+
+        # k1 is cooling down, so traffic goes to k2 and the provider stays healthy
+        responses = [await llm_manager.chat(messages) for _ in range(3)]
+        assert {r.content for r in responses} == {"k2"}
+        assert llm_manager.load_balancer.provider_health.get("pooled", True)
+
+    @pytest.mark.asyncio
+    async def test_streams_hold_a_pool_lease(self, llm_manager):
+        pool = None
+        peak = 0
+
+        async def stream(i):
+            nonlocal pool, peak
+            chunks = []
+            async for chunk in llm_manager.chat_stream([Message(role="user", content=f"Hello {i}")]):
+                pool = llm_manager.provider_pools["pooled"]
+                peak = max(peak, pool.in_flight)
+                chunks.append(chunk.delta)
+            return chunks
+
+        streams = await asyncio.gather(*(stream(i) for i in range(8)))
+        assert {key for chunks in streams for key in chunks} == {"k1", "k2"}
+        # Two instances with two slots each
+        assert peak <= 4
+        assert pool.in_flight == 0
+        assert sum(m["total_requests"] for m in pool.get_stats()["members"].values()) == 8
@@ -0,0 +1,126 @@
+"""
+Tests for the shared, invalidation-aware MCP tool-schema registry.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from fastmcp import FastMCP
+from fastmcp.client.transports import FastMCPTransport
+from fastmcp.tools import Tool
+
+from spoon_ai.agents.mcp_client_mixin import MCPClientMixin
+from spoon_ai.agents.mcp_schema_registry import SCHEMA_REGISTRY, MCPSchemaRegistry, ToolSchema
+from spoon_ai.agents.mcp_session_pool import SESSION_POOL
+from spoon_ai.agents.toolcall import ToolCallAgent
+from spoon_ai.chat import ChatBot
+from spoon_ai.schema import LLMResponse
+from spoon_ai.tools import ToolManager
+from spoon_ai.tools.mcp_tool import MCPTool
+
+
+def _server(tools=150):
+    server = FastMCP("schema-test")
+    for i in range(tools):
+        server.add_tool(Tool.from_function(lambda x: x, name=f"tool_{i}", description=f"Tool number {i}"))
+
+    @server.tool
+    def install(name: str) -> str:
+        """Add a tool at runtime."""
+        server.add_tool(Tool.from_function(lambda y: y, name=name, description="installed later"))
+        return name
+
+    return server
+
+
+class InMemoryMCPTool(MCPTool):
+    def _create_transport_from_config(self, config: dict):
+        return FastMCPTransport(config["server"])
+
+
+class MCPAgent(ToolCallAgent, MCPClientMixin):
+    def __init__(self, transport, **kwargs):
+        ToolCallAgent.__init__(self, **kwargs)
+        MCPClientMixin.__init__(self, transport)
+
+
+def _agent(transport):
+    llm = Mock(spec=ChatBot)
+    llm.ask_tool = AsyncMock(return_value=LLMResponse(content="done", tool_calls=[]))
+    return MCPAgent(transport, name="schema-agent", llm=llm, available_tools=ToolManager([]), next_step_prompt="")
+
+
+@pytest.mark.asyncio
+async def test_agents_and_tools_share_one_discovery():
+    server = _server()
+    tools = [InMemoryMCPTool(name=f"tool_{i}", mcp_config={"server": server}) for i in range(5)]
+    await asyncio.gather(*(tool.ensure_parameters_loaded() for tool in tools))
+    key = tools[0]._server_key
+    assert SCHEMA_REGISTRY.get_stats()[key]["fetches"] == 1
+    # No count cap: every tool of the server is kept
+    assert SCHEMA_REGISTRY.get_stats()[key]["tools"] == 151
+
+    agents = [_agent(FastMCPTransport(server)) for _ in range(3)]
+    for agent in agents:
+        await agent.think()
+        await agent.think()
+    assert SCHEMA_REGISTRY.get_stats()[key]["fetches"] == 1
+
+    # Every agent sends the same prebuilt specs, and tools reuse them too
+    sent = [agent.llm.ask_tool.call_args.kwargs["tools"] for agent in agents]
+    assert len(sent[0]) == 151
+    assert all(a is b for a, b in zip(sent[0], sent[1]))
+    schema = SCHEMA_REGISTRY.peek(key).get("tool_3")
+    assert tools[3].to_param() is schema.spec
+    assert schema.spec["function"]["description"] == "Tool number 3"
+    await SESSION_POOL.close()
+
+
+@pytest.mark.asyncio
+async def test_tool_list_changed_notification_refreshes_in_background():
+    server = _server(tools=3)
+    agent = _agent(FastMCPTransport(server))
+    await agent.think()
+    before = SCHEMA_REGISTRY.peek(agent._server_key)
+
+    async with agent.get_session() as session:
+        await session.call_tool("install", {"name": "fresh"})
+    for _ in range(50):
+        await asyncio.sleep(0.02)
+        if SCHEMA_REGISTRY.peek(agent._server_key) is not before:
+            break
+
+    after = SCHEMA_REGISTRY.peek(agent._server_key)
+    assert after.get("fresh") is not None and after.digest != before.digest
+    # Unchanged schemas (and their prebuilt specs) are kept as they were
+    assert after.get("tool_0") is before.get("tool_0")
+    await agent.think()
+    assert "fresh" in [spec["function"]["name"] for spec in agent.llm.ask_tool.call_args.kwargs["tools"]]
+    await SESSION_POOL.close()
+
+
+@pytest.mark.asyncio
+async def test_registry_single_flight_and_content_hash():
+    registry = MCPSchemaRegistry(max_age=None)
+    listing = [{"name": "quote", "description": "Get a quote", "inputSchema": {"type": "object"}}]
+    fetches = []
+
+    async def fetch():
+        fetches.append(1)
+        await asyncio.sleep(0.05)
+        return listing
+
+    results = await asyncio.gather(*(registry.get("server", fetch) for _ in range(10)))
+    assert len(fetches) == 1
+    assert all(result is results[0] for result in results)
+
+    # An unchanged listing keeps the snapshot; a changed one replaces it
+    assert await registry.refresh("server") is results[0]
+    listing = [{"name": "quote", "description": "Get a quote now", "inputSchema": {"type": "object"}}]
+    changed = await registry.refresh("server")
+    assert changed is not results[0] and changed.digest != results[0].digest
+    assert ToolSchema.from_mcp(listing[0]).digest == changed.get("quote").digest
+
+    with pytest.raises(KeyError):
+        await registry.get("unknown")
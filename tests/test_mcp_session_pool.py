@@ -0,0 +1,122 @@
+"""
+Tests for pooled, long-lived MCP client sessions.
+"""
+
+import asyncio
+import time
+
+import pytest
+from fastmcp import FastMCP
+from fastmcp.client.transports import FastMCPTransport, SSETransport, StdioTransport
+
+from spoon_ai.agents.mcp_client_mixin import MCPClientMixin
+from spoon_ai.agents.mcp_session_pool import MCPSessionPool, transport_key
+from spoon_ai.tools.mcp_tool import MCPTool
+
+
+def _server():
+    server = FastMCP("pool-test")
+
+    @server.tool
+    async def slow_echo(text: str, delay: float = 0.1) -> str:
+        """Echo after a delay."""
+        await asyncio.sleep(delay)
+        return text
+
+    return server
+
+
+async def _echo(client, text, delay=0.0):
+    async with client.get_session() as session:
+        result = await session.call_tool("slow_echo", {"text": text, "delay": delay})
+        return result.content[0].text
+
+
+class InMemoryMCPTool(MCPTool):
+    """MCPTool talking to an in-process FastMCP server."""
+
+    def _create_transport_from_config(self, config: dict):
+        return FastMCPTransport(config["server"])
+
+
+def test_transport_key_identifies_server():
+    assert transport_key(SSETransport("http://x/sse")) == transport_key(SSETransport("http://x/sse"))
+    assert transport_key(SSETransport("http://x/sse")) != transport_key(
+        SSETransport("http://x/sse", headers={"Authorization": "a"}))
+    key = transport_key(StdioTransport("node", ["server.js"], env={"API_KEY": "secret"}))
+    assert key == transport_key(StdioTransport("node", ["server.js"], env={"API_KEY": "secret"}))
+    assert "secret" not in key
+    assert key != transport_key(StdioTransport("node", ["server.js"], env={"API_KEY": "other"}))
+
+
+@pytest.mark.asyncio
+async def test_tools_share_one_warm_session():
+    server = _server()
+    pool = MCPSessionPool(health_check_interval=0)
+    clients = [MCPClientMixin(FastMCPTransport(server), session_pool=pool) for _ in range(3)]
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*[
+        _echo(clients[i % 3], str(i), 0.2) for i in range(12)
+    ])
+    elapsed = time.perf_counter() - started
+
+    # Twelve 200 ms calls multiplexed over one session
+    assert results == [str(i) for i in range(12)]
+    assert elapsed < 1.0
+    stats = clients[0].get_session_stats()
+    assert stats["connects"] == 1 and stats["total_calls"] == 12 and stats["owners"] == 3
+    assert stats["connected"] and stats["in_flight"] == 0
+
+    # The session outlives the request and the first users to leave
+    await clients[0].cleanup()
+    await clients[1].cleanup()
+    assert await _echo(clients[2], "still warm") == "still warm"
+    assert clients[2].get_session_stats()["connects"] == 1
+    await clients[2].cleanup()
+    assert pool.get_stats() == {}
+
+
+@pytest.mark.asyncio
+async def test_dropped_session_reconnects_transparently():
+    pool = MCPSessionPool(health_check_interval=0)
+    client = MCPClientMixin(FastMCPTransport(_server()), session_pool=pool)
+    assert await _echo(client, "one") == "one"
+
+    await pool._sessions[client._server_key].client.close()
+    assert await _echo(client, "two") == "two"
+    stats = client.get_session_stats()
+    assert stats["connects"] == 2 and stats["reconnects"] == 1
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_background_health_check_and_idle_close():
+    pool = MCPSessionPool(health_check_interval=0.05, idle_timeout=0.3)
+    tool = InMemoryMCPTool(name="slow_echo", mcp_config={"server": _server(), "health_check_interval": 0.05})
+    tool._session_pool = pool
+    pool.retain(tool._server_key, 0.05)
+
+    assert await tool.execute(text="hi", delay=0) == "hi"
+    # Parameters come from the server schema over the same session
+    assert "text" in tool.parameters["properties"]
+    await asyncio.sleep(0.15)
+    stats = tool.get_session_stats()
+    assert stats["connects"] == 1 and stats["last_health_check_age"] is not None
+    assert await tool._check_mcp_health()
+
+    await asyncio.sleep(0.4)
+    assert not tool.get_session_stats()["connected"]
+    assert await tool.execute(text="back", delay=0) == "back"
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_unreachable_server_raises_connection_error():
+    pool = MCPSessionPool(health_check_interval=0)
+    client = MCPClientMixin(StdioTransport("/nonexistent/mcp-server", []), session_pool=pool)
+    with pytest.raises(ConnectionError):
+        async with client.get_session():
+            pass
+    assert not pool.is_healthy(client._server_key)
+    assert client.get_session_stats()["failures"] == 1
@@ -0,0 +1,161 @@
+"""
+Tests for short-term memory token accounting and trimming.
+"""
+
+import random
+from typing import List, Optional
+
+import pytest
+
+from spoon_ai.memory import MessageTokenCounter, ShortTermMemoryManager, TrimStrategy
+from spoon_ai.schema import Message
+
+
+def _history(n: int, seed: int = 7) -> List[Message]:
+    rng = random.Random(seed)
+    messages = [Message(role="system", content="You are helpful.")]
+    for i in range(n):
+        role = "user" if i % 2 == 0 else "assistant"
+        messages.append(Message(role=role, content="x" * rng.randint(1, 400)))
+    return messages
+
+
+async def _reference_trim(messages, max_tokens, strategy, keep_system=True):
+    """The previous implementation: re-count every candidate list."""
+    count = lambda msgs: MessageTokenCounter._approximate_count(msgs)
+    if count(messages) <= max_tokens:
+        return messages
+    system_message = None
+    remaining = messages
+    if keep_system and strategy == TrimStrategy.FROM_END and messages[0].role == "system":
+        system_message, remaining = messages[0], messages[1:]
+    kept: List[Message] = []
+    if strategy == TrimStrategy.FROM_END:
+        for message in reversed(remaining):
+            trial = [message] + kept
+            if count(([system_message] if system_message else []) + trial) <= max_tokens or not kept:
+                kept = trial
+        return ([system_message] if system_message else []) + kept
+    for message in remaining:
+        trial = kept + [message]
+        if count(trial) <= max_tokens or not kept:
+            kept = trial
+        else:
+            break
+    return kept
+
+
+class CountingTokenCounter(MessageTokenCounter):
+    def __init__(self):
+        self.calls = 0
+
+    def _count_message(self, message: Message, model: Optional[str]) -> int:
+        self.calls += 1
+        return super()._count_message(message, model)
+
+
+class TestTrimMessages:
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("strategy", [TrimStrategy.FROM_END, TrimStrategy.FROM_START])
+    @pytest.mark.parametrize("max_tokens", [0, 50, 400, 2000])
+    async def test_matches_previous_algorithm(self, strategy, max_tokens):
+        messages = _history(60)
+        manager = ShortTermMemoryManager()
+        trimmed = await manager.trim_messages(messages, max_tokens, strategy=strategy)
+        expected = await _reference_trim(messages, max_tokens, strategy)
+        assert [m.id for m in trimmed] == [m.id for m in expected]
+
+    @pytest.mark.asyncio
+    async def test_counts_are_cached_on_messages(self):
+        counter = CountingTokenCounter()
+        manager = ShortTermMemoryManager(token_counter=counter)
+        messages = _history(200)
+
+        await manager.trim_messages(messages, 500)
+        assert counter.calls == len(messages)
+
+        messages.append(Message(role="user", content="one more turn"))
+        await manager.trim_messages(messages, 500)
+        assert counter.calls == len(messages)
+
+        # Editing a message invalidates only its own entry
+        messages[5].content = "edited"
+        assert await counter.count_tokens(messages) == MessageTokenCounter._approximate_count(messages)
+        assert counter.calls == len(messages) + 1
+
+    @pytest.mark.asyncio
+    async def test_custom_count_tokens_override_is_respected(self):
+        class FlatCounter(MessageTokenCounter):
+            async def count_tokens(self, messages, model=None):
+                return 10 * len(messages)
+
+        manager = ShortTermMemoryManager(token_counter=FlatCounter())
+        messages = _history(20)
+        trimmed = await manager.trim_messages(messages, 50, strategy=TrimStrategy.FROM_START)
+        assert len(trimmed) == 5
+
+
+class RecordingTokenizer:
+    name = "recording"
+
+    def __init__(self):
+        self.batches = []
+
+    def count(self, text):
+        return len(text.split())
+
+    def count_batch(self, texts):
+        self.batches.append(list(texts))
+        return [self.count(text) for text in texts]
+
+
+class TestTokenizers:
+
+    def test_byte_level_fallback_charges_cjk(self):
+        from spoon_ai.memory import ByteLevelTokenizer
+
+        tokenizer = ByteLevelTokenizer()
+        assert tokenizer.count("a" * 40) == 10
+        # 20 CJK characters count as ~25 tokens rather than 5
+        assert tokenizer.count("你好" * 10) == 25
+        assert tokenizer.count_batch(["", "abcd"]) == [0, 1]
+
+    def test_bpe_vocab_loaded_from_local_file(self, tmp_path):
+        import base64
+        from spoon_ai.memory import TiktokenTokenizer, get_tokenizer
+
+        ranks = {bytes([b]): b for b in range(256)}
+        ranks.update({b"he": 256, b"ll": 257, b"hell": 258})
+        lines = [f"{base64.b64encode(tok).decode()} {rank}" for tok, rank in ranks.items()]
+        (tmp_path / "o200k_base.tiktoken").write_text("\n".join(lines) + "\n")
+
+        tokenizer = get_tokenizer("openai/gpt-4o-mini", vocab_dir=str(tmp_path))
+        assert isinstance(tokenizer, TiktokenTokenizer)
+        assert tokenizer.name == "o200k_base"
+        assert tokenizer.count("hello") == 2
+        assert tokenizer.count_batch(["hello", "hell"]) == [2, 1]
+        # Unknown families and missing vocab files fall back to the estimator
+        assert get_tokenizer("claude-sonnet-4", vocab_dir=str(tmp_path)).name == "byte_level"
+        assert get_tokenizer("gpt-4", vocab_dir=str(tmp_path)).name == "byte_level"
+
+    @pytest.mark.asyncio
+    async def test_counter_batches_misses_and_reuses_lru(self):
+        from spoon_ai.memory import TokenizerTokenCounter, register_tokenizer
+
+        tokenizer = RecordingTokenizer()
+        register_tokenizer("recording", lambda: tokenizer, model_prefixes=["recording-model"])
+        counter = TokenizerTokenCounter(default_model="recording-model", cache_size=8)
+
+        history = [{"role": "user", "content": f"turn {i} with words"} for i in range(5)]
+        counts = await counter.count_per_message([Message(**m) for m in history])
+        assert counts == [1 + 4 + 3] * 5
+        assert len(tokenizer.batches) == 1
+
+        # Rebuilt Message objects (new ids) are served from the LRU
+        assert await counter.count_tokens([Message(**m) for m in history]) == 40
+        assert len(tokenizer.batches) == 1
+
+        history.append({"role": "assistant", "content": "new", "name": "bot"})
+        assert await counter.count_per_message([Message(**m) for m in history]) == [8] * 5 + [1 + 1 + 1 + 3 + 1]
+        assert tokenizer.batches[-1] == ["assistant", "new", "bot"]
@@ -0,0 +1,71 @@
+"""
+Tests for delta + offset streaming chunks and their lazily joined content.
+"""
+
+import pytest
+
+from spoon_ai.llm.providers.fake_provider import FakeProvider
+from spoon_ai.schema import LLMResponseChunk, Message, StreamContent
+from spoon_ai.utils.streaming import StreamOutcome
+
+
+def _stream(deltas):
+    content = StreamContent()
+    return [
+        LLMResponseChunk.from_stream(content, delta, provider="p", model="m", chunk_index=i)
+        for i, delta in enumerate(deltas)
+    ]
+
+
+def test_chunks_carry_delta_offset_and_lazy_content():
+    chunks = _stream(["Hel", "lo", "", " world"])
+
+    assert [c.offset for c in chunks] == [0, 3, 5, 5]
+    # Earlier chunks still see the text as it was when they were produced
+    assert [c.content for c in chunks] == ["Hel", "Hello", "Hello", "Hello world"]
+    assert chunks[1].model_dump()["content"] == "Hello"
+    assert chunks[1].model_copy().content == "Hello"
+
+
+def test_explicit_content_still_supported():
+    chunk = LLMResponseChunk(content="Hello world", delta=" world", provider="p", model="m")
+    assert chunk.content == "Hello world"
+    assert chunk.model_dump()["content"] == "Hello world"
+
+    chunk.content = "replaced"
+    assert chunk.content == "replaced"
+    # Without content or a stream the delta is all there is
+    assert LLMResponseChunk(delta="abc", provider="p", model="m").content == "abc"
+
+
+def test_stream_content_joins_once():
+    content = StreamContent()
+    for part in ("a", "b", "c"):
+        content.append(part)
+    assert len(content) == 3
+    assert content.text() == "abc"
+    assert content._parts == ["abc"]
+    assert content.text(2) == "ab"
+
+
+def test_stream_outcome_accumulates_deltas():
+    outcome = StreamOutcome()
+    for chunk in _stream(["one", " two", " three"]):
+        outcome.update_from_chunk(chunk)
+    assert outcome.build_response().content == "one two three"
+
+    # Chunks that only carry accumulated content replace what came before
+    legacy = StreamOutcome()
+    legacy.update_from_chunk(LLMResponseChunk(content="full text", delta="", provider="p", model="m"))
+    assert legacy.build_response().content == "full text"
+
+
+@pytest.mark.asyncio
+async def test_provider_stream_uses_shared_content():
+    provider = FakeProvider()
+    await provider.initialize({"extra_params": {"fake_latency": 0}})
+
+    chunks = [c async for c in provider.chat_stream([Message(role="user", content="hi there")])]
+
+    assert "".join(c.delta for c in chunks) == chunks[-1].content == "fake response to: hi there"
+    assert all(c.offset == len(chunks[i - 1].content) for i, c in enumerate(chunks) if i)
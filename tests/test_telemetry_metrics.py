@@ -0,0 +1,85 @@
+"""
+Tests for the instrumentation registry and its OpenMetrics endpoint.
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from spoon_ai.llm.monitoring import MetricsCollector
+from spoon_ai.telemetry import REGISTRY, MetricsRegistry, metrics_router
+
+
+def test_counter_gauge_histogram_render():
+    registry = MetricsRegistry()
+    requests = registry.counter("app_requests", "Requests served.", ["route"])
+    in_flight = registry.gauge("app_in_flight", "Requests in flight.")
+    latency = registry.histogram("app_latency_seconds", "Latency.", buckets=(0.1, 1.0))
+
+    requests.labels(route="/a").inc()
+    requests.labels("/a").inc(2)
+    requests.labels(route='say "hi"\n').inc()
+    in_flight.inc(3)
+    in_flight.dec()
+    latency.observe(0.05)
+    latency.observe(0.5)
+    latency.observe(5)
+
+    text = registry.render()
+    assert "# TYPE app_requests counter" in text
+    assert 'app_requests_total{route="/a"} 3' in text
+    assert 'app_requests_total{route="say \\"hi\\"\\n"} 1' in text
+    assert "app_in_flight 2" in text
+    assert 'app_latency_seconds_bucket{le="0.1"} 1' in text
+    assert 'app_latency_seconds_bucket{le="1"} 2' in text
+    assert 'app_latency_seconds_bucket{le="+Inf"} 3' in text
+    assert "app_latency_seconds_count 3" in text
+    assert text.endswith("# EOF\n")
+
+    classic = registry.render(openmetrics=False)
+    assert "# TYPE app_requests_total counter" in classic
+    assert "# EOF" not in classic
+
+
+def test_registry_is_get_or_create():
+    registry = MetricsRegistry()
+    counter = registry.counter("jobs", "Jobs.", ["kind"])
+    assert registry.counter("jobs", "Jobs.", ["kind"]) is counter
+    with pytest.raises(ValueError):
+        registry.gauge("jobs", "Jobs.")
+    with pytest.raises(ValueError):
+        counter.labels("a", "b")
+    with pytest.raises(ValueError):
+        counter.labels("a").inc(-1)
+
+
+def test_llm_requests_are_exported():
+    labels = {"provider": "metrics-test", "method": "chat", "status": "success"}
+    before = REGISTRY.get_sample_value("spoon_llm_requests_total", labels) or 0
+
+    collector = MetricsCollector()
+    collector.record_request("metrics-test", "chat", 0.2, True, tokens=15)
+    collector.record_request("metrics-test", "chat", 0.4, True, tokens=5)
+
+    assert REGISTRY.get_sample_value("spoon_llm_requests_total", labels) == before + 2
+    assert REGISTRY.get_sample_value("spoon_llm_tokens_total", {"provider": "metrics-test"}) >= 20
+    assert REGISTRY.get_sample_value(
+        "spoon_llm_request_duration_seconds_count", {"provider": "metrics-test", "method": "chat"}
+    ) >= 2
+
+
+def test_metrics_endpoint_negotiates_format():
+    registry = MetricsRegistry()
+    registry.counter("scrapes", "Scrapes.").inc()
+    app = FastAPI()
+    app.include_router(metrics_router(registry))
+    client = TestClient(app)
+
+    response = client.get("/metrics", headers={"Accept": "application/openmetrics-text; version=1.0.0"})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/openmetrics-text")
+    assert "scrapes_total 1" in response.text and response.text.endswith("# EOF\n")
+
+    response = client.get("/metrics")
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "# EOF" not in response.text
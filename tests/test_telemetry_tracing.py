@@ -0,0 +1,194 @@
+"""
+Tests for span tracing: context propagation, sampling and exporters.
+"""
+
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Any, Dict, TypedDict
+from unittest.mock import Mock
+
+import pytest
+
+from spoon_ai.graph import END, StateGraph
+from spoon_ai.llm.config import ConfigurationManager
+from spoon_ai.llm.manager import LLMManager
+from spoon_ai.llm.monitoring import DebugLogger, MetricsCollector
+from spoon_ai.llm.providers.fake_provider import FakeProvider
+from spoon_ai.llm.registry import LLMProviderRegistry
+from spoon_ai.schema import Message
+from spoon_ai.telemetry import (
+    InMemorySpanExporter,
+    JsonlSpanExporter,
+    OTLPHttpSpanExporter,
+    configure_tracing,
+    current_span,
+    start_span,
+    traced,
+)
+
+
+@pytest.fixture
+def exporter():
+    exporter = InMemorySpanExporter()
+    configure_tracing(exporter)
+    yield exporter
+    configure_tracing(None)
+
+
+def _by_name(spans):
+    return {span.name: span for span in spans}
+
+
+@pytest.mark.asyncio
+async def test_spans_nest_across_tasks(exporter):
+    @traced("work", lambda i: {"item": i})
+    async def work(i):
+        await asyncio.sleep(0.01)
+        current_span().set_attribute("done", True)
+
+    with start_span("root") as root:
+        await asyncio.gather(*(work(i) for i in range(3)))
+
+    children = [span for span in exporter.spans if span.name == "work"]
+    assert len(children) == 3
+    assert {span.parent_id for span in children} == {root.span_id}
+    assert {span.trace_id for span in exporter.spans} == {root.trace_id}
+    assert sorted(span.attributes["item"] for span in children) == [0, 1, 2]
+    assert all(span.attributes["done"] and span.duration >= 0.01 for span in children)
+
+
+@pytest.mark.asyncio
+async def test_attribute_errors_do_not_fail_the_call(exporter):
+    @traced("work", lambda messages: {"messages": len(messages)})
+    async def work(messages):
+        return "ok"
+
+    assert await work(None) == "ok"
+    span = exporter.spans[0]
+    assert span.name == "work" and span.status != "error" and "messages" not in span.attributes
+
+
+def test_failed_span_records_error(exporter):
+    with pytest.raises(ValueError):
+        with start_span("boom"):
+            raise ValueError("bad input")
+
+    span = exporter.spans[0]
+    assert span.status == "error" and span.error == "ValueError: bad input"
+
+
+def test_sampling_keeps_or_drops_whole_traces():
+    exporter = InMemorySpanExporter()
+    configure_tracing(exporter, sample_ratio=0.0)
+    with start_span("root"):
+        with start_span("child"):
+            pass
+    assert exporter.spans == []
+
+    configure_tracing(exporter, sample_ratio=0.5)
+    for _ in range(200):
+        with start_span("root"):
+            with start_span("child"):
+                pass
+    configure_tracing(None)
+
+    roots = [span for span in exporter.spans if span.name == "root"]
+    children = [span for span in exporter.spans if span.name == "child"]
+    assert 50 < len(roots) < 150
+    assert len(children) == len(roots)
+    assert {span.parent_id for span in children} == {span.span_id for span in roots}
+
+
+def test_disabled_tracing_is_a_no_op():
+    configure_tracing(None)
+    with start_span("anything") as span:
+        span.set_attribute("ignored", 1)
+        assert current_span() is span
+    assert not span.recording
+
+
+def test_jsonl_exporter(tmp_path):
+    path = tmp_path / "spans.jsonl"
+    configure_tracing(JsonlSpanExporter(str(path)))
+    with start_span("outer", {"key": "value"}):
+        with start_span("inner"):
+            pass
+    configure_tracing(None)
+
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [record["name"] for record in records] == ["inner", "outer"]
+    assert records[0]["parent_id"] == records[1]["span_id"]
+    assert records[1]["attributes"] == {"key": "value"}
+
+
+def test_otlp_exporter_posts_batches():
+    received = []
+
+    class Collector(BaseHTTPRequestHandler):
+        def do_POST(self):
+            received.append(json.loads(self.rfile.read(int(self.headers["Content-Length"]))))
+            self.send_response(200)
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Collector)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        exporter = OTLPHttpSpanExporter(f"http://127.0.0.1:{server.server_port}/v1/traces", flush_interval=0.05)
+        configure_tracing(exporter)
+        with start_span("request", {"tokens": 12}):
+            pass
+        configure_tracing(None)
+    finally:
+        server.shutdown()
+
+    spans = [span for body in received for span in body["resourceSpans"][0]["scopeSpans"][0]["spans"]]
+    assert [span["name"] for span in spans] == ["request"]
+    assert spans[0]["attributes"] == [{"key": "tokens", "value": {"intValue": "12"}}]
+
+
+class _State(TypedDict):
+    question: str
+    answer: str
+
+
+@pytest.mark.asyncio
+async def test_graph_to_provider_trace(exporter):
+    config_manager = Mock(spec=ConfigurationManager)
+    config_manager.list_configured_providers.return_value = ["fake"]
+    config_manager.get_default_provider.return_value = "fake"
+    config_manager.get_fallback_chain.return_value = ["fake"]
+    config_manager.load_provider_config.return_value = Mock(model_dump=Mock(return_value={
+        "api_key": "offline", "extra_params": {"fake_latency": 0.001},
+    }))
+    registry = LLMProviderRegistry()
+    registry.register("fake", FakeProvider)
+    manager = LLMManager(
+        config_manager=config_manager,
+        debug_logger=DebugLogger(),
+        metrics_collector=MetricsCollector(),
+        response_normalizer=Mock(normalize_response=Mock(side_effect=lambda x: x)),
+        registry=registry,
+    )
+
+    async def answer(state: Dict[str, Any]) -> Dict[str, Any]:
+        response = await manager.chat([Message(role="user", content=state["question"])])
+        return {"answer": response.content}
+
+    graph = StateGraph(_State)
+    graph.add_node("answer", answer)
+    graph.set_entry_point("answer")
+    graph.add_edge("answer", END)
+    result = await graph.compile().invoke({"question": "why", "answer": ""})
+
+    assert result["answer"] == "fake response to: why"
+    spans = _by_name(exporter.spans)
+    assert spans["graph.node"].parent_id == spans["graph.invoke"].span_id
+    assert spans["llm.chat"].parent_id == spans["graph.node"].span_id
+    assert spans["llm.provider"].parent_id == spans["llm.chat"].span_id
+    assert spans["llm.provider"].attributes["llm.provider"] == "fake"
+    assert spans["llm.provider"].attributes["llm.total_tokens"] > 0
@@ -0,0 +1,130 @@
+"""
+Tests for the offline tool retrieval index and top-k tool selection.
+"""
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from spoon_ai.agents.toolcall import ToolCallAgent
+from spoon_ai.chat import ChatBot
+from spoon_ai.schema import LLMResponse
+from spoon_ai.tools import ToolManager
+from spoon_ai.tools.base import BaseTool
+from spoon_ai.tools.tool_index import HashedNgramEmbedder, ToolIndex
+
+
+class DescribedTool(BaseTool):
+    parameters: dict = {"type": "object", "properties": {}}
+
+    async def execute(self, **kwargs) -> str:
+        return self.name
+
+
+TOOLS = {
+    "get_token_price": "Get the current market price of a crypto token in USD",
+    "send_transfer": "Send a token transfer from the wallet to a recipient address",
+    "get_weather": "Current weather forecast for a city",
+    "search_news": "Search recent news articles about a topic",
+    "terminate": "Finish the task",
+}
+
+
+def _tools(fillers=200):
+    tools = [DescribedTool(name=name, description=description) for name, description in TOOLS.items()]
+    tools += [
+        DescribedTool(name=f"toolkit_{i}", description=f"Toolkit operation {i} on resource group {i % 17}")
+        for i in range(fillers)
+    ]
+    return tools
+
+
+class CountingEmbedder(HashedNgramEmbedder):
+    def __init__(self):
+        super().__init__()
+        self.texts = 0
+
+    def __call__(self, texts):
+        self.texts += len(texts)
+        return super().__call__(texts)
+
+
+def test_query_tools_ranks_relevant_tools_offline():
+    manager = ToolManager(_tools())
+    assert manager.query_tools("what is the price of the NEO token?", top_k=3)[0] == "get_token_price"
+    assert manager.query_tools("transfer tokens to this address", top_k=1) == ["send_transfer"]
+    assert manager.query_tools("weather forecast in Paris", top_k=1) == ["get_weather"]
+
+    manager.add_tool(DescribedTool(name="get_gas_fee", description="Estimate the gas fee of a transaction"))
+    assert manager.query_tools("how much gas will this transaction cost", top_k=1) == ["get_gas_fee"]
+
+
+def test_embeddings_persist_and_only_changes_are_embedded(tmp_path):
+    path = str(tmp_path / "tool_embeddings.db")
+    documents = {name: description for name, description in TOOLS.items()}
+
+    first = CountingEmbedder()
+    index = ToolIndex(embedder=first, cache_path=path)
+    assert index.update(documents) == len(documents)
+    assert index.update(documents) == 0
+    index.cache.close()
+
+    # A new process reuses the persisted embeddings
+    second = CountingEmbedder()
+    reloaded = ToolIndex(embedder=second, cache_path=path)
+    documents["get_weather"] = "Weather forecast and air quality for a city"
+    assert reloaded.update(documents) == 1
+    assert second.texts == 1
+    assert reloaded.search("air quality", top_k=1)[0][0] == "get_weather"
+
+    del documents["search_news"]
+    reloaded.update(documents)
+    assert "search_news" not in reloaded and len(reloaded) == len(documents)
+
+
+def test_indexes_share_one_cache_per_file(tmp_path):
+    path = str(tmp_path / "tool_embeddings.db")
+    manager = ToolManager(_tools(fillers=10))
+    manager.index_tools(cache_path=path)
+    first = manager.tool_index
+    manager.add_tool(DescribedTool(name="get_gas_fee", description="Estimate the gas fee of a transaction"))
+    manager.index_tools(cache_path=path)
+    assert manager.tool_index is first
+
+    # Another index on the same file (e.g. another agent) reuses the connection
+    other = ToolIndex(cache_path=path)
+    assert other.cache is first.cache
+    other.cache.close()
+    assert ToolIndex(cache_path=path).cache is not first.cache
+
+
+def test_dense_embedder_is_pluggable():
+    def letters(texts):
+        return [[text.lower().count(letter) for letter in "abcdefghijklmnopqrstuvwxyz"] for text in texts]
+
+    index = ToolIndex(embedder=letters)
+    index.update({"zzz": "zzz zzz", "aaa": "aaa aaa"})
+    assert index.search("zz", top_k=1)[0][0] == "zzz"
+
+
+@pytest.mark.asyncio
+async def test_agent_sends_only_top_k_tools():
+    llm = Mock(spec=ChatBot)
+    llm.ask_tool = AsyncMock(return_value=LLMResponse(content="", tool_calls=[]))
+    agent = ToolCallAgent(
+        name="selective",
+        llm=llm,
+        available_tools=ToolManager(_tools()),
+        special_tool_names=["terminate"],
+        tool_top_k=3,
+    )
+    await agent.add_message("user", "What is the current price of the NEO token?")
+    await agent.think()
+
+    sent = [spec["function"]["name"] for spec in llm.ask_tool.call_args.kwargs["tools"]]
+    assert "get_token_price" in sent and "terminate" in sent
+    assert len(sent) <= 4
+
+    agent.tool_top_k = None
+    await agent.think()
+    assert len(llm.ask_tool.call_args.kwargs["tools"]) == len(TOOLS) + 200
@@ -0,0 +1,121 @@
+"""
+Tests for concurrent execution of the tool calls of one agent turn.
+"""
+
+import asyncio
+import json
+import time
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+
+from spoon_ai.agents.toolcall import ToolCallAgent
+from spoon_ai.chat import ChatBot
+from spoon_ai.schema import Function, ToolCall
+from spoon_ai.telemetry import REGISTRY
+from spoon_ai.tools import ToolManager
+from spoon_ai.tools.base import BaseTool
+
+
+class SleepTool(BaseTool):
+    name: str = "sleep"
+    description: str = "Sleep, then echo the label"
+    parameters: dict = {"type": "object", "properties": {"label": {"type": "string"}, "delay": {"type": "number"}}}
+    # Shared with the test (typed Any so pydantic keeps the same list)
+    log: Any = None
+
+    async def execute(self, label: str, delay: float = 0.1) -> str:
+        self.log.append(("start", label))
+        await asyncio.sleep(delay)
+        self.log.append(("end", label))
+        return label
+
+
+class TransferTool(SleepTool):
+    name: str = "transfer"
+    serial: bool = True
+
+
+def _call(call_id, name, label, delay=0.1):
+    return ToolCall(id=call_id, function=Function(name=name, arguments=json.dumps({"label": label, "delay": delay})))
+
+
+def _agent(*tools, **fields):
+    return ToolCallAgent(name="concurrent", llm=Mock(spec=ChatBot), available_tools=ToolManager(list(tools)), **fields)
+
+
+@pytest.mark.asyncio
+async def test_independent_calls_run_concurrently_in_order():
+    agent = _agent(SleepTool(log=[]), parallel_tool_calls=True)
+    agent.tool_calls = [_call(f"c{i}", "sleep", f"price-{i}", delay=0.2 - i * 0.05) for i in range(3)]
+
+    started = time.perf_counter()
+    await agent.act()
+    elapsed = time.perf_counter() - started
+
+    # Roughly the slowest call, not the 0.45 s sum
+    assert elapsed < 0.35
+    tool_messages = [m for m in agent.memory.messages if m.role == "tool"]
+    assert [m.tool_call_id for m in tool_messages] == ["c0", "c1", "c2"]
+    assert [m.content for m in tool_messages] == [
+        "Observed output of cmd sleep execution: price-0",
+        "Observed output of cmd sleep execution: price-1",
+        "Observed output of cmd sleep execution: price-2",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_serial_tools_keep_their_order():
+    log = []
+    agent = _agent(SleepTool(log=log), TransferTool(log=log), parallel_tool_calls=True)
+    agent.tool_calls = [
+        _call("a", "sleep", "quote-1", 0.05),
+        _call("b", "sleep", "quote-2", 0.02),
+        _call("c", "transfer", "send", 0.01),
+        _call("d", "sleep", "confirm", 0.01),
+    ]
+    await agent.act()
+
+    send_start = log.index(("start", "send"))
+    assert {("end", "quote-1"), ("end", "quote-2")} <= set(log[:send_start])
+    assert log.index(("end", "send")) < log.index(("start", "confirm"))
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limit_and_timeout():
+    log = []
+    agent = _agent(SleepTool(log=log), parallel_tool_calls=True, max_tool_concurrency=2, tool_timeout=0.15)
+    agent.tool_calls = [_call(f"c{i}", "sleep", str(i), 0.05) for i in range(4)] + [_call("slow", "sleep", "slow", 1.0)]
+    results = await agent.act()
+
+    in_flight = peak = 0
+    for event, _ in log:
+        in_flight += 1 if event == "start" else -1
+        peak = max(peak, in_flight)
+    assert peak == 2
+    assert "timed out after 0.15s" in results
+    assert agent.memory.messages[-1].tool_call_id == "slow"
+    assert "timed out" in agent.consume_last_tool_error()
+
+
+@pytest.mark.asyncio
+async def test_tool_call_timeout_overrides_agent_default():
+    agent = _agent(SleepTool(log=[], call_timeout=0.05), tool_timeout=10)
+    agent.tool_calls = [_call("c0", "sleep", "late", 0.5)]
+    assert "timed out after 0.05s" in await agent.act()
+
+
+@pytest.mark.asyncio
+async def test_unknown_tool_names_share_one_metric_series():
+    def count(tool):
+        return sum(REGISTRY.get_sample_value("spoon_agent_tool_calls_total", {"tool": tool, "status": status}) or 0
+                   for status in ("success", "error", "timeout"))
+
+    agent = _agent(SleepTool(log=[]))
+    before = count("unknown"), count("sleep")
+    for call_id, name in (("c0", "sleep"), ("c1", "hallucinated_1"), ("c2", "hallucinated_2")):
+        await agent._run_tool_call(_call(call_id, name, call_id, delay=0))
+
+    assert (count("unknown"), count("sleep")) == (before[0] + 2, before[1] + 1)
+    assert count("hallucinated_1") == 0